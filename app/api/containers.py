@@ -1,7 +1,9 @@
 from dependency_injector import containers, providers
+import importlib
 import os
 import sys
 from pathlib import Path
+from typing import Any, Callable
 
 # Ensure 'app' package root is importable
 # (contains 'infrastructure', 'domain', 'application')
@@ -9,9 +11,31 @@ _APP_ROOT = Path(__file__).resolve().parents[1]
 if str(_APP_ROOT) not in sys.path:
     sys.path.insert(0, str(_APP_ROOT))
 
-from infrastructure.config.database import AsyncSessionLocal  # noqa: E402
+from infrastructure.database.unit_of_work import current_session  # noqa: E402
 from infrastructure.config.config import settings  # noqa: E402
 
+
+def lazy(path: str) -> Callable[..., Any]:
+    """Stand-in for the class at *path* that imports it on first call.
+
+    Use cases, SQLAlchemy repositories and external services are referenced
+    this way so that building the container imports none of them; each is
+    loaded when a request first resolves its provider. Processes serving a
+    subset of domains (see ``API_DOMAINS``) never import the rest.
+    """
+    module_name, _, name = path.rpartition(".")
+    target = None
+
+    def create(*args: Any, **kwargs: Any) -> Any:
+        nonlocal target
+        if target is None:
+            target = getattr(importlib.import_module(module_name), name)
+        return target(*args, **kwargs)
+
+    create.__name__ = create.__qualname__ = name
+    return create
+
+
 # Repositories
 from domain.repositories.bnb import (  # noqa: E402
     BnbRepository,
@@ -38,204 +62,28 @@ from domain.repositories.bundle_booking import (  # noqa: E402
 # from domain.repositories.payment import PaymentRepository
 # Temporarily disabled
 from domain.repositories.review import ReviewRepository  # noqa: E402
-from infrastructure.database.repositories.bnb import (  # noqa: E402
-    SqlAlchemyBnbRepository,
-    SqlAlchemyBookingRepository,
-)
-from infrastructure.database.repositories.tours import (  # noqa: E402
-    SqlAlchemyTourRepository,
-    SqlAlchemyTourBookingRepository,
-    SqlAlchemyTourAvailabilityRepository,
-)
-from infrastructure.database.repositories.cars import (  # noqa: E402
-    SqlAlchemyVehicleRepository,
-    SqlAlchemyCarRentalRepository,
-)
-from infrastructure.database.repositories.property import (  # noqa: E402
-    SqlAlchemyPropertyRepository,
-)
-from infrastructure.database.repositories.investment import (  # noqa: E402
-    SqlAlchemyInvestmentRepository,
-    SqlAlchemyInvestmentHoldingRepository,
-)
-from infrastructure.database.repositories.user import (  # noqa: E402
-    SqlAlchemyUserRepository,
-)
-from infrastructure.database.repositories.bundle import (  # noqa: E402
-    SqlAlchemyBundleRepository,
-)
-from infrastructure.database.repositories.bundle_booking import (  # noqa: E402
-    SqlAlchemyBundleBookingRepository,
-)
+from domain.repositories.message import MessageRepository  # noqa: E402
+from domain.repositories.payout import PayoutRepository  # noqa: E402
+from domain.repositories.ledger import LedgerRepository  # noqa: E402
 # from infrastructure.database.repositories.payment import (
 #     SqlAlchemyPaymentRepository,
 # )
 # Temporarily disabled
-from infrastructure.database.repositories.review import (  # noqa: E402
-    SqlAlchemyReviewRepository,
-)
 
-# Use Cases
-from application.use_cases.bnb.search_listings import (  # noqa: E402
-    SearchListingsUseCase,
-)
-from application.use_cases.bnb.create_booking import (  # noqa: E402
-    CreateBookingUseCase,
-)
-from application.use_cases.bnb.create_listing import (  # noqa: E402
-    CreateListingUseCase,
-)
-from application.use_cases.bnb.get_listing import (  # noqa: E402
-    GetListingUseCase,
-)
-from application.use_cases.bnb.list_listings import (  # noqa: E402
-    ListListingsUseCase,
-)
-from application.use_cases.bnb.delete_listing import (  # noqa: E402
-    DeleteListingUseCase,
-)
-from application.use_cases.bnb.get_host_listings import (  # noqa: E402
-    GetHostListingsUseCase,
-)
-from application.use_cases.bnb.get_booking import (  # noqa: E402
-    GetBookingUseCase,
-)
-from application.use_cases.bnb.get_user_bookings import (  # noqa: E402
-    GetUserBookingsUseCase,
-)
-from application.use_cases.bnb.cancel_booking import (  # noqa: E402
-    CancelBookingUseCase,
-)
-from application.use_cases.bnb.get_host_bookings import (  # noqa: E402
-    GetHostBookingsUseCase,
-)
-from application.use_cases.bnb.approve_booking import (  # noqa: E402
-    ApproveBookingUseCase,
-)
-from application.use_cases.bnb.reject_booking import (  # noqa: E402
-    RejectBookingUseCase,
-)
-# Location-based grouping use cases
-from application.use_cases.bnb.get_listings_grouped_by_location import (  # noqa: E402, E501
-    GetListingsGroupedByLocationUseCase,
-)
-from application.use_cases.bnb.get_listings_by_location import (  # noqa: E402, E501
-    GetListingsByLocationUseCase,
-)
-from application.use_cases.tours.search_tours import (  # noqa: E402
-    SearchToursUseCase,
-)
-from application.use_cases.tours.create_tour_booking import (  # noqa: E402
-    CreateTourBookingUseCase,
-)
-from application.use_cases.tours.get_tour_booking import (  # noqa: E402
-    GetTourBookingUseCase,
-)
-from application.use_cases.tours.get_user_tour_bookings import (  # noqa: E402
-    GetUserTourBookingsUseCase,
-)
-from application.use_cases.tours.get_operator_tour_bookings import (  # noqa: E402, E501
-    GetOperatorTourBookingsUseCase,
-)
-from application.use_cases.tours.modify_tour_booking import (  # noqa: E402
-    ModifyTourBookingUseCase,
-)
-from application.use_cases.tours.cancel_tour_booking import (  # noqa: E402
-    CancelTourBookingUseCase,
-)
-from application.use_cases.tours.confirm_tour_booking import (  # noqa: E402
-    ConfirmTourBookingUseCase,
-)
-from application.use_cases.tours.complete_tour_booking import (  # noqa: E402
-    CompleteTourBookingUseCase,
-)
-from application.use_cases.tours.create_tour import (  # noqa: E402
-    CreateTourUseCase,
-)
-from application.use_cases.tours.get_tour import (  # noqa: E402
-    GetTourUseCase,
-)
-from application.use_cases.tours.list_tours import (  # noqa: E402
-    ListToursUseCase,
-)
-from application.use_cases.tours.delete_tour import (  # noqa: E402
-    DeleteTourUseCase,
-)
-from application.use_cases.tours.update_tour_availability import (  # noqa: E402, E501
-    UpdateTourAvailabilityUseCase,
-)
-from application.use_cases.tours.update_tour_pricing import (  # noqa: E402
-    UpdateTourPricingUseCase,
-)
-from application.use_cases.cars.search_vehicles import (  # noqa: E402
-    SearchVehiclesUseCase,
-)
-from application.use_cases.cars.create_rental import (  # noqa: E402
-    CreateRentalUseCase,
-)
-from application.use_cases.cars.create_vehicle import (  # noqa: E402
-    CreateVehicleUseCase,
-)
-from application.use_cases.cars.list_vehicles import (  # noqa: E402
-    ListVehiclesUseCase,
-)
-from application.use_cases.cars.get_vehicle import (  # noqa: E402
-    GetVehicleUseCase,
-)
-from application.use_cases.cars.delete_vehicle import (  # noqa: E402
-    DeleteVehicleUseCase,
-)
-from application.use_cases.cars.get_rental import (  # noqa: E402
-    GetRentalUseCase,
-)
-from application.use_cases.cars.list_rentals import (  # noqa: E402
-    ListRentalsUseCase,
-)
-from application.use_cases.cars.check_availability import (  # noqa: E402
-    CheckAvailabilityUseCase,
-)
-from application.use_cases.property.search_properties import (  # noqa: E402
-    SearchPropertiesUseCase,
-)
-from application.use_cases.property.create_property import (  # noqa: E402
-    CreatePropertyUseCase,
-)
-from application.use_cases.investment.list_investments import (  # noqa: E402
-    ListInvestmentsUseCase,
-)
-from application.use_cases.investment.make_investment import (  # noqa: E402
-    MakeInvestmentUseCase,
-)
-from application.use_cases.user.create_user import (  # noqa: E402
-    CreateUserUseCase,
-)
-from application.use_cases.user.enable_host import (  # noqa: E402
-    EnableHostUseCase,
-)
-from application.use_cases.auth.refresh_token import (  # noqa: E402
-    RefreshTokenUseCase,
-)
-from application.use_cases.auth.logout import (  # noqa: E402
-    LogoutUseCase,
-)
-from application.use_cases.auth.password_reset import (  # noqa: E402
-    PasswordResetRequestUseCase,
-    PasswordResetConfirmUseCase,
-)
-from application.use_cases.auth.change_password import (  # noqa: E402
-    ChangePasswordUseCase,
-)
+# Services
 from domain.services.password_service import (  # noqa: E402
     PasswordService,
 )
 from infrastructure.services.bcrypt_password_service import (  # noqa: E402
     BcryptPasswordService,
 )
-from application.use_cases.bundle.create_bundle import (  # noqa: E402
-    CreateBundleUseCase,
+from infrastructure.services.message_broker import (  # noqa: E402
+    InMemoryMessageBroker,
 )
-from application.use_cases.bundle.book_bundle import (  # noqa: E402
-    BookBundleUseCase,
+from infrastructure.services.message_hub import MessageHub  # noqa: E402
+from infrastructure.services.audit_log_writer import AuditLogWriter  # noqa: E402
+from infrastructure.external_services.http_client import (  # noqa: E402
+    create_http_client,
 )
 # from application.use_cases.payment.create_payment_intent import (
 #     CreatePaymentIntentUseCase,
@@ -249,39 +97,6 @@ from application.use_cases.bundle.book_bundle import (  # noqa: E402
 #     MpesaPaymentService,
 # )
 # Temporarily disabled
-from application.use_cases.review.create_review import (  # noqa: E402
-    CreateReviewUseCase,
-)
-from application.use_cases.review.get_reviews import (  # noqa: E402
-    GetReviewsUseCase,
-)
-from application.use_cases.review.get_review_stats import (  # noqa: E402
-    GetReviewStatsUseCase,
-)
-from application.use_cases.review.respond_to_review import (  # noqa: E402
-    RespondToReviewUseCase,
-)
-from application.use_cases.review.get_user_reviews import (  # noqa: E402
-    GetUserReviewsUseCase,
-)
-from application.use_cases.review.flag_review import (  # noqa: E402
-    FlagReviewUseCase,
-)
-from application.use_cases.review.delete_review import (  # noqa: E402
-    DeleteReviewUseCase,
-)
-from application.use_cases.analytics.host_dashboard import (  # noqa: E402
-    HostDashboardUseCase,
-)
-from application.use_cases.analytics.host_earnings import (  # noqa: E402
-    HostEarningsUseCase,
-)
-from application.use_cases.analytics.tour_operator_dashboard import (  # noqa: E402, E501
-    TourOperatorDashboardUseCase,
-)
-from application.use_cases.analytics.tour_operator_earnings import (  # noqa: E402, E501
-    TourOperatorEarningsUseCase,
-)
 
 
 class BundleUseCases(containers.DeclarativeContainer):
@@ -293,7 +108,7 @@ class BundleUseCases(containers.DeclarativeContainer):
     bnb_repo: providers.Dependency = providers.Dependency()
 
     create_bundle_use_case = providers.Factory(
-        CreateBundleUseCase,
+        lazy("application.use_cases.bundle.create_bundle.CreateBundleUseCase"),
         bundle_repo=bundle_repo,
         tour_repo=tour_repo,
         vehicle_repo=vehicle_repo,
@@ -301,7 +116,7 @@ class BundleUseCases(containers.DeclarativeContainer):
     )
 
     book_bundle_use_case = providers.Factory(
-        BookBundleUseCase,
+        lazy("application.use_cases.bundle.book_bundle.BookBundleUseCase"),
         bundle_repo=bundle_repo,
         booking_repo=booking_repo,
     )
@@ -314,45 +129,40 @@ class AuthUseCases(containers.DeclarativeContainer):
     google_auth_service: providers.Dependency = providers.Dependency()
 
     refresh_token_use_case = providers.Factory(
-        RefreshTokenUseCase,
+        lazy("application.use_cases.auth.refresh_token.RefreshTokenUseCase"),
         user_repository=user_repository,
     )
 
     logout_use_case = providers.Factory(
-        LogoutUseCase,
+        lazy("application.use_cases.auth.logout.LogoutUseCase"),
         user_repository=user_repository,
     )
 
     password_reset_request_use_case = providers.Factory(
-        PasswordResetRequestUseCase,
+        lazy("application.use_cases.auth.password_reset.PasswordResetRequestUseCase"),  # noqa: E501
         user_repository=user_repository,
     )
 
     password_reset_confirm_use_case = providers.Factory(
-        PasswordResetConfirmUseCase,
+        lazy("application.use_cases.auth.password_reset.PasswordResetConfirmUseCase"),  # noqa: E501
         user_repository=user_repository,
         password_service=password_service,
     )
 
     change_password_use_case = providers.Factory(
-        ChangePasswordUseCase,
+        lazy("application.use_cases.auth.change_password.ChangePasswordUseCase"),  # noqa: E501
         user_repository=user_repository,
         password_service=password_service,
     )
 
     # Social auth - Google
-    from application.use_cases.auth.social_google import (  # type: ignore  # noqa: E402, E501
-        StartGoogleOAuthUseCase,
-        HandleGoogleCallbackUseCase,
-    )
-
     start_google_oauth_use_case = providers.Factory(
-        StartGoogleOAuthUseCase,
+        lazy("application.use_cases.auth.social_google.StartGoogleOAuthUseCase"),  # noqa: E501
         google_service=google_auth_service,
     )
 
     handle_google_callback_use_case = providers.Factory(
-        HandleGoogleCallbackUseCase,
+        lazy("application.use_cases.auth.social_google.HandleGoogleCallbackUseCase"),  # noqa: E501
         user_repository=user_repository,
         google_service=google_auth_service,
     )
@@ -364,13 +174,13 @@ class UserUseCases(containers.DeclarativeContainer):
     password_service: providers.Dependency = providers.Dependency()
 
     create_user_use_case = providers.Factory(
-        CreateUserUseCase,
+        lazy("application.use_cases.user.create_user.CreateUserUseCase"),
         user_repository=user_repository,
         password_service=password_service,
     )
 
     enable_host_use_case = providers.Factory(
-        EnableHostUseCase,
+        lazy("application.use_cases.user.enable_host.EnableHostUseCase"),
         user_repository=user_repository,
     )
 
@@ -381,12 +191,12 @@ class InvestmentUseCases(containers.DeclarativeContainer):
     holding_repository: providers.Dependency = providers.Dependency()
 
     list_investments_use_case = providers.Factory(
-        ListInvestmentsUseCase,
+        lazy("application.use_cases.investment.list_investments.ListInvestmentsUseCase"),  # noqa: E501
         investment_repository=investment_repository,
     )
 
     make_investment_use_case = providers.Factory(
-        MakeInvestmentUseCase,
+        lazy("application.use_cases.investment.make_investment.MakeInvestmentUseCase"),  # noqa: E501
         investment_repository=investment_repository,
         holding_repository=holding_repository,
     )
@@ -397,57 +207,85 @@ class PropertyUseCases(containers.DeclarativeContainer):
     property_repository: providers.Dependency = providers.Dependency()
 
     search_properties_use_case = providers.Factory(
-        SearchPropertiesUseCase,
+        lazy("application.use_cases.property.search_properties.SearchPropertiesUseCase"),  # noqa: E501
         property_repository=property_repository,
     )
 
     create_property_use_case = providers.Factory(
-        CreatePropertyUseCase,
+        lazy("application.use_cases.property.create_property.CreatePropertyUseCase"),  # noqa: E501
         property_repository=property_repository,
     )
 
 
+class MessageUseCases(containers.DeclarativeContainer):
+    """Container for messaging use cases."""
+    message_repository: providers.Dependency = providers.Dependency()
+    user_repository: providers.Dependency = providers.Dependency()
+    notifier: providers.Dependency = providers.Dependency()
+
+    send_message_use_case = providers.Factory(
+        lazy("application.use_cases.message.send_message.SendMessageUseCase"),
+        message_repository=message_repository,
+        user_repository=user_repository,
+        notifier=notifier,
+    )
+
+    get_conversation_use_case = providers.Factory(
+        lazy("application.use_cases.message.get_conversation.GetConversationUseCase"),  # noqa: E501
+        message_repository=message_repository,
+        user_repository=user_repository,
+    )
+
+    get_user_conversations_use_case = providers.Factory(
+        lazy("application.use_cases.message.get_user_conversations.GetUserConversationsUseCase"),  # noqa: E501
+        message_repository=message_repository,
+        user_repository=user_repository,
+    )
+
+    mark_messages_read_use_case = providers.Factory(
+        lazy("application.use_cases.message.mark_messages_read.MarkMessagesReadUseCase"),  # noqa: E501
+        message_repository=message_repository,
+        notifier=notifier,
+    )
+
+    get_message_stats_use_case = providers.Factory(
+        lazy("application.use_cases.message.get_message_stats.GetMessageStatsUseCase"),  # noqa: E501
+        message_repository=message_repository,
+    )
+
+
 class AppContainer(containers.DeclarativeContainer):
     """DI container for repositories, services, and use cases."""
-    wiring_config = containers.WiringConfiguration(
-        modules=[
-            "api.v1.bnb.routes",
-            "api.v1.bnb.listing_routes",
-            "api.v1.bnb.booking_routes",
-            "api.v1.tours.routes",
-            "api.v1.tours.tour_routes",
-            "api.v1.tours.booking_routes",
-            "api.v1.cars.routes",
-            "api.v1.bundle.routes",
-            "api.v1.property_listing.public_routes",
-            "api.v1.property_listing.admin_routes",
-            "api.v1.investment_platform.public_routes",
-            "api.v1.investment_platform.user_routes",
-            "api.v1.shared.user_routes",
-            "api.v1.shared.auth_routes",
-            "api.v1.reviews.routes",
-            "api.v1.payments.routes",
-        ]
-    )
-
-    # Database - Factory approach with proper session management
-    @staticmethod
-    def create_managed_session():
-        """Create a session that will be properly managed."""
-        return AsyncSessionLocal()
-
-    db_session_factory = providers.Factory(create_managed_session)
+    # Wiring follows the enabled domains; see api.domains.register_domains
+
+    # Database - repositories share the current unit of work's session, so a
+    # request checks out one connection and commits once
+    db_session_factory = providers.Factory(current_session)
 
     # Services
     password_service: providers.Factory[PasswordService] = providers.Factory(
         BcryptPasswordService
     )
 
-    # OAuth Providers
-    from infrastructure.external_services.oauth.google_oauth import (  # type: ignore  # noqa: E402, E501
-        GoogleOAuthService,
+    # Realtime messaging: one hub per worker; swap the broker to share
+    # events between workers
+    message_broker = providers.Singleton(InMemoryMessageBroker)
+
+    message_hub: providers.Singleton[MessageHub] = providers.Singleton(
+        MessageHub,
+        broker=message_broker,
+        queue_size=settings.MESSAGE_WS_QUEUE_SIZE,
     )
 
+    # Audit entries are batched by one writer per worker
+    audit_log_writer: providers.Singleton[AuditLogWriter] = providers.Singleton(
+        AuditLogWriter,
+        queue_size=settings.AUDIT_LOG_QUEUE_SIZE,
+        batch_size=settings.AUDIT_LOG_BATCH_SIZE,
+        flush_interval=settings.AUDIT_LOG_FLUSH_SECONDS,
+    )
+
+    # OAuth Providers
     GOOGLE_CLIENT_ID = settings.GOOGLE_CLIENT_ID or ""
     GOOGLE_CLIENT_SECRET = settings.GOOGLE_CLIENT_SECRET or ""
     GOOGLE_REDIRECT_URI = (
@@ -456,7 +294,7 @@ class AppContainer(containers.DeclarativeContainer):
     )
 
     google_oauth_service = providers.Singleton(
-        GoogleOAuthService,
+        lazy("infrastructure.external_services.oauth.google_oauth.GoogleOAuthService"),  # noqa: E501
         client_id=GOOGLE_CLIENT_ID,
         client_secret=GOOGLE_CLIENT_SECRET,
         default_redirect_uri=GOOGLE_REDIRECT_URI,
@@ -464,13 +302,6 @@ class AppContainer(containers.DeclarativeContainer):
 
     # Payment Services
     # Note: defaults are for local dev only; use env in production
-    from infrastructure.external_services.payment.stripe_service import (  # type: ignore  # noqa: E402, E501
-        StripePaymentService,
-    )
-    from infrastructure.external_services.payment.mpesa_service import (  # type: ignore  # noqa: E402, E501
-        MpesaPaymentService,
-    )
-
     STRIPE_API_KEY = os.getenv(
         "STRIPE_API_KEY",
         "sk_test_mock_key",
@@ -484,41 +315,70 @@ class AppContainer(containers.DeclarativeContainer):
         "mock_secret",
     )  # nosec B105
     M_PESA_SHORTCODE = os.getenv("MPESA_SHORTCODE", "174379")
+    # No default: webhooks are rejected until the real secrets are set
+    STRIPE_WEBHOOK_SECRET = os.getenv("STRIPE_WEBHOOK_SECRET", "")
+    M_PESA_CALLBACK_TOKEN = os.getenv("MPESA_CALLBACK_TOKEN", "")
+    M_PESA_PASSKEY = os.getenv("MPESA_PASSKEY", "")
+    M_PESA_CALLBACK_URL = os.getenv("MPESA_CALLBACK_URL", "")
+    M_PESA_BASE_URL = os.getenv(
+        "MPESA_BASE_URL",
+        "https://sandbox.safaricom.co.ke",
+    )
+    # Placeholder responses are used unless live provider calls are enabled
+    PAYMENT_PROVIDERS_LIVE = os.getenv("PAYMENT_PROVIDERS_LIVE") == "1"
+
+    # One pooled keep-alive client per provider host; closed on app shutdown
+    stripe_http_client = providers.Singleton(
+        create_http_client,
+        base_url="https://api.stripe.com",
+    )
+
+    mpesa_http_client = providers.Singleton(
+        create_http_client,
+        base_url=M_PESA_BASE_URL,
+        max_connections=10,
+    )
 
     stripe_service = providers.Singleton(
-        StripePaymentService,
+        lazy("infrastructure.external_services.payment.stripe_service.StripePaymentService"),  # noqa: E501
         api_key=STRIPE_API_KEY,
+        webhook_secret=STRIPE_WEBHOOK_SECRET,
+        http_client=stripe_http_client if PAYMENT_PROVIDERS_LIVE else None,
     )
 
     mpesa_service = providers.Singleton(
-        MpesaPaymentService,
+        lazy("infrastructure.external_services.payment.mpesa_service.MpesaPaymentService"),  # noqa: E501
         consumer_key=M_PESA_CONSUMER_KEY,
         consumer_secret=M_PESA_CONSUMER_SECRET,
         shortcode=M_PESA_SHORTCODE,
+        callback_token=M_PESA_CALLBACK_TOKEN,
+        passkey=M_PESA_PASSKEY,
+        callback_url=M_PESA_CALLBACK_URL,
+        http_client=mpesa_http_client if PAYMENT_PROVIDERS_LIVE else None,
     )
 
     # BNB Repositories
     bnb_repository: providers.Factory[BnbRepository]
     bnb_repository = providers.Factory(
-        SqlAlchemyBnbRepository,
+        lazy("infrastructure.database.repositories.bnb.SqlAlchemyBnbRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     booking_repository: providers.Factory[BookingRepository]
     booking_repository = providers.Factory(
-        SqlAlchemyBookingRepository,
+        lazy("infrastructure.database.repositories.bnb.SqlAlchemyBookingRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     # Tour Repositories
     tour_repository: providers.Factory[TourRepository] = providers.Factory(
-        SqlAlchemyTourRepository,
+        lazy("infrastructure.database.repositories.tours.SqlAlchemyTourRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     tour_booking_repository: providers.Factory[TourBookingRepository]
     tour_booking_repository = providers.Factory(
-        SqlAlchemyTourBookingRepository,
+        lazy("infrastructure.database.repositories.tours.SqlAlchemyTourBookingRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
@@ -526,34 +386,34 @@ class AppContainer(containers.DeclarativeContainer):
     from domain.repositories.tours import TourAvailabilityRepository  # type: ignore  # noqa: E402, E501
     tour_availability_repository: providers.Factory[TourAvailabilityRepository]
     tour_availability_repository = providers.Factory(
-        SqlAlchemyTourAvailabilityRepository,
+        lazy("infrastructure.database.repositories.tours.SqlAlchemyTourAvailabilityRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     # Car Repositories
     vehicle_repository: providers.Factory[VehicleRepository]
     vehicle_repository = providers.Factory(
-        SqlAlchemyVehicleRepository,
+        lazy("infrastructure.database.repositories.cars.SqlAlchemyVehicleRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     car_rental_repository: providers.Factory[CarRentalRepository]
     car_rental_repository = providers.Factory(
-        SqlAlchemyCarRentalRepository,
+        lazy("infrastructure.database.repositories.cars.SqlAlchemyCarRentalRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     # Property Repository
     property_repository: providers.Factory[PropertyRepository]
     property_repository = providers.Factory(
-        SqlAlchemyPropertyRepository,
+        lazy("infrastructure.database.repositories.property.SqlAlchemyPropertyRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     # Investment Repositories
     investment_repository: providers.Factory[InvestmentRepository]
     investment_repository = providers.Factory(
-        SqlAlchemyInvestmentRepository,
+        lazy("infrastructure.database.repositories.investment.SqlAlchemyInvestmentRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
@@ -561,254 +421,281 @@ class AppContainer(containers.DeclarativeContainer):
         InvestmentHoldingRepository
     ]
     investment_holding_repository = providers.Factory(
-        SqlAlchemyInvestmentHoldingRepository,
+        lazy("infrastructure.database.repositories.investment.SqlAlchemyInvestmentHoldingRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     # User Repository
     user_repository: providers.Factory[UserRepository] = providers.Factory(
-        SqlAlchemyUserRepository,
+        lazy("infrastructure.database.repositories.user.SqlAlchemyUserRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     # Bundle Repository
     bundle_repository: providers.Factory[BundleRepository]
     bundle_repository = providers.Factory(
-        SqlAlchemyBundleRepository,
+        lazy("infrastructure.database.repositories.bundle.SqlAlchemyBundleRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     bundle_booking_repository: providers.Factory[BundleBookingRepository]
     bundle_booking_repository = providers.Factory(
-        SqlAlchemyBundleBookingRepository,
+        lazy("infrastructure.database.repositories.bundle_booking.SqlAlchemyBundleBookingRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     # Payment Repository
     from domain.repositories.payment import (  # type: ignore  # noqa: E402
         PaymentRepository,
-    )
-    from infrastructure.database.repositories.payment import (  # type: ignore  # noqa: E402, E501
-        SqlAlchemyPaymentRepository,
+        PaymentWebhookRepository,
     )
 
     payment_repository: providers.Factory[PaymentRepository]
     payment_repository = providers.Factory(
-        SqlAlchemyPaymentRepository,
+        lazy("infrastructure.database.repositories.payment.SqlAlchemyPaymentRepository"),  # noqa: E501
+        session=db_session_factory,
+    )
+
+    payment_webhook_repository: providers.Factory[PaymentWebhookRepository]
+    payment_webhook_repository = providers.Factory(
+        lazy("infrastructure.database.repositories.payment.SqlAlchemyPaymentWebhookRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     # Review Repository
     review_repository: providers.Factory[ReviewRepository] = providers.Factory(
-        SqlAlchemyReviewRepository,
+        lazy("infrastructure.database.repositories.review.SqlAlchemyReviewRepository"),  # noqa: E501
+        session=db_session_factory,
+    )
+
+    # Message Repository
+    message_repository: providers.Factory[MessageRepository]
+    message_repository = providers.Factory(
+        lazy("infrastructure.database.repositories.message.SqlAlchemyMessageRepository"),  # noqa: E501
+        session=db_session_factory,
+    )
+
+    # Payout Repository
+    payout_repository: providers.Factory[PayoutRepository]
+    payout_repository = providers.Factory(
+        lazy("infrastructure.database.repositories.payout.SqlAlchemyPayoutRepository"),  # noqa: E501
+        session=db_session_factory,
+    )
+
+    # Ledger Repository
+    ledger_repository: providers.Factory[LedgerRepository]
+    ledger_repository = providers.Factory(
+        lazy("infrastructure.database.repositories.ledger.SqlAlchemyLedgerRepository"),  # noqa: E501
         session=db_session_factory,
     )
 
     # BNB Use Cases
     search_listings_use_case = providers.Factory(
-        SearchListingsUseCase,
+        lazy("application.use_cases.bnb.search_listings.SearchListingsUseCase"),  # noqa: E501
         bnb_repository=bnb_repository,
     )
 
     create_booking_use_case = providers.Factory(
-        CreateBookingUseCase,
+        lazy("application.use_cases.bnb.create_booking.CreateBookingUseCase"),
         bnb_repository=bnb_repository,
         booking_repository=booking_repository,
     )
 
     # Additional BnB Use Cases
     create_listing_use_case = providers.Factory(
-        CreateListingUseCase,
+        lazy("application.use_cases.bnb.create_listing.CreateListingUseCase"),
         bnb_repository=bnb_repository,
     )
 
     get_listing_use_case = providers.Factory(
-        GetListingUseCase,
+        lazy("application.use_cases.bnb.get_listing.GetListingUseCase"),
         bnb_repository=bnb_repository,
     )
 
     list_listings_use_case = providers.Factory(
-        ListListingsUseCase,
+        lazy("application.use_cases.bnb.list_listings.ListListingsUseCase"),
         bnb_repository=bnb_repository,
     )
 
     delete_listing_use_case = providers.Factory(
-        DeleteListingUseCase,
+        lazy("application.use_cases.bnb.delete_listing.DeleteListingUseCase"),
         bnb_repository=bnb_repository,
     )
 
     get_host_listings_use_case = providers.Factory(
-        GetHostListingsUseCase,
+        lazy("application.use_cases.bnb.get_host_listings.GetHostListingsUseCase"),  # noqa: E501
         bnb_repository=bnb_repository,
     )
 
     get_booking_use_case = providers.Factory(
-        GetBookingUseCase,
+        lazy("application.use_cases.bnb.get_booking.GetBookingUseCase"),
         booking_repository=booking_repository,
     )
 
     get_user_bookings_use_case = providers.Factory(
-        GetUserBookingsUseCase,
+        lazy("application.use_cases.bnb.get_user_bookings.GetUserBookingsUseCase"),  # noqa: E501
         booking_repository=booking_repository,
     )
 
     cancel_booking_use_case = providers.Factory(
-        CancelBookingUseCase,
+        lazy("application.use_cases.bnb.cancel_booking.CancelBookingUseCase"),
         booking_repository=booking_repository,
     )
 
     get_host_bookings_use_case = providers.Factory(
-        GetHostBookingsUseCase,
+        lazy("application.use_cases.bnb.get_host_bookings.GetHostBookingsUseCase"),  # noqa: E501
         booking_repository=booking_repository,
         bnb_repository=bnb_repository,
     )
 
     approve_booking_use_case = providers.Factory(
-        ApproveBookingUseCase,
+        lazy("application.use_cases.bnb.approve_booking.ApproveBookingUseCase"),  # noqa: E501
         booking_repository=booking_repository,
     )
 
     reject_booking_use_case = providers.Factory(
-        RejectBookingUseCase,
+        lazy("application.use_cases.bnb.reject_booking.RejectBookingUseCase"),
         booking_repository=booking_repository,
     )
 
     # Location-based grouping use cases
     get_listings_grouped_by_location_use_case = providers.Factory(
-        GetListingsGroupedByLocationUseCase,
+        lazy("application.use_cases.bnb.get_listings_grouped_by_location.GetListingsGroupedByLocationUseCase"),  # noqa: E501
         bnb_repository=bnb_repository,
     )
 
     get_listings_by_location_use_case = providers.Factory(
-        GetListingsByLocationUseCase,
+        lazy("application.use_cases.bnb.get_listings_by_location.GetListingsByLocationUseCase"),  # noqa: E501
         bnb_repository=bnb_repository,
     )
 
     # Tour Use Cases
     search_tours_use_case = providers.Factory(
-        SearchToursUseCase,
+        lazy("application.use_cases.tours.search_tours.SearchToursUseCase"),
         tour_repository=tour_repository,
     )
 
     create_tour_booking_use_case = providers.Factory(
-        CreateTourBookingUseCase,
+        lazy("application.use_cases.tours.create_tour_booking.CreateTourBookingUseCase"),  # noqa: E501
         tour_repository=tour_repository,
         tour_booking_repository=tour_booking_repository,
     )
 
     get_tour_booking_use_case = providers.Factory(
-        GetTourBookingUseCase,
+        lazy("application.use_cases.tours.get_tour_booking.GetTourBookingUseCase"),  # noqa: E501
         tour_booking_repository=tour_booking_repository,
     )
 
     get_user_tour_bookings_use_case = providers.Factory(
-        GetUserTourBookingsUseCase,
+        lazy("application.use_cases.tours.get_user_tour_bookings.GetUserTourBookingsUseCase"),  # noqa: E501
         tour_booking_repository=tour_booking_repository,
     )
 
     get_operator_tour_bookings_use_case = providers.Factory(
-        GetOperatorTourBookingsUseCase,
+        lazy("application.use_cases.tours.get_operator_tour_bookings.GetOperatorTourBookingsUseCase"),  # noqa: E501
         booking_repository=tour_booking_repository,
         tour_repository=tour_repository,
     )
 
     modify_tour_booking_use_case = providers.Factory(
-        ModifyTourBookingUseCase,
+        lazy("application.use_cases.tours.modify_tour_booking.ModifyTourBookingUseCase"),  # noqa: E501
         tour_booking_repository=tour_booking_repository,
         tour_repository=tour_repository,
     )
 
     cancel_tour_booking_use_case = providers.Factory(
-        CancelTourBookingUseCase,
+        lazy("application.use_cases.tours.cancel_tour_booking.CancelTourBookingUseCase"),  # noqa: E501
         tour_booking_repository=tour_booking_repository,
     )
 
     confirm_tour_booking_use_case = providers.Factory(
-        ConfirmTourBookingUseCase,
+        lazy("application.use_cases.tours.confirm_tour_booking.ConfirmTourBookingUseCase"),  # noqa: E501
         tour_booking_repository=tour_booking_repository,
     )
 
     complete_tour_booking_use_case = providers.Factory(
-        CompleteTourBookingUseCase,
+        lazy("application.use_cases.tours.complete_tour_booking.CompleteTourBookingUseCase"),  # noqa: E501
         tour_booking_repository=tour_booking_repository,
+        tour_repository=tour_repository,
+        ledger_repository=ledger_repository,
     )
 
     # Additional Tour Use Cases
     create_tour_use_case = providers.Factory(
-        CreateTourUseCase,
+        lazy("application.use_cases.tours.create_tour.CreateTourUseCase"),
         tour_repository=tour_repository,
     )
 
     get_tour_use_case = providers.Factory(
-        GetTourUseCase,
+        lazy("application.use_cases.tours.get_tour.GetTourUseCase"),
         tour_repository=tour_repository,
     )
 
     list_tours_use_case = providers.Factory(
-        ListToursUseCase,
+        lazy("application.use_cases.tours.list_tours.ListToursUseCase"),
         tour_repository=tour_repository,
     )
 
     delete_tour_use_case = providers.Factory(
-        DeleteTourUseCase,
+        lazy("application.use_cases.tours.delete_tour.DeleteTourUseCase"),
         tour_repository=tour_repository,
     )
 
     update_tour_availability_use_case = providers.Factory(
-        UpdateTourAvailabilityUseCase,
+        lazy("application.use_cases.tours.update_tour_availability.UpdateTourAvailabilityUseCase"),  # noqa: E501
         tour_repository=tour_repository,
         availability_repository=tour_availability_repository,
     )
 
     update_tour_pricing_use_case = providers.Factory(
-        UpdateTourPricingUseCase,
+        lazy("application.use_cases.tours.update_tour_pricing.UpdateTourPricingUseCase"),  # noqa: E501
         tour_repository=tour_repository,
     )
 
     # Car Use Cases
     search_vehicles_use_case = providers.Factory(
-        SearchVehiclesUseCase,
+        lazy("application.use_cases.cars.search_vehicles.SearchVehiclesUseCase"),  # noqa: E501
         vehicle_repository=vehicle_repository,
     )
 
     create_rental_use_case = providers.Factory(
-        CreateRentalUseCase,
+        lazy("application.use_cases.cars.create_rental.CreateRentalUseCase"),
         vehicle_repository=vehicle_repository,
         car_rental_repository=car_rental_repository,
     )
 
     create_vehicle_use_case = providers.Factory(
-        CreateVehicleUseCase,
+        lazy("application.use_cases.cars.create_vehicle.CreateVehicleUseCase"),
         vehicle_repository=vehicle_repository,
     )
 
     list_vehicles_use_case = providers.Factory(
-        ListVehiclesUseCase,
+        lazy("application.use_cases.cars.list_vehicles.ListVehiclesUseCase"),
         vehicle_repository=vehicle_repository,
     )
 
     get_vehicle_use_case = providers.Factory(
-        GetVehicleUseCase,
+        lazy("application.use_cases.cars.get_vehicle.GetVehicleUseCase"),
         vehicle_repository=vehicle_repository,
     )
 
     delete_vehicle_use_case = providers.Factory(
-        DeleteVehicleUseCase,
+        lazy("application.use_cases.cars.delete_vehicle.DeleteVehicleUseCase"),
         vehicle_repository=vehicle_repository,
     )
 
     get_rental_use_case = providers.Factory(
-        GetRentalUseCase,
+        lazy("application.use_cases.cars.get_rental.GetRentalUseCase"),
         car_rental_repository=car_rental_repository,
     )
 
     list_rentals_use_case = providers.Factory(
-        ListRentalsUseCase,
+        lazy("application.use_cases.cars.list_rentals.ListRentalsUseCase"),
         car_rental_repository=car_rental_repository,
     )
 
     check_availability_use_case = providers.Factory(
-        CheckAvailabilityUseCase,
+        lazy("application.use_cases.cars.check_availability.CheckAvailabilityUseCase"),  # noqa: E501
         vehicle_repository=vehicle_repository,
         car_rental_repository=car_rental_repository,
     )
@@ -851,97 +738,127 @@ class AppContainer(containers.DeclarativeContainer):
         bnb_repo=bnb_repository,
     )
 
-    # Payment Use Cases
-    from application.use_cases.payment.create_payment_intent import (  # type: ignore  # noqa: E402, E501
-        CreatePaymentIntentUseCase,
-    )
-    from application.use_cases.payment.get_payment_status import (  # type: ignore  # noqa: E402, E501
-        GetPaymentStatusUseCase,
-    )
-    from application.use_cases.payment.get_booking_payments import (  # type: ignore  # noqa: E402, E501
-        GetBookingPaymentsUseCase,
+    # Message Use Cases
+    message_use_cases = providers.Container(
+        MessageUseCases,
+        message_repository=message_repository,
+        user_repository=user_repository,
+        notifier=message_hub,
     )
 
+    # Payment Use Cases
     create_payment_intent_use_case = providers.Factory(
-        CreatePaymentIntentUseCase,
+        lazy("application.use_cases.payment.create_payment_intent.CreatePaymentIntentUseCase"),  # noqa: E501
         payment_repository=payment_repository,
         stripe_service=stripe_service,
         mpesa_service=mpesa_service,
     )
 
     get_payment_status_use_case = providers.Factory(
-        GetPaymentStatusUseCase,
+        lazy("application.use_cases.payment.get_payment_status.GetPaymentStatusUseCase"),  # noqa: E501
         payment_repository=payment_repository,
     )
 
     get_booking_payments_use_case = providers.Factory(
-        GetBookingPaymentsUseCase,
+        lazy("application.use_cases.payment.get_booking_payments.GetBookingPaymentsUseCase"),  # noqa: E501
         payment_repository=payment_repository,
     )
 
+    receive_payment_webhook_use_case = providers.Factory(
+        lazy("application.use_cases.payment.receive_payment_webhook.ReceivePaymentWebhookUseCase"),  # noqa: E501
+        webhook_repository=payment_webhook_repository,
+        stripe_service=stripe_service,
+        mpesa_service=mpesa_service,
+    )
+
+    reconcile_pending_payments_use_case = providers.Factory(
+        lazy("application.use_cases.payment.reconcile_payments.ReconcilePendingPaymentsUseCase"),  # noqa: E501
+        # A factory: each page opens its own unit of work
+        payment_repository=payment_repository.provider,
+        stripe_service=stripe_service,
+        mpesa_service=mpesa_service,
+    )
+
+    # Payout Use Cases
+    schedule_payouts_use_case = providers.Factory(
+        lazy("application.use_cases.payout.schedule_payouts.SchedulePayoutsUseCase"),  # noqa: E501
+        payout_repository=payout_repository,
+        hold_days=settings.PAYOUT_HOLD_DAYS,
+    )
+
+    get_payout_balance_use_case = providers.Factory(
+        lazy("application.use_cases.payout.get_payout_balance.GetPayoutBalanceUseCase"),  # noqa: E501
+        ledger_repository=ledger_repository,
+    )
+
+    checkpoint_ledger_use_case = providers.Factory(
+        lazy("application.use_cases.payout.checkpoint_ledger.CheckpointLedgerUseCase"),  # noqa: E501
+        ledger_repository=ledger_repository,
+    )
+
     # Review Use Cases
     create_review_use_case = providers.Factory(
-        CreateReviewUseCase,
+        lazy("application.use_cases.review.create_review.CreateReviewUseCase"),
         review_repository=review_repository,
         user_repository=user_repository,
     )
 
     get_reviews_use_case = providers.Factory(
-        GetReviewsUseCase,
+        lazy("application.use_cases.review.get_reviews.GetReviewsUseCase"),
         review_repository=review_repository,
         user_repository=user_repository,
     )
 
     get_review_stats_use_case = providers.Factory(
-        GetReviewStatsUseCase,
+        lazy("application.use_cases.review.get_review_stats.GetReviewStatsUseCase"),  # noqa: E501
         review_repository=review_repository,
     )
 
     respond_to_review_use_case = providers.Factory(
-        RespondToReviewUseCase,
+        lazy("application.use_cases.review.respond_to_review.RespondToReviewUseCase"),  # noqa: E501
         review_repository=review_repository,
     )
 
     get_user_reviews_use_case = providers.Factory(
-        GetUserReviewsUseCase,
+        lazy("application.use_cases.review.get_user_reviews.GetUserReviewsUseCase"),  # noqa: E501
         review_repository=review_repository,
         user_repository=user_repository,
     )
 
     flag_review_use_case = providers.Factory(
-        FlagReviewUseCase,
+        lazy("application.use_cases.review.flag_review.FlagReviewUseCase"),
         review_repository=review_repository,
     )
 
     delete_review_use_case = providers.Factory(
-        DeleteReviewUseCase,
+        lazy("application.use_cases.review.delete_review.DeleteReviewUseCase"),
         review_repository=review_repository,
         user_repository=user_repository,
     )
 
     # Analytics Use Cases
     host_dashboard_use_case = providers.Factory(
-        HostDashboardUseCase,
+        lazy("application.use_cases.analytics.host_dashboard.HostDashboardUseCase"),  # noqa: E501
         bnb_repository=bnb_repository,
         booking_repository=booking_repository,
         review_repository=review_repository,
     )
 
     host_earnings_use_case = providers.Factory(
-        HostEarningsUseCase,
+        lazy("application.use_cases.analytics.host_earnings.HostEarningsUseCase"),  # noqa: E501
         bnb_repository=bnb_repository,
         booking_repository=booking_repository,
     )
 
     tour_operator_dashboard_use_case = providers.Factory(
-        TourOperatorDashboardUseCase,
+        lazy("application.use_cases.analytics.tour_operator_dashboard.TourOperatorDashboardUseCase"),  # noqa: E501
         tour_repository=tour_repository,
         tour_booking_repository=tour_booking_repository,
         review_repository=review_repository,
     )
 
     tour_operator_earnings_use_case = providers.Factory(
-        TourOperatorEarningsUseCase,
+        lazy("application.use_cases.analytics.tour_operator_earnings.TourOperatorEarningsUseCase"),  # noqa: E501
         tour_repository=tour_repository,
         tour_booking_repository=tour_booking_repository,
     )
@@ -0,0 +1,153 @@
+"""
+Business domains served by the API and the routers behind each one.
+
+A deployment serves the domains named in the ``API_DOMAINS`` setting
+(``all`` by default); required domains are always served. Router modules
+of the other domains are never imported, and only the enabled domains'
+modules are wired into the container, so a process serving one domain
+starts without loading the rest of the codebase.
+"""
+from __future__ import annotations
+
+import importlib
+from dataclasses import dataclass
+from typing import Iterable, List, Sequence, Tuple
+
+from fastapi import FastAPI
+
+from .containers import AppContainer
+
+
+@dataclass(frozen=True)
+class RouterSpec:
+    """Where a router lives and how it is mounted."""
+
+    module: str
+    prefix: str = ""
+    tags: Tuple[str, ...] = ()
+    attribute: str = "router"
+
+
+@dataclass(frozen=True)
+class Domain:
+    """Routers of one business domain and the modules that use ``@inject``."""
+
+    name: str
+    routers: Tuple[RouterSpec, ...]
+    wiring: Tuple[str, ...] = ()
+    required: bool = False
+
+
+# Included in this order; shared first for the auth routes
+DOMAINS: Tuple[Domain, ...] = (
+    Domain(
+        "shared",
+        routers=(RouterSpec("api.v1.shared", prefix="/api/v1"),),
+        wiring=("api.v1.shared.user_routes", "api.v1.shared.auth_routes"),
+        required=True,
+    ),
+    Domain(
+        "property",
+        routers=(RouterSpec("api.v1.property_listing", prefix="/api/v1/property"),),
+        wiring=(
+            "api.v1.property_listing.public_routes",
+            "api.v1.property_listing.admin_routes",
+        ),
+    ),
+    Domain(
+        "investment",
+        routers=(RouterSpec("api.v1.investment_platform", prefix="/api/v1/investment"),),
+        wiring=(
+            "api.v1.investment_platform.public_routes",
+            "api.v1.investment_platform.user_routes",
+        ),
+    ),
+    Domain(
+        "tours",
+        routers=(RouterSpec("api.v1.tours", prefix="/api/v1/tours", tags=("Tours",)),),
+        wiring=("api.v1.tours.routes", "api.v1.tours.tour_routes", "api.v1.tours.booking_routes"),
+    ),
+    Domain(
+        "cars",
+        routers=(RouterSpec("api.v1.cars", prefix="/api/v1/cars", tags=("Cars",)),),
+        wiring=("api.v1.cars.routes",),
+    ),
+    Domain(
+        "bnb",
+        routers=(RouterSpec("api.v1.bnb", prefix="/api/v1/bnb", tags=("BnB",)),),
+        wiring=("api.v1.bnb.routes", "api.v1.bnb.listing_routes", "api.v1.bnb.booking_routes"),
+    ),
+    Domain(
+        "bundles",
+        routers=(RouterSpec("api.v1.bundle.routes", prefix="/api/v1/bundles", tags=("Bundles",)),),
+        wiring=("api.v1.bundle.routes",),
+    ),
+    Domain(
+        "favorites",
+        routers=(RouterSpec("api.v1.favorites", prefix="/api/v1/favorites", tags=("Favorites",)),),
+    ),
+    Domain(
+        "payments",
+        routers=(
+            RouterSpec("api.v1.payments.routes", prefix="/api/v1/payments", tags=("Payments",)),
+            RouterSpec("api.v1.payouts.routes", prefix="/api/v1/payouts", tags=("Payouts",)),
+        ),
+        wiring=("api.v1.payments.routes", "api.v1.payouts.routes"),
+    ),
+    Domain(
+        "search",
+        routers=(RouterSpec("api.v1.search.routes", prefix="/api/v1/search", tags=("Search",)),),
+    ),
+    Domain(
+        "reviews",
+        routers=(RouterSpec("api.v1.reviews.routes", prefix="/api/v1/reviews", tags=("Reviews",)),),
+        wiring=("api.v1.reviews.routes",),
+    ),
+    Domain(
+        "messages",
+        routers=(RouterSpec("api.v1.messages.routes", prefix="/api/v1/messages", tags=("Messages",)),),
+        wiring=("api.v1.messages.routes",),
+    ),
+    Domain(
+        "content",
+        routers=(
+            RouterSpec("api.v1.public.article_routes"),
+            RouterSpec("api.v1.public.sitemap"),
+        ),
+    ),
+    Domain(
+        "account",
+        routers=(
+            RouterSpec("api.v1.notifications_unified"),
+            RouterSpec("api.v1.settings_unified"),
+        ),
+        required=True,
+    ),
+)
+
+
+def enabled_domains(setting: str) -> List[Domain]:
+    """Resolve a comma-separated ``API_DOMAINS`` value, e.g. ``"bnb,search"``."""
+    names = {name.strip() for name in setting.split(",") if name.strip()}
+    if not names or "all" in names:
+        return list(DOMAINS)
+    unknown = names - {domain.name for domain in DOMAINS}
+    if unknown:
+        raise ValueError(
+            f"Unknown API_DOMAINS entries: {', '.join(sorted(unknown))}; "
+            f"expected 'all' or any of {', '.join(domain.name for domain in DOMAINS)}"
+        )
+    return [domain for domain in DOMAINS if domain.required or domain.name in names]
+
+
+def wiring_modules(domains: Iterable[Domain]) -> List[str]:
+    return [module for domain in domains for module in domain.wiring]
+
+
+def register_domains(app: FastAPI, container: AppContainer, domains: Sequence[Domain]) -> None:
+    """Wire the container into *domains* and mount their routers on *app*."""
+    container.wire(modules=wiring_modules(domains))
+    for domain in domains:
+        for spec in domain.routers:
+            router = getattr(importlib.import_module(spec.module), spec.attribute)
+            app.include_router(router, prefix=spec.prefix, tags=list(spec.tags) or None)
@@ -4,12 +4,15 @@ FastAPI Property Listing Platform Backend
 Main application entry point with CORS, middleware, and router configuration.
 """
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Header
+import json
+import logging
+import secrets
 import sys
+from dataclasses import asdict
 from pathlib import Path
 from fastapi.middleware.cors import CORSMiddleware
-from slowapi.errors import RateLimitExceeded
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse
 
 # Ensure 'app' package root (containing 'infrastructure', 'domain', 'application') is importable
 _APP_ROOT = Path(__file__).resolve().parents[1]
@@ -17,17 +20,24 @@ if str(_APP_ROOT) not in sys.path:
     sys.path.insert(0, str(_APP_ROOT))
 
 from infrastructure.config.middleware import (
-    limiter,
-    rate_limit_middleware,
     AuditLoggingMiddleware,
-    rate_limit_exceeded_handler,
+    MetricsMiddleware,
+    RateLimitMiddleware,
+    ResponseCacheMiddleware,
+    UnitOfWorkMiddleware,
 )
+from infrastructure.config.metrics import CONTENT_TYPE, add_stats_gauges, registry
+from infrastructure.config.rate_limit import create_rate_limiter
+from infrastructure.config.response_cache import response_cache
+from infrastructure.config.slow_query import slow_query_log
 
 from infrastructure.config.config import settings
+from infrastructure.config.auth import access_token_denylist, password_executor, principal_cache
+from infrastructure.database.replica import replica_router
 from fastapi.openapi.utils import get_openapi
 
 from .containers import AppContainer
-from .v1.favorites import router as favorites_router
+from .domains import enabled_domains, register_domains
 
 # Create FastAPI application
 app = FastAPI(
@@ -42,13 +52,22 @@ app = FastAPI(
     redirect_slashes=False,  # Disable automatic trailing slash redirects
 )
 
-# Create and wire container
+# Create the container; register_domains wires it into the enabled routers
 container = AppContainer()
-container.wire()  # Wire the container
 app.state.container = container
+domains = enabled_domains(settings.API_DOMAINS)
 
 @app.on_event("shutdown")
 async def shutdown_event():
+    # Close realtime connections before tearing down providers
+    await container.message_hub().stop()
+    # Write out queued audit entries before the engine goes away
+    await container.audit_log_writer().stop()
+    if AppContainer.PAYMENT_PROVIDERS_LIVE:
+        await container.stripe_http_client().aclose()
+        await container.mpesa_http_client().aclose()
+    password_executor.shutdown(wait=False)
+
     # Fix: Check if shutdown_resources exists and is awaitable
     if hasattr(container, 'shutdown_resources') and callable(container.shutdown_resources):
         try:
@@ -63,8 +82,11 @@ async def shutdown_event():
         if hasattr(container, 'unwire'):
             container.unwire()
 
-# Always generate a fresh OpenAPI schema (avoids stale cached schemas in long-running dev sessions)
-def _fresh_openapi():  # pragma: no cover
+logger = logging.getLogger(__name__)
+
+
+def build_openapi() -> dict:
+    """Generate the OpenAPI schema from the registered routes."""
     return get_openapi(
         title=app.title,
         version=app.version,
@@ -72,30 +94,40 @@ def _fresh_openapi():  # pragma: no cover
         routes=app.routes,
     )
 
-app.openapi = _fresh_openapi  # type: ignore[assignment]
 
-# Rate limiting setup
-app.state.limiter = limiter
-app.add_exception_handler(Exception, rate_limit_exceeded_handler)  # type: ignore[arg-type]
+def _load_prebuilt_openapi() -> dict | None:
+    path = settings.OPENAPI_SCHEMA_PATH
+    if not path:
+        return None
+    try:
+        with open(path, encoding="utf-8") as schema_file:
+            return json.load(schema_file)
+    except (OSError, ValueError):
+        logger.warning("Prebuilt OpenAPI schema %s unusable; generating it instead", path, exc_info=True)
+        return None
 
-# Configure CORS
-allowlist = [o.strip() for o in settings.CORS_ALLOW_ORIGINS.split(",") if o.strip()]
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=allowlist or ["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+
+def _cached_openapi() -> dict:  # pragma: no cover
+    # Walking every route costs hundreds of milliseconds; do it once per process
+    if app.openapi_schema is None:
+        app.openapi_schema = _load_prebuilt_openapi() or build_openapi()
+    return app.openapi_schema
+
+
+# OPENAPI_REGENERATE keeps the schema in step with code reloads during development
+app.openapi = build_openapi if settings.OPENAPI_REGENERATE else _cached_openapi  # type: ignore[assignment]
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
+    """Health check endpoint, including read replica lag when configured"""
+    replica = await replica_router.health()
+    degraded = replica["configured"] and not replica["healthy"]
     return JSONResponse(
         content={
-            "status": "healthy",
-            "message": "Buckler Investment Group API is running"
+            "status": "degraded" if degraded else "healthy",
+            "message": "Buckler Investment Group API is running",
+            "database": {"replica": replica},
         }
     )
 
@@ -113,67 +145,62 @@ async def root():
         }
     )
 
-# Import new business-focused router structure
-from .v1.property_listing import router as property_router
-from .v1.investment_platform import router as investment_router
-from .v1.shared import router as shared_router
-
-# Import additional business routers
-from .v1.tours import router as tours_router
-from .v1.cars import router as cars_router
-from .v1.bnb import router as bnb_router
-from .v1.bundle.routes import router as bundle_router
-
-# Import remaining routers that are already well-organized
-from .v1.public.article_routes import router as public_article_router
-from .v1.public.sitemap import router as sitemap_router
-from .v1.notifications_unified import router as notifications_router
-from .v1.settings_unified import router as settings_router
-
-# Import payment and payout routers
-from .v1.payments.routes import router as payments_router
-from .v1.payouts.routes import router as payouts_router
-
-# Import search router
-from .v1.search.routes import router as search_router
+# Prometheus scrape target; closed to everyone until METRICS_TOKEN is set
+if settings.METRICS_ENABLED:
+    if not settings.METRICS_TOKEN:
+        logger.warning("METRICS_TOKEN is not set; /metrics will reject every request")
 
-# Import reviews router
-from .v1.reviews.routes import router as reviews_router
+    @app.get("/metrics", include_in_schema=False)
+    async def metrics(authorization: str | None = Header(None)):
+        if not settings.METRICS_TOKEN or not secrets.compare_digest(
+            authorization or "", f"Bearer {settings.METRICS_TOKEN}"
+        ):
+            return PlainTextResponse("Unauthorized", status_code=401)
+        return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
 
-# Include business domain routers
-# Shared router first for auth routes, then specific domain routers
-app.include_router(shared_router, prefix="/api/v1")
-app.include_router(property_router, prefix="/api/v1/property")
-app.include_router(investment_router, prefix="/api/v1/investment")
-
-# Include additional business routers
-app.include_router(tours_router, prefix="/api/v1/tours", tags=["Tours"])
-app.include_router(cars_router, prefix="/api/v1/cars", tags=["Cars"])
-app.include_router(bnb_router, prefix="/api/v1/bnb", tags=["BnB"])
-app.include_router(bundle_router, prefix="/api/v1/bundles", tags=["Bundles"])
-
-# Include favorites router
-app.include_router(favorites_router, prefix="/api/v1/favorites", tags=["Favorites"])
-
-# Include payment and payout routers
-app.include_router(payments_router, prefix="/api/v1/payments", tags=["Payments"]) 
-app.include_router(payouts_router, prefix="/api/v1/payouts", tags=["Payouts"]) 
-
-# Include search router
-app.include_router(search_router, prefix="/api/v1/search", tags=["Search"])
-
-# Include reviews router
-app.include_router(reviews_router, prefix="/api/v1/reviews", tags=["Reviews"])
-
-# Include remaining standalone routers
-app.include_router(public_article_router)
-app.include_router(notifications_router)
-app.include_router(settings_router)
-app.include_router(sitemap_router)
+# Mount the routers of the domains this deployment serves
+register_domains(app, container, domains)
 
 # Add middlewares (order matters)
-app.add_middleware(rate_limit_middleware)
-app.add_middleware(AuditLoggingMiddleware, critical_paths={"/api/v1/admin", "/api/v1/auth"})
+# Innermost, so the request's session is committed before the response leaves
+app.add_middleware(UnitOfWorkMiddleware)
+# Outside the unit of work, so only committed data is cached
+if settings.RESPONSE_CACHE_ENABLED:
+    app.add_middleware(ResponseCacheMiddleware, cache=response_cache)
+if settings.RATE_LIMIT_ENABLED:
+    rate_limiter = create_rate_limiter()
+    app.add_middleware(RateLimitMiddleware, limiter=rate_limiter)
+    add_stats_gauges("rate_limiter_stats", "Requests rejected by the rate limiter",
+                     lambda: {"limited": rate_limiter.limited})
+app.add_middleware(
+    AuditLoggingMiddleware,
+    writer=container.audit_log_writer(),
+    critical_paths={"/api/v1/admin", "/api/v1/auth"},
+)
+# Outside the response cache, so CORS headers are computed for each request's
+# Origin (cached and 304 replies included) and never stored
+allowlist = [o.strip() for o in settings.CORS_ALLOW_ORIGINS.split(",") if o.strip()]
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=allowlist or ["*"],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+# Outermost, so the timings include every other middleware
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
+# Component counters sampled on each scrape
+add_stats_gauges("password_executor_stats", "Password hashing pool", lambda: asdict(password_executor.stats()))
+add_stats_gauges("audit_log_writer_stats", "Batched audit log writer",
+                 lambda: asdict(container.audit_log_writer().stats()))
+add_stats_gauges("principal_cache_stats", "Authenticated principal cache",
+                 lambda: {"hits": principal_cache.hits, "misses": principal_cache.misses})
+add_stats_gauges("access_token_denylist_stats", "Revoked access token checks",
+                 lambda: {"checks": access_token_denylist.checks, "filter_hits": access_token_denylist.filter_hits})
+add_stats_gauges("response_cache_stats", "Public response cache", response_cache.stats)
+add_stats_gauges("slow_query_log_stats", "Slow SQL statements and captured plans", slow_query_log.stats)
 
 # Start background scheduler only when explicitly enabled (avoid serverless runtimes like Vercel)
 import os
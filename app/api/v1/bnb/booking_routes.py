@@ -3,6 +3,7 @@ from dependency_injector.wiring import inject, Provide
 from typing import List
 
 from ...containers import AppContainer
+from infrastructure.config.dependencies import use_read_replica
 from application.use_cases.bnb.create_booking import CreateBookingUseCase
 from application.use_cases.bnb.get_booking import GetBookingUseCase
 from application.use_cases.bnb.get_user_bookings import GetUserBookingsUseCase
@@ -204,7 +205,7 @@ async def get_user_conversations(
     return []
 
 # Host dashboard & analytics
-@router.get("/host/dashboard", response_model=dict)
+@router.get("/host/dashboard", response_model=dict, dependencies=[Depends(use_read_replica)])
 @inject
 async def get_host_dashboard(
     # TODO: Get host_id from authentication context
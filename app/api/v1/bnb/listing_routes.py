@@ -3,6 +3,8 @@ from dependency_injector.wiring import inject, Provide
 from typing import List, Optional
 
 from ...containers import AppContainer
+from infrastructure.config.dependencies import use_read_replica
+from infrastructure.config.response_cache import cache_response, invalidate_cached
 from application.use_cases.bnb.search_listings import SearchListingsUseCase
 from application.use_cases.bnb.create_listing import CreateListingUseCase
 from application.use_cases.bnb.get_listing import GetListingUseCase
@@ -26,7 +28,7 @@ from shared.exceptions.bnb import ListingNotFoundError
 router = APIRouter()
 
 # Search endpoints
-@router.post("/search", response_model=List[ListingResponse])
+@router.post("/search", response_model=List[ListingResponse], dependencies=[Depends(use_read_replica)])
 @inject
 async def search_listings(
     request: SearchListingsRequest,
@@ -36,7 +38,7 @@ async def search_listings(
     return await search_use_case.execute(request)
 
 # Public listing endpoints
-@router.get("/listings", response_model=List[StListingRead])
+@router.get("/listings", response_model=List[StListingRead], dependencies=[Depends(use_read_replica)])
 @inject
 async def list_listings(
     limit: int = Query(20, ge=1, le=100),
@@ -47,7 +49,8 @@ async def list_listings(
     return await use_case.execute(limit=limit, offset=offset)
 
 # Location-based grouping endpoints (Airbnb-style)
-@router.get("/listings/grouped-by-location", response_model=LocationGroupedListingsResponse)
+@router.get("/listings/grouped-by-location", response_model=LocationGroupedListingsResponse, dependencies=[Depends(use_read_replica)])
+@cache_response("bnb_listings", ttl=60)
 @inject
 async def get_listings_grouped_by_location(
     limit_per_group: int = Query(4, ge=1, le=10, description="Listings per location group"),
@@ -57,7 +60,7 @@ async def get_listings_grouped_by_location(
     """Get listings grouped by location for homepage display (Airbnb-style)"""
     return await use_case.execute(limit_per_group=limit_per_group, max_groups=max_groups)
 
-@router.get("/listings/by-county/{county}", response_model=List[StListingRead])
+@router.get("/listings/by-county/{county}", response_model=List[StListingRead], dependencies=[Depends(use_read_replica)])
 @inject
 async def get_listings_by_county(
     county: str,
@@ -68,7 +71,7 @@ async def get_listings_by_county(
     """Get listings filtered by county (e.g., 'Mombasa', 'Nairobi')"""
     return await use_case.execute(county=county, limit=limit, offset=offset)
 
-@router.get("/listings/by-town/{town}", response_model=List[StListingRead])
+@router.get("/listings/by-town/{town}", response_model=List[StListingRead], dependencies=[Depends(use_read_replica)])
 @inject
 async def get_listings_by_town(
     town: str,
@@ -81,7 +84,7 @@ async def get_listings_by_town(
     return await use_case.execute(county=county, town=town, limit=limit, offset=offset)
 
 # Place static routes BEFORE dynamic parameterized routes to avoid path conflicts
-@router.get("/listings/featured", response_model=List[StListingRead])
+@router.get("/listings/featured", response_model=List[StListingRead], dependencies=[Depends(use_read_replica)])
 @inject
 async def get_featured_listings(
     limit: int = Query(10, ge=1, le=50),
@@ -91,7 +94,7 @@ async def get_featured_listings(
     # TODO: Implement featured logic in use case (e.g., high ratings, promoted)
     return await use_case.execute(limit=limit, offset=0)
 
-@router.get("/listings/nearby", response_model=List[StListingRead])
+@router.get("/listings/nearby", response_model=List[StListingRead], dependencies=[Depends(use_read_replica)])
 @inject
 async def get_nearby_listings(
     latitude: float = Query(..., ge=-90, le=90),
@@ -104,7 +107,8 @@ async def get_nearby_listings(
     # TODO: Implement geospatial search logic in use case
     return await use_case.execute(limit=limit, offset=0)
 
-@router.get("/listings/{listing_id}", response_model=StListingRead)
+@router.get("/listings/{listing_id}", response_model=StListingRead, dependencies=[Depends(use_read_replica)])
+@cache_response("bnb_listings", ttl=60)
 @inject
 async def get_listing_details(
     listing_id: int,
@@ -116,7 +120,7 @@ async def get_listing_details(
     except ListingNotFoundError:
         raise HTTPException(status_code=404, detail="Listing not found")
 
-@router.get("/listings/{listing_id}/availability", response_model=List[AvailabilityItem])
+@router.get("/listings/{listing_id}/availability", response_model=List[AvailabilityItem], dependencies=[Depends(use_read_replica)])
 @inject
 async def get_listing_availability(
     listing_id: int,
@@ -169,9 +173,11 @@ async def create_or_update_listing(
 ):
     """Create new listing (id=0) or update existing listing (id>0)"""
     try:
-        return await use_case.execute(request)
+        listing = await use_case.execute(request)
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
+    invalidate_cached("bnb_listings")
+    return listing
 
 @router.get("/listings/{listing_id}/delete", response_model=dict)
 @inject
@@ -182,6 +188,7 @@ async def delete_listing(
     """Delete a listing (using GET as per platform standards)"""
     try:
         await use_case.execute(listing_id)
+        invalidate_cached("bnb_listings")
         return {"ok": True, "listing_id": listing_id}
     except ListingNotFoundError:
         raise HTTPException(status_code=404, detail="Listing not found")
@@ -204,6 +211,7 @@ async def update_listing_availability(
 ):
     """Update availability calendar for a listing"""
     # TODO: Implement availability management use case
+    invalidate_cached("bnb_listings")
     return {"ok": True, "message": "Availability updated", "listing_id": listing_id}
 
 @router.post("/listings/{listing_id}/pricing", response_model=dict)
@@ -214,4 +222,5 @@ async def update_listing_pricing(
 ):
     """Update pricing (seasonal/dynamic) for a listing"""
     # TODO: Implement pricing management use case
+    invalidate_cached("bnb_listings")
     return {"ok": True, "message": "Pricing updated", "listing_id": listing_id}
@@ -7,6 +7,7 @@ from application.dto.bundle_booking import CreateBundleBookingRequestDTO, Bundle
 from application.use_cases.bundle.create_bundle import CreateBundleUseCase
 from application.use_cases.bundle.book_bundle import BookBundleUseCase
 from ...containers import AppContainer
+from infrastructure.config.dependencies import use_read_replica
 from shared.exceptions.bundle import BundledItemNotFoundError, BundleNotFoundError
 
 router = APIRouter()
@@ -24,7 +25,7 @@ async def create_bundle(
     except BundledItemNotFoundError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
-@router.get("/", response_model=List[BundleResponseDTO])
+@router.get("/", response_model=List[BundleResponseDTO], dependencies=[Depends(use_read_replica)])
 async def list_bundles(
     limit: int = Query(20, ge=1, le=100),
     offset: int = Query(0, ge=0),
@@ -58,7 +59,7 @@ async def list_bundles(
         )
     ]
 
-@router.get("/{bundle_id}", response_model=BundleResponseDTO)
+@router.get("/{bundle_id}", response_model=BundleResponseDTO, dependencies=[Depends(use_read_replica)])
 async def get_bundle_details(
     bundle_id: int,
     # TODO: Implement get bundle use case
@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, status, HTTPException, Query
 from dependency_injector.wiring import inject, Provide
 
 from ...containers import AppContainer
+from infrastructure.config.dependencies import use_read_replica
 from application.use_cases.cars.search_vehicles import SearchVehiclesUseCase
 from application.use_cases.cars.create_rental import CreateRentalUseCase
 from application.use_cases.cars.create_vehicle import CreateVehicleUseCase
@@ -27,7 +28,7 @@ from shared.exceptions import VehicleNotFoundError
 
 router = APIRouter()
 
-@router.post("/search", response_model=List[VehicleResponse])
+@router.post("/search", response_model=List[VehicleResponse], dependencies=[Depends(use_read_replica)])
 @inject
 async def search_vehicles(
     request: SearchVehiclesRequest,
@@ -59,7 +60,7 @@ async def create_or_update_vehicle(
     """Create new vehicle (id=0) or update existing vehicle (id>0)"""
     return await use_case.execute(request)
 
-@router.get("/", response_model=List[VehicleResponse])
+@router.get("/", response_model=List[VehicleResponse], dependencies=[Depends(use_read_replica)])
 @inject
 async def list_vehicles(
     owner_id: Optional[int] = Query(None),
@@ -70,7 +71,7 @@ async def list_vehicles(
     """List vehicles with optional filtering by owner"""
     return await use_case.execute(owner_id=owner_id, limit=limit, offset=offset)
 
-@router.get("/{vehicle_id}", response_model=VehicleResponse)
+@router.get("/{vehicle_id}", response_model=VehicleResponse, dependencies=[Depends(use_read_replica)])
 @inject
 async def get_vehicle(
     vehicle_id: int,
@@ -129,7 +130,7 @@ async def list_rentals(
     )
 
 # Availability Checking
-@router.post("/availability", response_model=AvailabilityResponse)
+@router.post("/availability", response_model=AvailabilityResponse, dependencies=[Depends(use_read_replica)])
 @inject
 async def check_availability(
     request: AvailabilityRequest,
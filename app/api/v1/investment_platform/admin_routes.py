@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from infrastructure.config.database import get_async_session
 from infrastructure.config.dependencies import require_admin
+from infrastructure.config.response_cache import invalidate_cached
 from infrastructure.database.models import InvProduct, InvNavSnapshot
 from infrastructure.database.models.user import User
 from application.dto.invest import ProductCU, ProductRead, NavSnapshotRead
@@ -31,6 +32,7 @@ async def create_or_update_product(
         new_product = InvProduct(**payload.model_dump(exclude={"id"}))
         session.add(new_product)
         await session.commit()
+        invalidate_cached("investment_products")
         await session.refresh(new_product)
         return new_product
     
@@ -43,6 +45,7 @@ async def create_or_update_product(
             setattr(product, field, value)
     
     await session.commit()
+    invalidate_cached("investment_products")
     await session.refresh(product)
     return product
 
@@ -59,6 +62,7 @@ async def delete_product(
         raise HTTPException(status_code=404, detail="Product not found")
     await session.delete(product)
     await session.commit()
+    invalidate_cached("investment_products")
     return {"detail": "Product deleted"}
 
 # NAV snapshot management
@@ -14,6 +14,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from dependency_injector.wiring import inject, Provide
 
 from infrastructure.config.database import get_async_session
+from infrastructure.config.dependencies import use_read_replica
+from infrastructure.config.response_cache import cache_response
 from infrastructure.database.models import InvProduct
 from application.dto.invest import ProductRead
 from application.dto.investment import InvestmentResponseDTO
@@ -23,7 +25,8 @@ from api.containers import AppContainer
 router = APIRouter()
 
 # Investment products catalog
-@router.get("/products", response_model=List[ProductRead])
+@router.get("/products", response_model=List[ProductRead], dependencies=[Depends(use_read_replica)])
+@cache_response("investment_products")
 async def list_products(
     active: Optional[bool] = Query(None),
     max_min_invest: Optional[Decimal] = None,
@@ -40,7 +43,8 @@ async def list_products(
     return res.scalars().all()
 
 # Product details
-@router.get("/products/{slug}", response_model=ProductRead)
+@router.get("/products/{slug}", response_model=ProductRead, dependencies=[Depends(use_read_replica)])
+@cache_response("investment_products")
 async def get_product(slug: str, session: AsyncSession = Depends(get_async_session)):
     """Get investment product details by slug."""
     stmt = select(InvProduct).where(InvProduct.slug == slug)
@@ -51,7 +55,7 @@ async def get_product(slug: str, session: AsyncSession = Depends(get_async_sessi
     return product
 
 # General investment opportunities (using use case)
-@router.get("/opportunities", response_model=List[InvestmentResponseDTO])
+@router.get("/opportunities", response_model=List[InvestmentResponseDTO], dependencies=[Depends(use_read_replica)])
 @inject
 async def list_investment_opportunities(
     status: Optional[str] = None,
@@ -0,0 +1 @@
+# Messages module
@@ -0,0 +1,175 @@
+import asyncio
+
+from fastapi import APIRouter, Depends, HTTPException, Query, WebSocket, WebSocketDisconnect, status
+from dependency_injector.wiring import inject, Provide, Provider
+from typing import Callable, List, Optional
+
+from ...containers import AppContainer
+from application.dto.message import (
+    BookingType,
+    MessageCreateDTO,
+    MessageResponseDTO,
+    MessagePageDTO,
+    ConversationThreadDTO,
+    MessageStatsDTO,
+)
+from application.use_cases.message.send_message import SendMessageUseCase
+from application.use_cases.message.get_conversation import GetConversationUseCase
+from application.use_cases.message.get_user_conversations import GetUserConversationsUseCase
+from application.use_cases.message.mark_messages_read import MarkMessagesReadUseCase
+from application.use_cases.message.get_message_stats import GetMessageStatsUseCase
+from infrastructure.config.auth import authenticate_token
+from infrastructure.config.dependencies import current_active_user
+from infrastructure.database.query_budget import query_budget
+from infrastructure.database.unit_of_work import unit_of_work
+from infrastructure.services.message_hub import HubConnection, MessageHub
+from domain.entities.user import User
+from domain.repositories.message import MessageRepository
+
+router = APIRouter()
+
+
+@router.post("/", response_model=MessageResponseDTO)
+@inject
+async def send_message(
+    request: MessageCreateDTO,
+    current_user: User = Depends(current_active_user),
+    use_case: SendMessageUseCase = Depends(Provide[AppContainer.message_use_cases.send_message_use_case]),
+):
+    """Send a message to another participant of a booking"""
+    try:
+        return await use_case.execute(request, current_user.id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/conversations", response_model=List[ConversationThreadDTO])
+@query_budget(5, max_repeats=2)
+@inject
+async def get_conversations(
+    limit: int = Query(50, ge=1, le=100),
+    offset: int = Query(0, ge=0),
+    current_user: User = Depends(current_active_user),
+    use_case: GetUserConversationsUseCase = Depends(Provide[AppContainer.message_use_cases.get_user_conversations_use_case]),
+):
+    """Get the inbox: one summary per conversation thread, most recent first"""
+    return await use_case.execute(current_user.id, limit, offset)
+
+
+@router.get("/conversations/{booking_type}/{booking_id}/{other_user_id}", response_model=MessagePageDTO)
+@query_budget(6, max_repeats=2)
+@inject
+async def get_conversation(
+    booking_type: BookingType,
+    booking_id: int,
+    other_user_id: int,
+    limit: int = Query(50, ge=1, le=100),
+    before: Optional[str] = Query(None, description="Cursor from a previous page's next_cursor"),
+    current_user: User = Depends(current_active_user),
+    use_case: GetConversationUseCase = Depends(Provide[AppContainer.message_use_cases.get_conversation_use_case]),
+):
+    """Get one page of a conversation thread, newest page first"""
+    try:
+        return await use_case.execute(
+            booking_type, booking_id, current_user.id, other_user_id, limit, before
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/conversations/{booking_type}/{booking_id}/{other_user_id}/read", response_model=dict)
+@inject
+async def mark_conversation_read(
+    booking_type: BookingType,
+    booking_id: int,
+    other_user_id: int,
+    up_to_message_id: Optional[int] = Query(None, ge=1),
+    current_user: User = Depends(current_active_user),
+    use_case: MarkMessagesReadUseCase = Depends(Provide[AppContainer.message_use_cases.mark_messages_read_use_case]),
+):
+    """Mark a conversation as read for the current user, optionally only up to a message"""
+    return await use_case.mark_conversation_read(
+        booking_type.value, booking_id, current_user.id, other_user_id, up_to_message_id
+    )
+
+
+@router.post("/{message_id}/read", response_model=dict)
+@inject
+async def mark_message_read(
+    message_id: int,
+    current_user: User = Depends(current_active_user),
+    use_case: MarkMessagesReadUseCase = Depends(Provide[AppContainer.message_use_cases.mark_messages_read_use_case]),
+):
+    """Mark a single message as read"""
+    return await use_case.execute(message_id, current_user.id)
+
+
+@router.get("/stats", response_model=MessageStatsDTO)
+@query_budget(7, max_repeats=2)
+@inject
+async def get_message_stats(
+    current_user: User = Depends(current_active_user),
+    use_case: GetMessageStatsUseCase = Depends(Provide[AppContainer.message_use_cases.get_message_stats_use_case]),
+):
+    """Get message totals, unread count and number of conversations"""
+    return await use_case.execute(current_user.id)
+
+
+async def _watch_client(websocket: WebSocket, connection: HubConnection) -> None:
+    """Read until the client goes away, then end the outbound stream."""
+    try:
+        while True:
+            # Clients may send keep-alive frames; there is nothing to act on
+            await websocket.receive_text()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        connection.close()
+
+
+@router.websocket("/ws")
+@inject
+async def messages_socket(
+    websocket: WebSocket,
+    token: str = Query(..., description="Access token; browsers cannot set headers on WebSockets"),
+    hub: MessageHub = Depends(Provide[AppContainer.message_hub]),
+    message_repository: Callable[[], MessageRepository] = Depends(Provider[AppContainer.message_repository]),
+):
+    """Push new messages, read receipts and unread counts to the current user.
+
+    Events are JSON objects of the form ``{"type": ..., "data": {...}}``. A
+    client that falls too far behind is closed with code 1013 and should
+    reconnect and refresh through the REST endpoints.
+
+    The request middleware gives WebSockets no unit of work, so each
+    database access opens its own and returns the connection to the pool
+    before the socket waits on traffic.
+    """
+    # Same checks as the HTTP routes: signature, denylist, token version, active flag
+    user = await authenticate_token(token)
+    if user is None:
+        await websocket.close(code=status.WS_1008_POLICY_VIOLATION)
+        return
+
+    await websocket.accept()
+    connection = await hub.connect(user.id)
+    watcher = asyncio.create_task(_watch_client(websocket, connection))
+    try:
+        # Initial snapshot so the badge is correct without a REST round-trip
+        async with unit_of_work():
+            unread_count = await message_repository().get_unread_count(user.id)
+        await websocket.send_json({"type": "unread.count", "data": {"unread_count": unread_count}})
+
+        while True:
+            event = await connection.next_event()
+            if event is None:
+                if connection.overflowed:
+                    await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+                break
+            await websocket.send_json(event)
+    except (WebSocketDisconnect, RuntimeError):
+        # RuntimeError: the socket was already closed by the peer
+        pass
+    finally:
+        watcher.cancel()
+        hub.disconnect(connection)
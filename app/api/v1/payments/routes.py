@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Query
 from dependency_injector.wiring import inject, Provide
 from typing import Dict, Any
 
@@ -6,6 +6,7 @@ from ...containers import AppContainer
 from application.use_cases.payment.create_payment_intent import CreatePaymentIntentUseCase
 from application.use_cases.payment.get_payment_status import GetPaymentStatusUseCase
 from application.use_cases.payment.get_booking_payments import GetBookingPaymentsUseCase
+from application.use_cases.payment.receive_payment_webhook import ReceivePaymentWebhookUseCase
 from application.dto.payment import (
     PaymentIntentRequestDTO,
     PaymentIntentResponseDTO,
@@ -15,7 +16,7 @@ from application.dto.payment import (
     RefundResponseDTO,
     WebhookEventDTO,
 )
-from shared.exceptions.payment import PaymentNotFoundError, PaymentProcessingError
+from shared.exceptions.payment import PaymentNotFoundError, PaymentProcessingError, WebhookVerificationError
 
 router = APIRouter()
 
@@ -63,28 +64,39 @@ async def get_payment_status(
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Internal server error: {str(e)}")
 
-@router.post("/webhook", response_model=dict)
-async def payment_webhook(
+# Webhooks only verify and enqueue; the scheduler's payment webhook job
+# applies the status changes in batches.
+@router.post("/webhooks/stripe", response_model=dict)
+@inject
+async def stripe_webhook(
     request: Request,
-    # TODO: Implement webhook processing use case
+    use_case: ReceivePaymentWebhookUseCase = Depends(Provide[AppContainer.receive_payment_webhook_use_case]),
 ):
-    """Handle payment webhooks from payment providers"""
+    """Receive Stripe events"""
+    body = await request.body()
     try:
-        # Get raw body for signature verification
-        body = await request.body()
-        headers = dict(request.headers)
-        
-        # TODO: Implement webhook verification and processing
-        # This should:
-        # 1. Verify webhook signature
-        # 2. Parse webhook data
-        # 3. Update payment status
-        # 4. Trigger booking confirmation if payment successful
-        # 5. Send notifications
-        
-        return {"ok": True, "message": "Webhook processed"}
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Webhook processing failed: {str(e)}")
+        return await use_case.receive_stripe(body, request.headers.get("stripe-signature", ""))
+    except WebhookVerificationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.post("/webhooks/mpesa", response_model=dict)
+@inject
+async def mpesa_webhook(
+    request: Request,
+    token: str = Query("", description="Shared secret embedded in the registered callback URL"),
+    use_case: ReceivePaymentWebhookUseCase = Depends(Provide[AppContainer.receive_payment_webhook_use_case]),
+):
+    """Receive M-Pesa STK push callbacks"""
+    try:
+        payload = await request.json()
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Malformed M-Pesa callback payload")
+    try:
+        await use_case.receive_mpesa(payload, token)
+    except WebhookVerificationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    # Daraja expects this acknowledgement shape
+    return {"ResultCode": 0, "ResultDesc": "Accepted"}
 
 @router.post("/refund", response_model=RefundResponseDTO)
 @inject
@@ -9,7 +9,11 @@ from application.dto.payout import (
     PayoutRequestDTO,
     PayoutResponseDTO,
     PayoutListResponseDTO,
+    PayoutBalanceDTO,
 )
+from application.use_cases.payout.get_payout_balance import GetPayoutBalanceUseCase
+from infrastructure.config.dependencies import current_active_user
+from domain.entities.user import User
 
 router = APIRouter()
 
@@ -105,23 +109,15 @@ async def get_payout_details(
         fee=Decimal("15.00")
     )
 
-@router.get("/balance/current", response_model=dict)
+@router.get("/balance/current", response_model=PayoutBalanceDTO)
+@inject
 async def get_current_balance(
-    # TODO: Get user_id from authentication context
-    user_id: int = Query(1, description="User ID (from auth context)"),
+    currency: str = Query("KES", max_length=3),
+    current_user: User = Depends(current_active_user),
+    use_case: GetPayoutBalanceUseCase = Depends(Provide[AppContainer.get_payout_balance_use_case]),
 ):
     """Get user's current available balance for payout"""
-    # TODO: Implement balance calculation use case
-    return {
-        "user_id": user_id,
-        "available_balance": "2450.00",
-        "pending_balance": "380.00",
-        "total_earnings": "15830.00",
-        "total_payouts": "13000.00",
-        "currency": "KES",
-        "minimum_payout": "100.00",
-        "next_payout_date": "2024-01-25T00:00:00Z"
-    }
+    return await use_case.execute(current_user.id, currency)
 
 @router.get("/methods", response_model=dict)
 async def get_payout_methods():
@@ -18,7 +18,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from infrastructure.config.config import settings
 from infrastructure.config.database import get_async_session
-from infrastructure.config.dependencies import require_admin
+from infrastructure.config.dependencies import require_admin, use_read_replica
+from infrastructure.config.response_cache import cache_response, invalidate_cached
 from infrastructure.database.models import AreaProfile, Developer, Project, Property
 from infrastructure.database.models.user import User
 from application.dto.areas import AreaRead
@@ -33,7 +34,8 @@ from infrastructure.database.models import Property as PropertyModel, PropertySt
 router = APIRouter()
 
 # Areas -----------------------------------------------------------------------
-@router.get("/areas", response_model=List[AreaRead])
+@router.get("/areas", response_model=List[AreaRead], dependencies=[Depends(use_read_replica)])
+@cache_response("catalog")
 async def list_areas(
     q: Optional[str] = Query(None), 
     limit: int = Query(50, ge=1, le=100), 
@@ -47,7 +49,8 @@ async def list_areas(
     res = await session.execute(stmt)
     return res.scalars().all()
 
-@router.get("/areas/{slug}", response_model=AreaRead)
+@router.get("/areas/{slug}", response_model=AreaRead, dependencies=[Depends(use_read_replica)])
+@cache_response("catalog")
 async def get_area(slug: str, session: AsyncSession = Depends(get_async_session)):
     """Get area details by slug."""
     stmt = select(AreaProfile).where(AreaProfile.slug == slug)
@@ -68,6 +71,7 @@ async def create_or_update_area(
         new_area = AreaProfile(**payload.model_dump(exclude={"id"}))
         session.add(new_area)
         await session.commit()
+        invalidate_cached("catalog")
         await session.refresh(new_area)
         return new_area
     
@@ -80,6 +84,7 @@ async def create_or_update_area(
             setattr(area, field, value)
     
     await session.commit()
+    invalidate_cached("catalog")
     await session.refresh(area)
     return area
 
@@ -95,17 +100,20 @@ async def delete_area(
         raise HTTPException(status_code=404, detail="Area not found")
     await session.delete(area)
     await session.commit()
+    invalidate_cached("catalog")
     return {"detail": "Area deleted"}
 
 # Developers ------------------------------------------------------------------
-@router.get("/developers", response_model=List[DeveloperRead])
+@router.get("/developers", response_model=List[DeveloperRead], dependencies=[Depends(use_read_replica)])
+@cache_response("catalog")
 async def list_developers(session: AsyncSession = Depends(get_async_session)):
     """List property developers."""
     stmt = select(Developer).order_by(Developer.name.asc())
     res = await session.execute(stmt)
     return res.scalars().all()
 
-@router.get("/developers/{slug}", response_model=DeveloperRead)
+@router.get("/developers/{slug}", response_model=DeveloperRead, dependencies=[Depends(use_read_replica)])
+@cache_response("catalog")
 async def get_developer(slug: str, session: AsyncSession = Depends(get_async_session)):
     """Get developer details by slug."""
     stmt = select(Developer).where(Developer.slug == slug)
@@ -126,6 +134,7 @@ async def create_or_update_developer(
         new_developer = Developer(**payload.model_dump(exclude={"id"}))
         session.add(new_developer)
         await session.commit()
+        invalidate_cached("catalog")
         await session.refresh(new_developer)
         return new_developer
     
@@ -138,6 +147,7 @@ async def create_or_update_developer(
             setattr(developer, field, value)
     
     await session.commit()
+    invalidate_cached("catalog")
     await session.refresh(developer)
     return developer
 
@@ -153,10 +163,12 @@ async def delete_developer(
         raise HTTPException(status_code=404, detail="Developer not found")
     await session.delete(developer)
     await session.commit()
+    invalidate_cached("catalog")
     return {"detail": "Developer deleted"}
 
 # Projects --------------------------------------------------------------------
-@router.get("/projects", response_model=PaginatedProjects)
+@router.get("/projects", response_model=PaginatedProjects, dependencies=[Depends(use_read_replica)])
+@cache_response("catalog")
 async def list_projects(
     page_size: int = Query(20, ge=1, le=100),
     cursor: Optional[str] = Query(None),
@@ -207,7 +219,8 @@ async def list_projects(
         has_more=has_more,
     )
 
-@router.get("/projects/{slug}", response_model=ProjectRead)
+@router.get("/projects/{slug}", response_model=ProjectRead, dependencies=[Depends(use_read_replica)])
+@cache_response("catalog")
 async def get_project(slug: str, session: AsyncSession = Depends(get_async_session)):
     """Get project details by slug."""
     stmt = select(Project).where(Project.slug == slug)
@@ -228,6 +241,7 @@ async def create_or_update_project(
         new_project = Project(**payload.model_dump(exclude={"id"}))
         session.add(new_project)
         await session.commit()
+        invalidate_cached("catalog")
         await session.refresh(new_project)
         return new_project
     
@@ -240,6 +254,7 @@ async def create_or_update_project(
             setattr(project, field, value)
     
     await session.commit()
+    invalidate_cached("catalog")
     await session.refresh(project)
     return project
 
@@ -255,5 +270,6 @@ async def delete_project(
         raise HTTPException(status_code=404, detail="Project not found")
     await session.delete(project)
     await session.commit()
+    invalidate_cached("catalog")
     return {"detail": "Project deleted"}
 
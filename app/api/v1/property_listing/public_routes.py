@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from dependency_injector.wiring import inject, Provide
 
 from infrastructure.config.database import get_async_session
+from infrastructure.config.dependencies import use_read_replica
 from infrastructure.config.config import settings
 from infrastructure.database.models import Property, PropertyStatus
 from application.dto.property_schemas import (
@@ -33,7 +34,7 @@ from api.containers import AppContainer
 router = APIRouter(redirect_slashes=False)
 
 # Property search using use case pattern
-@router.post("/search")
+@router.post("/search", dependencies=[Depends(use_read_replica)])
 @inject  
 async def search_properties(
     request: dict = Body(...),
@@ -45,7 +46,7 @@ async def search_properties(
     return await use_case.execute(search_dto)
 
 # Public property listings with pagination
-@router.get("/", response_model=PaginatedPropertyResponse)
+@router.get("/", response_model=PaginatedPropertyResponse, dependencies=[Depends(use_read_replica)])
 async def list_properties(
     page_size: int = Query(20, ge=1, le=100),
     cursor: Optional[str] = Query(None),
@@ -148,7 +149,7 @@ async def list_properties(
         raise e
 
 # Property detail
-@router.get("/{property_id}", response_model=PropertyDetailResponse)
+@router.get("/{property_id}", response_model=PropertyDetailResponse, dependencies=[Depends(use_read_replica)])
 async def get_property_detail(property_id: int, session: AsyncSession = Depends(get_async_session)):
     """Get detailed information about a specific property."""
     try:
@@ -185,7 +186,7 @@ async def get_property_detail(property_id: int, session: AsyncSession = Depends(
         raise e
 
 # Recently listed properties
-@router.get("/recently-listed", response_model=PaginatedPropertyResponse)
+@router.get("/recently-listed", response_model=PaginatedPropertyResponse, dependencies=[Depends(use_read_replica)])
 async def recently_listed(
     page_size: int = Query(20, ge=1, le=100), 
     cursor: Optional[str] = Query(None), 
@@ -6,6 +6,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from infrastructure.config.database import get_async_session
+from infrastructure.config.response_cache import cache_response
 from infrastructure.database.models.article import Article
 from application.dto.article import ArticleSummary, ArticleDetail
 
@@ -16,6 +17,7 @@ MAX_PAGE_SIZE = 100
 
 
 @router.get("/", response_model=List[ArticleSummary])
+@cache_response("articles")
 async def list_articles(
     page_size: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
     page: int = Query(1, ge=1),
@@ -35,6 +37,7 @@ async def list_articles(
 
 
 @router.get("/{slug}", response_model=ArticleDetail)
+@cache_response("articles")
 async def get_article_detail(
     slug: str,
     session: AsyncSession = Depends(get_async_session),
@@ -7,13 +7,14 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from infrastructure.config.database import get_async_session
+from infrastructure.config.dependencies import use_read_replica
 from infrastructure.database.models import Property, Project, Article, AreaProfile
 
 
 router = APIRouter(tags=["Sitemap"])
 
 
-@router.get("/sitemap.xml", response_class=Response)
+@router.get("/sitemap.xml", response_class=Response, dependencies=[Depends(use_read_replica)])
 async def sitemap(session: AsyncSession = Depends(get_async_session)):
     urls: list[str] = []
     base = "https://example.com"  # TODO: move to settings
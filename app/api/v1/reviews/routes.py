@@ -3,6 +3,7 @@ from dependency_injector.wiring import inject, Provide
 from typing import List
 
 from ...containers import AppContainer
+from infrastructure.config.dependencies import use_read_replica
 from application.dto.reviews import (
     ReviewCreateDTO,
     ReviewResponseDTO,
@@ -36,7 +37,7 @@ async def create_review(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/{target_type}/{target_id}", response_model=List[ReviewResponseDTO])
+@router.get("/{target_type}/{target_id}", response_model=List[ReviewResponseDTO], dependencies=[Depends(use_read_replica)])
 @inject
 async def get_reviews(
     target_type: ReviewType,
@@ -54,7 +55,7 @@ async def get_reviews(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/{target_type}/{target_id}/stats", response_model=ReviewStatsDTO)
+@router.get("/{target_type}/{target_id}/stats", response_model=ReviewStatsDTO, dependencies=[Depends(use_read_replica)])
 @inject
 async def get_review_stats(
     target_type: ReviewType,
@@ -67,7 +68,7 @@ async def get_review_stats(
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
-@router.get("/review/{review_id}", response_model=ReviewResponseDTO)
+@router.get("/review/{review_id}", response_model=ReviewResponseDTO, dependencies=[Depends(use_read_replica)])
 
 async def get_review_details(
     review_id: int,
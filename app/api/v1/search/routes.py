@@ -2,6 +2,8 @@ from fastapi import APIRouter, Query
 from typing import List, Dict, Any, Optional
 from datetime import date
 
+from infrastructure.config.response_cache import cache_response
+
 router = APIRouter()
 
 @router.post("/all", response_model=Dict[str, Any])
@@ -190,6 +192,7 @@ async def get_trending_searches():
     }
 
 @router.get("/filters", response_model=Dict[str, Any])
+@cache_response("search_filters", ttl=3600)
 async def get_available_filters():
     """Get all available search filters for the unified search"""
     return {
@@ -204,7 +207,7 @@ async def get_available_filters():
                 {"label": "Budget", "min": 0, "max": 5000},
                 {"label": "Mid-range", "min": 5000, "max": 15000},
                 {"label": "Luxury", "min": 15000, "max": 50000},
-                {"label": "Premium", "min": 50000, "max": null}
+                {"label": "Premium", "min": 50000, "max": None}
             ]
         },
         "amenity_filters": {
@@ -6,8 +6,9 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from infrastructure.config.auth import get_password_hash_async, invalidate_principal
 from infrastructure.config.database import get_async_session
-from infrastructure.config.dependencies import current_active_user, require_admin
+from infrastructure.config.dependencies import current_active_user, require_admin, use_read_replica
 from infrastructure.database.models.user import User, UserRole
 from infrastructure.database.models import Property, InvOrder, Booking
 from application.dto.user import AdminUserCreateUpdate, UserRead
@@ -16,7 +17,7 @@ from application.dto.settings import SystemSettingsOut
 router = APIRouter()
 
 # Dashboard stats
-@router.get("/dashboard/stats", response_model=Dict[str, int])
+@router.get("/dashboard/stats", response_model=Dict[str, int], dependencies=[Depends(use_read_replica)])
 async def get_dashboard_stats(
     session: AsyncSession = Depends(get_async_session),
     _: User = Depends(require_admin)
@@ -68,7 +69,9 @@ async def create_or_update_user(
     if payload.id == 0:
         new_user = User(
             email=payload.email,
-            hashed_password=payload.password,  # should be hashed upstream in user manager
+            hashed_password=(
+                await get_password_hash_async(payload.password) if payload.password else None
+            ),
             role=payload.role or UserRole.USER,
             name=payload.name,
             phone=payload.phone,
@@ -84,12 +87,23 @@ async def create_or_update_user(
     if user is None:
         raise HTTPException(404, "User not found")
 
-    for field, value in payload.model_dump(exclude={"id"}).items():
-        if value is not None:
-            setattr(user, field, value)
+    changes = {k: v for k, v in payload.model_dump(exclude={"id"}).items() if v is not None}
+    # Role, status or password changes revoke the user's existing access tokens
+    revoke = any(
+        field in changes and changes[field] != getattr(user, field, None)
+        for field in ("role", "is_active", "password")
+    )
+    password = changes.pop("password", None)
+    for field, value in changes.items():
+        setattr(user, field, value)
+    if password is not None:
+        user.hashed_password = await get_password_hash_async(password)
+    if revoke:
+        user.token_version += 1
 
     await session.commit()
     await session.refresh(user)
+    await invalidate_principal(user.id, user.token_version if revoke else None)
     return user
 
 @router.get("/users/{user_id}/deactivate", response_model=dict)
@@ -100,11 +114,18 @@ async def deactivate_user(
 ):
     """Deactivate a user - admin only."""
     from sqlalchemy import update
-    stmt = update(User).where(User.id == user_id).values(is_active=False)
+    stmt = (
+        update(User)
+        .where(User.id == user_id)
+        .values(is_active=False, token_version=User.token_version + 1)
+        .returning(User.token_version)
+    )
     res = await session.execute(stmt)
-    if res.rowcount == 0:
+    token_version = res.scalar_one_or_none()
+    if token_version is None:
         raise HTTPException(404, "User not found")
     await session.commit()
+    await invalidate_principal(user_id, token_version)
     return {"detail": "User deactivated"}
 
 # System settings (placeholder - would need actual settings model)
@@ -35,6 +35,7 @@ from infrastructure.config.auth import (
     authenticate_user,
     create_access_token,
     create_refresh_token,
+    principal_claims,
     ACCESS_TOKEN_EXPIRE_MINUTES,
     create_oauth_state,
     pop_oauth_state,
@@ -105,12 +106,15 @@ async def login_for_access_token(
     
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    from shared.mappers.user import UserMapper
     access_token = create_access_token(
-        subject=user.id, expires_delta=access_token_expires
+        subject=user.id,
+        expires_delta=access_token_expires,
+        claims=principal_claims(UserMapper.model_to_entity(user)),
     )
     
     # Create refresh token
-    refresh_token = create_refresh_token(user.id)
+    refresh_token = await create_refresh_token(user.id)
     
     return TokenResponse(
         access_token=access_token,
@@ -161,7 +165,7 @@ async def logout(
     ),
     session: AsyncSession = Depends(get_async_session),
 ) -> GenericResponse:
-    """Logout user (invalidates access token on client side)."""
+    """Logout user and revoke the presented access token."""
     # Extract token from Authorization header
     if not authorization or not authorization.startswith("Bearer "):
         raise HTTPException(
@@ -174,7 +178,7 @@ async def logout(
     from infrastructure.config.auth import _decode_token
     try:
         user_id = await _decode_token(token)
-        return await use_case.execute(int(user_id))
+        return await use_case.execute(int(user_id), access_token=token)
     except Exception:
         # Avoid leaking internal errors
         raise HTTPException(status_code=401, detail="Authentication failed")
@@ -412,7 +416,7 @@ async def google_login(
 ) -> RedirectResponse:
     """Start Google OAuth flow by redirecting to Google's consent screen."""
     # Build state for CSRF and carry back return_url
-    state = create_oauth_state("google", return_url)
+    state = await create_oauth_state("google", return_url)
 
     # Get and validate redirect_uri (prevents redirect_uri_mismatch issues)
     redirect_uri = _compute_redirect_uri(request)
@@ -448,7 +452,7 @@ async def google_callback(
     # Validate state and extract return_url
     if not state:
         raise HTTPException(status_code=400, detail="Missing state")
-    state_data = pop_oauth_state(state)
+    state_data = await pop_oauth_state(state)
     if not state_data:
         raise HTTPException(status_code=400, detail="Invalid state")
 
@@ -522,7 +526,7 @@ async def google_authorize_url_debug(
         Provide[AppContainer.auth_use_cases.start_google_oauth_use_case]
     ),
 ):
-    state = create_oauth_state("google", return_url)
+    state = await create_oauth_state("google", return_url)
     redirect_uri = (
         settings.GOOGLE_REDIRECT_URI
         or str(request.url_for("auth_google_callback"))
@@ -3,6 +3,7 @@ from dependency_injector.wiring import inject, Provide
 from typing import List
 
 from ...containers import AppContainer
+from infrastructure.config.dependencies import use_read_replica
 from application.use_cases.tours.cancel_tour_booking import CancelTourBookingUseCase
 from application.use_cases.tours.confirm_tour_booking import ConfirmTourBookingUseCase
 from application.use_cases.tours.complete_tour_booking import CompleteTourBookingUseCase
@@ -188,7 +189,7 @@ async def get_tour_conversations(
     return []
 
 # Operator dashboard & analytics
-@router.get("/operator/dashboard", response_model=dict)
+@router.get("/operator/dashboard", response_model=dict, dependencies=[Depends(use_read_replica)])
 @inject
 async def get_operator_dashboard(
     # TODO: Get operator_id from authentication context
@@ -3,6 +3,7 @@ from dependency_injector.wiring import inject, Provide
 from typing import List
 
 from ...containers import AppContainer
+from infrastructure.config.dependencies import use_read_replica
 from application.use_cases.tours.search_tours import SearchToursUseCase
 from application.use_cases.tours.create_tour import CreateTourUseCase
 from application.use_cases.tours.get_tour import GetTourUseCase
@@ -26,7 +27,7 @@ router = APIRouter()
 # Search endpoints
 
 
-@router.post("/search", response_model=List[TourResponse])
+@router.post("/search", response_model=List[TourResponse], dependencies=[Depends(use_read_replica)])
 @inject
 async def search_tours(
     request: SearchToursRequest,
@@ -40,7 +41,7 @@ async def search_tours(
 # Public tour endpoints
 
 
-@router.get("/", response_model=List[TourResponseDTO])
+@router.get("/", response_model=List[TourResponseDTO], dependencies=[Depends(use_read_replica)])
 @inject
 async def list_tours(
     limit: int = Query(20, ge=1, le=100),
@@ -62,7 +63,7 @@ async def list_tours(
 # Static routes must be defined BEFORE dynamic parameterized routes
 
 
-@router.get("/featured", response_model=List[TourResponseDTO])
+@router.get("/featured", response_model=List[TourResponseDTO], dependencies=[Depends(use_read_replica)])
 @inject
 async def get_featured_tours(
     limit: int = Query(10, ge=1, le=50),
@@ -116,6 +117,7 @@ async def get_tour_categories():
 @router.get(
     "/categories/{category}/tours",
     response_model=List[TourResponseDTO],
+    dependencies=[Depends(use_read_replica)],
 )
 @inject
 async def get_tours_by_category(
@@ -134,7 +136,7 @@ async def get_tours_by_category(
     )
 
 
-@router.get("/{tour_id}", response_model=TourResponseDTO)
+@router.get("/{tour_id}", response_model=TourResponseDTO, dependencies=[Depends(use_read_replica)])
 @inject
 async def get_tour_details(
     tour_id: int,
@@ -152,6 +154,7 @@ async def get_tour_details(
 @router.get(
     "/{tour_id}/availability",
     response_model=List[TourAvailabilityItem],
+    dependencies=[Depends(use_read_replica)],
 )
 @inject
 async def get_tour_availability(
@@ -44,17 +44,34 @@ class MessageResponseDTO(BaseModel):
 
 
 class ConversationThreadDTO(BaseModel):
+    thread_id: int
     booking_type: str
     booking_id: int
     other_participant_id: int
     other_participant_name: str
-    messages: List[MessageResponseDTO]
+    messages: List[MessageResponseDTO] = Field(default_factory=list)
+    last_message_id: Optional[int] = None
+    last_message_sender_id: Optional[int] = None
+    last_message_preview: Optional[str] = None
     last_message_at: Optional[datetime] = None
     unread_count: int = 0
     
     model_config = ConfigDict(from_attributes=True)
 
 
+class MessagePageDTO(BaseModel):
+    """One page of a conversation, oldest first within the page.
+
+    Pass ``next_cursor`` back as ``before`` to load older messages.
+    """
+    thread_id: Optional[int] = None
+    messages: List[MessageResponseDTO] = Field(default_factory=list)
+    next_cursor: Optional[str] = None
+    has_more: bool = False
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
 class MessageStatsDTO(BaseModel):
     total_messages: int
     unread_count: int
@@ -85,6 +85,7 @@ class RefundResponseDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
 class WebhookEventDTO(BaseModel):
+    event_id: Optional[str] = Field(None, description="Provider event ID used for deduplication")
     event_type: str
     payment_intent_id: Optional[str] = None
     payment_id: Optional[str] = None
@@ -49,3 +49,15 @@ class PayoutListResponseDTO(BaseModel):
     has_more: bool
     
     model_config = ConfigDict(from_attributes=True)
+
+class PayoutBalanceDTO(BaseModel):
+    user_id: int
+    currency: str
+    available_balance: Decimal = Field(..., description="Released from hold and not yet in a payout")
+    pending_balance: Decimal = Field(..., description="Earned on completed bookings still in the hold period")
+    in_payout_balance: Decimal = Field(Decimal("0"), description="Scheduled in payouts not yet settled")
+    total_earnings: Decimal
+    total_payouts: Decimal
+    minimum_payout: Decimal
+
+    model_config = ConfigDict(from_attributes=True)
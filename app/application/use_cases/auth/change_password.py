@@ -8,6 +8,7 @@ from domain.repositories.user import UserRepository
 from domain.services.password_service import PasswordService
 from shared.exceptions.auth import InvalidPasswordError
 from shared.exceptions.user import UserNotFoundError
+from infrastructure.config.auth import invalidate_principal
 
 
 class ChangePasswordUseCase:
@@ -38,17 +39,20 @@ class ChangePasswordUseCase:
             raise UserNotFoundError("User not found")
         
         # Verify old password
-        if not self._password_service.verify_password(request.old_password, user.hashed_password):
+        if not await self._password_service.verify_password(request.old_password, user.hashed_password):
             raise InvalidPasswordError("Current password is incorrect")
         
         # Hash new password
-        new_hashed_password = self._password_service.hash_password(request.new_password)
+        new_hashed_password = await self._password_service.hash_password(request.new_password)
         
         # Update user password and timestamp
         from datetime import datetime, timezone
         user.hashed_password = new_hashed_password
         user.updated_at = datetime.now(timezone.utc)
+        # Revoke access tokens issued with the old password
+        user.token_version += 1
         await self._user_repository.update(user)
+        await invalidate_principal(user.id, user.token_version)
         
         # TODO: In production, consider:
         # - Revoking all existing refresh tokens for security
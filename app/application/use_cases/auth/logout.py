@@ -1,11 +1,17 @@
 """
 Logout use case.
 
-Handles user logout by revoking refresh tokens.
+Handles user logout by revoking the access token and refresh token.
 """
+from typing import Optional
+
 from application.dto.user import GenericResponse
 from domain.repositories.user import UserRepository
-from infrastructure.config.auth import revoke_refresh_token
+from infrastructure.config.auth import (
+    invalidate_principal,
+    revoke_access_token,
+    revoke_refresh_token,
+)
 
 
 class LogoutUseCase:
@@ -14,13 +20,19 @@ class LogoutUseCase:
     def __init__(self, user_repository: UserRepository):
         self._user_repository = user_repository
     
-    async def execute(self, user_id: int = None, refresh_token: str = None) -> GenericResponse:
+    async def execute(
+        self,
+        user_id: Optional[int] = None,
+        refresh_token: Optional[str] = None,
+        access_token: Optional[str] = None
+    ) -> GenericResponse:
         """
-        Logout a user by revoking their refresh token.
+        Logout a user by revoking their tokens.
         
         Args:
             user_id: ID of the user logging out (optional)
             refresh_token: Optional refresh token to revoke
+            access_token: Optional access token to deny until it expires
             
         Returns:
             Generic success response
@@ -28,9 +40,12 @@ class LogoutUseCase:
         # Revoke the specific refresh token if provided
         if refresh_token:
             await revoke_refresh_token(refresh_token)
+        if access_token:
+            await revoke_access_token(access_token)
+        if user_id:
+            await invalidate_principal(user_id)
         
         # In a more complex system, you might also:
-        # - Add the access token to a blacklist
         # - Log the logout event
         # - Clear any server-side sessions
         
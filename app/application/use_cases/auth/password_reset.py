@@ -12,6 +12,7 @@ from domain.repositories.user import UserRepository
 from domain.services.password_service import PasswordService
 from shared.exceptions.auth import InvalidResetTokenError
 from shared.exceptions.user import UserNotFoundError
+from infrastructure.config.auth import invalidate_principal
 
 
 class PasswordResetRequestUseCase:
@@ -83,13 +84,16 @@ class PasswordResetConfirmUseCase:
             raise UserNotFoundError("User not found")
         
         # Hash new password
-        hashed_password = self._password_service.hash_password(request.new_password)
+        hashed_password = await self._password_service.hash_password(request.new_password)
         
         # Update user password and timestamp
         from datetime import timezone
         user.hashed_password = hashed_password
         user.updated_at = datetime.now(timezone.utc)
+        # Revoke access tokens issued with the old password
+        user.token_version += 1
         await self._user_repository.update(user)
+        await invalidate_principal(user.id, user.token_version)
         
         # TODO: Invalidate reset token
         # TODO: Revoke all existing refresh tokens for security
@@ -8,7 +8,7 @@ from typing import Optional
 
 from application.dto.user import RefreshTokenRequest, TokenResponse
 from domain.repositories.user import UserRepository
-from infrastructure.config.auth import create_access_token, verify_refresh_token
+from infrastructure.config.auth import create_access_token, principal_claims, verify_refresh_token
 from shared.exceptions.auth import InvalidRefreshTokenError
 
 
@@ -45,7 +45,8 @@ class RefreshTokenUseCase:
         access_token_expires = timedelta(minutes=15)  # 15 minutes
         access_token = create_access_token(
             subject=user.id, 
-            expires_delta=access_token_expires
+            expires_delta=access_token_expires,
+            claims=principal_claims(user),
         )
         
         # For now, we'll reuse the same refresh token
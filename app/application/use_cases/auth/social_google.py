@@ -12,6 +12,7 @@ from infrastructure.config.auth import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     create_access_token,
     create_refresh_token,
+    principal_claims,
 )
 from shared.constants.user_roles import UserRole
 
@@ -88,8 +89,9 @@ class HandleGoogleCallbackUseCase:
         access_token = create_access_token(
             subject=user.id,
             expires_delta=access_token_expires,
+            claims=principal_claims(user),
         )
-        refresh_token = create_refresh_token(user.id)
+        refresh_token = await create_refresh_token(user.id)
 
         return TokenResponse(
             access_token=access_token,
@@ -1,13 +1,14 @@
 """Get conversation use case."""
-from typing import List
+from typing import Optional
 from domain.repositories.message import MessageRepository
 from domain.repositories.user import UserRepository
-from application.dto.message import MessageResponseDTO, BookingType
+from application.dto.message import MessageResponseDTO, MessagePageDTO, BookingType
+from shared.utils.pagination import encode_keyset_cursor, decode_keyset_cursor
 
 
 class GetConversationUseCase:
     def __init__(
-        self, 
+        self,
         message_repository: MessageRepository,
         user_repository: UserRepository
     ):
@@ -15,39 +16,50 @@ class GetConversationUseCase:
         self._user_repository = user_repository
 
     async def execute(
-        self, 
-        booking_type: BookingType, 
+        self,
+        booking_type: BookingType,
         booking_id: int,
         user_id: int,
-        other_user_id: int
-    ) -> List[MessageResponseDTO]:
-        # Get messages in the conversation
-        messages = await self._message_repository.get_conversation(
+        other_user_id: int,
+        limit: int = 50,
+        before: Optional[str] = None
+    ) -> MessagePageDTO:
+        """Get one page of a conversation, walking backwards from ``before``.
+
+        Raises:
+            ValueError: If ``before`` is not a valid cursor
+        """
+        thread = await self._message_repository.find_thread(
             booking_type.value, booking_id, user_id, other_user_id
         )
-        
-        # Get user information for mapping
-        users = {}
-        for message in messages:
-            if message.sender_id not in users:
-                user = await self._user_repository.get_by_id(message.sender_id)
-                users[message.sender_id] = user.name if user else "Unknown User"
-            
-            if message.recipient_id not in users:
-                user = await self._user_repository.get_by_id(message.recipient_id)
-                users[message.recipient_id] = user.name if user else "Unknown User"
-        
-        # Convert to DTOs
+        if thread is None:
+            return MessagePageDTO()
+
+        # Fetch one extra row to learn whether an older page exists
+        cursor = decode_keyset_cursor(before) if before else None
+        messages = await self._message_repository.get_thread_messages(
+            thread.id, limit + 1, cursor
+        )
+        has_more = len(messages) > limit
+        messages = messages[:limit]
+
+        # Both participants are known up front, so names need one lookup
+        users = await self._user_repository.get_by_ids([user_id, other_user_id])
+        names = {
+            uid: user.full_name for uid, user in users.items()
+        }
+
+        # Repository returns newest first; present the page oldest first
         result = []
-        for message in messages:
+        for message in reversed(messages):
             result.append(MessageResponseDTO(
                 id=message.id,
                 booking_type=message.booking_type,
                 booking_id=message.booking_id,
                 sender_id=message.sender_id,
-                sender_name=users.get(message.sender_id, "Unknown User"),
+                sender_name=names.get(message.sender_id, "Unknown User"),
                 recipient_id=message.recipient_id,
-                recipient_name=users.get(message.recipient_id, "Unknown User"),
+                recipient_name=names.get(message.recipient_id, "Unknown User"),
                 subject=message.subject,
                 body=message.body,
                 is_read=message.is_read,
@@ -57,5 +69,14 @@ class GetConversationUseCase:
                 created_at=message.created_at,
                 updated_at=message.updated_at
             ))
-        
-        return result
+
+        oldest = messages[-1] if messages else None
+        next_cursor = None
+        if has_more and oldest and oldest.created_at:
+            next_cursor = encode_keyset_cursor(oldest.created_at, oldest.id)
+        return MessagePageDTO(
+            thread_id=thread.id,
+            messages=result,
+            next_cursor=next_cursor,
+            has_more=has_more
+        )
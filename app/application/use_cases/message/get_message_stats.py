@@ -18,8 +18,7 @@ class GetMessageStatsUseCase:
         total_messages = len(sent_messages) + len(received_messages)
         
         # Get conversations count
-        conversations = await self._message_repository.get_user_conversations(user_id)
-        conversations_count = len(conversations)
+        conversations_count = await self._message_repository.count_user_conversations(user_id)
         
         return MessageStatsDTO(
             total_messages=total_messages,
@@ -2,65 +2,40 @@
 from typing import List
 from domain.repositories.message import MessageRepository
 from domain.repositories.user import UserRepository
-from application.dto.message import ConversationThreadDTO, MessageResponseDTO
+from application.dto.message import ConversationThreadDTO
 
 
 class GetUserConversationsUseCase:
     def __init__(
-        self, 
+        self,
         message_repository: MessageRepository,
         user_repository: UserRepository
     ):
         self._message_repository = message_repository
         self._user_repository = user_repository
 
-    async def execute(self, user_id: int) -> List[ConversationThreadDTO]:
-        # Get conversation threads
-        threads = await self._message_repository.get_user_conversations(user_id)
-        
-        # Convert to DTOs
+    async def execute(self, user_id: int, limit: int = 50, offset: int = 0) -> List[ConversationThreadDTO]:
+        # Summaries only; messages are loaded per thread when it is opened
+        threads = await self._message_repository.get_user_conversations(user_id, limit, offset)
+
+        # Resolve all other participants in a single lookup
+        other_ids = [thread.get_other_participant(user_id) for thread in threads]
+        users = await self._user_repository.get_by_ids(other_ids)
+
         result = []
-        for thread in threads:
-            # Get other participant info
-            other_participant_id = thread.get_other_participant(user_id)
-            other_participant = await self._user_repository.get_by_id(other_participant_id)
-            other_participant_name = other_participant.name if other_participant else "Unknown User"
-            
-            # Convert messages to DTOs
-            message_dtos = []
-            for message in thread.messages:
-                sender = await self._user_repository.get_by_id(message.sender_id)
-                recipient = await self._user_repository.get_by_id(message.recipient_id)
-                
-                message_dtos.append(MessageResponseDTO(
-                    id=message.id,
-                    booking_type=message.booking_type,
-                    booking_id=message.booking_id,
-                    sender_id=message.sender_id,
-                    sender_name=sender.name if sender else "Unknown User",
-                    recipient_id=message.recipient_id,
-                    recipient_name=recipient.name if recipient else "Unknown User",
-                    subject=message.subject,
-                    body=message.body,
-                    is_read=message.is_read,
-                    read_at=message.read_at,
-                    parent_message_id=message.parent_message_id,
-                    is_system_message=message.is_system_message,
-                    created_at=message.created_at,
-                    updated_at=message.updated_at
-                ))
-            
-            # Create conversation thread DTO
-            conversation_dto = ConversationThreadDTO(
+        for thread, other_participant_id in zip(threads, other_ids):
+            other_participant = users.get(other_participant_id)
+            result.append(ConversationThreadDTO(
+                thread_id=thread.id,
                 booking_type=thread.booking_type,
                 booking_id=thread.booking_id,
                 other_participant_id=other_participant_id,
-                other_participant_name=other_participant_name,
-                messages=message_dtos,
+                other_participant_name=other_participant.full_name if other_participant else "Unknown User",
+                last_message_id=thread.last_message_id,
+                last_message_sender_id=thread.last_message_sender_id,
+                last_message_preview=thread.last_message_preview,
                 last_message_at=thread.last_message_at,
                 unread_count=thread.get_unread_count(user_id)
-            )
-            
-            result.append(conversation_dto)
-        
+            ))
+
         return result
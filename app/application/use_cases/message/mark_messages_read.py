@@ -1,15 +1,35 @@
 """Mark messages as read use case."""
+from typing import Optional
 from domain.repositories.message import MessageRepository
+from domain.services.realtime_notifier import RealtimeNotifier
+from infrastructure.database.unit_of_work import run_after_commit
 
 
 class MarkMessagesReadUseCase:
-    def __init__(self, message_repository: MessageRepository):
+    def __init__(
+        self,
+        message_repository: MessageRepository,
+        notifier: Optional[RealtimeNotifier] = None
+    ):
         self._message_repository = message_repository
+        self._notifier = notifier
 
     async def execute(self, message_id: int, user_id: int) -> dict:
         """Mark a specific message as read."""
-        await self._message_repository.mark_as_read(message_id, user_id)
-        
+        message = await self._message_repository.get_by_id(message_id)
+        if message and message.recipient_id == user_id and not message.is_read:
+            # Only the call whose UPDATE flipped the row adjusts the counter,
+            # so concurrent reads of the same message decrement it once
+            marked = await self._message_repository.mark_as_read(message_id, user_id)
+            if marked:
+                if message.thread_id:
+                    await self._message_repository.decrement_thread_unread(message.thread_id, user_id)
+                await self._push_read_receipt(
+                    message.sender_id,
+                    user_id,
+                    {"thread_id": message.thread_id, "message_ids": [message_id], "read_by": user_id}
+                )
+
         return {
             "ok": True,
             "message": "Message marked as read",
@@ -17,27 +37,59 @@ class MarkMessagesReadUseCase:
         }
 
     async def mark_conversation_read(
-        self, 
-        booking_type: str, 
-        booking_id: int, 
-        user_id: int, 
-        other_user_id: int
+        self,
+        booking_type: str,
+        booking_id: int,
+        user_id: int,
+        other_user_id: int,
+        up_to_message_id: Optional[int] = None
     ) -> dict:
-        """Mark all messages in a conversation as read for the user."""
-        # Get all messages in the conversation
-        messages = await self._message_repository.get_conversation(
+        """Mark messages in a conversation as read for the user.
+
+        Everything addressed to the user is marked when ``up_to_message_id``
+        is omitted; otherwise only messages up to and including that ID.
+        """
+        thread = await self._message_repository.find_thread(
             booking_type, booking_id, user_id, other_user_id
         )
-        
-        # Mark unread messages as read
+
         marked_count = 0
-        for message in messages:
-            if message.recipient_id == user_id and not message.is_read:
-                await self._message_repository.mark_as_read(message.id, user_id)
-                marked_count += 1
-        
+        if thread:
+            # Single UPDATE over the thread instead of one round-trip per message
+            marked_count = await self._message_repository.mark_thread_read_up_to(
+                thread.id, user_id, up_to_message_id
+            )
+            if marked_count:
+                # Decrement by what was marked rather than zeroing the counter,
+                # which would drop a message that arrived after the UPDATE
+                await self._message_repository.decrement_thread_unread(
+                    thread.id, user_id, marked_count
+                )
+                await self._push_read_receipt(
+                    other_user_id,
+                    user_id,
+                    {"thread_id": thread.id, "up_to_message_id": up_to_message_id, "read_by": user_id}
+                )
+
         return {
             "ok": True,
             "message": f"Marked {marked_count} messages as read",
             "marked_count": marked_count
         }
+
+    async def _push_read_receipt(self, sender_id: int, reader_id: int, data: dict) -> None:
+        """Tell the sender their messages were read and refresh the reader's badge.
+
+        Sent once the read state has committed, so clients never see a
+        receipt for an update that was rolled back.
+        """
+        if not self._notifier:
+            return
+        notifier = self._notifier
+        unread_count = await self._message_repository.get_unread_count(reader_id)
+
+        async def push() -> None:
+            await notifier.notify([sender_id], "message.read", data)
+            await notifier.notify([reader_id], "unread.count", {"unread_count": unread_count})
+
+        await run_after_commit(push)
@@ -2,18 +2,23 @@
 from domain.entities.message import Message
 from domain.repositories.message import MessageRepository
 from domain.repositories.user import UserRepository
+from domain.services.realtime_notifier import RealtimeNotifier
 from application.dto.message import MessageCreateDTO, MessageResponseDTO
+from infrastructure.database.unit_of_work import run_after_commit
 from datetime import datetime
+from typing import Optional
 
 
 class SendMessageUseCase:
     def __init__(
         self, 
         message_repository: MessageRepository,
-        user_repository: UserRepository
+        user_repository: UserRepository,
+        notifier: Optional[RealtimeNotifier] = None
     ):
         self._message_repository = message_repository
         self._user_repository = user_repository
+        self._notifier = notifier
 
     async def execute(self, request: MessageCreateDTO, sender_id: int) -> MessageResponseDTO:
         # Validate sender and recipient exist
@@ -46,18 +51,18 @@ class SendMessageUseCase:
             updated_at=datetime.utcnow()
         )
         
-        # Save message
-        saved_message = await self._message_repository.create(message_entity)
+        # Save message into its summary thread so the inbox never has to scan messages
+        saved_message = await self._message_repository.create_in_thread(message_entity)
         
         # Convert to response DTO
-        return MessageResponseDTO(
+        response = MessageResponseDTO(
             id=saved_message.id,
             booking_type=saved_message.booking_type,
             booking_id=saved_message.booking_id,
             sender_id=saved_message.sender_id,
-            sender_name=sender.name,
+            sender_name=sender.full_name,
             recipient_id=saved_message.recipient_id,
-            recipient_name=recipient.name,
+            recipient_name=recipient.full_name,
             subject=saved_message.subject,
             body=saved_message.body,
             is_read=saved_message.is_read,
@@ -67,3 +72,20 @@ class SendMessageUseCase:
             created_at=saved_message.created_at,
             updated_at=saved_message.updated_at
         )
+
+        # Push to connected clients so they do not need to poll, once the
+        # message has committed; a rolled-back send is never announced
+        if self._notifier:
+            notifier = self._notifier
+            unread_count = await self._message_repository.get_unread_count(request.recipient_id)
+            created = {"thread_id": saved_message.thread_id, "message": response.model_dump(mode="json")}
+
+            async def push() -> None:
+                await notifier.notify([sender_id, request.recipient_id], "message.created", created)
+                await notifier.notify(
+                    [request.recipient_id], "unread.count", {"unread_count": unread_count}
+                )
+
+            await run_after_commit(push)
+
+        return response
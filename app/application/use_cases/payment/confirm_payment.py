@@ -88,6 +88,11 @@ class ConfirmPaymentUseCase:
             status = PaymentStatus.COMPLETED
             transaction_id = result.get("mpesa_receipt_number")
             failure_reason = None
+        elif result["result_code"] is None:
+            # The customer has not answered the STK prompt yet
+            status = PaymentStatus.PENDING
+            transaction_id = None
+            failure_reason = None
         else:
             status = PaymentStatus.FAILED
             transaction_id = None
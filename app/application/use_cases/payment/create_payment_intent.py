@@ -45,16 +45,20 @@ class CreatePaymentIntentUseCase:
     
     async def _create_stripe_intent(self, request: PaymentIntentRequestDTO) -> PaymentIntentResponseDTO:
         """Create Stripe payment intent"""
+        amount = int(request.amount * 100)  # Convert to cents
+        currency = request.currency.lower()
         intent = await self._stripe_service.create_payment_intent(
-            amount=int(request.amount * 100),  # Convert to cents
-            currency=request.currency.lower(),
+            amount=amount,
+            currency=currency,
             customer_email=request.customer_email,
             metadata={
                 "booking_id": str(request.booking_id),
                 "booking_type": request.booking_type,
                 "customer_id": str(request.customer_id),
                 **(request.metadata or {})
-            }
+            },
+            # One intent per booking and amount, however often the request is retried
+            idempotency_key=f"booking-{request.booking_type}-{request.booking_id}-{amount}-{currency}"
         )
         
         return PaymentIntentResponseDTO(
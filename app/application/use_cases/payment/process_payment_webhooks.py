@@ -0,0 +1,82 @@
+from typing import Dict, Optional, Tuple
+
+from application.dto.payment import PaymentStatus
+from domain.entities.payment import PaymentWebhookEvent
+from domain.repositories.payment import PaymentRepository, PaymentWebhookRepository
+
+# Provider event types that move a payment intent to a new status
+WEBHOOK_STATUS_MAP: Dict[Tuple[str, str], PaymentStatus] = {
+    ("stripe", "payment_intent.processing"): PaymentStatus.PROCESSING,
+    ("stripe", "payment_intent.succeeded"): PaymentStatus.COMPLETED,
+    ("stripe", "payment_intent.payment_failed"): PaymentStatus.FAILED,
+    ("stripe", "payment_intent.canceled"): PaymentStatus.CANCELLED,
+    ("stripe", "charge.refunded"): PaymentStatus.REFUNDED,
+    ("mpesa", "stk_callback.succeeded"): PaymentStatus.COMPLETED,
+    ("mpesa", "stk_callback.failed"): PaymentStatus.FAILED,
+    ("mpesa", "stk_callback.cancelled"): PaymentStatus.CANCELLED,
+}
+
+
+def event_status(event: PaymentWebhookEvent) -> Optional[PaymentStatus]:
+    """Status an inbox event moves its intent to, if any"""
+    status = WEBHOOK_STATUS_MAP.get((event.provider, event.event_type))
+    if status is PaymentStatus.REFUNDED:
+        # charge.refunded also fires for partial refunds; Stripe sets
+        # ``refunded`` only once the whole charge has been returned
+        charge = ((event.payload or {}).get("data") or {}).get("object") or {}
+        if charge.get("refunded") is not True:
+            return None
+    return status
+
+
+class ProcessPaymentWebhooksUseCase:
+    """Apply stored webhook events to payment intents in batches"""
+
+    def __init__(
+        self,
+        webhook_repository: PaymentWebhookRepository,
+        payment_repository: PaymentRepository,
+        batch_size: int = 200,
+        max_attempts: int = 5
+    ):
+        self._webhook_repository = webhook_repository
+        self._payment_repository = payment_repository
+        self._batch_size = batch_size
+        self._max_attempts = max_attempts
+
+    async def execute(self) -> int:
+        """Process one batch; return the number of events claimed."""
+        events = await self._webhook_repository.claim_batch(self._batch_size)
+        if not events:
+            return 0
+
+        # Events are claimed oldest first, so the last status per intent wins.
+        # Refunds only apply to completed intents and go in a second pass, so
+        # a capture and its refund claimed together are both applied.
+        latest: Dict[str, str] = {}
+        refunds: Dict[str, str] = {}
+        for event in events:
+            status = event_status(event)
+            if status and event.payment_intent_id:
+                target = refunds if status is PaymentStatus.REFUNDED else latest
+                target[event.payment_intent_id] = status.value
+
+        event_ids = [event.id for event in events]
+        try:
+            await self._payment_repository.update_payment_statuses(list(latest.items()))
+            await self._payment_repository.update_payment_statuses(list(refunds.items()))
+        except Exception as e:
+            await self._webhook_repository.mark_failed(event_ids, str(e), self._max_attempts)
+            raise
+        await self._webhook_repository.mark_processed(event_ids)
+        return len(events)
+
+    async def drain(self, max_batches: int = 50) -> int:
+        """Process batches until the inbox is empty or *max_batches* is reached."""
+        total = 0
+        for _ in range(max_batches):
+            claimed = await self.execute()
+            total += claimed
+            if claimed < self._batch_size:
+                break
+        return total
@@ -0,0 +1,53 @@
+from typing import Any, Dict
+
+from pydantic import ValidationError
+
+from application.dto.payment import WebhookEventDTO
+from domain.repositories.payment import PaymentWebhookRepository
+from infrastructure.external_services.payment.stripe_service import StripePaymentService
+from infrastructure.external_services.payment.mpesa_service import MpesaPaymentService
+from shared.exceptions.payment import WebhookVerificationError
+
+class ReceivePaymentWebhookUseCase:
+    """Verify a provider callback and append it to the webhook inbox.
+
+    Only verification and one INSERT happen on the request path; payment
+    statuses are applied later by ``ProcessPaymentWebhooksUseCase``.
+    """
+
+    def __init__(
+        self,
+        webhook_repository: PaymentWebhookRepository,
+        stripe_service: StripePaymentService,
+        mpesa_service: MpesaPaymentService
+    ):
+        self._webhook_repository = webhook_repository
+        self._stripe_service = stripe_service
+        self._mpesa_service = mpesa_service
+
+    async def receive_stripe(self, payload: bytes, signature_header: str) -> Dict[str, Any]:
+        event = self._stripe_service.parse_webhook(payload, signature_header)
+        return await self._store("stripe", event)
+
+    async def receive_mpesa(self, payload: Dict[str, Any], token: str) -> Dict[str, Any]:
+        event = self._mpesa_service.parse_callback(payload, token)
+        return await self._store("mpesa", event)
+
+    async def _store(self, provider: str, fields: Dict[str, Any]) -> Dict[str, Any]:
+        # Checked before building the DTO so a bad event is a 400, not a 500
+        event_id = fields.get("event_id")
+        if not event_id or not fields.get("event_type"):
+            raise WebhookVerificationError("Webhook event has no ID or type")
+        try:
+            event = WebhookEventDTO(provider=provider, **fields)
+        except ValidationError as exc:
+            raise WebhookVerificationError("Malformed webhook event") from exc
+
+        inserted = await self._webhook_repository.record_event(
+            provider=event.provider,
+            event_id=event_id,
+            event_type=event.event_type,
+            payment_intent_id=event.payment_intent_id,
+            payload=event.data
+        )
+        return {"ok": True, "duplicate": not inserted}
@@ -0,0 +1,131 @@
+import asyncio
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Tuple
+
+from application.dto.payment import PaymentStatus
+from domain.entities.payment import PaymentIntent
+from domain.repositories.payment import PaymentRepository
+from infrastructure.external_services.payment.stripe_service import StripePaymentService
+from infrastructure.external_services.payment.mpesa_service import MpesaPaymentService
+from infrastructure.database.unit_of_work import unit_of_work
+from shared.utils.concurrency import AsyncRateLimiter, backoff_delay
+
+# Stripe payment intent states that settle our intent
+STRIPE_STATUS_MAP: Dict[str, PaymentStatus] = {
+    "succeeded": PaymentStatus.COMPLETED,
+    "canceled": PaymentStatus.CANCELLED,
+    "processing": PaymentStatus.PROCESSING,
+}
+
+# Daraja STK query result codes; anything else non-zero is a failure
+MPESA_CANCELLED_CODES = {"1032"}
+
+class ReconcilePendingPaymentsUseCase:
+    """Resolve stale pending intents by asking the providers for their state.
+
+    Each page of intents is claimed in its own short transaction, so
+    concurrent workers never poll the same intent. Provider calls then run
+    with no transaction open, concurrently behind a token bucket per
+    provider and a global semaphore, with jittered retries. Results are
+    written back with one bulk update per page, committed on its own so a
+    failing page does not undo earlier ones.
+    """
+
+    def __init__(
+        self,
+        payment_repository: Callable[[], PaymentRepository],
+        stripe_service: StripePaymentService,
+        mpesa_service: MpesaPaymentService,
+        concurrency: int = 20,
+        rate_limits: Optional[Dict[str, float]] = None,
+        max_retries: int = 3,
+        stale_after: timedelta = timedelta(minutes=10),
+        page_size: int = 500,
+        claim_lease: timedelta = timedelta(minutes=5)
+    ):
+        self._payment_repository = payment_repository
+        self._stripe_service = stripe_service
+        self._mpesa_service = mpesa_service
+        self._concurrency = concurrency
+        self._max_retries = max_retries
+        self._stale_after = stale_after
+        self._page_size = page_size
+        self._claim_lease = claim_lease
+        limits = {"mpesa": 5.0, "stripe": 25.0, **(rate_limits or {})}
+        self._limiters = {provider: AsyncRateLimiter(rate) for provider, rate in limits.items()}
+
+    async def execute(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """Sweep all stale intents; return counts of checked, updated and errored intents."""
+        cutoff = (now or datetime.utcnow()) - self._stale_after
+        semaphore = asyncio.Semaphore(self._concurrency)
+        stats = {"checked": 0, "updated": 0, "errors": 0}
+
+        while True:
+            # Repositories are built inside each unit of work to share its session
+            async with unit_of_work():
+                intents = await self._payment_repository().claim_stale_pending_intents(
+                    cutoff, self._page_size, self._claim_lease
+                )
+            if not intents:
+                break
+
+            results = await asyncio.gather(
+                *(self._check(intent, semaphore) for intent in intents)
+            )
+            updates: List[Tuple[str, str]] = []
+            for intent, status in zip(intents, results):
+                stats["checked"] += 1
+                if status is None:
+                    continue
+                if status is False:
+                    stats["errors"] += 1
+                elif status.value != intent.status:
+                    updates.append((intent.intent_id, status.value))
+
+            async with unit_of_work():
+                stats["updated"] += await self._payment_repository().update_payment_statuses(updates)
+            if len(intents) < self._page_size:
+                break
+
+        return stats
+
+    async def _check(self, intent: PaymentIntent, semaphore: asyncio.Semaphore):
+        """Return the provider's status, None if still pending, or False on error."""
+        limiter = self._limiters.get(intent.payment_method)
+        if limiter is None:
+            return None
+
+        for attempt in range(self._max_retries + 1):
+            # Wait for the provider's token before taking a slot, so a page of
+            # slow-rate intents cannot hold every slot and starve the others
+            await limiter.acquire()
+            async with semaphore:
+                try:
+                    return await self._query_provider(intent)
+                except Exception:
+                    if attempt == self._max_retries:
+                        return False
+            # Back off without holding a slot other intents could use
+            await asyncio.sleep(backoff_delay(attempt))
+        return False
+
+    async def _query_provider(self, intent: PaymentIntent) -> Optional[PaymentStatus]:
+        if intent.payment_method == "stripe":
+            result = await self._stripe_service.retrieve_payment_intent(intent.intent_id)
+            if result.get("status") == "requires_payment_method" and result.get("last_payment_error"):
+                return PaymentStatus.FAILED
+            return STRIPE_STATUS_MAP.get(result.get("status", ""))
+
+        result = await self._mpesa_service.check_transaction_status(
+            checkout_request_id=intent.intent_id
+        )
+        result_code = result.get("result_code")
+        if result_code is None:
+            # The STK push has not completed yet
+            return None
+        result_code = str(result_code)
+        if result_code == "0":
+            return PaymentStatus.COMPLETED
+        if result_code in MPESA_CANCELLED_CODES:
+            return PaymentStatus.CANCELLED
+        return PaymentStatus.FAILED
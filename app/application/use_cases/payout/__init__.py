@@ -0,0 +1 @@
+# Payout use cases module
@@ -0,0 +1,12 @@
+"""Checkpoint ledger use case."""
+from domain.entities.ledger import LedgerCheckpointSummary
+from domain.repositories.ledger import LedgerRepository
+
+
+class CheckpointLedgerUseCase:
+    def __init__(self, ledger_repository: LedgerRepository):
+        self._ledger_repository = ledger_repository
+
+    async def execute(self) -> LedgerCheckpointSummary:
+        """Verify account snapshots against the entries written since the last checkpoint."""
+        return await self._ledger_repository.checkpoint()
@@ -0,0 +1,36 @@
+"""Get payout balance use case."""
+from decimal import Decimal
+
+from application.dto.payout import PayoutBalanceDTO
+from domain.entities.ledger import LedgerAccountKind
+from domain.repositories.ledger import LedgerRepository
+
+MINIMUM_PAYOUT = Decimal("100.00")
+
+
+class GetPayoutBalanceUseCase:
+    def __init__(self, ledger_repository: LedgerRepository):
+        self._ledger_repository = ledger_repository
+
+    async def execute(self, user_id: int, currency: str = "KES") -> PayoutBalanceDTO:
+        """Read the user's balances from the ledger account snapshots."""
+        accounts = {
+            account.kind: account
+            for account in await self._ledger_repository.get_owner_accounts(user_id, currency)
+        }
+        pending = accounts.get(LedgerAccountKind.HOST_PENDING)
+        available = accounts.get(LedgerAccountKind.HOST_AVAILABLE)
+        # Scheduling moves earnings out of the available account, so money
+        # already being paid out is never reported as available
+        in_payout = accounts.get(LedgerAccountKind.PAYOUT_CLEARING)
+        zero = Decimal("0")
+        return PayoutBalanceDTO(
+            user_id=user_id,
+            currency=currency,
+            available_balance=available.balance if available else zero,
+            pending_balance=pending.balance if pending else zero,
+            in_payout_balance=in_payout.balance if in_payout else zero,
+            total_earnings=pending.credits_total if pending else zero,
+            total_payouts=in_payout.credits_total if in_payout else zero,
+            minimum_payout=MINIMUM_PAYOUT,
+        )
@@ -0,0 +1,21 @@
+"""Schedule payouts use case."""
+from datetime import datetime, timedelta
+from typing import Optional
+
+from domain.entities.payout import PayoutRunSummary
+from domain.repositories.payout import PayoutRepository
+
+
+class SchedulePayoutsUseCase:
+    def __init__(self, payout_repository: PayoutRepository, hold_days: int = 2):
+        self._payout_repository = payout_repository
+        self._hold_days = hold_days
+
+    async def execute(self, now: Optional[datetime] = None) -> PayoutRunSummary:
+        """Pay out every completed booking whose hold period has elapsed.
+
+        Safe to re-run: bookings already scheduled are never paid twice.
+        """
+        now = now or datetime.utcnow()
+        cutoff_date = (now - timedelta(days=self._hold_days)).date()
+        return await self._payout_repository.schedule_payouts(cutoff_date, now)
@@ -1,13 +1,22 @@
 from datetime import datetime
-from domain.repositories.tours import TourBookingRepository
+from domain.repositories.ledger import LedgerRepository
+from domain.repositories.tours import TourBookingRepository, TourRepository
+from domain.services.ledger_postings import booking_completed
 from application.dto.tours import TourBookingResponseDTO
 from shared.exceptions.tours import TourBookingNotFoundError
 from shared.constants.booking_status import BookingStatus
 
 
 class CompleteTourBookingUseCase:
-    def __init__(self, tour_booking_repository: TourBookingRepository):
+    def __init__(
+        self,
+        tour_booking_repository: TourBookingRepository,
+        tour_repository: TourRepository,
+        ledger_repository: LedgerRepository,
+    ):
         self._tour_booking_repository = tour_booking_repository
+        self._tour_repository = tour_repository
+        self._ledger_repository = ledger_repository
 
     async def execute(self, booking_id: int) -> TourBookingResponseDTO:
         booking = await self._tour_booking_repository.get_by_id(booking_id)
@@ -18,6 +27,17 @@ class CompleteTourBookingUseCase:
         booking.updated_at = datetime.now()
 
         saved = await self._tour_booking_repository.update(booking)
+
+        # Credit the operator's pending balance; re-completing posts nothing new
+        tour = await self._tour_repository.get_by_id(saved.tour_id)
+        if tour:
+            await self._ledger_repository.post([
+                booking_completed(
+                    "tour", saved.id, tour.operator_id,
+                    saved.total_price.amount, saved.total_price.currency,
+                )
+            ])
+
         return TourBookingResponseDTO(
             id=saved.id,
             tour_id=saved.tour_id,
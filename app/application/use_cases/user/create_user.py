@@ -16,7 +16,7 @@ class CreateUserUseCase:
         if existing_user:
             raise UserAlreadyExistsError(f"User with email {user_data.email} already exists.")
 
-        hashed_password = self._password_service.hash_password(user_data.password)
+        hashed_password = await self._password_service.hash_password(user_data.password)
 
         new_user = User(
             id=0,  # Assigned by repository/DB
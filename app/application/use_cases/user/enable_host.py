@@ -7,6 +7,7 @@ from datetime import datetime
 from domain.repositories.user import UserRepository
 from shared.constants.user_roles import UserRole
 from application.dto.user import UserResponseDTO
+from infrastructure.config.auth import invalidate_principal
 
 
 class EnableHostUseCase:
@@ -29,5 +30,8 @@ class EnableHostUseCase:
             user.role = UserRole.HOST
             user.updated_at = datetime.now()
             user = await self._user_repository.update(user)
+            # An upgrade only needs the cached principal refreshed; tokens
+            # carrying the old role as a signed claim just lack the new rights
+            await invalidate_principal(user.id)
 
         return UserResponseDTO.from_entity(user)
@@ -0,0 +1,30 @@
+"""pytest configuration for the API.
+
+Tests never touch the database in DATABASE_URL: they use TEST_DATABASE_URL,
+or a throwaway SQLite file when it is unset. Settings are read on import,
+so this runs before any application module is loaded.
+"""
+import os
+import tempfile
+
+import pytest_asyncio
+
+os.environ["DATABASE_URL"] = os.environ.get(
+    "TEST_DATABASE_URL",
+    "sqlite+aiosqlite:///" + os.path.join(tempfile.gettempdir(), "buckler-test.db"),
+)
+os.environ.pop("DATABASE_REPLICA_URL", None)
+# Keep request outcomes independent of earlier requests
+os.environ["RATE_LIMIT_ENABLED"] = "0"
+os.environ["RESPONSE_CACHE_ENABLED"] = "0"
+
+pytest_plugins = ["pytester", "infrastructure.database.query_budget_plugin"]
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def dispose_engine():
+    """Drop pooled connections with the test's event loop, which owns them."""
+    yield
+    from infrastructure.config.database import engine
+
+    await engine.dispose()
@@ -0,0 +1,72 @@
+"""Double-entry ledger domain entities."""
+from dataclasses import dataclass, field
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import List, Optional
+
+# Owner id used for accounts held by the platform itself
+PLATFORM_OWNER_ID = 0
+
+
+class LedgerAccountKind(str, Enum):
+    """Accounts money moves between.
+
+    Amounts are signed from the platform's books: credits are positive and
+    debits negative, so host balances read as what the platform owes them.
+    """
+    PLATFORM_CASH = "platform_cash"      # Money collected from providers
+    GUEST_FUNDS = "guest_funds"          # Paid bookings not yet completed
+    HOST_PENDING = "host_pending"        # Earned by hosts, still in the hold period
+    HOST_AVAILABLE = "host_available"    # Past the hold period, not yet in a payout
+    PAYOUT_CLEARING = "payout_clearing"  # Scheduled payouts on their way to the host
+
+
+@dataclass(frozen=True)
+class LedgerLine:
+    """One leg of a posting against the account identified by kind, owner and currency."""
+    kind: LedgerAccountKind
+    owner_id: int
+    currency: str
+    amount: Decimal
+
+
+@dataclass
+class LedgerPosting:
+    """A balanced set of lines applied atomically.
+
+    *key* identifies the business event (e.g. ``payment:pi_123:captured``);
+    posting the same key twice is a no-op.
+    """
+    key: str
+    description: str
+    lines: List[LedgerLine] = field(default_factory=list)
+
+    def is_balanced(self) -> bool:
+        return sum((line.amount for line in self.lines), Decimal("0")) == 0
+
+
+@dataclass
+class LedgerAccount:
+    """Account with its running balance snapshot."""
+    id: Optional[int] = None
+    kind: LedgerAccountKind = LedgerAccountKind.HOST_PENDING
+    owner_id: int = PLATFORM_OWNER_ID
+    currency: str = "KES"
+    balance: Decimal = Decimal("0")
+    credits_total: Decimal = Decimal("0")
+    debits_total: Decimal = Decimal("0")
+    last_entry_id: int = 0
+    updated_at: Optional[datetime] = None
+
+
+@dataclass
+class LedgerCheckpointSummary:
+    """Outcome of one checkpoint run."""
+    accounts_checked: int = 0
+    mismatched_account_ids: List[int] = field(default_factory=list)
+    unbalanced_currencies: List[str] = field(default_factory=list)
+
+    @property
+    def consistent(self) -> bool:
+        return not self.mismatched_account_ids and not self.unbalanced_currencies
@@ -5,9 +5,13 @@ from typing import Optional
 from .base import DomainEntity
 
 
-@dataclass
+@dataclass(kw_only=True)
 class Message(DomainEntity):
-    """Message entity for communication between users regarding bookings."""
+    """Message entity for communication between users regarding bookings.
+
+    Keyword-only so the booking and participant keys can stay required after
+    the defaulted ``DomainEntity`` fields.
+    """
     booking_type: str  # 'bnb', 'tour', 'car', 'bundle'
     booking_id: int
     sender_id: int
@@ -18,6 +22,7 @@ class Message(DomainEntity):
     read_at: Optional[datetime] = None
     parent_message_id: Optional[int] = None  # For threading
     is_system_message: bool = False
+    thread_id: Optional[int] = None
     
     def mark_as_read(self, read_by_user_id: int) -> None:
         """Business rule: Mark message as read by recipient."""
@@ -34,9 +39,16 @@ class Message(DomainEntity):
         return not self.is_system_message
 
 
+PREVIEW_LENGTH = 255
+
+
 @dataclass
 class MessageThread:
-    """Represents a conversation thread between two users about a booking."""
+    """Represents a conversation thread between two users about a booking.
+
+    Inbox listings carry only the summary fields; ``messages`` is populated
+    when a single thread is opened.
+    """
     booking_type: str
     booking_id: int
     participant_1_id: int
@@ -45,15 +57,27 @@ class MessageThread:
     last_message_at: Optional[datetime] = None
     unread_count_participant_1: int = 0
     unread_count_participant_2: int = 0
+    id: int = 0
+    last_message_id: Optional[int] = None
+    last_message_sender_id: Optional[int] = None
+    last_message_preview: Optional[str] = None
     
     def __post_init__(self):
         if self.messages is None:
             self.messages = []
     
+    @staticmethod
+    def make_preview(body: str) -> str:
+        """Truncate a message body to the stored preview length."""
+        return body[:PREVIEW_LENGTH]
+    
     def add_message(self, message: Message) -> None:
         """Add a message to the thread and update metadata."""
         self.messages.append(message)
         self.last_message_at = message.created_at
+        self.last_message_id = message.id
+        self.last_message_sender_id = message.sender_id
+        self.last_message_preview = self.make_preview(message.body)
         
         # Update unread counts
         if message.sender_id == self.participant_1_id:
@@ -15,7 +15,7 @@ class PaymentIntent(DomainEntity):
     booking_type: str = ""
     customer_id: int = 0
     status: str = "pending"
-    metadata: Dict[str, Any] = None
+    metadata: Optional[Dict[str, Any]] = None
     expires_at: Optional[datetime] = None
 
 @dataclass
@@ -52,3 +52,16 @@ class Refund(DomainEntity):
     status: str = "pending"
     reason: str = ""
     processed_at: Optional[datetime] = None
+
+@dataclass
+class PaymentWebhookEvent(DomainEntity):
+    """A provider callback stored in the webhook inbox"""
+    provider: str = ""
+    event_id: str = ""
+    event_type: str = ""
+    payment_intent_id: Optional[str] = None
+    payload: Optional[Dict[str, Any]] = None
+    status: str = "received"
+    attempts: int = 0
+    last_error: Optional[str] = None
+    processed_at: Optional[datetime] = None
@@ -0,0 +1,26 @@
+"""Payout domain entities."""
+from dataclasses import dataclass
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+from .base import DomainEntity
+
+
+@dataclass
+class Payout(DomainEntity):
+    """Money owed to a host, tour operator or vehicle owner."""
+    host_id: int = 0
+    booking_id: Optional[int] = None
+    amount: Decimal = Decimal("0")
+    currency: str = "KES"
+    status: str = "SCHEDULED"
+    scheduled_at: Optional[datetime] = None
+    paid_at: Optional[datetime] = None
+
+
+@dataclass
+class PayoutRunSummary:
+    """Outcome of one payout scheduling run."""
+    payouts_created: int = 0
+    bookings_paid_out: int = 0
+    total_amount: Decimal = Decimal("0")
@@ -15,6 +15,8 @@ class User(DomainEntity):
     phone_number: Optional[str] = None
     agent_license_id: Optional[str] = None
     agency_name: Optional[str] = None
+    # Bumped whenever existing access tokens must stop working
+    token_version: int = 0
 
     def is_agent(self) -> bool:
         return self.role == UserRole.AGENT
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+from ..entities.ledger import LedgerAccount, LedgerCheckpointSummary, LedgerPosting
+
+
+class LedgerRepository(ABC):
+    @abstractmethod
+    async def post(self, postings: Sequence[LedgerPosting]) -> int:
+        """Append balanced postings and update account balances atomically.
+
+        Postings whose key was already recorded are skipped.
+
+        Returns:
+            Number of postings actually applied
+        """
+        pass
+
+    @abstractmethod
+    async def get_owner_accounts(self, owner_id: int, currency: str) -> List[LedgerAccount]:
+        """Return the balance snapshots of every account an owner holds in *currency*."""
+        pass
+
+    @abstractmethod
+    async def checkpoint(self) -> LedgerCheckpointSummary:
+        """Record a checkpoint per account and verify it against the previous one.
+
+        Only entries written since the previous checkpoint are summed.
+        """
+        pass
@@ -1,6 +1,7 @@
 """Message repository interface."""
 from abc import abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from .base import BaseRepository
 from ..entities.message import Message, MessageThread
 
@@ -34,19 +35,87 @@ class MessageRepository(BaseRepository[Message]):
         """Get conversation between two users about a specific booking."""
         pass
     
+    @abstractmethod
+    async def get_thread_messages(
+        self,
+        thread_id: int,
+        limit: int = 50,
+        before: Optional[Tuple[datetime, int]] = None
+    ) -> List[Message]:
+        """Get a page of a thread's messages, newest first.
+        
+        ``before`` is a ``(created_at, id)`` keyset cursor; only messages
+        strictly older than it are returned.
+        """
+        pass
+    
     @abstractmethod
     async def get_unread_count(self, user_id: int) -> int:
         """Get count of unread messages for a user."""
         pass
     
     @abstractmethod
-    async def mark_as_read(self, message_id: int, user_id: int) -> None:
-        """Mark a message as read by a specific user."""
+    async def mark_as_read(self, message_id: int, user_id: int) -> int:
+        """Mark a message as read by its recipient; returns 1 if it was unread, else 0."""
+        pass
+    
+    @abstractmethod
+    async def mark_thread_read_up_to(
+        self,
+        thread_id: int,
+        user_id: int,
+        up_to_message_id: Optional[int] = None
+    ) -> int:
+        """Mark every unread message addressed to the user in a thread as read.
+        
+        Only messages with ``id <= up_to_message_id`` are touched when given.
+        Returns the number of messages that changed state.
+        """
+        pass
+    
+    @abstractmethod
+    async def get_user_conversations(
+        self,
+        user_id: int,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[MessageThread]:
+        """Get conversation thread summaries for a user, most recent first.
+
+        Threads are returned without their messages; open a thread with
+        ``get_thread`` or ``get_conversation`` to load them.
+        """
+        pass
+    
+    @abstractmethod
+    async def count_user_conversations(self, user_id: int) -> int:
+        """Count conversation threads a user participates in."""
+        pass
+    
+    @abstractmethod
+    async def create_in_thread(self, entity: Message) -> Message:
+        """Store a message in its summary thread, creating the thread if missing.
+
+        The thread, the message and the thread's last-message fields and
+        unread counter are written together, so a failed send leaves no
+        empty thread behind.
+        """
+        pass
+    
+    @abstractmethod
+    async def find_thread(
+        self,
+        booking_type: str,
+        booking_id: int,
+        user1_id: int,
+        user2_id: int
+    ) -> Optional[MessageThread]:
+        """Get the summary thread for a booking and participant pair without messages."""
         pass
     
     @abstractmethod
-    async def get_user_conversations(self, user_id: int) -> List[MessageThread]:
-        """Get all conversation threads for a user."""
+    async def decrement_thread_unread(self, thread_id: int, user_id: int, count: int = 1) -> None:
+        """Lower a participant's unread counter, never below zero."""
         pass
     
     @abstractmethod
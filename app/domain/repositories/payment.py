@@ -1,9 +1,9 @@
-from abc import abstractmethod
-from typing import Optional, List
-from datetime import datetime
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional, List, Sequence, Tuple
+from datetime import datetime, timedelta
 from decimal import Decimal
 from .base import BaseRepository
-from ..entities.payment import Payment, PaymentIntent
+from ..entities.payment import Payment, PaymentIntent, PaymentWebhookEvent
 
 class PaymentRepository(BaseRepository[Payment]):
     @abstractmethod
@@ -33,6 +33,32 @@ class PaymentRepository(BaseRepository[Payment]):
         transaction_id: Optional[str] = None,
         failure_reason: Optional[str] = None
     ) -> None:
+        """Apply one status change; see ``update_payment_statuses``."""
+        pass
+    
+    @abstractmethod
+    async def claim_stale_pending_intents(
+        self,
+        older_than: datetime,
+        limit: int = 500,
+        lease: timedelta = timedelta(minutes=5)
+    ) -> List[PaymentIntent]:
+        """Claim unsettled intents created before *older_than* for reconciliation.
+
+        A claimed intent is not returned again, to this or any other worker,
+        until *lease* has passed. Returns the claimed intents in ID order.
+        """
+        pass
+    
+    @abstractmethod
+    async def update_payment_statuses(self, updates: Sequence[Tuple[str, str]]) -> int:
+        """Apply many ``(intent_id, status)`` changes in one batch.
+
+        Intents already in a final state are left untouched, except that a
+        completed intent may become refunded. Captures and refunds are
+        posted to the ledger in the same transaction. Returns the number of
+        intents updated.
+        """
         pass
     
     @abstractmethod
@@ -46,3 +72,37 @@ class PaymentRepository(BaseRepository[Payment]):
     @abstractmethod
     async def get_payments_by_customer(self, customer_id: int) -> List[Payment]:
         pass
+
+
+class PaymentWebhookRepository(ABC):
+    """Inbox of provider webhook events awaiting processing"""
+
+    @abstractmethod
+    async def record_event(
+        self,
+        provider: str,
+        event_id: str,
+        event_type: str,
+        payment_intent_id: Optional[str],
+        payload: Dict[str, Any]
+    ) -> bool:
+        """Store an event; return False if it was already recorded."""
+        pass
+
+    @abstractmethod
+    async def claim_batch(self, limit: int, lease_seconds: int = 300) -> List[PaymentWebhookEvent]:
+        """Claim up to *limit* unprocessed events, oldest first.
+
+        Events claimed by a consumer that did not finish within
+        *lease_seconds* become claimable again.
+        """
+        pass
+
+    @abstractmethod
+    async def mark_processed(self, event_ids: Sequence[int]) -> None:
+        pass
+
+    @abstractmethod
+    async def mark_failed(self, event_ids: Sequence[int], error: str, max_attempts: int) -> None:
+        """Release events for retry, or park them once *max_attempts* is reached."""
+        pass
@@ -0,0 +1,15 @@
+from abc import ABC, abstractmethod
+from datetime import date, datetime
+from ..entities.payout import PayoutRunSummary
+
+
+class PayoutRepository(ABC):
+    @abstractmethod
+    async def schedule_payouts(self, cutoff_date: date, scheduled_at: datetime) -> PayoutRunSummary:
+        """Create one payout per host and currency for completed bookings ending on or before *cutoff_date*.
+
+        Bookings already included in a payout are skipped, so repeated runs
+        only pick up newly eligible bookings. Each payout is posted to the
+        ledger in the same transaction.
+        """
+        pass
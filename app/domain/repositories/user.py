@@ -1,5 +1,5 @@
 from abc import abstractmethod
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from ..entities.user import User
 from .base import BaseRepository
@@ -14,3 +14,8 @@ class UserRepository(BaseRepository[User]):
     async def is_agent(self, user_id: int) -> bool:
         """Check if a user has the 'agent' role."""
         pass
+
+    @abstractmethod
+    async def get_by_ids(self, ids: Iterable[int]) -> Dict[int, User]:
+        """Fetch several users in one query, keyed by ID; unknown IDs are omitted."""
+        pass
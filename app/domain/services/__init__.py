@@ -1,3 +1,4 @@
 """Domain services for complex business logic that doesn't belong to a single entity."""
 
-from .password_service import PasswordService
\ No newline at end of file
+from .password_service import PasswordService
+from .realtime_notifier import RealtimeNotifier
\ No newline at end of file
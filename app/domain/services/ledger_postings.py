@@ -0,0 +1,82 @@
+"""Ledger postings for the business events that move money."""
+from decimal import Decimal
+
+from ..entities.ledger import LedgerAccountKind, LedgerLine, LedgerPosting, PLATFORM_OWNER_ID
+
+
+def payment_captured(intent_id: str, amount: Decimal, currency: str) -> LedgerPosting:
+    """Provider confirmed the guest's payment; hold it until the booking completes."""
+    return LedgerPosting(
+        key=f"payment:{intent_id}:captured",
+        description=f"Payment {intent_id} captured",
+        lines=[
+            LedgerLine(LedgerAccountKind.PLATFORM_CASH, PLATFORM_OWNER_ID, currency, -amount),
+            LedgerLine(LedgerAccountKind.GUEST_FUNDS, PLATFORM_OWNER_ID, currency, amount),
+        ],
+    )
+
+
+def payment_refunded(intent_id: str, amount: Decimal, currency: str) -> LedgerPosting:
+    """Money returned to the guest before the booking completed."""
+    return LedgerPosting(
+        key=f"payment:{intent_id}:refunded",
+        description=f"Payment {intent_id} refunded",
+        lines=[
+            LedgerLine(LedgerAccountKind.GUEST_FUNDS, PLATFORM_OWNER_ID, currency, -amount),
+            LedgerLine(LedgerAccountKind.PLATFORM_CASH, PLATFORM_OWNER_ID, currency, amount),
+        ],
+    )
+
+
+def booking_completed(
+    booking_type: str, booking_id: int, host_id: int, amount: Decimal, currency: str
+) -> LedgerPosting:
+    """The stay, tour or rental took place; the host has earned the booking amount."""
+    return LedgerPosting(
+        key=f"booking:{booking_type}:{booking_id}:completed",
+        description=f"{booking_type} booking {booking_id} completed",
+        lines=[
+            LedgerLine(LedgerAccountKind.GUEST_FUNDS, PLATFORM_OWNER_ID, currency, -amount),
+            LedgerLine(LedgerAccountKind.HOST_PENDING, host_id, currency, amount),
+        ],
+    )
+
+
+def payout_released(payout_id: int, host_id: int, amount: Decimal, currency: str) -> LedgerPosting:
+    """Earnings in a payout passed the hold period and became available to the host."""
+    return LedgerPosting(
+        key=f"payout:{payout_id}:released",
+        description=f"Earnings in payout {payout_id} released",
+        lines=[
+            LedgerLine(LedgerAccountKind.HOST_PENDING, host_id, currency, -amount),
+            LedgerLine(LedgerAccountKind.HOST_AVAILABLE, host_id, currency, amount),
+        ],
+    )
+
+
+def payout_scheduled(payout_id: int, host_id: int, amount: Decimal, currency: str) -> LedgerPosting:
+    """Available earnings were committed to a payout, so they are no longer available."""
+    return LedgerPosting(
+        key=f"payout:{payout_id}:scheduled",
+        description=f"Payout {payout_id} scheduled",
+        lines=[
+            LedgerLine(LedgerAccountKind.HOST_AVAILABLE, host_id, currency, -amount),
+            LedgerLine(LedgerAccountKind.PAYOUT_CLEARING, host_id, currency, amount),
+        ],
+    )
+
+
+def payout_bookings_recognised(payout_id: int, host_id: int, amount: Decimal, currency: str) -> LedgerPosting:
+    """Bookings in a payout that completed without their own completion posting.
+
+    Only tours post on completion today, so stays and rentals are recognised
+    in aggregate when their payout is scheduled.
+    """
+    return LedgerPosting(
+        key=f"payout:{payout_id}:recognised",
+        description=f"Bookings in payout {payout_id} recognised",
+        lines=[
+            LedgerLine(LedgerAccountKind.GUEST_FUNDS, PLATFORM_OWNER_ID, currency, -amount),
+            LedgerLine(LedgerAccountKind.HOST_PENDING, host_id, currency, amount),
+        ],
+    )
@@ -6,7 +6,7 @@ class PasswordService(ABC):
     """Abstract password service for domain layer."""
     
     @abstractmethod
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """Hash a plain text password.
         
         Args:
@@ -18,7 +18,7 @@ class PasswordService(ABC):
         pass
     
     @abstractmethod
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash.
         
         Args:
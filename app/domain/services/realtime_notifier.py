@@ -0,0 +1,21 @@
+"""Realtime notifier abstraction for pushing events to connected users."""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable
+
+
+class RealtimeNotifier(ABC):
+    """Abstract push channel used by use cases to notify online users."""
+
+    @abstractmethod
+    async def notify(self, user_ids: Iterable[int], event_type: str, data: Dict[str, Any]) -> None:
+        """Push an event to every live connection of the given users.
+
+        Delivery is best effort: users without an open connection simply
+        miss the event and catch up through the REST endpoints.
+
+        Args:
+            user_ids: Users that should receive the event
+            event_type: Event name, e.g. ``message.created``
+            data: JSON-serialisable event payload
+        """
+        pass
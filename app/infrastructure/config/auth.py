@@ -5,8 +5,10 @@ helpers.
 """
 from __future__ import annotations
 
+import secrets
 from datetime import datetime, timedelta, UTC
-from typing import Annotated, Optional
+from functools import lru_cache
+from typing import Annotated, Any, Dict, Optional
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -16,7 +18,11 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .config import settings
-from .database import get_async_session
+from .database import AsyncSessionLocal
+from .principal_cache import PrincipalCache
+from .revocation import AccessTokenDenylist, PrincipalInvalidations
+from .token_store import TokenStore, create_token_store
+from shared.utils.concurrency import BoundedExecutor
 from infrastructure.database.models.user import User as UserModel, UserRole
 from domain.entities.user import User as DomainUser
 
@@ -25,17 +31,29 @@ __all__ = [
     "oauth2_scheme",
     "verify_password",
     "get_password_hash",
+    "verify_password_async",
+    "get_password_hash_async",
+    "password_executor",
     "create_access_token",
+    "principal_claims",
+    "authenticate_token",
+    "token_subject",
     "create_refresh_token",
     "verify_refresh_token",
     "revoke_refresh_token",
+    "revoke_access_token",
+    "access_token_denylist",
     "get_current_user",
     "get_current_active_user",
+    "invalidate_principal",
+    "principal_cache",
+    "principal_invalidations",
     "authenticate_user",
     "require_roles",
     # OAuth helpers
     "create_oauth_state",
     "pop_oauth_state",
+    "token_store",
 ]
 
 # ---------------------------------------------------------------------------
@@ -50,9 +68,30 @@ REFRESH_TOKEN_EXPIRE_DAYS: int = getattr(
     settings, "REFRESH_TOKEN_EXPIRE_DAYS", 30
 )
 
-# In-memory refresh token store (in production, use Redis or database)
-_refresh_tokens: dict[str, dict] = {}
-_oauth_states: dict[str, dict] = {}
+OAUTH_STATE_EXPIRE_MINUTES = 10
+
+# Refresh tokens and OAuth state; use the database backend with several workers
+token_store: TokenStore = create_token_store(settings.AUTH_TOKEN_STORE)
+
+# Revoked access-token IDs; authoritative in the token store, filtered in memory
+access_token_denylist = AccessTokenDenylist(
+    token_store,
+    capacity=settings.AUTH_DENYLIST_CAPACITY,
+    refresh_interval=settings.AUTH_DENYLIST_REFRESH_SECONDS,
+)
+
+principal_cache = PrincipalCache(
+    maxsize=settings.AUTH_PRINCIPAL_CACHE_SIZE,
+    ttl=settings.AUTH_PRINCIPAL_CACHE_TTL,
+)
+
+# Invalidations reach other workers through the token store
+principal_invalidations = PrincipalInvalidations(
+    token_store,
+    principal_cache,
+    retention=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES, seconds=settings.AUTH_PRINCIPAL_CACHE_TTL),
+    refresh_interval=settings.AUTH_DENYLIST_REFRESH_SECONDS,
+)
 
 # ---------------------------------------------------------------------------
 # Password hashing
@@ -60,6 +99,12 @@ _oauth_states: dict[str, dict] = {}
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt takes 100-300 ms of CPU per call; request handlers run it here so
+# a burst of logins queues instead of blocking the event loop
+password_executor = BoundedExecutor(
+    max_workers=settings.PASSWORD_HASH_WORKERS, name="password-hash"
+)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Return True if *plain_password* matches *hashed_password*."""
@@ -70,6 +115,16 @@ def get_password_hash(password: str) -> str:
     """Return a hash for *password*."""
     return pwd_context.hash(password)
 
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """``verify_password`` on the password executor."""
+    return await password_executor.run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """``get_password_hash`` on the password executor."""
+    return await password_executor.run(get_password_hash, password)
+
 # ---------------------------------------------------------------------------
 # OAuth2 setup
 # ---------------------------------------------------------------------------
@@ -83,74 +138,101 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/token")
 # ---------------------------------------------------------------------------
 
 def create_access_token(
-    subject: str | int, expires_delta: Optional[timedelta] = None
+    subject: str | int,
+    expires_delta: Optional[timedelta] = None,
+    claims: Optional[dict] = None,
 ) -> str:
-    """Generate a signed JWT for *subject*."""
+    """Generate a signed JWT for *subject* with optional extra *claims*.
+
+    Each token gets a unique ``jti`` so it can be revoked on its own.
+    """
     if expires_delta is None:
         expires_delta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     to_encode = {
+        **(claims or {}),
         "sub": str(subject),
         "exp": datetime.now(UTC) + expires_delta,
+        "jti": secrets.token_urlsafe(16),
     }
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
 
-def create_refresh_token(user_id: int) -> str:
+def principal_claims(user: DomainUser) -> dict:
+    """Claims to embed in *user*'s access tokens.
+
+    The token version is always included. With ``AUTH_SIGNED_CLAIMS`` the
+    role, active flag, email and name travel in the token as well, so
+    ``get_current_user`` can skip the users lookup.
+    """
+    claims: Dict[str, Any] = {"ver": user.token_version}
+    if settings.AUTH_SIGNED_CLAIMS:
+        claims.update({
+            "role": user.role.value,
+            "act": user.is_active,
+            "email": user.email,
+            "name": user.full_name,
+        })
+    return claims
+
+
+async def create_refresh_token(user_id: int) -> str:
     """Generate a refresh token for a user."""
-    import secrets
-    
     refresh_token = secrets.token_urlsafe(32)
-    expires_at = datetime.now(UTC) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
-    
-    # Store refresh token (in production, use Redis or database)
-    _refresh_tokens[refresh_token] = {
-        "user_id": user_id,
-        "expires_at": expires_at,
-        "created_at": datetime.now(UTC)
-    }
-    
+    await token_store.put(
+        "refresh",
+        refresh_token,
+        {"user_id": user_id, "created_at": datetime.now(UTC).isoformat()},
+        timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+    )
     return refresh_token
 
 
 async def verify_refresh_token(refresh_token: str) -> Optional[int]:
     """Verify a refresh token and return user ID if valid."""
-    token_data = _refresh_tokens.get(refresh_token)
-    
-    if not token_data:
-        return None
-    
-    # Check if token has expired
-    if datetime.now(UTC) > token_data["expires_at"]:
-        # Remove expired token
-        _refresh_tokens.pop(refresh_token, None)
-        return None
-    
-    return token_data["user_id"]
+    token_data = await token_store.get("refresh", refresh_token)
+    return token_data["user_id"] if token_data else None
 
 
 async def revoke_refresh_token(refresh_token: str) -> bool:
     """Revoke a refresh token."""
-    return _refresh_tokens.pop(refresh_token, None) is not None
+    return await token_store.pop("refresh", refresh_token) is not None
+
+
+async def revoke_access_token(token: str) -> bool:
+    """Deny *token* for the rest of its lifetime.
+
+    Returns False for tokens that are invalid, expired or carry no ``jti``.
+    """
+    try:
+        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    except JWTError:
+        return False
+    if not payload.get("jti") or payload.get("exp") is None:
+        return False
+    expires_at = datetime.fromtimestamp(payload["exp"], UTC)
+    await access_token_denylist.revoke(payload["jti"], expires_at)
+    return True
 
 
 # ---------------------------------------------------------------------------
-# OAuth state helpers (in-memory; replace with Redis in production)
+# OAuth state helpers
 # ---------------------------------------------------------------------------
 
-def create_oauth_state(provider: str, return_url: Optional[str] = None) -> str:
-    import secrets
+async def create_oauth_state(provider: str, return_url: Optional[str] = None) -> str:
     state = secrets.token_urlsafe(16)
-    _oauth_states[state] = {
-        "provider": provider,
-        "return_url": return_url,
-        "created_at": datetime.now(UTC),
-    }
+    await token_store.put(
+        "oauth_state",
+        state,
+        {"provider": provider, "return_url": return_url},
+        timedelta(minutes=OAUTH_STATE_EXPIRE_MINUTES),
+    )
     return state
 
 
-def pop_oauth_state(state: str) -> Optional[dict]:
-    return _oauth_states.pop(state, None)
+async def pop_oauth_state(state: str) -> Optional[dict]:
+    """Consume *state*; a state can be used once, by any worker."""
+    return await token_store.pop("oauth_state", state)
 
 
 # ---------------------------------------------------------------------------
@@ -170,7 +252,7 @@ async def authenticate_user(
 ) -> Optional[UserModel]:
     """Return user if credentials are valid, else None."""
     user = await _get_user_by_email(session, email)
-    if not user or not verify_password(password, user.hashed_password):
+    if not user or not await verify_password_async(password, user.hashed_password):
         return None
     return user
 
@@ -179,41 +261,136 @@ async def authenticate_user(
 # Current user dependencies
 # ---------------------------------------------------------------------------
 
-async def _decode_token(token: str) -> str:
+def _decode_payload(token: str) -> dict:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        subject: Optional[str] = payload.get("sub")
-        if subject is None:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token",
-            )
-        return subject
     except JWTError as exc:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
         ) from exc
+    if payload.get("sub") is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+        )
+    return payload
+
+
+async def _decode_token(token: str) -> str:
+    return _decode_payload(token)["sub"]
+
+
+@lru_cache(maxsize=4096)
+def token_subject(token: str) -> Optional[str]:
+    """Return the subject of a correctly signed *token*, ignoring expiry.
+
+    Cached, for keying per-user state such as rate limits and response
+    caches; it does not authenticate the request.
+    """
+    try:
+        payload = jwt.decode(
+            token, SECRET_KEY, algorithms=[ALGORITHM], options={"verify_exp": False}
+        )
+    except JWTError:
+        return None
+    subject = payload.get("sub")
+    return str(subject) if subject is not None else None
+
+
+async def invalidate_principal(user_id: int, token_version: Optional[int] = None) -> None:
+    """Forget the cached principal for *user_id* in every worker.
+
+    Pass the user's new *token_version* after bumping it so older tokens
+    are rejected without a query, including signed-claims tokens. This
+    worker applies it at once; others within
+    ``AUTH_DENYLIST_REFRESH_SECONDS`` when the token store is shared.
+    """
+    await principal_invalidations.publish(user_id, token_version)
+
+
+def _principal_from_claims(user_id: int, payload: dict) -> DomainUser:
+    """Build the principal carried by a signed-claims token.
+
+    Only identity, role and status are available; routes needing the full
+    profile load it themselves.
+    """
+    return DomainUser(
+        id=user_id,
+        email=payload.get("email", ""),
+        full_name=payload.get("name", ""),
+        role=UserRole(payload["role"]),
+        is_active=bool(payload.get("act", True)),
+        token_version=payload.get("ver", 0),
+    )
 
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-    session: Annotated[AsyncSession, Depends(get_async_session)],
 ):
     from shared.mappers.user import UserMapper
-    
-    user_id = await _decode_token(token)
-    stmt = select(UserModel).where(UserModel.id == int(user_id))
-    result = await session.execute(stmt)
-    user_model: Optional[UserModel] = result.scalar_one_or_none()
+
+    payload = _decode_payload(token)
+    try:
+        user_id = int(payload["sub"])
+        token_version = int(payload.get("ver", 0))
+    except (TypeError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token",
+        ) from exc
+
+    await principal_invalidations.refresh()
+    if principal_cache.is_revoked(user_id, token_version):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+        )
+    # Tokens issued before jti was introduced expire on their own
+    jti = payload.get("jti")
+    if jti and await access_token_denylist.is_revoked(jti):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+        )
+    if "role" in payload:
+        return _principal_from_claims(user_id, payload)
+
+    cached = principal_cache.get(user_id, token_version)
+    if cached is not None:
+        return cached
+
+    user_model = await _load_user_model(user_id)
     if user_model is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User not found",
         )
-    
+    if user_model.token_version != token_version:
+        principal_cache.invalidate(user_id, user_model.token_version)
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token has been revoked",
+        )
+
     # Convert to domain entity
-    return UserMapper.model_to_entity(user_model)
+    user = UserMapper.model_to_entity(user_model)
+    principal_cache.put(user)
+    return user
+
+
+async def _load_user_model(user_id: int) -> Optional[UserModel]:
+    """Load a user on the request's session, or a short-lived one outside a request."""
+    from infrastructure.database.unit_of_work import current_session, current_unit_of_work
+
+    stmt = select(UserModel).where(UserModel.id == user_id)
+    if current_unit_of_work() is not None:
+        # Reuse the unit of work's connection rather than checking out a second one
+        result = await current_session().execute(stmt)
+        return result.scalar_one_or_none()
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
 
 
 async def get_current_active_user(
@@ -230,6 +407,20 @@ async def get_current_active_user(
     return current_user
 
 
+async def authenticate_token(token: str) -> Optional[DomainUser]:
+    """Return the active user *token* authenticates, or None.
+
+    Applies the same checks as ``get_current_active_user`` (denylist, token
+    version, active flag) for transports such as WebSockets that cannot
+    use the HTTP 401 flow.
+    """
+    try:
+        user = await get_current_user(token)
+    except HTTPException:
+        return None
+    return user if user.is_active else None
+
+
 # ---------------------------------------------------------------------------
 # Role-based access helper
 # ---------------------------------------------------------------------------
@@ -1,9 +1,40 @@
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.orm import declarative_base
 
 from .config import settings
+from .metrics import TimedAsyncAdaptedQueuePool, instrument_engine
+from .slow_query import slow_query_log
 
-engine = create_async_engine(settings.DATABASE_URL, echo=True)
+engine = create_async_engine(
+    settings.DATABASE_URL, echo=settings.DATABASE_ECHO, poolclass=TimedAsyncAdaptedQueuePool
+)
+instrument_engine(engine, "primary")
+if engine.dialect.name == "sqlite":
+    # pysqlite only opens a transaction before DML, so a SAVEPOINT would start
+    # one of its own and RELEASE would commit it. Emit BEGIN ourselves so
+    # begin_nested() stays inside the session's transaction.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin_sqlite_transaction(connection):
+        connection.exec_driver_sql("BEGIN")
+
+if settings.SLOW_QUERY_LOG_ENABLED:
+    slow_query_log.install(engine, "primary")
+
+# Read replica for read-only routes; None sends everything to the primary
+replica_engine = (
+    create_async_engine(settings.DATABASE_REPLICA_URL, poolclass=TimedAsyncAdaptedQueuePool)
+    if settings.DATABASE_REPLICA_URL
+    else None
+)
+if replica_engine is not None:
+    instrument_engine(replica_engine, "replica")
+    if settings.SLOW_QUERY_LOG_ENABLED:
+        slow_query_log.install(replica_engine, "replica")
 
 # Primary async session maker with improved configuration
 AsyncSessionLocal = async_sessionmaker(
@@ -25,7 +56,17 @@ Base = declarative_base()
 async_session_maker = AsyncSessionLocal
 
 async def get_async_session():
-    """Get an async database session."""
+    """Get an async database session.
+
+    Inside a request this is the unit of work's session, so the route's
+    ``commit()`` joins the single commit made when the request ends.
+    """
+    from infrastructure.database.unit_of_work import current_unit_of_work
+
+    uow = current_unit_of_work()
+    if uow is not None:
+        yield uow.session
+        return
     async with AsyncSessionLocal() as session:
         yield session
 
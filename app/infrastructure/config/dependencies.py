@@ -3,12 +3,17 @@
 Exposes:
 - `current_active_user`: returns the authenticated user (or raises 401).
 - `require_admin`, `require_agent_or_admin`: role-based dependency helpers.
+- `use_read_replica`: marks a route read-only so it may read from the replica.
 """
 
 from typing import Callable
 
+from fastapi import Request
+
 from .auth import get_current_active_user, require_roles
 from infrastructure.database.models.user import UserRole
+from infrastructure.database.replica import STICKY_COOKIE, replica_router
+from infrastructure.database.unit_of_work import current_unit_of_work
 
 # Base current-user dependency
 current_active_user = get_current_active_user
@@ -19,3 +24,19 @@ authenticated_user = current_active_user
 # Role-based helpers
 require_admin: Callable = require_roles(UserRole.ADMIN)
 require_agent_or_admin: Callable = require_roles(UserRole.AGENT, UserRole.ADMIN)
+
+
+async def use_read_replica(request: Request) -> None:
+    """Let this request's plain reads go to the read replica when safe.
+
+    Add as ``dependencies=[Depends(use_read_replica)]`` on routes that only
+    read. Clients that wrote recently, or a lagging replica, keep the
+    request on the primary.
+    """
+    uow = current_unit_of_work()
+    if uow is None:
+        return
+    if await replica_router.allows(
+        request.headers.get("authorization"), request.cookies.get(STICKY_COOKIE)
+    ):
+        uow.use_replica()
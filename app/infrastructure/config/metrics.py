@@ -0,0 +1,383 @@
+"""In-process metrics in the Prometheus text exposition format.
+
+Requests are labelled by route template (``/api/v1/bnb/listings/{listing_id}``),
+never by raw path, so label cardinality is bounded by the route table.
+Queries are attributed to the request or background job that issued them
+through a context variable the SQLAlchemy engine events read.
+
+Metrics are kept per worker process; scrape each worker, or run a single
+worker per container, to see all of them.
+"""
+from __future__ import annotations
+
+import bisect
+import functools
+import logging
+import math
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Label for responses produced before routing (404s, rate limits)
+UNROUTED = "<unrouted>"
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if len(labels) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Monotonically increasing total."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in self._values.items()
+        ]
+
+
+class Gauge(_Metric):
+    """Value that goes up and down."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: str) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"
+            for key, value in self._values.items()
+        ]
+
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class _HistogramSeries:
+    counts: List[int]
+    total: float = 0.0
+    count: int = 0
+
+
+class Histogram(_Metric):
+    """Distribution of observations over fixed buckets."""
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelValues, _HistogramSeries] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = _HistogramSeries(counts=[0] * len(self.buckets))
+        index = bisect.bisect_left(self.buckets, value)
+        if index < len(self.buckets):
+            series.counts[index] += 1
+        series.total += value
+        series.count += 1
+
+    def _samples(self) -> List[str]:
+        lines = []
+        inf = 'le="+Inf"'
+        for key, series in self._series.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets, series.counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, inf)} {series.count}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, key)} {_format_value(series.total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, key)} {series.count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Metrics rendered together, plus collectors sampled at scrape time."""
+
+    def __init__(self) -> None:
+        self._metrics: List[_Metric] = []
+        self._collectors: List[Callable[[], None]] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def add_collector(self, collect: Callable[[], None]) -> None:
+        """Run *collect* before each render, typically to set gauges from stats."""
+        self._collectors.append(collect)
+
+    def render(self) -> str:
+        for collect in self._collectors:
+            try:
+                collect()
+            except Exception:
+                # One broken source must not hide every other metric
+                logger.exception("Metrics collector failed")
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter(
+    "http_requests_total", "HTTP requests by route template and status", ("method", "route", "status")
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds", "HTTP request latency by route template", ("method", "route")
+)
+http_requests_in_flight = registry.gauge("http_requests_in_flight", "HTTP requests being served")
+db_query_duration = registry.histogram(
+    "db_query_duration_seconds",
+    "SQL statement execution time by issuing route or job",
+    ("route", "database"),
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+db_queries_per_request = registry.histogram(
+    "db_queries_per_request",
+    "SQL statements issued per request by route template",
+    ("route",),
+    buckets=(0, 1, 2, 5, 10, 20, 50, 100),
+)
+db_pool_checkout_wait = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ("database",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+db_pool_connections = registry.gauge(
+    "db_pool_connections", "Pooled connections by state", ("database", "state")
+)
+job_duration = registry.histogram(
+    "background_job_duration_seconds",
+    "Scheduled job run time",
+    ("job", "outcome"),
+    buckets=(0.01, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0, 900.0),
+)
+
+
+@dataclass
+class QueryScope:
+    """Queries issued on behalf of one request or job."""
+
+    label: Callable[[], str]
+    queries: int = 0
+
+
+_query_scope: ContextVar[Optional[QueryScope]] = ContextVar("query_scope", default=None)
+
+
+def route_label(scope: Mapping[str, Any]) -> str:
+    """Route template of an ASGI request, once routing has happened."""
+    route = scope.get("route")
+    path = getattr(route, "path", None) or scope.get("route_template")
+    return path or UNROUTED
+
+
+def open_query_scope(label: Callable[[], str]):
+    """Attribute queries to *label* until ``close_query_scope(token)``."""
+    query_scope = QueryScope(label=label)
+    return query_scope, _query_scope.set(query_scope)
+
+
+def close_query_scope(token) -> None:
+    _query_scope.reset(token)
+
+
+def current_query_label() -> str:
+    """Route template or job the statement being executed belongs to."""
+    query_scope = _query_scope.get()
+    return query_scope.label() if query_scope is not None else UNROUTED
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(database: str):
+    def after(conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["query_started"].pop()
+        query_scope = _query_scope.get()
+        if query_scope is not None:
+            query_scope.queries += 1
+            label = query_scope.label()
+        else:
+            label = UNROUTED
+        db_query_duration.observe(time.perf_counter() - started, route=label, database=database)
+
+    return after
+
+
+def _handle_error(context) -> None:
+    stack = context.connection.info.get("query_started") if context.connection is not None else None
+    if stack:
+        stack.pop()
+
+
+def instrument_engine(engine, database: str) -> None:
+    """Time every statement *engine* executes and expose its pool state."""
+    sync_engine = engine.sync_engine
+    event.listen(sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(sync_engine, "after_cursor_execute", _after_cursor_execute(database))
+    event.listen(sync_engine, "handle_error", _handle_error)
+    pool = sync_engine.pool
+    if isinstance(pool, TimedAsyncAdaptedQueuePool):
+        pool.database = database
+
+        def collect() -> None:
+            db_pool_connections.set(pool.checkedout(), database=database, state="checked_out")
+            db_pool_connections.set(pool.checkedin(), database=database, state="idle")
+            db_pool_connections.set(max(0, pool.overflow()), database=database, state="overflow")
+
+        registry.add_collector(collect)
+
+
+class TimedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """The async engines' default pool, timing how long checkouts wait."""
+
+    database = "primary"
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            db_pool_checkout_wait.observe(time.perf_counter() - started, database=self.database)
+
+
+def timed_job(name: str):
+    """Record a scheduled coroutine's duration and attribute its queries to it.
+
+    The outcome is ``error`` only when the job raised; jobs that log and
+    swallow their own failures count as ``success``.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            _, token = open_query_scope(lambda: f"job:{name}")
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result = await fn(*args, **kwargs)
+                outcome = "success"
+                return result
+            finally:
+                close_query_scope(token)
+                job_duration.observe(time.perf_counter() - started, job=name, outcome=outcome)
+
+        return wrapper
+
+    return decorator
+
+
+def observe_request(method: str, route: str, status: int, duration: float, queries: int) -> None:
+    http_requests.inc(method=method, route=route, status=str(status))
+    http_request_duration.observe(duration, method=method, route=route)
+    db_queries_per_request.observe(queries, route=route)
+
+
+def add_stats_gauges(name: str, documentation: str, stats: Callable[[], Mapping[str, float]]) -> None:
+    """Expose a component's ``stats()``-style numbers as one labelled gauge."""
+    gauge = registry.gauge(name, documentation, ("stat",))
+
+    def collect() -> None:
+        for stat, value in stats().items():
+            gauge.set(float(value), stat=stat)
+
+    registry.add_collector(collect)
+
@@ -1,100 +1,339 @@
 """Custom middleware for rate limiting and audit logging.
 
 This module defines:
-1. Rate limiting using `slowapi` and Redis backend (memory fallback).
+1. Sliding-window rate limiting per user or IP (see `rate_limit`).
 2. Audit logging middleware that records critical requests to the database.
+3. A unit-of-work middleware sharing one session per request.
+4. A response cache with ETags for endpoints marked ``@cache_response``.
+5. Request metrics: latency, status and query counts per route template.
 
 All IDs are integers as per project convention.
 """
 from __future__ import annotations
 
+import logging
+import time
 from datetime import datetime, UTC
-from typing import Callable, Awaitable
 
-from fastapi import Request, Response
-from slowapi import Limiter
-from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
-from .database import AsyncSessionLocal
-from infrastructure.database.models.audit_log import AuditLog, AuditAction
+from infrastructure.database.models.audit_log import AuditAction
+from infrastructure.database.replica import replica_router
+from infrastructure.database.unit_of_work import UnitOfWork
+from infrastructure.services.audit_log_writer import AuditLogWriter
+from .metrics import (
+    close_query_scope,
+    http_requests_in_flight,
+    observe_request,
+    open_query_scope,
+    route_label,
+)
+from .rate_limit import RateLimiter, client_key
+from .response_cache import (
+    CachePolicy,
+    CachedResponse,
+    ResponseCache,
+    cache_key,
+    etag_matches,
+    make_etag,
+    policy_for,
+)
+
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
-# Rate limiting setup
+# Rate limiting middleware
 # ---------------------------------------------------------------------------
-# In-memory backend by default; can be switched to Redis by setting env var
-def _key_func(request: Request) -> str:
-    # Prefer user id if available for authenticated routes; fallback to client host
-    try:
-        uid = getattr(request.state, "user", None)
-        if uid and getattr(uid, "id", None):
-            return f"user:{uid.id}"
-    except Exception:
-        pass
-    return request.client.host
+class RateLimitMiddleware:
+    """Reject requests over their route's sliding-window limit with a 429.
+
+    Paths without a policy pass straight through. If the counter store is
+    unreachable the request is allowed, so an outage of a shared store
+    does not take the API down with it.
+    """
+
+    def __init__(self, app: ASGIApp, limiter: RateLimiter) -> None:
+        self.app = app
+        self.limiter = limiter
 
-limiter = Limiter(key_func=_key_func)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        policy = self.limiter.policy_for(scope["path"])
+        if policy is None:
+            await self.app(scope, receive, send)
+            return
+
+        authorization = None
+        for name, value in scope["headers"]:
+            if name == b"authorization":
+                authorization = value.decode("latin-1")
+                break
+        client = scope.get("client")
+        key = client_key(authorization, client[0] if client else None)
+        try:
+            result = await self.limiter.hit(policy, key)
+        except Exception:
+            logger.warning("Rate limit store unavailable; allowing request", exc_info=True)
+            await self.app(scope, receive, send)
+            return
 
-rate_limit_middleware = SlowAPIMiddleware
+        if result.allowed:
+            await self.app(scope, receive, send)
+            return
+        response = JSONResponse(
+            status_code=429,
+            content={"detail": "Rate limit exceeded"},
+            headers={
+                "Retry-After": str(result.retry_after),
+                "RateLimit-Limit": str(result.limit),
+                "RateLimit-Remaining": "0",
+            },
+        )
+        await response(scope, receive, send)
 
 
 # ---------------------------------------------------------------------------
 # Audit logging middleware
 # ---------------------------------------------------------------------------
-class AuditLoggingMiddleware(BaseHTTPMiddleware):
-    """Persist critical actions to `audit_logs` table for compliance."""
+class AuditLoggingMiddleware:
+    """Persist critical actions to `audit_logs` table for compliance.
 
-    def __init__(self, app, critical_paths: set[str] | None = None):  # type: ignore[override]
-        super().__init__(app)
-        self.critical_paths = critical_paths or set()
+    Pure ASGI: requests outside ``critical_paths`` pass straight through,
+    and audited ones only have their response status observed. Entries are
+    handed to an ``AuditLogWriter``, which inserts them in batches in the
+    background, so no request waits on an audit commit.
+    """
+
+    def __init__(self, app: ASGIApp, writer: AuditLogWriter, critical_paths: set[str] | None = None) -> None:
+        self.app = app
+        self.writer = writer
+        self.critical_paths = tuple(critical_paths or ())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(self.critical_paths):
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
-    async def dispatch(self, request: Request, call_next: Callable[[Request], Awaitable[Response]]):  # type: ignore[override]
-        response: Response | None = None
         try:
-            response = await call_next(request)
-            return response
+            await self.app(scope, receive, send_with_status)
         finally:
-            if self._should_audit(request):
-                await self._log_request(request, response)
+            self._log_request(scope, status_code)
+
+    def _log_request(self, scope: Scope, status_code: int) -> None:
+        # Queued only; a full queue drops the entry rather than slow the request
+        user = scope.get("state", {}).get("user")
+        self.writer.record({
+            "path": scope["path"][:500],
+            "method": scope["method"],
+            "status_code": status_code,
+            "user_id": getattr(user, "id", None),
+            "action": AuditAction.AUTO.value,
+            "created_at": datetime.now(UTC),
+        })
+
+
+# ---------------------------------------------------------------------------
+# Response cache middleware
+# ---------------------------------------------------------------------------
+# Set per request (CORS varies by Origin) or replaced on every cached reply
+UNCACHED_HEADERS = (b"etag", b"cache-control", b"vary")
+
+
+class ResponseCacheMiddleware:
+    """Serve cached GET responses and answer conditional requests with 304.
+
+    Only endpoints marked with ``@cache_response`` are stored, and only
+    complete 200 responses that set no cookie. Sits outside the unit of
+    work, so a response is stored after its transaction has committed.
+    """
+
+    def __init__(self, app: ASGIApp, cache: ResponseCache) -> None:
+        self.app = app
+        self.cache = cache
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        key = cache_key(scope["path"], scope.get("query_string", b""), headers.get("authorization"))
+        if_none_match = headers.get("if-none-match")
+        entry = self.cache.get(key)
+        if entry is not None:
+            # Served before routing; lets metrics still label the route
+            scope["route_template"] = entry.route
+            await self._send_cached(entry, if_none_match, send)
+            return
+
+        start: Message | None = None
+        policy: CachePolicy | None = None
+        chunks: list[bytes] = []
 
-    def _should_audit(self, request: Request) -> bool:
-        path = request.url.path
-        if any(path.startswith(p) for p in self.critical_paths):
-            return True
-        return False
+        async def send_and_store(message: Message) -> None:
+            nonlocal start, policy
+            if message["type"] == "http.response.start":
+                policy = policy_for(scope.get("endpoint"))
+                if (
+                    policy is not None
+                    and message["status"] == 200
+                    and not any(name == b"set-cookie" for name, _ in message.get("headers", []))
+                ):
+                    # Hold the start until the whole body is known for the ETag
+                    start = message
+                    return
+            elif message["type"] == "http.response.body" and start is not None and policy is not None:
+                chunks.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    return
+                entry = self._store(key, policy, route_label(scope), start, b"".join(chunks))
+                start = None
+                await self._send_cached(entry, if_none_match, send)
+                return
+            await send(message)
 
-    async def _log_request(self, request: Request, response: Response | None):
-        # Use a fresh session for each audit log to avoid conflicts
+        await self.app(scope, receive, send_and_store)
+
+    def _store(self, key: str, policy: CachePolicy, route: str, start: Message, body: bytes) -> CachedResponse:
+        scope = "private" if key.startswith("user:") else "public"
+        entry = CachedResponse(
+            namespace=policy.namespace,
+            route=route,
+            expires_at=time.monotonic() + policy.ttl,
+            etag=make_etag(body),
+            cache_control=f"{scope}, max-age={policy.ttl}".encode(),
+            headers=[
+                (name, value)
+                for name, value in start.get("headers", [])
+                if name not in UNCACHED_HEADERS and not name.startswith(b"access-control-")
+            ],
+            body=body,
+        )
+        self.cache.put(key, entry)
+        return entry
+
+    async def _send_cached(self, entry: CachedResponse, if_none_match: str | None, send: Send) -> None:
+        validators = [(b"etag", entry.etag), (b"cache-control", entry.cache_control)]
+        if etag_matches(if_none_match, entry.etag):
+            self.cache.not_modified += 1
+            await send({"type": "http.response.start", "status": 304, "headers": validators})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await send({"type": "http.response.start", "status": 200, "headers": [*entry.headers, *validators]})
+        await send({"type": "http.response.body", "body": entry.body})
+
+
+# ---------------------------------------------------------------------------
+# Metrics middleware
+# ---------------------------------------------------------------------------
+class MetricsMiddleware:
+    """Record latency, status and SQL statement count of every request.
+
+    Outermost, so time spent in the other middlewares counts too. Labels
+    use the matched route template, resolved after the request has been
+    routed.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        query_scope, token = open_query_scope(lambda: route_label(scope))
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
         try:
-            async with AsyncSessionLocal() as session:
-                audit_entry = AuditLog(
-                    path=request.url.path,
-                    method=request.method,
-                    status_code=response.status_code if response else 500,
-                    user_id=request.state.user.id if hasattr(request.state, "user") and request.state.user else None,  # type: ignore[attr-defined]
-                    action=AuditAction.AUTO,
-                    created_at=datetime.now(UTC),
-                )
-                session.add(audit_entry)
-                await session.commit()
-        except Exception:
-            # Silently fail audit logging to not break the main request flow
-            pass
+            await self.app(scope, receive, send_with_status)
+        finally:
+            http_requests_in_flight.dec()
+            close_query_scope(token)
+            observe_request(
+                scope["method"],
+                route_label(scope),
+                status_code,
+                time.perf_counter() - started,
+                query_scope.queries,
+            )
 
 
 # ---------------------------------------------------------------------------
-# Error handler for rate limit exceeded
+# Unit of work middleware
 # ---------------------------------------------------------------------------
-from typing import Any
-from fastapi import Request
-from slowapi.errors import RateLimitExceeded
-from starlette.responses import JSONResponse
+class UnitOfWorkMiddleware:
+    """Give each HTTP request one session, committed before the response.
+
+    The transaction commits when the response starts with a status below
+    400 and rolls back otherwise. If the commit fails the client gets a 500
+    instead of the original response. Writes made while a streaming body is
+    being sent are not committed.
+
+    With a read replica configured, a committed write also starts the
+    client's read-your-writes window (see ``ReplicaRouter``).
+    """
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-async def rate_limit_exceeded_handler(request: Request, exc: Exception) -> JSONResponse:  # noqa: D401
-    return JSONResponse(
-        status_code=429,
-        content={"detail": "Rate limit exceeded"},
-    )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        uow = UnitOfWork()
+        token = uow.activate()
+        commit_failed = False
+
+        async def send_after_commit(message: Message) -> None:
+            nonlocal commit_failed
+            if commit_failed:
+                return
+            if message["type"] == "http.response.start" and uow.pending:
+                try:
+                    if message["status"] < 400:
+                        await uow.commit()
+                        if uow.wrote and replica_router.enabled:
+                            authorization = Headers(scope=scope).get("authorization")
+                            cookie = replica_router.record_write(authorization)
+                            message = {
+                                **message,
+                                "headers": [*message.get("headers", []), (b"set-cookie", cookie.encode())],
+                            }
+                    else:
+                        await uow.rollback()
+                except Exception:
+                    logger.exception("Request commit failed")
+                    commit_failed = True
+                    await uow.rollback()
+                    response = JSONResponse(status_code=500, content={"detail": "Internal server error"})
+                    await response(scope, receive, send)
+                    return
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_after_commit)
+        finally:
+            uow.deactivate(token)
+            await uow.close()
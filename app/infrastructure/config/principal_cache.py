@@ -0,0 +1,63 @@
+"""Bounded in-process cache of authenticated principals."""
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Optional, Tuple
+
+from domain.entities.user import User
+
+
+class PrincipalCache:
+    """TTL + LRU cache of users keyed by user ID and token version.
+
+    An entry only matches tokens minted for the same ``token_version``, so
+    bumping the version in the database makes older tokens miss the cache
+    and fail the version check on reload. Invalidation also records the
+    new minimum version locally, which lets this process reject old tokens
+    without a query even when they carry signed claims.
+
+    Args:
+        maxsize: Maximum number of cached principals
+        ttl: Seconds an entry stays valid after it was loaded
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 60.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: "OrderedDict[int, Tuple[float, int, User]]" = OrderedDict()
+        self._min_versions: "OrderedDict[int, int]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, user_id: int, token_version: int) -> Optional[User]:
+        """Return a copy of the cached user, or None on a miss."""
+        entry = self._entries.get(user_id)
+        if entry is None or entry[1] != token_version or entry[0] < time.monotonic():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(user_id)
+        self.hits += 1
+        # Callers may mutate the user they receive; keep the cached one pristine
+        return replace(entry[2])
+
+    def put(self, user: User) -> None:
+        self._entries[user.id] = (time.monotonic() + self.ttl, user.token_version, replace(user))
+        self._entries.move_to_end(user.id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: int, min_version: Optional[int] = None) -> None:
+        """Drop the user's entry; with *min_version*, also reject older tokens."""
+        self._entries.pop(user_id, None)
+        if min_version is not None:
+            self._min_versions[user_id] = max(min_version, self._min_versions.get(user_id, 0))
+            self._min_versions.move_to_end(user_id)
+            while len(self._min_versions) > self.maxsize:
+                self._min_versions.popitem(last=False)
+
+    def is_revoked(self, user_id: int, token_version: int) -> bool:
+        return token_version < self._min_versions.get(user_id, 0)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._min_versions.clear()
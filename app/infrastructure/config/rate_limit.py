@@ -0,0 +1,224 @@
+"""Sliding-window rate limiting.
+
+Each request is charged to the authenticated user (from a verified bearer
+token) or else the client IP, under the policy of the longest matching
+path prefix. Limits use the sliding-window counter approximation: the
+current fixed window's count plus the previous window's count weighted by
+how much of it still overlaps the sliding window. That needs two counters
+per key and one store round trip per request.
+
+The in-memory store is per worker, so with N workers it allows N times
+the limit; use the Redis store to share counters between workers.
+"""
+from __future__ import annotations
+
+import logging
+import math
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Sequence, Tuple
+
+from .auth import token_subject
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+_UNITS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+
+@dataclass(frozen=True)
+class RateLimitPolicy:
+    """*limit* requests per *window* seconds."""
+
+    name: str
+    limit: int
+    window: int
+
+    @classmethod
+    def parse(cls, name: str, spec: str) -> "RateLimitPolicy":
+        """Build a policy from a spec such as ``"10/minute"``."""
+        count, _, unit = spec.partition("/")
+        try:
+            return cls(name=name, limit=int(count), window=_UNITS[unit.strip().rstrip("s")])
+        except (KeyError, ValueError) as exc:
+            raise ValueError(f"Invalid rate limit {spec!r}; expected e.g. '10/minute'") from exc
+
+
+@dataclass(frozen=True)
+class RateLimitResult:
+    allowed: bool
+    limit: int
+    remaining: int
+    retry_after: int
+
+
+class RateLimitStore(ABC):
+    """Counters for fixed windows, addressed by key and window index."""
+
+    @abstractmethod
+    async def increment(self, key: str, window_index: int, window: int) -> Tuple[int, int]:
+        """Count a hit in *window_index*; return (current, previous window) counts."""
+        pass
+
+
+class InMemoryRateLimitStore(RateLimitStore):
+    """Per-process counters; the local stand-in for a shared store.
+
+    Counters are bucketed by window, so stale windows are dropped whole
+    when a new one starts instead of scanning every key on each request.
+    """
+
+    def __init__(self) -> None:
+        # (window length, window index) -> counts by key
+        self._buckets: Dict[Tuple[int, int], Dict[str, int]] = {}
+
+    async def increment(self, key: str, window_index: int, window: int) -> Tuple[int, int]:
+        bucket = self._buckets.get((window, window_index))
+        if bucket is None:
+            bucket = self._buckets[(window, window_index)] = {}
+            self._prune(window, window_index)
+        current = bucket.get(key, 0) + 1
+        bucket[key] = current
+        previous = self._buckets.get((window, window_index - 1))
+        return current, previous.get(key, 0) if previous else 0
+
+    def _prune(self, window: int, window_index: int) -> None:
+        # Windows older than the previous one no longer affect any estimate
+        for stale in [
+            bucket for bucket in self._buckets
+            if bucket[0] == window and bucket[1] < window_index - 1
+        ]:
+            del self._buckets[stale]
+
+    def __len__(self) -> int:
+        return sum(len(bucket) for bucket in self._buckets.values())
+
+
+class RedisRateLimitStore(RateLimitStore):
+    """Counters shared by every worker, kept in Redis.
+
+    One pipelined round trip per hit: INCR and EXPIRE the current window
+    and GET the previous one.
+    """
+
+    def __init__(self, url: str) -> None:
+        # Only needed when this backend is selected
+        from redis.asyncio import Redis
+
+        self._redis = Redis.from_url(url)
+
+    async def increment(self, key: str, window_index: int, window: int) -> Tuple[int, int]:
+        current_key = f"rl:{key}:{window_index}"
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.incr(current_key)
+            pipe.expire(current_key, window * 2)
+            pipe.get(f"rl:{key}:{window_index - 1}")
+            current, _, previous = await pipe.execute()
+        return int(current), int(previous or 0)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+
+def create_rate_limit_store(backend: str, url: Optional[str] = None) -> RateLimitStore:
+    """Build the store named by the ``RATE_LIMIT_STORE`` setting."""
+    if backend == "redis":
+        if not url:
+            raise ValueError("RATE_LIMIT_REDIS_URL is required for the redis rate limit store")
+        return RedisRateLimitStore(url)
+    if backend == "memory":
+        return InMemoryRateLimitStore()
+    raise ValueError(f"Unknown rate limit store backend: {backend}")
+
+
+def client_key(authorization: Optional[str], client_host: Optional[str]) -> str:
+    """``user:<id>`` for a validly signed bearer token, else ``ip:<address>``.
+
+    The signature check means nobody can spend another user's allowance.
+    """
+    if authorization and authorization[:7].lower() == "bearer ":
+        subject = token_subject(authorization[7:])
+        if subject is not None:
+            return f"user:{subject}"
+    return f"ip:{client_host or 'unknown'}"
+
+
+class RateLimiter:
+    """Apply per-route policies against a counter store.
+
+    Args:
+        store: Where window counters live
+        default: Policy for paths under ``default_prefix`` with no own policy
+        routes: (path prefix, policy) pairs; the longest matching prefix wins
+        default_prefix: Paths outside it are not limited unless listed
+        exempt: Path prefixes never limited, e.g. provider callbacks
+    """
+
+    def __init__(
+        self,
+        store: RateLimitStore,
+        default: RateLimitPolicy,
+        routes: Iterable[Tuple[str, RateLimitPolicy]] = (),
+        default_prefix: str = "/api/",
+        exempt: Iterable[str] = (),
+    ) -> None:
+        self.store = store
+        self.default = default
+        self.default_prefix = default_prefix
+        self.exempt = tuple(exempt)
+        self._routes: Sequence[Tuple[str, RateLimitPolicy]] = sorted(
+            routes, key=lambda route: len(route[0]), reverse=True
+        )
+        self.limited = 0
+
+    def policy_for(self, path: str) -> Optional[RateLimitPolicy]:
+        if path.startswith(self.exempt):
+            return None
+        for prefix, policy in self._routes:
+            if path.startswith(prefix):
+                return policy
+        return self.default if path.startswith(self.default_prefix) else None
+
+    async def hit(self, policy: RateLimitPolicy, key: str, now: Optional[float] = None) -> RateLimitResult:
+        """Count one request by *key* against *policy*."""
+        now = time.time() if now is None else now
+        window_index, offset = divmod(now, policy.window)
+        current, previous = await self.store.increment(
+            f"{policy.window}:{policy.name}:{key}", int(window_index), policy.window
+        )
+        estimate = previous * (1 - offset / policy.window) + current
+        allowed = estimate <= policy.limit
+        if not allowed:
+            self.limited += 1
+        return RateLimitResult(
+            allowed=allowed,
+            limit=policy.limit,
+            remaining=max(0, int(policy.limit - estimate)),
+            retry_after=0 if allowed else max(1, math.ceil(policy.window - offset)),
+        )
+
+
+def create_rate_limiter() -> RateLimiter:
+    """Build the limiter from settings with the API's route policies."""
+    auth = RateLimitPolicy.parse("auth", settings.RATE_LIMIT_AUTH)
+    search = RateLimitPolicy.parse("search", settings.RATE_LIMIT_SEARCH)
+    return RateLimiter(
+        store=create_rate_limit_store(settings.RATE_LIMIT_STORE, settings.RATE_LIMIT_REDIS_URL),
+        default=RateLimitPolicy.parse("default", settings.RATE_LIMIT_DEFAULT),
+        routes=[
+            # Credential and account endpoints: strict, keyed by IP for guests
+            ("/api/v1/auth/token", auth),
+            ("/api/v1/auth/register", auth),
+            ("/api/v1/auth/password-reset", auth),
+            # Search is the most frequent call; generous
+            ("/api/v1/search", search),
+            ("/api/v1/bnb/search", search),
+            ("/api/v1/tours/search", search),
+            ("/api/v1/cars/search", search),
+            ("/api/v1/property/search", search),
+        ],
+        # Signed provider callbacks arrive in bursts from a few provider IPs;
+        # throttling them would only make the providers retry
+        exempt=("/api/v1/payments/webhooks/",),
+    )
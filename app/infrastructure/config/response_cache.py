@@ -0,0 +1,163 @@
+"""HTTP response cache for public catalog endpoints.
+
+Endpoints opt in with ``@cache_response(namespace, ttl)`` placed directly
+under their route decorator. ``ResponseCacheMiddleware`` then keeps their
+200 responses keyed by path, normalised query string and auth scope
+(anonymous, or the user of a validly signed bearer token), serves them
+with a strong ETag and answers a matching ``If-None-Match`` with a 304.
+
+Routes that change cached data call ``invalidate_cached(namespace)``.
+Inside a request the entries are dropped once its transaction commits, so
+a rolled back write never evicts anything and a reader cannot re-cache the
+old rows between the flush and the commit.
+
+The cache is per worker: invalidation only reaches the worker that served
+the write, so other workers may serve their copy until its TTL runs out.
+Keep TTLs short enough for that to be acceptable.
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
+from urllib.parse import parse_qsl, urlencode
+
+from infrastructure.database.unit_of_work import current_unit_of_work
+from .auth import token_subject
+from .config import settings
+
+F = TypeVar("F", bound=Callable)
+
+POLICY_ATTRIBUTE = "__response_cache__"
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    namespace: str
+    ttl: int
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    namespace: str
+    route: str
+    expires_at: float
+    etag: bytes
+    cache_control: bytes
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+
+
+def cache_response(namespace: str, ttl: int = 300) -> Callable[[F], F]:
+    """Mark an endpoint's 200 responses as cacheable for *ttl* seconds."""
+
+    def decorator(endpoint: F) -> F:
+        setattr(endpoint, POLICY_ATTRIBUTE, CachePolicy(namespace=namespace, ttl=ttl))
+        return endpoint
+
+    return decorator
+
+
+def policy_for(endpoint) -> Optional[CachePolicy]:
+    return getattr(endpoint, POLICY_ATTRIBUTE, None)
+
+
+def cache_key(path: str, query_string: bytes, authorization: Optional[str]) -> str:
+    """Key a GET by path, query parameters in sorted order, and auth scope."""
+    scope = "public"
+    if authorization and authorization[:7].lower() == "bearer ":
+        subject = token_subject(authorization[7:])
+        if subject is not None:
+            scope = f"user:{subject}"
+    query = urlencode(sorted(parse_qsl(query_string.decode("latin-1"), keep_blank_values=True)))
+    return f"{scope} {path}?{query}"
+
+
+def make_etag(body: bytes) -> bytes:
+    """Strong ETag derived from the response body."""
+    return b'"' + hashlib.blake2b(body, digest_size=16).hexdigest().encode() + b'"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: bytes) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    # Weak comparison, as RFC 9110 requires for If-None-Match
+    wanted = etag.decode()
+    return any(
+        candidate.strip().removeprefix("W/") == wanted
+        for candidate in if_none_match.split(",")
+    )
+
+
+class ResponseCache:
+    """TTL + LRU store of rendered responses, grouped by namespace.
+
+    Args:
+        maxsize: Maximum number of cached responses
+        max_body_bytes: Larger responses are passed through uncached
+    """
+
+    def __init__(self, maxsize: int = 2000, max_body_bytes: int = 1_000_000) -> None:
+        self.maxsize = maxsize
+        self.max_body_bytes = max_body_bytes
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.invalidations = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        if len(entry.body) > self.max_body_bytes:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, *namespaces: str) -> int:
+        """Drop every entry in *namespaces*; returns how many were dropped."""
+        wanted = set(namespaces)
+        stale = [key for key, entry in self._entries.items() if entry.namespace in wanted]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += 1
+        return len(stale)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+            "invalidations": self.invalidations,
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+response_cache = ResponseCache(maxsize=settings.RESPONSE_CACHE_SIZE)
+
+
+def invalidate_cached(*namespaces: str) -> None:
+    """Evict cached responses in *namespaces* once the current write commits."""
+    uow = current_unit_of_work()
+    if uow is None:
+        response_cache.invalidate(*namespaces)
+    else:
+        uow.after_commit(lambda: response_cache.invalidate(*namespaces))
@@ -0,0 +1,179 @@
+"""Access-token revocation denylist and shared principal invalidations.
+
+Revoked token IDs (``jti`` claims) are written to the token store, which is
+authoritative, and mirrored into an in-memory Bloom filter. A token whose
+ID is not in the filter is certainly not revoked, so the common case costs
+a few hash probes and no I/O; only filter hits are confirmed against the
+store.
+
+Each worker rebuilds its filter from the store at most every
+``refresh_interval`` seconds, which is how revocations made by other
+workers become visible. Entries expire with the token they revoke.
+
+Principal cache invalidations travel the same way: each is written to the
+store and replayed into every worker's ``PrincipalCache`` on its next
+refresh.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import secrets
+import time
+from datetime import datetime, timedelta, UTC
+from typing import Dict, Optional, Set
+
+from shared.utils.bloom import BloomFilter
+from .principal_cache import PrincipalCache
+from .token_store import TokenStore, key_digest
+
+logger = logging.getLogger(__name__)
+
+DENYLIST_NAMESPACE = "revoked_jti"
+INVALIDATION_NAMESPACE = "principal_invalidation"
+
+
+class AccessTokenDenylist:
+    """Bloom-filtered view over revoked access-token IDs.
+
+    Args:
+        store: Authoritative store for revoked IDs
+        capacity: Revoked IDs the filter is sized for before it grows
+        error_rate: Target false positive rate, i.e. share of store lookups
+        refresh_interval: Seconds between rebuilds from the store
+    """
+
+    def __init__(
+        self,
+        store: TokenStore,
+        capacity: int = 100_000,
+        error_rate: float = 0.001,
+        refresh_interval: float = 30.0,
+    ) -> None:
+        self._store = store
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._refresh_interval = refresh_interval
+        self._filter = BloomFilter(capacity, error_rate)
+        self._last_refresh = float("-inf")
+        self._refresh_lock = asyncio.Lock()
+        # Digests revoked locally while a rebuild is reading the store
+        self._pending: Optional[Set[str]] = None
+        self.checks = 0
+        self.filter_hits = 0
+
+    async def revoke(self, jti: str, expires_at: datetime) -> None:
+        """Deny *jti* until *expires_at*, when the token expires anyway."""
+        ttl = expires_at - datetime.now(UTC)
+        if ttl <= timedelta(0):
+            return
+        await self._store.put(DENYLIST_NAMESPACE, jti, {"expires_at": expires_at.isoformat()}, ttl)
+        digest = key_digest(jti)
+        self._filter.add(digest)
+        if self._pending is not None:
+            self._pending.add(digest)
+
+    async def is_revoked(self, jti: str) -> bool:
+        """Return True if *jti* has been revoked and has not yet expired."""
+        if time.monotonic() - self._last_refresh >= self._refresh_interval:
+            await self.refresh()
+        self.checks += 1
+        if not self._filter.might_contain(key_digest(jti)):
+            return False
+        self.filter_hits += 1
+        return await self._store.get(DENYLIST_NAMESPACE, jti) is not None
+
+    async def refresh(self) -> None:
+        """Rebuild the filter from the store, dropping expired IDs."""
+        async with self._refresh_lock:
+            if time.monotonic() - self._last_refresh < self._refresh_interval:
+                return
+            self._pending = set()
+            try:
+                digests = await self._store.digests(DENYLIST_NAMESPACE)
+            except Exception:
+                # Keep the previous filter and retry after the next interval
+                logger.exception("Access token denylist refresh failed")
+                digests = None
+            if digests is not None:
+                bloom = BloomFilter(max(self._capacity, 2 * len(digests)), self._error_rate)
+                for digest in [*digests, *self._pending]:
+                    bloom.add(digest)
+                self._filter = bloom
+            self._pending = None
+            self._last_refresh = time.monotonic()
+
+    def __len__(self) -> int:
+        return self._filter.count
+
+
+class PrincipalInvalidations:
+    """Principal cache invalidations shared by every worker.
+
+    ``publish`` applies an invalidation to this worker's cache and records
+    it in the store; other workers apply it when they next refresh, so a
+    deactivated user or a bumped token version is honoured everywhere
+    within ``refresh_interval`` seconds.
+
+    Args:
+        store: Store shared by the workers
+        cache: This worker's principal cache
+        retention: How long an invalidation is kept; at least the access
+            token lifetime, so minimum versions outlive the tokens they reject
+        refresh_interval: Seconds between reads of the store
+    """
+
+    def __init__(
+        self,
+        store: TokenStore,
+        cache: PrincipalCache,
+        retention: timedelta,
+        refresh_interval: float = 30.0,
+    ) -> None:
+        self._store = store
+        self._cache = cache
+        self._retention = retention
+        self._refresh_interval = refresh_interval
+        self._last_refresh = float("-inf")
+        self._refresh_lock = asyncio.Lock()
+        # Stamp of the last invalidation applied per user
+        self._applied: Dict[int, str] = {}
+
+    async def publish(self, user_id: int, min_version: Optional[int] = None) -> None:
+        """Drop *user_id*'s cached principal in every worker."""
+        self._cache.invalidate(user_id, min_version)
+        previous = await self._store.get(INVALIDATION_NAMESPACE, str(user_id))
+        if previous and previous.get("min_version") is not None:
+            # A later plain invalidation must not lift an earlier version bump
+            min_version = max(min_version or 0, previous["min_version"])
+        stamp = secrets.token_hex(8)
+        await self._store.put(
+            INVALIDATION_NAMESPACE,
+            str(user_id),
+            {"user_id": user_id, "min_version": min_version, "stamp": stamp},
+            self._retention,
+        )
+        self._applied[user_id] = stamp
+
+    async def refresh(self) -> None:
+        """Apply invalidations published by other workers, if one is due."""
+        if time.monotonic() - self._last_refresh < self._refresh_interval:
+            return
+        async with self._refresh_lock:
+            if time.monotonic() - self._last_refresh < self._refresh_interval:
+                return
+            try:
+                entries = await self._store.values(INVALIDATION_NAMESPACE)
+            except Exception:
+                # Keep serving the cache and retry after the next interval
+                logger.exception("Principal invalidation refresh failed")
+                entries = None
+            if entries is not None:
+                applied: Dict[int, str] = {}
+                for entry in entries:
+                    user_id = entry["user_id"]
+                    applied[user_id] = entry["stamp"]
+                    if self._applied.get(user_id) != entry["stamp"]:
+                        self._cache.invalidate(user_id, entry.get("min_version"))
+                self._applied = applied
+            self._last_refresh = time.monotonic()
@@ -0,0 +1,208 @@
+"""Slow-query log with statement fingerprints and EXPLAIN capture.
+
+Every statement's duration is aggregated under its fingerprint (literals
+and bind parameters replaced by ``?``), so ``summary()`` can report counts
+and percentiles per statement shape. Statements slower than
+``SLOW_QUERY_THRESHOLD_MS`` are logged through ``shared.utils.logging``
+with the route or job that issued them; parameter values are never logged.
+
+With ``SLOW_QUERY_EXPLAIN_MS`` set, a statement slower than that has its
+plan captured by running ``EXPLAIN`` on a separate pooled connection, at
+most once per fingerprint every ``SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS``.
+The plan is taken outside the original transaction, so it does not see
+that transaction's uncommitted rows.
+
+Aggregates are per worker, like the metrics in ``metrics.py``.
+"""
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import math
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Set
+
+from sqlalchemy import event
+
+from shared.utils.logging import log_query_plan, log_slow_query
+from shared.utils.sql import fingerprint as _fingerprint
+from .config import settings
+from .metrics import current_query_label
+
+logger = logging.getLogger(__name__)
+
+# Durations kept per fingerprint for percentiles
+SAMPLE_SIZE = 512
+
+# Plan statement per dialect; others are not explained
+EXPLAIN_PREFIXES = {
+    "postgresql": "EXPLAIN ",
+    "sqlite": "EXPLAIN QUERY PLAN ",
+}
+_EXPLAINABLE = ("select", "with")
+
+# Compiled statements repeat verbatim, so normalising each text once is enough
+fingerprint = functools.lru_cache(maxsize=4096)(_fingerprint)
+
+
+@dataclass
+class StatementStats:
+    """Timings of one statement fingerprint, in milliseconds."""
+
+    count: int = 0
+    slow: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+    samples: Deque[float] = field(default_factory=lambda: deque(maxlen=SAMPLE_SIZE))
+    explained_at: float = -math.inf
+
+    def add(self, duration_ms: float, slow: bool) -> None:
+        self.count += 1
+        self.slow += slow
+        self.total_ms += duration_ms
+        self.max_ms = max(self.max_ms, duration_ms)
+        self.samples.append(duration_ms)
+
+    def percentile(self, q: float) -> float:
+        """Nearest-rank percentile of the recent samples."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
+
+
+class SlowQueryLog:
+    """Per-fingerprint statement timings and the slow-query log.
+
+    Args:
+        threshold_ms: Statements at least this slow are logged
+        explain_ms: Statements at least this slow are explained; None disables
+        explain_interval: Seconds before the same fingerprint is explained again
+        max_fingerprints: Least recently seen fingerprints beyond this are dropped
+    """
+
+    def __init__(
+        self,
+        threshold_ms: float = 200.0,
+        explain_ms: Optional[float] = None,
+        explain_interval: float = 600.0,
+        max_fingerprints: int = 1000,
+    ) -> None:
+        self.threshold_ms = threshold_ms
+        self.explain_ms = explain_ms
+        self.explain_interval = explain_interval
+        self.max_fingerprints = max_fingerprints
+        self._stats: "OrderedDict[str, StatementStats]" = OrderedDict()
+        self._explains: Set[asyncio.Task] = set()
+        self.slow_queries = 0
+        self.plans_captured = 0
+
+    def observe(self, statement: str, duration_ms: float, database: str) -> bool:
+        """Record one execution; True when its plan should be captured."""
+        key = fingerprint(statement)
+        stats = self._stats.get(key)
+        if stats is None:
+            stats = self._stats[key] = StatementStats()
+            if len(self._stats) > self.max_fingerprints:
+                self._stats.popitem(last=False)
+        else:
+            self._stats.move_to_end(key)
+        slow = duration_ms >= self.threshold_ms
+        stats.add(duration_ms, slow)
+        if not slow:
+            return False
+
+        self.slow_queries += 1
+        log_slow_query(key, duration_ms, self.threshold_ms, database, route=current_query_label())
+        if self.explain_ms is None or duration_ms < self.explain_ms:
+            return False
+        now = time.monotonic()
+        if now - stats.explained_at < self.explain_interval:
+            return False
+        stats.explained_at = now
+        return True
+
+    def summary(self, limit: int = 10) -> List[Dict[str, Any]]:
+        """The *limit* fingerprints with the most total time, costliest first."""
+        costliest = sorted(self._stats.items(), key=lambda item: item[1].total_ms, reverse=True)
+        return [
+            {
+                "fingerprint": key,
+                "count": stats.count,
+                "slow": stats.slow,
+                "total_ms": round(stats.total_ms, 2),
+                "p50_ms": round(stats.percentile(50), 2),
+                "p95_ms": round(stats.percentile(95), 2),
+                "p99_ms": round(stats.percentile(99), 2),
+                "max_ms": round(stats.max_ms, 2),
+            }
+            for key, stats in costliest[:limit]
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "fingerprints": len(self._stats),
+            "slow_queries": self.slow_queries,
+            "plans_captured": self.plans_captured,
+        }
+
+    def reset(self) -> None:
+        self._stats.clear()
+
+    def install(self, engine, database: str) -> None:
+        """Time every statement the async *engine* executes."""
+        sync_engine = engine.sync_engine
+        prefix = EXPLAIN_PREFIXES.get(sync_engine.dialect.name)
+
+        def before(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("slow_query_started", []).append(time.perf_counter())
+
+        def after(conn, cursor, statement, parameters, context, executemany):
+            started = conn.info["slow_query_started"].pop()
+            duration_ms = (time.perf_counter() - started) * 1000
+            if statement.startswith("EXPLAIN "):
+                return
+            explain = self.observe(statement, duration_ms, database)
+            if explain and prefix and not executemany and statement.lstrip()[:6].lower().startswith(_EXPLAINABLE):
+                self._schedule_explain(engine, prefix + statement, parameters, fingerprint(statement), duration_ms, database)
+
+        def handle_error(context) -> None:
+            stack = context.connection.info.get("slow_query_started") if context.connection is not None else None
+            if stack:
+                stack.pop()
+
+        event.listen(sync_engine, "before_cursor_execute", before)
+        event.listen(sync_engine, "after_cursor_execute", after)
+        event.listen(sync_engine, "handle_error", handle_error)
+
+    def _schedule_explain(self, engine, statement, parameters, key, duration_ms, database) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        task = loop.create_task(self._explain(engine, statement, parameters, key, duration_ms, database))
+        self._explains.add(task)
+        task.add_done_callback(self._explains.discard)
+
+    async def _explain(self, engine, statement, parameters, key, duration_ms, database) -> None:
+        if isinstance(parameters, list):
+            parameters = tuple(parameters)
+        try:
+            async with engine.connect() as conn:
+                result = await conn.exec_driver_sql(statement, parameters)
+                plan = "\n".join(str(row[-1]) for row in result)
+        except Exception:
+            logger.warning("EXPLAIN failed for slow query %s", key, exc_info=True)
+            return
+        self.plans_captured += 1
+        log_query_plan(key, plan, duration_ms, database)
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.SLOW_QUERY_THRESHOLD_MS,
+    explain_ms=settings.SLOW_QUERY_EXPLAIN_MS,
+    explain_interval=settings.SLOW_QUERY_EXPLAIN_INTERVAL_SECONDS,
+)
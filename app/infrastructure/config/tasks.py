@@ -3,8 +3,11 @@ from __future__ import annotations
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 import logging
 
+from .metrics import timed_job
+
 logger = logging.getLogger(__name__)
 
 scheduler = AsyncIOScheduler()
@@ -13,17 +16,138 @@ scheduler = AsyncIOScheduler()
 def start_scheduler() -> None:
     """Start the APScheduler instance if not already running."""
     if not scheduler.running:
+        from api.containers import AppContainer
+
+        # Without live providers the status checks are placeholders
+        if AppContainer.PAYMENT_PROVIDERS_LIVE:
+            scheduler.add_job(
+                reconcile_pending_payments_job,
+                IntervalTrigger(minutes=10),
+                id="reconcile_pending_payments",
+                max_instances=1,
+                coalesce=True,
+                replace_existing=True,
+            )
         scheduler.start()
         logger.info("APScheduler started")
 
 
 # Example nightly maintenance job
 @scheduler.scheduled_job(CronTrigger(hour=3, minute=0))
+@timed_job("nightly_maintenance")
 async def nightly_maintenance():  # pragma: no cover
     logger.info("Running nightly maintenance job")
 
 
 @scheduler.scheduled_job(CronTrigger(hour=4, minute=0))
+@timed_job("schedule_payouts")
 async def schedule_payouts_job():  # pragma: no cover
-    """Placeholder to aggregate completed bookings and schedule payouts."""
-    logger.info("BNB payout scheduler tick")
+    """Aggregate completed bookings past their hold period into payouts."""
+    from api.main import container
+    from infrastructure.database.unit_of_work import unit_of_work
+
+    try:
+        async with unit_of_work():
+            summary = await container.schedule_payouts_use_case().execute()
+    except Exception:
+        logger.exception("Payout scheduling failed")
+        return
+    logger.info(
+        "Scheduled %d payouts covering %d bookings (total %s)",
+        summary.payouts_created, summary.bookings_paid_out, summary.total_amount,
+    )
+
+
+@scheduler.scheduled_job(IntervalTrigger(minutes=15), max_instances=1, coalesce=True)
+@timed_job("sweep_auth_tokens")
+async def sweep_auth_tokens_job():  # pragma: no cover
+    """Delete expired refresh tokens and OAuth state."""
+    from .auth import token_store
+
+    try:
+        removed = await token_store.sweep()
+    except Exception:
+        logger.exception("Auth token sweep failed")
+        return
+    if removed:
+        logger.info("Swept %d expired auth tokens", removed)
+
+
+@scheduler.scheduled_job(IntervalTrigger(minutes=15), max_instances=1, coalesce=True)
+@timed_job("log_query_summary")
+async def log_query_summary_job():  # pragma: no cover
+    """Log the costliest statement fingerprints seen by this worker."""
+    from shared.utils.logging import log_query_summary
+    from .slow_query import slow_query_log
+
+    statements = slow_query_log.summary()
+    if statements:
+        log_query_summary(statements)
+
+
+@scheduler.scheduled_job(IntervalTrigger(hours=1), max_instances=1, coalesce=True)
+@timed_job("ledger_checkpoint")
+async def ledger_checkpoint_job():  # pragma: no cover
+    """Checkpoint ledger balances and flag accounts that drifted from their entries."""
+    from api.main import container
+    from infrastructure.database.unit_of_work import unit_of_work
+
+    try:
+        async with unit_of_work():
+            summary = await container.checkpoint_ledger_use_case().execute()
+    except Exception:
+        logger.exception("Ledger checkpoint failed")
+        return
+    if not summary.consistent:
+        logger.error(
+            "Ledger inconsistency: accounts=%s unbalanced currencies=%s",
+            summary.mismatched_account_ids, summary.unbalanced_currencies,
+        )
+    else:
+        logger.info("Ledger checkpoint verified %d accounts", summary.accounts_checked)
+
+
+@scheduler.scheduled_job(IntervalTrigger(seconds=5), max_instances=1, coalesce=True)
+@timed_job("process_payment_webhooks")
+async def process_payment_webhooks_job():  # pragma: no cover
+    """Apply queued payment webhook events in batches."""
+    from .database import AsyncSessionLocal
+    from infrastructure.database.repositories.payment import (
+        SqlAlchemyPaymentRepository,
+        SqlAlchemyPaymentWebhookRepository,
+    )
+    from application.use_cases.payment.process_payment_webhooks import (
+        ProcessPaymentWebhooksUseCase,
+    )
+
+    async with AsyncSessionLocal() as session:
+        try:
+            use_case = ProcessPaymentWebhooksUseCase(
+                webhook_repository=SqlAlchemyPaymentWebhookRepository(session),
+                payment_repository=SqlAlchemyPaymentRepository(session),
+            )
+            processed = await use_case.drain()
+        except Exception:
+            logger.exception("Payment webhook batch failed")
+            return
+    if processed:
+        logger.info("Applied %d payment webhook events", processed)
+
+
+# Registered by start_scheduler only when PAYMENT_PROVIDERS_LIVE is set
+@timed_job("reconcile_pending_payments")
+async def reconcile_pending_payments_job():  # pragma: no cover
+    """Ask providers about intents that never received a webhook."""
+    # Resolved lazily: the container is built by the API module that starts us
+    from api.main import container
+
+    try:
+        # Commits per page; see ReconcilePendingPaymentsUseCase
+        stats = await container.reconcile_pending_payments_use_case().execute()
+    except Exception:
+        logger.exception("Payment reconciliation failed")
+        return
+    logger.info(
+        "Payment reconciliation checked=%d updated=%d errors=%d",
+        stats["checked"], stats["updated"], stats["errors"],
+    )
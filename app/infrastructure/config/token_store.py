@@ -0,0 +1,208 @@
+"""Expiring key/value stores for refresh tokens and OAuth state.
+
+Values are small JSON-serialisable dicts grouped by namespace (for example
+``refresh`` and ``oauth_state``). The in-memory store suits a single worker
+and tests; the database store is shared by every worker process.
+"""
+from __future__ import annotations
+
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from datetime import datetime, timedelta, UTC
+from typing import Any, Dict, List, Optional, Tuple, cast
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import CursorResult
+
+from .database import AsyncSessionLocal
+from infrastructure.database.models.auth_token import AuthTokenModel
+
+
+def key_digest(key: str) -> str:
+    # Only digests are persisted, so a leaked table holds no usable tokens
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class TokenStore(ABC):
+    """Expiring storage for opaque auth tokens and their payloads."""
+
+    @abstractmethod
+    async def put(self, namespace: str, key: str, data: Dict[str, Any], ttl: timedelta) -> None:
+        """Store *data* under *key*, replacing any previous value."""
+        pass
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        """Return the live value for *key*, or None if missing or expired."""
+        pass
+
+    @abstractmethod
+    async def pop(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        """Atomically remove *key* and return its live value.
+
+        At most one caller gets the value, which makes one-time values such
+        as OAuth state safe to consume from concurrent workers.
+        """
+        pass
+
+    @abstractmethod
+    async def digests(self, namespace: str) -> List[str]:
+        """Return the ``key_digest`` of every live key in *namespace*."""
+        pass
+
+    @abstractmethod
+    async def values(self, namespace: str) -> List[Dict[str, Any]]:
+        """Return the value of every live key in *namespace*."""
+        pass
+
+    @abstractmethod
+    async def sweep(self) -> int:
+        """Delete expired entries; return how many were removed."""
+        pass
+
+
+class InMemoryTokenStore(TokenStore):
+    """Per-process store that sweeps expired entries as it is written to.
+
+    Args:
+        sweep_interval: Minimum seconds between opportunistic sweeps
+    """
+
+    def __init__(self, sweep_interval: float = 60.0) -> None:
+        self._entries: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+        self._sweep_interval = sweep_interval
+        self._last_sweep = time.monotonic()
+
+    async def put(self, namespace: str, key: str, data: Dict[str, Any], ttl: timedelta) -> None:
+        now = time.monotonic()
+        if now - self._last_sweep >= self._sweep_interval:
+            await self.sweep()
+        self._entries[(namespace, key)] = (now + ttl.total_seconds(), dict(data))
+
+    async def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self._entries.pop((namespace, key), None)
+            return None
+        return dict(entry[1])
+
+    async def pop(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        entry = self._entries.pop((namespace, key), None)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    async def digests(self, namespace: str) -> List[str]:
+        now = time.monotonic()
+        return [
+            key_digest(key)
+            for (entry_namespace, key), (expires_at, _) in list(self._entries.items())
+            if entry_namespace == namespace and expires_at > now
+        ]
+
+    async def values(self, namespace: str) -> List[Dict[str, Any]]:
+        now = time.monotonic()
+        return [
+            dict(data)
+            for (entry_namespace, _), (expires_at, data) in list(self._entries.items())
+            if entry_namespace == namespace and expires_at > now
+        ]
+
+    async def sweep(self) -> int:
+        now = time.monotonic()
+        self._last_sweep = now
+        expired = [key for key, (expires_at, _) in self._entries.items() if expires_at <= now]
+        for key in expired:
+            del self._entries[key]
+        return len(expired)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class DatabaseTokenStore(TokenStore):
+    """Store shared by all workers, backed by the ``auth_tokens`` table."""
+
+    def __init__(self, session_factory=AsyncSessionLocal) -> None:
+        self._session_factory = session_factory
+
+    async def put(self, namespace: str, key: str, data: Dict[str, Any], ttl: timedelta) -> None:
+        expires_at = datetime.now(UTC) + ttl
+        stmt = insert(AuthTokenModel).values(
+            namespace=namespace, key_hash=key_digest(key), data=data, expires_at=expires_at,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["namespace", "key_hash"],
+            set_={"data": stmt.excluded.data, "expires_at": stmt.excluded.expires_at},
+        )
+        async with self._session_factory() as session:
+            await session.execute(stmt)
+            await session.commit()
+
+    async def get(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(AuthTokenModel.data).where(
+                    AuthTokenModel.namespace == namespace,
+                    AuthTokenModel.key_hash == key_digest(key),
+                    AuthTokenModel.expires_at > datetime.now(UTC),
+                )
+            )
+            return result.scalar_one_or_none()
+
+    async def pop(self, namespace: str, key: str) -> Optional[Dict[str, Any]]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                delete(AuthTokenModel)
+                .where(
+                    AuthTokenModel.namespace == namespace,
+                    AuthTokenModel.key_hash == key_digest(key),
+                )
+                .returning(AuthTokenModel.data, AuthTokenModel.expires_at)
+            )
+            row = result.one_or_none()
+            await session.commit()
+        if row is None or row.expires_at <= datetime.now(UTC):
+            return None
+        return row.data
+
+    async def digests(self, namespace: str) -> List[str]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(AuthTokenModel.key_hash).where(
+                    AuthTokenModel.namespace == namespace,
+                    AuthTokenModel.expires_at > datetime.now(UTC),
+                )
+            )
+            return list(result.scalars())
+
+    async def values(self, namespace: str) -> List[Dict[str, Any]]:
+        async with self._session_factory() as session:
+            result = await session.execute(
+                select(AuthTokenModel.data).where(
+                    AuthTokenModel.namespace == namespace,
+                    AuthTokenModel.expires_at > datetime.now(UTC),
+                )
+            )
+            return list(result.scalars())
+
+    async def sweep(self) -> int:
+        async with self._session_factory() as session:
+            result = cast(CursorResult, await session.execute(
+                delete(AuthTokenModel).where(AuthTokenModel.expires_at <= datetime.now(UTC))
+            ))
+            await session.commit()
+        return result.rowcount
+
+
+def create_token_store(backend: str) -> TokenStore:
+    """Build the store named by the ``AUTH_TOKEN_STORE`` setting."""
+    if backend == "database":
+        return DatabaseTokenStore()
+    if backend == "memory":
+        return InMemoryTokenStore()
+    raise ValueError(f"Unknown token store backend: {backend}")
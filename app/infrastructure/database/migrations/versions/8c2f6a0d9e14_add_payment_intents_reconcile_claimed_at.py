@@ -0,0 +1,31 @@
+"""add payment_intents.reconcile_claimed_at reconciliation lease
+
+Revision ID: 8c2f6a0d9e14
+Revises: f1a3c5e7b902
+Create Date: 2026-10-19 18:22:41.530917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2f6a0d9e14'
+down_revision: Union[str, Sequence[str], None] = 'f1a3c5e7b902'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        'payment_intents',
+        sa.Column('reconcile_claimed_at', sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('payment_intents', 'reconcile_claimed_at')
@@ -0,0 +1,114 @@
+"""add conversation_threads summary table and messages.thread_id
+
+Revision ID: a3f1c2d4e5b6
+Revises: 9ef572aae67b
+Create Date: 2026-10-19 09:12:41.204117
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3f1c2d4e5b6'
+down_revision: Union[str, Sequence[str], None] = '9ef572aae67b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'conversation_threads',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('booking_type', sa.String(20), nullable=False),
+        sa.Column('booking_id', sa.Integer(), nullable=False),
+        sa.Column('participant_1_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('participant_2_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('last_message_id', sa.Integer(), nullable=True),
+        sa.Column('last_message_sender_id', sa.Integer(), nullable=True),
+        sa.Column('last_message_preview', sa.String(255), nullable=True),
+        sa.Column('last_message_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('unread_count_participant_1', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('unread_count_participant_2', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint(
+            'booking_type', 'booking_id', 'participant_1_id', 'participant_2_id',
+            name='uq_conversation_threads_pair',
+        ),
+    )
+    op.create_index('ix_conversation_threads_p1_last', 'conversation_threads', ['participant_1_id', 'last_message_at'])
+    op.create_index('ix_conversation_threads_p2_last', 'conversation_threads', ['participant_2_id', 'last_message_at'])
+
+    op.add_column('messages', sa.Column('thread_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'messages_thread_id_fkey', 'messages', 'conversation_threads',
+        ['thread_id'], ['id'], ondelete='CASCADE',
+    )
+    op.create_index('ix_messages_thread_created', 'messages', ['thread_id', 'created_at', 'id'])
+
+    # Backfill one thread per (booking, participant pair) from existing messages
+    op.execute(
+        """
+        INSERT INTO conversation_threads (booking_type, booking_id, participant_1_id, participant_2_id)
+        SELECT DISTINCT booking_type, booking_id,
+               LEAST(sender_id, recipient_id), GREATEST(sender_id, recipient_id)
+        FROM messages
+        """
+    )
+    op.execute(
+        """
+        UPDATE messages m SET thread_id = t.id
+        FROM conversation_threads t
+        WHERE t.booking_type = m.booking_type
+          AND t.booking_id = m.booking_id
+          AND t.participant_1_id = LEAST(m.sender_id, m.recipient_id)
+          AND t.participant_2_id = GREATEST(m.sender_id, m.recipient_id)
+        """
+    )
+    op.execute(
+        """
+        UPDATE conversation_threads t SET
+            last_message_id = last.id,
+            last_message_sender_id = last.sender_id,
+            last_message_preview = LEFT(last.body, 255),
+            last_message_at = last.created_at
+        FROM (
+            SELECT DISTINCT ON (thread_id) thread_id, id, sender_id, body, created_at
+            FROM messages
+            ORDER BY thread_id, created_at DESC, id DESC
+        ) AS last
+        WHERE last.thread_id = t.id
+        """
+    )
+    op.execute(
+        """
+        UPDATE conversation_threads t SET
+            unread_count_participant_1 = COALESCE(u.unread_1, 0),
+            unread_count_participant_2 = COALESCE(u.unread_2, 0)
+        FROM (
+            SELECT m.thread_id,
+                   COUNT(*) FILTER (WHERE m.recipient_id = ct.participant_1_id) AS unread_1,
+                   COUNT(*) FILTER (WHERE m.recipient_id = ct.participant_2_id) AS unread_2
+            FROM messages m
+            JOIN conversation_threads ct ON ct.id = m.thread_id
+            WHERE m.is_read = false
+            GROUP BY m.thread_id
+        ) AS u
+        WHERE u.thread_id = t.id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_messages_thread_created', table_name='messages')
+    op.drop_constraint('messages_thread_id_fkey', 'messages', type_='foreignkey')
+    op.drop_column('messages', 'thread_id')
+
+    op.drop_index('ix_conversation_threads_p2_last', table_name='conversation_threads')
+    op.drop_index('ix_conversation_threads_p1_last', table_name='conversation_threads')
+    op.drop_table('conversation_threads')
@@ -0,0 +1,49 @@
+"""add payment_webhook_events inbox table
+
+Revision ID: b7e4d1c9f2a3
+Revises: a3f1c2d4e5b6
+Create Date: 2026-10-19 11:05:17.418209
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e4d1c9f2a3'
+down_revision: Union[str, Sequence[str], None] = 'a3f1c2d4e5b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'payment_webhook_events',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('provider', sa.String(20), nullable=False),
+        sa.Column('event_id', sa.String(255), nullable=False),
+        sa.Column('event_type', sa.String(100), nullable=False),
+        sa.Column('payment_intent_id', sa.String(255), nullable=True),
+        sa.Column('payload', sa.JSON(), nullable=False),
+        sa.Column('status', sa.String(20), nullable=False, server_default='received'),
+        sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('claimed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('processed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint('provider', 'event_id', name='uq_payment_webhook_events_provider_event'),
+    )
+    op.create_index('ix_payment_webhook_events_status_id', 'payment_webhook_events', ['status', 'id'])
+    op.create_index(
+        op.f('ix_payment_webhook_events_payment_intent_id'), 'payment_webhook_events', ['payment_intent_id']
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_payment_webhook_events_payment_intent_id'), table_name='payment_webhook_events')
+    op.drop_index('ix_payment_webhook_events_status_id', table_name='payment_webhook_events')
+    op.drop_table('payment_webhook_events')
@@ -0,0 +1,52 @@
+"""add st_payout_items and payout eligibility indexes
+
+Revision ID: c5a9e2f18d47
+Revises: b7e4d1c9f2a3
+Create Date: 2026-10-19 13:42:08.551730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a9e2f18d47'
+down_revision: Union[str, Sequence[str], None] = 'b7e4d1c9f2a3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'st_payout_items',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('payout_id', sa.Integer(), sa.ForeignKey('st_payouts.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('booking_type', sa.String(20), nullable=False),
+        sa.Column('booking_id', sa.Integer(), nullable=False),
+        sa.Column('host_id', sa.Integer(), sa.ForeignKey('users.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('amount', sa.Numeric(12, 2), nullable=False),
+        sa.Column('currency', sa.String(10), nullable=False, server_default='KES'),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint('booking_type', 'booking_id', name='uq_st_payout_items_booking'),
+    )
+    op.create_index('ix_st_payout_items_payout_id', 'st_payout_items', ['payout_id'])
+    op.create_index('ix_st_payout_items_host_id', 'st_payout_items', ['host_id'])
+
+    # Let the scheduler range-scan completed bookings by end date
+    op.create_index('ix_bookings_status_check_out', 'bookings', ['status', 'check_out'])
+    op.create_index('ix_tour_bookings_status_booking_date', 'tour_bookings', ['status', 'booking_date'])
+    op.create_index('ix_car_rentals_status_return_date', 'car_rentals', ['status', 'return_date'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_car_rentals_status_return_date', table_name='car_rentals')
+    op.drop_index('ix_tour_bookings_status_booking_date', table_name='tour_bookings')
+    op.drop_index('ix_bookings_status_check_out', table_name='bookings')
+
+    op.drop_index('ix_st_payout_items_host_id', table_name='st_payout_items')
+    op.drop_index('ix_st_payout_items_payout_id', table_name='st_payout_items')
+    op.drop_table('st_payout_items')
@@ -0,0 +1,79 @@
+"""add double-entry ledger tables
+
+Revision ID: d2b8f4a61c39
+Revises: c5a9e2f18d47
+Create Date: 2026-10-19 15:10:27.904312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b8f4a61c39'
+down_revision: Union[str, Sequence[str], None] = 'c5a9e2f18d47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'ledger_accounts',
+        sa.Column('id', sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column('kind', sa.String(30), nullable=False),
+        sa.Column('owner_id', sa.Integer(), nullable=False),
+        sa.Column('currency', sa.String(10), nullable=False),
+        sa.Column('balance', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('credits_total', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('debits_total', sa.Numeric(14, 2), nullable=False, server_default='0'),
+        sa.Column('last_entry_id', sa.BigInteger(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint('owner_id', 'kind', 'currency', name='uq_ledger_accounts_owner_kind_currency'),
+    )
+
+    op.create_table(
+        'ledger_transactions',
+        sa.Column('id', sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column('key', sa.String(200), nullable=False, unique=True),
+        sa.Column('description', sa.String(255), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+
+    op.create_table(
+        'ledger_entries',
+        sa.Column('id', sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column('transaction_id', sa.BigInteger(), sa.ForeignKey('ledger_transactions.id', ondelete='RESTRICT'), nullable=False),
+        sa.Column('account_id', sa.Integer(), sa.ForeignKey('ledger_accounts.id', ondelete='RESTRICT'), nullable=False),
+        sa.Column('amount', sa.Numeric(14, 2), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index('ix_ledger_entries_transaction_id', 'ledger_entries', ['transaction_id'])
+    op.create_index('ix_ledger_entries_account_id_id', 'ledger_entries', ['account_id', 'id'])
+
+    op.create_table(
+        'ledger_checkpoints',
+        sa.Column('id', sa.BigInteger(), primary_key=True, autoincrement=True),
+        sa.Column('account_id', sa.Integer(), sa.ForeignKey('ledger_accounts.id', ondelete='CASCADE'), nullable=False),
+        sa.Column('entry_id', sa.BigInteger(), nullable=False),
+        sa.Column('balance', sa.Numeric(14, 2), nullable=False),
+        sa.Column('expected_balance', sa.Numeric(14, 2), nullable=False),
+        sa.Column('consistent', sa.Boolean(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index('ix_ledger_checkpoints_account_id_id', 'ledger_checkpoints', ['account_id', 'id'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_ledger_checkpoints_account_id_id', table_name='ledger_checkpoints')
+    op.drop_table('ledger_checkpoints')
+
+    op.drop_index('ix_ledger_entries_account_id_id', table_name='ledger_entries')
+    op.drop_index('ix_ledger_entries_transaction_id', table_name='ledger_entries')
+    op.drop_table('ledger_entries')
+
+    op.drop_table('ledger_transactions')
+    op.drop_table('ledger_accounts')
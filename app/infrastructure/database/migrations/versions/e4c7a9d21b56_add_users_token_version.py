@@ -0,0 +1,28 @@
+"""add users.token_version
+
+Revision ID: e4c7a9d21b56
+Revises: d2b8f4a61c39
+Create Date: 2026-10-19 16:02:44.118920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4c7a9d21b56'
+down_revision: Union[str, Sequence[str], None] = 'd2b8f4a61c39'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), nullable=False, server_default='0'))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'token_version')
@@ -0,0 +1,37 @@
+"""add auth_tokens for shared refresh tokens and oauth state
+
+Revision ID: f1a3c5e7b902
+Revises: e4c7a9d21b56
+Create Date: 2026-10-19 16:48:13.602177
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a3c5e7b902'
+down_revision: Union[str, Sequence[str], None] = 'e4c7a9d21b56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'auth_tokens',
+        sa.Column('namespace', sa.String(30), primary_key=True),
+        sa.Column('key_hash', sa.String(64), primary_key=True),
+        sa.Column('data', sa.JSON(), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index('ix_auth_tokens_expires_at', 'auth_tokens', ['expires_at'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_auth_tokens_expires_at', table_name='auth_tokens')
+    op.drop_table('auth_tokens')
@@ -17,6 +17,7 @@ from .bnb_listing import (
     Booking,
     StMessage,
     StPayout,
+    StPayoutItem,
     StTaxJurisdiction,
     StTaxRecord,
 )
@@ -42,6 +43,13 @@ from .vehicle import Vehicle
 from .car_rental import CarRental
 from .bundle import BundleModel, BundledItemModel
 from .bundle_booking import BundleBookingModel
+from .auth_token import AuthTokenModel
+from .ledger import (
+    LedgerAccountModel,
+    LedgerTransactionModel,
+    LedgerEntryModel,
+    LedgerCheckpointModel,
+)
 # from .payment import PaymentIntentModel, PaymentModel, RefundModel  # Temporarily disabled for troubleshooting
 
 __all__ = [
@@ -66,6 +74,7 @@ __all__ = [
     "Booking",
     "StMessage",
     "StPayout",
+    "StPayoutItem",
     "StTaxJurisdiction",
     "StTaxRecord",
     "InvProduct",
@@ -82,6 +91,11 @@ __all__ = [
     "BundleModel",
     "BundledItemModel",
     "BundleBookingModel",
+    "AuthTokenModel",
+    "LedgerAccountModel",
+    "LedgerTransactionModel",
+    "LedgerEntryModel",
+    "LedgerCheckpointModel",
     # "PaymentIntentModel",  # Temporarily disabled
     # "PaymentModel",  # Temporarily disabled
     # "RefundModel",  # Temporarily disabled
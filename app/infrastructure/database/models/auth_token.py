@@ -0,0 +1,23 @@
+"""Shared storage for refresh tokens and OAuth state."""
+from datetime import datetime
+from typing import Any, Dict
+
+from sqlalchemy import JSON, DateTime, Index, String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from ...config.database import Base
+
+
+class AuthTokenModel(Base):
+    """Expiring opaque token, stored by SHA-256 digest"""
+    __tablename__ = "auth_tokens"
+    __table_args__ = (
+        Index("ix_auth_tokens_expires_at", "expires_at"),
+    )
+
+    namespace: Mapped[str] = mapped_column(String(30), primary_key=True)
+    key_hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    data: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
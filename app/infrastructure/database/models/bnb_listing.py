@@ -8,7 +8,7 @@ from typing import Optional
 
 from sqlalchemy import (
     Integer, String, Text, Date, DateTime, Numeric, Float, JSON,
-    ForeignKey, Index, Boolean, Enum as SAEnum
+    ForeignKey, Index, Boolean, UniqueConstraint, Enum as SAEnum
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
@@ -102,6 +102,7 @@ class Booking(Base):
         Index("ix_bookings_guest_id", "guest_id"),
         Index("ix_bookings_listing_id", "listing_id"),
         Index("ix_bookings_status", "status"),
+        Index("ix_bookings_status_check_out", "status", "check_out"),
     )
 
 
@@ -124,7 +125,8 @@ class StPayout(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     host_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
-    booking_id: Mapped[int] = mapped_column(Integer, ForeignKey("st_bookings.id", ondelete="SET NULL"), nullable=True)
+    # Set for single-booking payouts; scheduled runs aggregate via StPayoutItem
+    booking_id: Mapped[int] = mapped_column(Integer, ForeignKey("bookings.id", ondelete="SET NULL"), nullable=True)
     amount: Mapped[Decimal] = mapped_column(Numeric(12,2), nullable=False)
     currency: Mapped[str] = mapped_column(String(10), nullable=False, default="KES")
     status: Mapped[str] = mapped_column(String(20), nullable=False, default="SCHEDULED")
@@ -137,6 +139,26 @@ class StPayout(Base):
     )
 
 
+class StPayoutItem(Base):
+    """A booking included in a payout; each booking can be paid out once."""
+    __tablename__ = "st_payout_items"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    payout_id: Mapped[int] = mapped_column(Integer, ForeignKey("st_payouts.id", ondelete="CASCADE"), nullable=False)
+    booking_type: Mapped[str] = mapped_column(String(20), nullable=False)  # 'bnb', 'tour', 'car'
+    booking_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    host_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    amount: Mapped[Decimal] = mapped_column(Numeric(12,2), nullable=False)
+    currency: Mapped[str] = mapped_column(String(10), nullable=False, default="KES")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("booking_type", "booking_id", name="uq_st_payout_items_booking"),
+        Index("ix_st_payout_items_payout_id", "payout_id"),
+        Index("ix_st_payout_items_host_id", "host_id"),
+    )
+
+
 class StTaxJurisdiction(Base):
     __tablename__ = "st_tax_jurisdictions"
 
@@ -5,12 +5,16 @@ from sqlalchemy import (
     Numeric,
     String,
     ForeignKey,
+    Index,
     func
 )
 from ...config.database import Base
 
 class CarRental(Base):
     __tablename__ = "car_rentals"
+    __table_args__ = (
+        Index("ix_car_rentals_status_return_date", "status", "return_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     vehicle_id = Column(Integer, ForeignKey("vehicles.id"), nullable=False)
@@ -0,0 +1,72 @@
+"""Double-entry ledger models."""
+from datetime import datetime
+from decimal import Decimal
+from typing import Optional
+
+from sqlalchemy import BigInteger, Boolean, DateTime, ForeignKey, Index, Integer, Numeric, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from ...config.database import Base
+
+
+class LedgerAccountModel(Base):
+    """An account and its running balance snapshot, updated with every entry"""
+    __tablename__ = "ledger_accounts"
+    __table_args__ = (
+        UniqueConstraint("owner_id", "kind", "currency", name="uq_ledger_accounts_owner_kind_currency"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(30), nullable=False)
+    # 0 for platform accounts, otherwise the host's user id
+    owner_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    currency: Mapped[str] = mapped_column(String(10), nullable=False)
+    balance: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0, server_default="0")
+    credits_total: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0, server_default="0")
+    debits_total: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False, default=0, server_default="0")
+    last_entry_id: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class LedgerTransactionModel(Base):
+    """One business event; its entries always sum to zero"""
+    __tablename__ = "ledger_transactions"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    key: Mapped[str] = mapped_column(String(200), unique=True, nullable=False)
+    description: Mapped[str] = mapped_column(String(255), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class LedgerEntryModel(Base):
+    """Append-only ledger line; never updated or deleted"""
+    __tablename__ = "ledger_entries"
+    __table_args__ = (
+        Index("ix_ledger_entries_account_id_id", "account_id", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    transaction_id: Mapped[int] = mapped_column(
+        BigInteger, ForeignKey("ledger_transactions.id", ondelete="RESTRICT"), nullable=False, index=True
+    )
+    account_id: Mapped[int] = mapped_column(Integer, ForeignKey("ledger_accounts.id", ondelete="RESTRICT"), nullable=False)
+    amount: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+
+class LedgerCheckpointModel(Base):
+    """Verified balance of an account up to and including *entry_id*"""
+    __tablename__ = "ledger_checkpoints"
+    __table_args__ = (
+        Index("ix_ledger_checkpoints_account_id_id", "account_id", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    account_id: Mapped[int] = mapped_column(Integer, ForeignKey("ledger_accounts.id", ondelete="CASCADE"), nullable=False)
+    entry_id: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    balance: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    # Balance implied by the previous checkpoint plus the entries since
+    expected_balance: Mapped[Decimal] = mapped_column(Numeric(14, 2), nullable=False)
+    consistent: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -1,7 +1,7 @@
 """Message database model."""
 from sqlalchemy import (
     Integer, String, Text, DateTime, Boolean, 
-    ForeignKey, Index
+    ForeignKey, Index, UniqueConstraint
 )
 from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.sql import func
@@ -25,6 +25,7 @@ class Message(Base):
     read_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     parent_message_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("messages.id", ondelete="SET NULL"), nullable=True)
     is_system_message: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    thread_id: Mapped[Optional[int]] = mapped_column(Integer, ForeignKey("conversation_threads.id", ondelete="CASCADE"), nullable=True)
 
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
@@ -37,4 +38,38 @@ class Message(Base):
         Index("ix_messages_unread", "recipient_id", "is_read"),
         Index("ix_messages_created_at", "created_at"),
         Index("ix_messages_parent", "parent_message_id"),
+        Index("ix_messages_thread_created", "thread_id", "created_at", "id"),
+    )
+
+
+class ConversationThread(Base):
+    """Summary row per (booking, participant pair), maintained on send/read.
+
+    Participants are stored ordered (participant_1_id < participant_2_id) so a
+    pair maps to exactly one row regardless of who sent the first message.
+    """
+    __tablename__ = "conversation_threads"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    booking_type: Mapped[str] = mapped_column(String(20), nullable=False)
+    booking_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    participant_1_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    participant_2_id: Mapped[int] = mapped_column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    last_message_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    last_message_sender_id: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    last_message_preview: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    last_message_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    unread_count_participant_1: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    unread_count_participant_2: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "booking_type", "booking_id", "participant_1_id", "participant_2_id",
+            name="uq_conversation_threads_pair",
+        ),
+        Index("ix_conversation_threads_p1_last", "participant_1_id", "last_message_at"),
+        Index("ix_conversation_threads_p2_last", "participant_2_id", "last_message_at"),
     )
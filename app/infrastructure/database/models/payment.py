@@ -1,4 +1,4 @@
-from sqlalchemy import Integer, String, Numeric, DateTime, Text, JSON, ForeignKey
+from sqlalchemy import Integer, String, Numeric, DateTime, Text, JSON, ForeignKey, UniqueConstraint, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 from datetime import datetime
@@ -23,6 +23,8 @@ class PaymentIntentModel(Base):
     status: Mapped[str] = mapped_column(String(50), nullable=False, default="pending")
     extra: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSON, nullable=True)
     expires_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Lease taken by a reconciliation worker so other workers skip the intent
+    reconcile_claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), 
         server_default=func.now(),
@@ -91,3 +93,30 @@ class RefundModel(Base):
         DateTime(timezone=True), 
         onupdate=func.now()
     )
+
+
+class PaymentWebhookEventModel(Base):
+    """Durable inbox of provider callbacks, applied by a background consumer"""
+    __tablename__ = "payment_webhook_events"
+    __table_args__ = (
+        # Providers retry deliveries; the same event must only be stored once
+        UniqueConstraint("provider", "event_id", name="uq_payment_webhook_events_provider_event"),
+        Index("ix_payment_webhook_events_status_id", "status", "id"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    provider: Mapped[str] = mapped_column(String(20), nullable=False)
+    event_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    event_type: Mapped[str] = mapped_column(String(100), nullable=False)
+    payment_intent_id: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, index=True)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    status: Mapped[str] = mapped_column(String(20), nullable=False, default="received", server_default="received")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    last_error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    claimed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    processed_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), 
+        server_default=func.now(),
+        nullable=False
+    )
@@ -6,12 +6,16 @@ from sqlalchemy import (
     String,
     DateTime,
     ForeignKey,
+    Index,
     func
 )
 from ...config.database import Base
 
 class TourBooking(Base):
     __tablename__ = "tour_bookings"
+    __table_args__ = (
+        Index("ix_tour_bookings_status_booking_date", "status", "booking_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     tour_id = Column(Integer, ForeignKey("tours.id"), nullable=False)
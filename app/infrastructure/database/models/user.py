@@ -42,6 +42,8 @@ class User(Base):
         default=UserRole.USER,
     )
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
+    # Embedded in access tokens; bumping it revokes every token issued before
+    token_version: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     
     # Agent-specific fields (optional)
     agent_license_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
@@ -0,0 +1,219 @@
+"""SQL statement budgets that catch N+1 regressions.
+
+Endpoints declare how many statements a request may issue with
+``@query_budget(max_queries, max_repeats)`` placed directly under their
+route decorator. ``max_repeats`` caps how often one statement fingerprint
+may run, which is what an N+1 loop trips first.
+
+Nothing is counted in production: the ``before_cursor_execute`` listener
+is only attached by ``install(engine)``, which the pytest plugin in
+``infrastructure.database.query_budget_plugin`` does. Statements are
+attributed to the use case and repository method that issued them, read
+from the call stack (through the awaiting coroutines for async engines).
+"""
+from __future__ import annotations
+
+import logging
+import sys
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from sqlalchemy import event
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from infrastructure.config.metrics import route_label
+from shared.utils.sql import fingerprint
+
+logger = logging.getLogger(__name__)
+
+F = TypeVar("F", bound=Callable)
+
+BUDGET_ATTRIBUTE = "__query_budget__"
+
+_USE_CASE_PATH = "/application/use_cases/"
+_REPOSITORY_PATH = "/infrastructure/database/repositories/"
+
+
+class QueryBudgetExceeded(AssertionError):
+    """A block issued more SQL statements than its budget allows."""
+
+
+@dataclass(frozen=True)
+class QueryBudget:
+    max_queries: int
+    max_repeats: Optional[int] = None
+
+
+@dataclass(frozen=True)
+class RecordedQuery:
+    fingerprint: str
+    statement: str
+    caller: str
+
+
+def query_budget(max_queries: int, max_repeats: Optional[int] = None) -> Callable[[F], F]:
+    """Declare the most SQL statements one request to the endpoint may issue."""
+
+    def decorator(endpoint: F) -> F:
+        setattr(endpoint, BUDGET_ATTRIBUTE, QueryBudget(max_queries=max_queries, max_repeats=max_repeats))
+        return endpoint
+
+    return decorator
+
+
+def budget_for(endpoint) -> Optional[QueryBudget]:
+    return getattr(endpoint, BUDGET_ATTRIBUTE, None)
+
+
+class QueryRecorder:
+    """Statements issued while recording; enclosing recorders see them too."""
+
+    def __init__(self, parent: Optional["QueryRecorder"] = None) -> None:
+        self.parent = parent
+        self.queries: List[RecordedQuery] = []
+
+    def record(self, query: RecordedQuery) -> None:
+        recorder: Optional[QueryRecorder] = self
+        while recorder is not None:
+            recorder.queries.append(query)
+            recorder = recorder.parent
+
+    @property
+    def count(self) -> int:
+        return len(self.queries)
+
+    def repeated(self, threshold: int = 2) -> List[Tuple[str, int, List[str]]]:
+        """Fingerprints run at least *threshold* times, most repeated first."""
+        counts = Counter(query.fingerprint for query in self.queries)
+        callers: Dict[str, List[str]] = defaultdict(list)
+        for query in self.queries:
+            if query.caller not in callers[query.fingerprint]:
+                callers[query.fingerprint].append(query.caller)
+        return [
+            (statement, times, callers[statement])
+            for statement, times in counts.most_common()
+            if times >= threshold
+        ]
+
+    def check(self, budget: QueryBudget, label: str) -> Optional[str]:
+        """Describe how *budget* was exceeded, or ``None`` if it was not."""
+        problems = []
+        if self.count > budget.max_queries:
+            problems.append(f"{self.count} statements, budget {budget.max_queries}")
+        if budget.max_repeats is not None:
+            worst = self.repeated(budget.max_repeats + 1)
+            if worst:
+                problems.append(f"a statement ran {worst[0][1]} times, budget {budget.max_repeats}")
+        if not problems:
+            return None
+        return f"Query budget exceeded for {label}: {'; '.join(problems)}\n{self.report()}"
+
+    def report(self) -> str:
+        lines = [f"{self.count} SQL statements"]
+        repeated = self.repeated()
+        if repeated:
+            lines.append("Repeated statements:")
+            for statement, times, callers in repeated:
+                lines.append(f"  {times}x {statement}")
+                lines.extend(f"       from {caller}" for caller in callers)
+        return "\n".join(lines)
+
+
+_recorder: ContextVar[Optional[QueryRecorder]] = ContextVar("query_recorder", default=None)
+
+
+@contextmanager
+def recording() -> Iterator[QueryRecorder]:
+    """Record the statements issued in this context until the block exits."""
+    recorder = QueryRecorder(parent=_recorder.get())
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+@contextmanager
+def assert_query_budget(
+    max_queries: int, max_repeats: Optional[int] = None, label: str = "block"
+) -> Iterator[QueryRecorder]:
+    """Raise ``QueryBudgetExceeded`` if the block exceeds the budget."""
+    with recording() as recorder:
+        yield recorder
+    message = recorder.check(QueryBudget(max_queries, max_repeats), label)
+    if message:
+        raise QueryBudgetExceeded(message)
+
+
+def _frames():
+    frame = sys._getframe(3)
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+    # Async engines run the cursor call in a greenlet; the awaiting
+    # coroutines hang off the frame the parent greenlet is suspended in
+    greenlet = sys.modules.get("greenlet")
+    parent = greenlet.getcurrent().parent if greenlet is not None else None
+    frame = parent.gr_frame if parent is not None else None
+    while frame is not None:
+        yield frame
+        frame = frame.f_back
+
+
+def _caller() -> str:
+    use_case = repository = None
+    for frame in _frames():
+        filename = frame.f_code.co_filename.replace("\\", "/")
+        if repository is None and _REPOSITORY_PATH in filename:
+            repository = frame.f_code.co_qualname
+        elif use_case is None and _USE_CASE_PATH in filename:
+            use_case = frame.f_code.co_qualname
+            break
+    if use_case and repository:
+        return f"{use_case} via {repository}"
+    return use_case or repository or "<unknown>"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.record(RecordedQuery(fingerprint(statement), statement, _caller()))
+
+
+def install(engine) -> None:
+    """Count the statements *engine* (sync or async) issues while recording."""
+    target = getattr(engine, "sync_engine", engine)
+    if not event.contains(target, "before_cursor_execute", _before_cursor_execute):
+        event.listen(target, "before_cursor_execute", _before_cursor_execute)
+
+
+class QueryBudgetMiddleware:
+    """Check each request against the budget its endpoint declares.
+
+    Wrap the whole application so the commit at the end of the request is
+    counted too. Violations are collected in ``violations`` for the test
+    to assert on rather than failing the request.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+        self.violations: List[str] = []
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with recording() as recorder:
+            await self.app(scope, receive, send)
+
+        budget = budget_for(scope.get("endpoint"))
+        if budget is None:
+            return
+        message = recorder.check(budget, f"{scope['method']} {route_label(scope)}")
+        if message:
+            logger.warning(message)
+            self.violations.append(message)
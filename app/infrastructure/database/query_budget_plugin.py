@@ -0,0 +1,95 @@
+"""pytest plugin enforcing SQL statement budgets.
+
+Enable it with ``-p infrastructure.database.query_budget_plugin`` or
+``pytest_plugins = ["infrastructure.database.query_budget_plugin"]`` in a
+conftest. It provides:
+
+* ``query_recorder``: records every statement the test issues and fails
+  the test when it exceeds ``@pytest.mark.query_budget(max_queries,
+  max_repeats=None)``. Statements issued by fixtures set up after it count
+  too.
+* ``query_budget_app``: ``api.main.app`` wrapped so every request is held
+  to the ``@query_budget`` its endpoint declares; drive it with
+  ``httpx.AsyncClient(transport=httpx.ASGITransport(app=query_budget_app))``.
+* ``--query-report``: print each test's statement count and repeated
+  statements with the use case that issued them.
+
+Statements are counted on ``query_budget_engine``, by default the
+application engine. Point ``DATABASE_URL`` at a local Postgres, or at a
+SQLite file (``sqlite+aiosqlite:///./query_budget.db``; not ``:memory:``,
+which is per connection), or override the fixture for another engine.
+"""
+import pytest
+
+from .query_budget import QueryBudget, QueryBudgetMiddleware, QueryRecorder, install, recording
+
+_recorder_key = pytest.StashKey[QueryRecorder]()
+_app_key = pytest.StashKey[QueryBudgetMiddleware]()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--query-report",
+        action="store_true",
+        default=False,
+        help="Print the SQL statements issued by each test using query_recorder",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "query_budget(max_queries, max_repeats=None): fail when the test issues more SQL statements",
+    )
+
+
+@pytest.fixture(scope="session")
+def query_budget_engine():
+    """Engine whose statements are counted."""
+    from infrastructure.config.database import engine
+
+    return engine
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    # Checked on the call report so an overrun fails the test itself rather
+    # than erroring in fixture teardown
+    outcome = yield
+    report = outcome.get_result()
+    if report.when != "call" or not report.passed:
+        return
+
+    problems = []
+    recorder = item.stash.get(_recorder_key, None)
+    marker = item.get_closest_marker("query_budget")
+    if recorder is not None and marker is not None:
+        message = recorder.check(QueryBudget(*marker.args, **marker.kwargs), item.nodeid)
+        if message:
+            problems.append(message)
+    app = item.stash.get(_app_key, None)
+    if app is not None:
+        problems.extend(app.violations)
+    if problems:
+        report.outcome = "failed"
+        report.longrepr = "\n\n".join(problems)
+
+
+@pytest.fixture
+def query_recorder(request, query_budget_engine):
+    install(query_budget_engine)
+    with recording() as recorder:
+        request.node.stash[_recorder_key] = recorder
+        yield recorder
+
+    if request.config.getoption("query_report"):
+        print(f"\n{request.node.nodeid}: {recorder.report()}")
+
+
+@pytest.fixture
+def query_budget_app(request, query_recorder):
+    from api.main import app
+
+    wrapped = QueryBudgetMiddleware(app)
+    request.node.stash[_app_key] = wrapped
+    return wrapped
@@ -0,0 +1,196 @@
+"""Read-replica routing.
+
+Routes marked read-only (the ``use_read_replica`` dependency) send their
+plain SELECTs to ``replica_engine``. Everything else, any statement that
+writes or locks, and every read after it in the same request stays on the
+primary.
+
+Reads fall back to the primary when:
+
+- the client wrote within ``DATABASE_REPLICA_STICKY_SECONDS`` (tracked by
+  a cookie, plus the Authorization header within this worker), so users
+  see their own writes;
+- the replica lags by more than ``DATABASE_REPLICA_MAX_LAG_SECONDS`` or
+  cannot be reached.
+"""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import Select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+
+from infrastructure.config.config import settings
+from infrastructure.config.database import replica_engine
+
+logger = logging.getLogger(__name__)
+
+STICKY_COOKIE = "db_primary_until"
+
+# Seconds since the replica last replayed WAL; 0 when caught up or primary
+REPLICA_LAG_SQL = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+def _is_plain_select(clause: Any) -> bool:
+    return isinstance(clause, Select) and clause._for_update_arg is None
+
+
+class RoutingSession(Session):
+    """Session that can send plain SELECTs to the read replica."""
+
+    use_replica = False
+    wrote = False
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if self._flushing or not _is_plain_select(clause):
+            # Later reads must see this write, so stop using the replica
+            self.wrote = True
+            self.use_replica = False
+        elif self.use_replica and replica_engine is not None:
+            return replica_engine.sync_engine
+        return super().get_bind(mapper=mapper, clause=clause, **kw)
+
+
+def _client_key(authorization: str) -> str:
+    return hashlib.sha256(authorization.encode()).hexdigest()
+
+
+class ReplicaRouter:
+    """Decides per request whether reads may go to the replica.
+
+    Args:
+        engine: Replica engine, or None when no replica is configured
+        sticky_seconds: Primary-only window after a client's write
+        max_lag: Lag in seconds beyond which the replica is skipped
+        lag_check_interval: Seconds between lag measurements per worker
+        max_tracked: Clients remembered in the per-worker sticky map
+    """
+
+    def __init__(
+        self,
+        engine: Optional[AsyncEngine],
+        sticky_seconds: float,
+        max_lag: float,
+        lag_check_interval: float = 5.0,
+        max_tracked: int = 10_000,
+    ) -> None:
+        self._engine = engine
+        self.sticky_seconds = sticky_seconds
+        self.max_lag = max_lag
+        self._lag_check_interval = lag_check_interval
+        self._max_tracked = max_tracked
+        self._sticky_until: Dict[str, float] = {}
+        self._lag: Optional[float] = None
+        self._lag_checked_at = float("-inf")
+        self._lag_lock = asyncio.Lock()
+        self.replica_requests = 0
+        self.sticky_requests = 0
+        self.lagging_requests = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self._engine is not None
+
+    @property
+    def lag_seconds(self) -> Optional[float]:
+        return self._lag
+
+    @property
+    def healthy(self) -> bool:
+        return self._lag is not None and self._lag <= self.max_lag
+
+    def is_sticky(self, authorization: Optional[str], cookie: Optional[str]) -> bool:
+        """True if this client wrote recently and must read from the primary."""
+        now = time.time()
+        if cookie:
+            try:
+                if float(cookie) > now:
+                    return True
+            except ValueError:
+                pass
+        if authorization:
+            until = self._sticky_until.get(_client_key(authorization))
+            return until is not None and until > now
+        return False
+
+    def record_write(self, authorization: Optional[str]) -> str:
+        """Start the sticky window for a client; returns a Set-Cookie value."""
+        until = time.time() + self.sticky_seconds
+        if authorization:
+            if len(self._sticky_until) >= self._max_tracked:
+                now = time.time()
+                self._sticky_until = {k: v for k, v in self._sticky_until.items() if v > now}
+            self._sticky_until[_client_key(authorization)] = until
+        return (
+            f"{STICKY_COOKIE}={until:.0f}; Max-Age={int(self.sticky_seconds)}; "
+            "Path=/; HttpOnly; SameSite=Lax"
+        )
+
+    async def refresh_lag(self, force: bool = False) -> Optional[float]:
+        """Measure replica lag at most every ``lag_check_interval`` seconds."""
+        if self._engine is None:
+            return None
+        if not force and time.monotonic() - self._lag_checked_at < self._lag_check_interval:
+            return self._lag
+        async with self._lag_lock:
+            if not force and time.monotonic() - self._lag_checked_at < self._lag_check_interval:
+                return self._lag
+            try:
+                async with self._engine.connect() as conn:
+                    self._lag = float((await conn.execute(REPLICA_LAG_SQL)).scalar() or 0)
+            except Exception:
+                logger.warning("Replica lag check failed", exc_info=True)
+                self._lag = None
+            self._lag_checked_at = time.monotonic()
+        if self._lag is not None and self._lag > self.max_lag:
+            logger.warning("Replica lag %.1fs exceeds %.1fs; reading from primary", self._lag, self.max_lag)
+        return self._lag
+
+    async def allows(self, authorization: Optional[str], cookie: Optional[str]) -> bool:
+        """Whether a read-only request may use the replica right now."""
+        if self._engine is None:
+            return False
+        if self.is_sticky(authorization, cookie):
+            self.sticky_requests += 1
+            return False
+        await self.refresh_lag()
+        if not self.healthy:
+            self.lagging_requests += 1
+            return False
+        self.replica_requests += 1
+        return True
+
+    async def health(self) -> Dict[str, Any]:
+        """Replica state for the health endpoint."""
+        if self._engine is None:
+            return {"configured": False}
+        lag = await self.refresh_lag()
+        return {
+            "configured": True,
+            "healthy": self.healthy,
+            "lag_seconds": None if lag is None else round(lag, 3),
+            "max_lag_seconds": self.max_lag,
+            "replica_requests": self.replica_requests,
+            "sticky_requests": self.sticky_requests,
+            "lagging_requests": self.lagging_requests,
+        }
+
+
+replica_router = ReplicaRouter(
+    replica_engine,
+    sticky_seconds=settings.DATABASE_REPLICA_STICKY_SECONDS,
+    max_lag=settings.DATABASE_REPLICA_MAX_LAG_SECONDS,
+)
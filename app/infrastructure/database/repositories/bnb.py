@@ -11,6 +11,7 @@ from infrastructure.database.models.bnb_listing import Booking as BookingModel
 from infrastructure.database.models.user import User as UserModel
 from shared.mappers.bnb import BnbMapper
 from infrastructure.config.database import AsyncSessionLocal
+from infrastructure.database.unit_of_work import current_unit_of_work
 
 class SqlAlchemyBnbRepository(BnbRepository):
     def __init__(self, session: AsyncSession = None):
@@ -23,6 +24,9 @@ class SqlAlchemyBnbRepository(BnbRepository):
         if self._session and not self._managed_session:
             # Use provided session
             yield self._session
+        elif current_unit_of_work() is not None:
+            # Share the request's session instead of opening one per call
+            yield current_unit_of_work().session
         else:
             # Create and manage our own session
             session = AsyncSessionLocal()
@@ -42,14 +46,12 @@ class SqlAlchemyBnbRepository(BnbRepository):
     async def create(self, entity: ShortTermListing) -> ShortTermListing:
         async def _create():
             model = BnbMapper.entity_to_model(entity)
-            self._session.add(model)
-            try:
-                await self._session.commit()
-                await self._session.refresh(model)
-                return BnbMapper.model_to_entity(model)
-            except Exception as e:
-                await self._session.rollback()
-                raise e
+            async with self._session.begin_nested():
+                self._session.add(model)
+                await self._session.flush()
+            await self._session.commit()
+            await self._session.refresh(model)
+            return BnbMapper.model_to_entity(model)
 
         return await self._execute_in_session(_create)
 
@@ -98,26 +100,22 @@ class SqlAlchemyBnbRepository(BnbRepository):
     async def update(self, entity: ShortTermListing) -> ShortTermListing:
         async def _update():
             model = BnbMapper.entity_to_model(entity)
-            try:
+            async with self._session.begin_nested():
                 await self._session.merge(model)
-                await self._session.commit()
-                return entity
-            except Exception as e:
-                await self._session.rollback()
-                raise e
+                await self._session.flush()
+            await self._session.commit()
+            return entity
 
         return await self._execute_in_session(_update)
 
     async def delete(self, id: int) -> None:
         async def _delete():
-            try:
-                model = await self._session.get(StListingModel, id)
-                if model:
+            model = await self._session.get(StListingModel, id)
+            if model:
+                async with self._session.begin_nested():
                     await self._session.delete(model)
-                    await self._session.commit()
-            except Exception as e:
-                await self._session.rollback()
-                raise e
+                    await self._session.flush()
+                await self._session.commit()
 
         await self._execute_in_session(_delete)
 
@@ -248,6 +246,9 @@ class SqlAlchemyBookingRepository(BookingRepository):
         if self._session and not self._managed_session:
             # Use provided session
             yield self._session
+        elif current_unit_of_work() is not None:
+            # Share the request's session instead of opening one per call
+            yield current_unit_of_work().session
         else:
             # Create and manage our own session
             session = AsyncSessionLocal()
@@ -267,14 +268,12 @@ class SqlAlchemyBookingRepository(BookingRepository):
     async def create(self, entity: Booking) -> Booking:
         async def _create():
             model = BnbMapper.booking_entity_to_model(entity)
-            self._session.add(model)
-            try:
-                await self._session.commit()
-                await self._session.refresh(model)
-                return BnbMapper.booking_model_to_entity(model)
-            except Exception as e:
-                await self._session.rollback()
-                raise e
+            async with self._session.begin_nested():
+                self._session.add(model)
+                await self._session.flush()
+            await self._session.commit()
+            await self._session.refresh(model)
+            return BnbMapper.booking_model_to_entity(model)
 
         return await self._execute_in_session(_create)
 
@@ -290,26 +289,22 @@ class SqlAlchemyBookingRepository(BookingRepository):
     async def update(self, entity: Booking) -> Booking:
         async def _update():
             model = BnbMapper.booking_entity_to_model(entity)
-            try:
+            async with self._session.begin_nested():
                 await self._session.merge(model)
-                await self._session.commit()
-                return entity
-            except Exception as e:
-                await self._session.rollback()
-                raise e
+                await self._session.flush()
+            await self._session.commit()
+            return entity
 
         return await self._execute_in_session(_update)
 
     async def delete(self, id: int) -> None:
         async def _delete():
-            try:
-                model = await self._session.get(BookingModel, id)
-                if model:
+            model = await self._session.get(BookingModel, id)
+            if model:
+                async with self._session.begin_nested():
                     await self._session.delete(model)
-                    await self._session.commit()
-            except Exception as e:
-                await self._session.rollback()
-                raise e
+                    await self._session.flush()
+                await self._session.commit()
 
         await self._execute_in_session(_delete)
 
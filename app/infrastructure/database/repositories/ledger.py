@@ -0,0 +1,191 @@
+from collections import defaultdict
+from decimal import Decimal
+from typing import Dict, List, Sequence
+
+from sqlalchemy import BigInteger, Integer, Numeric, column, func, select, text, tuple_, update, values
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.ledger import LedgerAccount, LedgerCheckpointSummary, LedgerPosting
+from domain.repositories.ledger import LedgerRepository
+from infrastructure.database.models.ledger import (
+    LedgerAccountModel,
+    LedgerEntryModel,
+    LedgerTransactionModel,
+)
+from shared.exceptions.payment import LedgerImbalanceError
+from shared.mappers.ledger import LedgerMapper
+
+# Keeps each multi-row INSERT well under the driver's bind parameter limit
+POSTING_CHUNK_SIZE = 1000
+
+# Checkpoint every account that moved since its last checkpoint. The expected
+# balance only sums entries after the previous checkpoint, so the cost grows
+# with recent activity rather than with the size of the ledger.
+CHECKPOINT_SQL = text("""
+WITH snapshot AS (
+    SELECT a.id AS account_id, a.balance, a.last_entry_id,
+           COALESCE(p.balance, 0) + COALESCE((
+               SELECT SUM(e.amount) FROM ledger_entries e
+               WHERE e.account_id = a.id
+                 AND e.id > COALESCE(p.entry_id, 0) AND e.id <= a.last_entry_id
+           ), 0) AS expected_balance
+    FROM ledger_accounts a
+    LEFT JOIN LATERAL (
+        SELECT c.entry_id, c.balance FROM ledger_checkpoints c
+        WHERE c.account_id = a.id
+        ORDER BY c.id DESC
+        LIMIT 1
+    ) p ON true
+    WHERE p.entry_id IS NULL OR a.last_entry_id > p.entry_id
+)
+INSERT INTO ledger_checkpoints (account_id, entry_id, balance, expected_balance, consistent)
+SELECT account_id, last_entry_id, balance, expected_balance, balance = expected_balance
+FROM snapshot
+RETURNING account_id, consistent
+""")
+
+# Every posting is balanced, so balances must net to zero per currency
+TRIAL_BALANCE_SQL = text("""
+SELECT currency FROM ledger_accounts GROUP BY currency HAVING SUM(balance) <> 0
+""")
+
+
+async def apply_postings(session: AsyncSession, postings: Sequence[LedgerPosting]) -> int:
+    """Write postings within the caller's transaction; the caller commits.
+
+    Flows that change other tables call this before their own commit so the
+    ledger moves atomically with the business data.
+    """
+    unique: Dict[str, LedgerPosting] = {}
+    for posting in postings:
+        if not posting.is_balanced():
+            raise LedgerImbalanceError(f"Posting {posting.key} does not balance")
+        unique.setdefault(posting.key, posting)
+
+    batch = list(unique.values())
+    applied = 0
+    for start in range(0, len(batch), POSTING_CHUNK_SIZE):
+        applied += await _apply_chunk(session, batch[start:start + POSTING_CHUNK_SIZE])
+    return applied
+
+
+async def _apply_chunk(session: AsyncSession, postings: List[LedgerPosting]) -> int:
+    account_keys = sorted({
+        (line.owner_id, line.kind.value, line.currency)
+        for posting in postings for line in posting.lines
+    })
+    await session.execute(
+        insert(LedgerAccountModel)
+        .values([{"owner_id": o, "kind": k, "currency": c} for o, k, c in account_keys])
+        .on_conflict_do_nothing(index_elements=["owner_id", "kind", "currency"])
+    )
+    # Lock in id order so concurrent posters cannot deadlock; holding the
+    # locks while inserting also keeps each account's entry ids in commit order
+    rows = await session.execute(
+        select(
+            LedgerAccountModel.id,
+            LedgerAccountModel.owner_id,
+            LedgerAccountModel.kind,
+            LedgerAccountModel.currency,
+        )
+        .where(tuple_(
+            LedgerAccountModel.owner_id, LedgerAccountModel.kind, LedgerAccountModel.currency
+        ).in_(account_keys))
+        .order_by(LedgerAccountModel.id)
+        .with_for_update()
+    )
+    account_ids = {(row.owner_id, row.kind, row.currency): row.id for row in rows}
+
+    inserted = await session.execute(
+        insert(LedgerTransactionModel)
+        .values([{"key": p.key, "description": p.description[:255]} for p in postings])
+        .on_conflict_do_nothing(index_elements=["key"])
+        .returning(LedgerTransactionModel.id, LedgerTransactionModel.key)
+    )
+    transaction_ids = {row.key: row.id for row in inserted}
+    if not transaction_ids:
+        return 0
+
+    entries = [
+        {
+            "transaction_id": transaction_ids[posting.key],
+            "account_id": account_ids[(line.owner_id, line.kind.value, line.currency)],
+            "amount": line.amount,
+        }
+        for posting in postings if posting.key in transaction_ids
+        for line in posting.lines
+    ]
+    written = await session.execute(
+        insert(LedgerEntryModel)
+        .values(entries)
+        .returning(LedgerEntryModel.id, LedgerEntryModel.account_id)
+    )
+
+    last_entry_ids: Dict[int, int] = defaultdict(int)
+    for row in written:
+        last_entry_ids[row.account_id] = max(last_entry_ids[row.account_id], row.id)
+    credits: Dict[int, Decimal] = defaultdict(Decimal)
+    debits: Dict[int, Decimal] = defaultdict(Decimal)
+    for entry in entries:
+        if entry["amount"] >= 0:
+            credits[entry["account_id"]] += entry["amount"]
+        else:
+            debits[entry["account_id"]] -= entry["amount"]
+
+    deltas = values(
+        column("account_id", Integer),
+        column("credits", Numeric(14, 2)),
+        column("debits", Numeric(14, 2)),
+        column("last_entry_id", BigInteger),
+        name="ledger_deltas",
+    ).data([
+        (account_id, credits[account_id], debits[account_id], last_entry_id)
+        for account_id, last_entry_id in last_entry_ids.items()
+    ])
+    await session.execute(
+        update(LedgerAccountModel)
+        .where(LedgerAccountModel.id == deltas.c.account_id)
+        .values(
+            balance=LedgerAccountModel.balance + deltas.c.credits - deltas.c.debits,
+            credits_total=LedgerAccountModel.credits_total + deltas.c.credits,
+            debits_total=LedgerAccountModel.debits_total + deltas.c.debits,
+            last_entry_id=deltas.c.last_entry_id,
+            updated_at=func.now(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+    return len(transaction_ids)
+
+
+class SqlAlchemyLedgerRepository(LedgerRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def post(self, postings: Sequence[LedgerPosting]) -> int:
+        async with self._session.begin_nested():
+            applied = await apply_postings(self._session, postings)
+            await self._session.flush()
+        await self._session.commit()
+        return applied
+
+    async def get_owner_accounts(self, owner_id: int, currency: str) -> List[LedgerAccount]:
+        result = await self._session.execute(
+            select(LedgerAccountModel).where(
+                LedgerAccountModel.owner_id == owner_id,
+                LedgerAccountModel.currency == currency,
+            )
+        )
+        return [LedgerMapper.account_model_to_entity(model) for model in result.scalars().all()]
+
+    async def checkpoint(self) -> LedgerCheckpointSummary:
+        async with self._session.begin_nested():
+            checked = (await self._session.execute(CHECKPOINT_SQL)).all()
+            unbalanced = (await self._session.execute(TRIAL_BALANCE_SQL)).scalars().all()
+            await self._session.flush()
+        await self._session.commit()
+        return LedgerCheckpointSummary(
+            accounts_checked=len(checked),
+            mismatched_account_ids=[row.account_id for row in checked if not row.consistent],
+            unbalanced_currencies=list(unbalanced),
+        )
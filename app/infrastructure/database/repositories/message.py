@@ -1,10 +1,15 @@
 """Message repository implementation."""
-from typing import List, Optional
+from typing import List, Optional, Tuple, cast
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_, or_, func, desc
+from sqlalchemy import select, update, and_, or_, func, desc, case, tuple_
+from sqlalchemy.engine import CursorResult
+from sqlalchemy.exc import IntegrityError
 from domain.repositories.message import MessageRepository
 from domain.entities.message import Message, MessageThread
-from infrastructure.database.models.message import Message as MessageModel
+from infrastructure.database.models.message import (
+    Message as MessageModel,
+    ConversationThread as ConversationThreadModel,
+)
 from shared.mappers.message import MessageMapper
 from datetime import datetime
 
@@ -15,14 +20,12 @@ class SqlAlchemyMessageRepository(MessageRepository):
 
     async def create(self, entity: Message) -> Message:
         model = MessageMapper.entity_to_model(entity)
-        self._session.add(model)
-        try:
-            await self._session.commit()
-            await self._session.refresh(model)
-            return MessageMapper.model_to_entity(model)
-        except Exception as e:
-            await self._session.rollback()
-            raise e
+        async with self._session.begin_nested():
+            self._session.add(model)
+            await self._session.flush()
+        await self._session.commit()
+        await self._session.refresh(model)
+        return MessageMapper.model_to_entity(model)
 
     async def get_by_id(self, id: int) -> Optional[Message]:
         stmt = select(MessageModel).where(MessageModel.id == id)
@@ -92,73 +95,220 @@ class SqlAlchemyMessageRepository(MessageRepository):
         models = result.scalars().all()
         return [MessageMapper.model_to_entity(model) for model in models]
 
+    async def get_thread_messages(
+        self,
+        thread_id: int,
+        limit: int = 50,
+        before: Optional[Tuple[datetime, int]] = None
+    ) -> List[Message]:
+        stmt = select(MessageModel).where(MessageModel.thread_id == thread_id)
+        if before is not None:
+            # Row comparison keeps the seek on ix_messages_thread_created
+            stmt = stmt.where(
+                tuple_(MessageModel.created_at, MessageModel.id) < tuple_(before[0], before[1])
+            )
+        stmt = stmt.order_by(
+            desc(MessageModel.created_at),
+            desc(MessageModel.id)
+        ).limit(limit)
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        return [MessageMapper.model_to_entity(model) for model in models]
+
     async def get_unread_count(self, user_id: int) -> int:
-        stmt = select(func.count(MessageModel.id)).where(
+        """Sum the maintained per-thread counters instead of counting messages."""
+        table = ConversationThreadModel
+        stmt = select(
+            func.coalesce(
+                func.sum(
+                    case(
+                        (table.participant_1_id == user_id, table.unread_count_participant_1),
+                        else_=table.unread_count_participant_2
+                    )
+                ),
+                0
+            )
+        ).where(
+            or_(
+                table.participant_1_id == user_id,
+                table.participant_2_id == user_id
+            )
+        )
+        result = await self._session.execute(stmt)
+        return int(result.scalar() or 0)
+
+    async def mark_as_read(self, message_id: int, user_id: int) -> int:
+        stmt = update(MessageModel).where(
             and_(
+                MessageModel.id == message_id,
                 MessageModel.recipient_id == user_id,
                 MessageModel.is_read == False
             )
+        ).values(
+            is_read=True,
+            read_at=datetime.utcnow()
+        ).execution_options(synchronize_session=False)
+        result = cast(CursorResult, await self._session.execute(stmt))
+        await self._session.commit()
+        return result.rowcount or 0
+
+    async def mark_thread_read_up_to(
+        self,
+        thread_id: int,
+        user_id: int,
+        up_to_message_id: Optional[int] = None
+    ) -> int:
+        conditions = [
+            MessageModel.thread_id == thread_id,
+            MessageModel.recipient_id == user_id,
+            MessageModel.is_read == False
+        ]
+        if up_to_message_id is not None:
+            conditions.append(MessageModel.id <= up_to_message_id)
+        stmt = update(MessageModel).where(and_(*conditions)).values(
+            is_read=True,
+            read_at=datetime.utcnow()
+        ).execution_options(synchronize_session=False)
+        result = cast(CursorResult, await self._session.execute(stmt))
+        await self._session.commit()
+        return result.rowcount or 0
+
+    async def get_user_conversations(
+        self,
+        user_id: int,
+        limit: int = 50,
+        offset: int = 0
+    ) -> List[MessageThread]:
+        """Get thread summaries for a user from the maintained thread table."""
+        stmt = select(ConversationThreadModel).where(
+            or_(
+                ConversationThreadModel.participant_1_id == user_id,
+                ConversationThreadModel.participant_2_id == user_id
+            )
+        ).order_by(
+            desc(ConversationThreadModel.last_message_at),
+            desc(ConversationThreadModel.id)
+        ).limit(limit).offset(offset)
+        result = await self._session.execute(stmt)
+        models = result.scalars().all()
+        return [MessageMapper.thread_model_to_entity(model) for model in models]
+
+    async def count_user_conversations(self, user_id: int) -> int:
+        stmt = select(func.count(ConversationThreadModel.id)).where(
+            or_(
+                ConversationThreadModel.participant_1_id == user_id,
+                ConversationThreadModel.participant_2_id == user_id
+            )
         )
         result = await self._session.execute(stmt)
         return result.scalar() or 0
 
-    async def mark_as_read(self, message_id: int, user_id: int) -> None:
-        stmt = select(MessageModel).where(MessageModel.id == message_id)
+    @staticmethod
+    def _thread_key_clause(booking_type: str, booking_id: int, user1_id: int, user2_id: int):
+        # Participants are stored ordered so either direction hits the unique key
+        low, high = sorted((user1_id, user2_id))
+        return and_(
+            ConversationThreadModel.booking_type == booking_type,
+            ConversationThreadModel.booking_id == booking_id,
+            ConversationThreadModel.participant_1_id == low,
+            ConversationThreadModel.participant_2_id == high
+        )
+
+    async def find_thread(
+        self,
+        booking_type: str,
+        booking_id: int,
+        user1_id: int,
+        user2_id: int
+    ) -> Optional[MessageThread]:
+        stmt = select(ConversationThreadModel).where(
+            self._thread_key_clause(booking_type, booking_id, user1_id, user2_id)
+        )
         result = await self._session.execute(stmt)
         model = result.scalar_one_or_none()
-        
-        if model and model.recipient_id == user_id and not model.is_read:
-            model.is_read = True
-            model.read_at = datetime.utcnow()
-            await self._session.commit()
+        return MessageMapper.thread_model_to_entity(model) if model else None
 
-    async def get_user_conversations(self, user_id: int) -> List[MessageThread]:
-        """Get all conversation threads for a user (simplified implementation)."""
-        # This is a simplified implementation that groups messages by booking
-        # In a full implementation, we'd use more sophisticated grouping
-        
-        stmt = select(
-            MessageModel.booking_type,
-            MessageModel.booking_id,
-            MessageModel.sender_id,
-            MessageModel.recipient_id,
-            func.max(MessageModel.created_at).label('last_message_at')
-        ).where(
-            or_(
-                MessageModel.sender_id == user_id,
-                MessageModel.recipient_id == user_id
+    async def create_in_thread(self, entity: Message) -> Message:
+        try:
+            model = await self._insert_in_thread(entity)
+        except IntegrityError:
+            # A concurrent sender created the same thread first; the retry finds it
+            model = await self._insert_in_thread(entity)
+        await self._session.commit()
+        await self._session.refresh(model)
+        return MessageMapper.model_to_entity(model)
+
+    async def _insert_in_thread(self, entity: Message) -> MessageModel:
+        # One savepoint for thread, message and summary: a failure anywhere
+        # rolls back all three and the rest of the unit of work survives
+        async with self._session.begin_nested():
+            thread = await self.find_thread(
+                entity.booking_type, entity.booking_id, entity.sender_id, entity.recipient_id
             )
-        ).group_by(
-            MessageModel.booking_type,
-            MessageModel.booking_id,
-            MessageModel.sender_id,
-            MessageModel.recipient_id
-        ).order_by(desc('last_message_at'))
-        
-        result = await self._session.execute(stmt)
-        threads = []
-        
-        for row in result:
-            # Determine participants
-            if row.sender_id == user_id:
-                other_participant = row.recipient_id
+            if thread is None:
+                low, high = sorted((entity.sender_id, entity.recipient_id))
+                thread_model = ConversationThreadModel(
+                    booking_type=entity.booking_type,
+                    booking_id=entity.booking_id,
+                    participant_1_id=low,
+                    participant_2_id=high,
+                    unread_count_participant_1=0,
+                    unread_count_participant_2=0
+                )
+                self._session.add(thread_model)
+                await self._session.flush()
+                thread_id = thread_model.id
             else:
-                other_participant = row.sender_id
-            
-            # Get all messages for this booking
-            messages = await self.get_by_booking(row.booking_type, row.booking_id)
-            
-            thread = MessageThread(
-                booking_type=row.booking_type,
-                booking_id=row.booking_id,
-                participant_1_id=user_id,
-                participant_2_id=other_participant,
-                messages=messages,
-                last_message_at=row.last_message_at
-            )
-            threads.append(thread)
-        
-        return threads
+                thread_id = thread.id
+
+            model = MessageMapper.entity_to_model(entity)
+            model.thread_id = thread_id
+            self._session.add(model)
+            await self._session.flush()
+
+            table = ConversationThreadModel
+            await self._session.execute(update(table).where(table.id == thread_id).values(
+                last_message_id=model.id,
+                last_message_sender_id=entity.sender_id,
+                last_message_preview=MessageThread.make_preview(entity.body),
+                last_message_at=select(MessageModel.created_at).where(
+                    MessageModel.id == model.id
+                ).scalar_subquery(),
+                unread_count_participant_1=table.unread_count_participant_1 + case(
+                    (table.participant_1_id == entity.recipient_id, 1), else_=0
+                ),
+                unread_count_participant_2=table.unread_count_participant_2 + case(
+                    (table.participant_2_id == entity.recipient_id, 1), else_=0
+                ),
+            ))
+        return model
+
+    async def decrement_thread_unread(self, thread_id: int, user_id: int, count: int = 1) -> None:
+        table = ConversationThreadModel
+        stmt = update(table).where(table.id == thread_id).values(
+            unread_count_participant_1=case(
+                (
+                    table.participant_1_id == user_id,
+                    case(
+                        (table.unread_count_participant_1 > count, table.unread_count_participant_1 - count),
+                        else_=0
+                    )
+                ),
+                else_=table.unread_count_participant_1
+            ),
+            unread_count_participant_2=case(
+                (
+                    table.participant_2_id == user_id,
+                    case(
+                        (table.unread_count_participant_2 > count, table.unread_count_participant_2 - count),
+                        else_=0
+                    )
+                ),
+                else_=table.unread_count_participant_2
+            ),
+        )
+        await self._session.execute(stmt)
+        await self._session.commit()
 
     async def get_thread(
         self, 
@@ -167,21 +317,14 @@ class SqlAlchemyMessageRepository(MessageRepository):
         participant1_id: int, 
         participant2_id: int
     ) -> Optional[MessageThread]:
-        """Get a specific conversation thread."""
-        messages = await self.get_conversation(
+        """Get a specific conversation thread with its messages."""
+        thread = await self.find_thread(
             booking_type, booking_id, participant1_id, participant2_id
         )
-        
-        if not messages:
+        if thread is None:
             return None
         
-        thread = MessageThread(
-            booking_type=booking_type,
-            booking_id=booking_id,
-            participant_1_id=participant1_id,
-            participant_2_id=participant2_id,
-            messages=messages,
-            last_message_at=messages[-1].created_at if messages else None
+        thread.messages = await self.get_conversation(
+            booking_type, booking_id, participant1_id, participant2_id
         )
-        
         return thread
@@ -1,16 +1,35 @@
-from typing import Optional, List
-from datetime import datetime
+from typing import Any, Dict, Optional, List, Sequence, Tuple, cast
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, and_, or_, case, func, values, column, String
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.orm import selectinload
 
-from domain.repositories.payment import PaymentRepository
-from domain.entities.payment import Payment, PaymentIntent, Refund
-from infrastructure.database.models.payment import PaymentModel, PaymentIntentModel, RefundModel
+from domain.repositories.payment import PaymentRepository, PaymentWebhookRepository
+from domain.entities.payment import Payment, PaymentIntent, Refund, PaymentWebhookEvent
+from infrastructure.database.models.payment import (
+    PaymentModel,
+    PaymentIntentModel,
+    RefundModel,
+    PaymentWebhookEventModel,
+)
+from domain.services import ledger_postings
+from infrastructure.database.repositories.ledger import apply_postings
 from shared.mappers.payment import PaymentMapper
 
 
+# Intent statuses that provider events may still move forward
+OPEN_PAYMENT_STATUSES = ("pending", "processing")
+
+# Intent statuses that move money, mapped to their ledger posting
+LEDGER_POSTINGS = {
+    "completed": ledger_postings.payment_captured,
+    "refunded": ledger_postings.payment_refunded,
+}
+
+
 class SqlAlchemyPaymentRepository(PaymentRepository):
     """SQLAlchemy implementation of PaymentRepository"""
     
@@ -63,16 +82,88 @@ class SqlAlchemyPaymentRepository(PaymentRepository):
         transaction_id: Optional[str] = None,
         failure_reason: Optional[str] = None
     ) -> None:
-        """Update payment intent status"""
+        """Update payment intent status with the same guard and ledger postings as batches"""
+        await self.update_payment_statuses([(intent_id, getattr(status, "value", status))])
+
+    async def claim_stale_pending_intents(
+        self,
+        older_than: datetime,
+        limit: int = 500,
+        lease: timedelta = timedelta(minutes=5)
+    ) -> List[PaymentIntent]:
+        """Lease unsettled intents with SKIP LOCKED so concurrent workers never poll the same one"""
+        now = datetime.now(timezone.utc)
+        claimable = (
+            select(PaymentIntentModel.id)
+            .where(
+                PaymentIntentModel.status.in_(OPEN_PAYMENT_STATUSES),
+                PaymentIntentModel.created_at < older_than,
+                or_(
+                    PaymentIntentModel.reconcile_claimed_at.is_(None),
+                    PaymentIntentModel.reconcile_claimed_at < now - lease,
+                ),
+            )
+            .order_by(PaymentIntentModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
         result = await self._session.execute(
-            select(PaymentIntentModel).where(PaymentIntentModel.intent_id == intent_id)
+            update(PaymentIntentModel)
+            .where(PaymentIntentModel.id.in_(claimable.scalar_subquery()))
+            .values(reconcile_claimed_at=now)
+            .returning(PaymentIntentModel)
+            .execution_options(synchronize_session=False)
         )
-        model = result.scalar_one_or_none()
-        
-        if model:
-            model.status = status
-            model.updated_at = datetime.utcnow()
-            await self._session.commit()
+        models = result.scalars().all()
+        await self._session.commit()
+        return sorted(
+            (PaymentMapper.intent_model_to_entity(model) for model in models),
+            key=lambda intent: intent.id,
+        )
+
+    async def update_payment_statuses(self, updates: Sequence[Tuple[str, str]]) -> int:
+        """Apply a batch of status changes with a single UPDATE ... FROM (VALUES ...)"""
+        if not updates:
+            return 0
+
+        batch = values(
+            column("intent_id", String),
+            column("status", String),
+            name="status_updates",
+        ).data(list(updates))
+        # A savepoint leaves the session usable so the caller can record the failure
+        async with self._session.begin_nested():
+            result = await self._session.execute(
+                update(PaymentIntentModel)
+                .where(
+                    PaymentIntentModel.intent_id == batch.c.intent_id,
+                    or_(
+                        # Late or replayed events must not reopen a settled intent
+                        PaymentIntentModel.status.in_(OPEN_PAYMENT_STATUSES),
+                        and_(
+                            PaymentIntentModel.status == "completed",
+                            batch.c.status == "refunded",
+                        ),
+                    ),
+                )
+                .values(status=batch.c.status, updated_at=func.now())
+                .returning(
+                    PaymentIntentModel.intent_id,
+                    PaymentIntentModel.amount,
+                    PaymentIntentModel.currency,
+                    PaymentIntentModel.status,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            changed = result.all()
+            # Money movements are booked in the same transaction as the status change
+            await apply_postings(self._session, [
+                LEDGER_POSTINGS[row.status](row.intent_id, row.amount, row.currency)
+                for row in changed if row.status in LEDGER_POSTINGS
+            ])
+            await self._session.flush()
+        await self._session.commit()
+        return len(changed)
 
     async def create(self, entity: Payment) -> Payment:
         """Create a new payment record"""
@@ -160,3 +251,103 @@ class SqlAlchemyPaymentRepository(PaymentRepository):
         )
         models = result.scalars().all()
         return [PaymentMapper.payment_model_to_entity(model) for model in models]
+
+    async def list(self, limit: int = 100, offset: int = 0) -> List[Payment]:
+        """List payments with pagination (``BaseRepository`` interface)"""
+        return await self.list_all(limit, offset)
+
+
+class SqlAlchemyPaymentWebhookRepository(PaymentWebhookRepository):
+    """SQLAlchemy implementation of the payment webhook inbox"""
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def record_event(
+        self,
+        provider: str,
+        event_id: str,
+        event_type: str,
+        payment_intent_id: Optional[str],
+        payload: Dict[str, Any]
+    ) -> bool:
+        """Insert the event unless (provider, event_id) is already stored"""
+        stmt = (
+            insert(PaymentWebhookEventModel)
+            .values(
+                provider=provider,
+                event_id=event_id,
+                event_type=event_type,
+                payment_intent_id=payment_intent_id,
+                payload=payload,
+            )
+            .on_conflict_do_nothing(constraint="uq_payment_webhook_events_provider_event")
+        )
+        result = cast(CursorResult, await self._session.execute(stmt))
+        await self._session.commit()
+        return result.rowcount == 1
+
+    async def claim_batch(self, limit: int, lease_seconds: int = 300) -> List[PaymentWebhookEvent]:
+        """Claim events with SKIP LOCKED so concurrent consumers never share rows"""
+        now = datetime.now(timezone.utc)
+        claimable = (
+            select(PaymentWebhookEventModel.id)
+            .where(
+                or_(
+                    PaymentWebhookEventModel.status == "received",
+                    and_(
+                        PaymentWebhookEventModel.status == "processing",
+                        PaymentWebhookEventModel.claimed_at < now - timedelta(seconds=lease_seconds),
+                    ),
+                )
+            )
+            .order_by(PaymentWebhookEventModel.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(
+            update(PaymentWebhookEventModel)
+            .where(PaymentWebhookEventModel.id.in_(claimable.scalar_subquery()))
+            .values(
+                status="processing",
+                claimed_at=now,
+                attempts=PaymentWebhookEventModel.attempts + 1,
+            )
+            .returning(PaymentWebhookEventModel)
+            .execution_options(synchronize_session=False)
+        )
+        models = result.scalars().all()
+        await self._session.commit()
+        return sorted(
+            (PaymentMapper.webhook_event_model_to_entity(model) for model in models),
+            key=lambda event: event.id,
+        )
+
+    async def mark_processed(self, event_ids: Sequence[int]) -> None:
+        if not event_ids:
+            return
+        await self._session.execute(
+            update(PaymentWebhookEventModel)
+            .where(PaymentWebhookEventModel.id.in_(event_ids))
+            .values(status="processed", processed_at=func.now(), last_error=None)
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.commit()
+
+    async def mark_failed(self, event_ids: Sequence[int], error: str, max_attempts: int) -> None:
+        if not event_ids:
+            return
+        await self._session.execute(
+            update(PaymentWebhookEventModel)
+            .where(PaymentWebhookEventModel.id.in_(event_ids))
+            .values(
+                status=case(
+                    (PaymentWebhookEventModel.attempts >= max_attempts, "failed"),
+                    else_="received",
+                ),
+                claimed_at=None,
+                last_error=error,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self._session.commit()
@@ -0,0 +1,111 @@
+from datetime import date, datetime
+from decimal import Decimal
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from domain.entities.payout import PayoutRunSummary
+from domain.repositories.payout import PayoutRepository
+from domain.services import ledger_postings
+from domain.value_objects.booking_status import BookingStatus
+from infrastructure.database.repositories.ledger import apply_postings
+
+# Serialises scheduling runs across workers for the duration of a transaction
+PAYOUT_SCHEDULER_LOCK_ID = 7_140_032
+
+# Eligible bookings across verticals, minus those already paid out, are
+# grouped into payouts and recorded as payout items in a single statement
+# that returns one row per new payout.
+SCHEDULE_PAYOUTS_SQL = text("""
+WITH eligible AS (
+    SELECT 'bnb' AS booking_type, b.id AS booking_id, l.host_id AS host_id,
+           b.amount_total AS amount, b.currency AS currency
+    FROM bookings b
+    JOIN st_listings l ON l.id = b.listing_id
+    WHERE b.status = :completed AND b.check_out <= :cutoff_date
+      AND NOT EXISTS (
+          SELECT 1 FROM st_payout_items pi
+          WHERE pi.booking_type = 'bnb' AND pi.booking_id = b.id
+      )
+    UNION ALL
+    SELECT 'tour', tb.id, t.operator_id, tb.total_price, :default_currency
+    FROM tour_bookings tb
+    JOIN tours t ON t.id = tb.tour_id
+    WHERE tb.status = :completed AND tb.booking_date <= :cutoff_date
+      AND NOT EXISTS (
+          SELECT 1 FROM st_payout_items pi
+          WHERE pi.booking_type = 'tour' AND pi.booking_id = tb.id
+      )
+    UNION ALL
+    SELECT 'car', cr.id, v.owner_id, cr.total_cost, :default_currency
+    FROM car_rentals cr
+    JOIN vehicles v ON v.id = cr.vehicle_id
+    WHERE cr.status = :completed AND cr.return_date < CAST(:cutoff_date AS date) + 1
+      AND NOT EXISTS (
+          SELECT 1 FROM st_payout_items pi
+          WHERE pi.booking_type = 'car' AND pi.booking_id = cr.id
+      )
+),
+payouts AS (
+    INSERT INTO st_payouts (host_id, amount, currency, status, scheduled_at)
+    SELECT host_id, SUM(amount), currency, 'SCHEDULED', :scheduled_at
+    FROM eligible
+    GROUP BY host_id, currency
+    RETURNING id, host_id, currency, amount
+),
+items AS (
+    INSERT INTO st_payout_items (payout_id, booking_type, booking_id, host_id, amount, currency)
+    SELECT p.id, e.booking_type, e.booking_id, e.host_id, e.amount, e.currency
+    FROM eligible e
+    JOIN payouts p ON p.host_id = e.host_id AND p.currency = e.currency
+    RETURNING payout_id, booking_type, booking_id, amount
+)
+SELECT p.id, p.host_id, p.currency, p.amount, COUNT(*) AS bookings,
+       -- Bookings whose completion has not been posted to the ledger yet
+       COALESCE(SUM(i.amount) FILTER (WHERE NOT EXISTS (
+           SELECT 1 FROM ledger_transactions t
+           WHERE t.key = 'booking:' || i.booking_type || ':' || i.booking_id || ':completed'
+       )), 0) AS unrecognised_amount
+FROM payouts p
+JOIN items i ON i.payout_id = p.id
+GROUP BY p.id, p.host_id, p.currency, p.amount
+""")
+
+
+class SqlAlchemyPayoutRepository(PayoutRepository):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+
+    async def schedule_payouts(self, cutoff_date: date, scheduled_at: datetime) -> PayoutRunSummary:
+        async with self._session.begin_nested():
+            await self._session.execute(
+                text("SELECT pg_advisory_xact_lock(:lock_id)"), {"lock_id": PAYOUT_SCHEDULER_LOCK_ID}
+            )
+            result = await self._session.execute(
+                SCHEDULE_PAYOUTS_SQL,
+                {
+                    "completed": BookingStatus.COMPLETED.value,
+                    "cutoff_date": cutoff_date,
+                    "scheduled_at": scheduled_at,
+                    "default_currency": "KES",
+                },
+            )
+            payouts = result.all()
+            postings = []
+            for payout in payouts:
+                if payout.unrecognised_amount:
+                    postings.append(ledger_postings.payout_bookings_recognised(
+                        payout.id, payout.host_id, payout.unrecognised_amount, payout.currency
+                    ))
+                postings.extend(
+                    posting(payout.id, payout.host_id, payout.amount, payout.currency)
+                    for posting in (ledger_postings.payout_released, ledger_postings.payout_scheduled)
+                )
+            await apply_postings(self._session, postings)
+            await self._session.flush()
+        await self._session.commit()
+        return PayoutRunSummary(
+            payouts_created=len(payouts),
+            bookings_paid_out=sum(payout.bookings for payout in payouts),
+            total_amount=sum((Decimal(payout.amount) for payout in payouts), Decimal("0")),
+        )
@@ -14,14 +14,12 @@ class SqlAlchemyReviewRepository(ReviewRepository):
 
     async def create(self, entity: Review) -> Review:
         model = ReviewMapper.entity_to_model(entity)
-        self._session.add(model)
-        try:
-            await self._session.commit()
-            await self._session.refresh(model)
-            return ReviewMapper.model_to_entity(model)
-        except Exception as e:
-            await self._session.rollback()
-            raise e
+        async with self._session.begin_nested():
+            self._session.add(model)
+            await self._session.flush()
+        await self._session.commit()
+        await self._session.refresh(model)
+        return ReviewMapper.model_to_entity(model)
 
     async def get_by_id(self, id: int) -> Optional[Review]:
         stmt = select(ReviewModel).where(ReviewModel.id == id)
@@ -31,23 +29,19 @@ class SqlAlchemyReviewRepository(ReviewRepository):
 
     async def update(self, entity: Review) -> Review:
         model = ReviewMapper.entity_to_model(entity)
-        try:
+        async with self._session.begin_nested():
             await self._session.merge(model)
-            await self._session.commit()
-            return entity
-        except Exception as e:
-            await self._session.rollback()
-            raise e
+            await self._session.flush()
+        await self._session.commit()
+        return entity
 
     async def delete(self, id: int) -> None:
-        try:
-            model = await self._session.get(ReviewModel, id)
-            if model:
+        model = await self._session.get(ReviewModel, id)
+        if model:
+            async with self._session.begin_nested():
                 await self._session.delete(model)
-                await self._session.commit()
-        except Exception as e:
-            await self._session.rollback()
-            raise e
+                await self._session.flush()
+            await self._session.commit()
 
     async def list(self, limit: int = 100, offset: int = 0) -> List[Review]:
         stmt = select(ReviewModel).limit(limit).offset(offset)
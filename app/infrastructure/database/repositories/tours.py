@@ -15,14 +15,12 @@ class SqlAlchemyTourRepository(TourRepository):
 
     async def create(self, entity: Tour) -> Tour:
         model = TourMapper.entity_to_model(entity)
-        try:
+        async with self._session.begin_nested():
             self._session.add(model)
-            await self._session.commit()
-            await self._session.refresh(model)
-            return TourMapper.model_to_entity(model)
-        except Exception as e:
-            await self._session.rollback()
-            raise e
+            await self._session.flush()
+        await self._session.commit()
+        await self._session.refresh(model)
+        return TourMapper.model_to_entity(model)
 
     async def get_by_id(self, id: int) -> Optional[Tour]:
         stmt = select(TourModel).where(TourModel.id == id)
@@ -32,23 +30,19 @@ class SqlAlchemyTourRepository(TourRepository):
 
     async def update(self, entity: Tour) -> Tour:
         model = TourMapper.entity_to_model(entity)
-        try:
+        async with self._session.begin_nested():
             await self._session.merge(model)
-            await self._session.commit()
-            return entity
-        except Exception as e:
-            await self._session.rollback()
-            raise e
+            await self._session.flush()
+        await self._session.commit()
+        return entity
 
     async def delete(self, id: int) -> None:
-        try:
-            model = await self._session.get(TourModel, id)
-            if model:
+        model = await self._session.get(TourModel, id)
+        if model:
+            async with self._session.begin_nested():
                 await self._session.delete(model)
-                await self._session.commit()
-        except Exception as e:
-            await self._session.rollback()
-            raise e
+                await self._session.flush()
+            await self._session.commit()
 
     async def list(self, limit: int = 100, offset: int = 0) -> List[Tour]:
         stmt = select(TourModel).limit(limit).offset(offset)
@@ -78,14 +72,12 @@ class SqlAlchemyTourBookingRepository(TourBookingRepository):
 
     async def create(self, entity: TourBooking) -> TourBooking:
         model = TourMapper.booking_entity_to_model(entity)
-        try:
+        async with self._session.begin_nested():
             self._session.add(model)
-            await self._session.commit()
-            await self._session.refresh(model)
-            return TourMapper.booking_model_to_entity(model)
-        except Exception as e:
-            await self._session.rollback()
-            raise e
+            await self._session.flush()
+        await self._session.commit()
+        await self._session.refresh(model)
+        return TourMapper.booking_model_to_entity(model)
 
     async def get_by_id(self, id: int) -> Optional[TourBooking]:
         stmt = select(TourBookingModel).where(TourBookingModel.id == id)
@@ -95,23 +87,19 @@ class SqlAlchemyTourBookingRepository(TourBookingRepository):
 
     async def update(self, entity: TourBooking) -> TourBooking:
         model = TourMapper.booking_entity_to_model(entity)
-        try:
+        async with self._session.begin_nested():
             await self._session.merge(model)
-            await self._session.commit()
-            return entity
-        except Exception as e:
-            await self._session.rollback()
-            raise e
+            await self._session.flush()
+        await self._session.commit()
+        return entity
 
     async def delete(self, id: int) -> None:
-        try:
-            model = await self._session.get(TourBookingModel, id)
-            if model:
+        model = await self._session.get(TourBookingModel, id)
+        if model:
+            async with self._session.begin_nested():
                 await self._session.delete(model)
-                await self._session.commit()
-        except Exception as e:
-            await self._session.rollback()
-            raise e
+                await self._session.flush()
+            await self._session.commit()
 
     async def list(self, limit: int = 100, offset: int = 0) -> List[TourBooking]:
         stmt = select(TourBookingModel).limit(limit).offset(offset)
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Dict, Iterable, Optional
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -25,6 +25,17 @@ class SqlAlchemyUserRepository(UserRepository):
         model = result.scalar_one_or_none()
         return UserMapper.model_to_entity(model) if model else None
 
+    async def get_by_ids(self, ids: Iterable[int]) -> Dict[int, User]:
+        unique_ids = set(ids)
+        if not unique_ids:
+            return {}
+        stmt = select(UserModel).where(UserModel.id.in_(unique_ids))
+        result = await self._session.execute(stmt)
+        return {
+            model.id: UserMapper.model_to_entity(model)
+            for model in result.scalars().all()
+        }
+
     async def get_by_email(self, email: str) -> Optional[User]:
         stmt = select(UserModel).where(UserModel.email == email)
         result = await self._session.execute(stmt)
@@ -55,6 +66,7 @@ class SqlAlchemyUserRepository(UserRepository):
         model.hashed_password = updated_model.hashed_password
         model.role = updated_model.role
         model.is_active = updated_model.is_active
+        model.token_version = updated_model.token_version
         model.agent_license_id = updated_model.agent_license_id
         model.agency_name = updated_model.agency_name
         model.updated_at = updated_model.updated_at
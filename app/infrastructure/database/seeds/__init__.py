@@ -2,7 +2,8 @@
 
 Provides seeding utilities to populate the database with initial data for
 BnB listings and Tours, including minimal users required to reference as
-hosts and tour operators.
+hosts and tour operators. ``generate_bulk_data`` builds production-sized
+datasets for performance work.
 """
 
 
@@ -0,0 +1,776 @@
+"""Synthetic bulk data generator for performance work.
+
+Unlike ``seed_demo_data`` this does not go through the ORM. Rows are built
+as plain tuples in worker processes and streamed to the database in
+chunks: with ``COPY`` (asyncpg ``copy_records_to_table``) on PostgreSQL,
+and with multi-row INSERTs elsewhere. Several chunks load in parallel,
+each over its own connection.
+
+Output is deterministic for a given ``--seed``, ``--as-of`` date and set of
+sizes. Every chunk has its own RNG. Attributes other tables depend on,
+such as a listing's host, location and price or a booking's guest and
+dates, are pure functions of the row number. That makes a review or
+message agree with the booking it belongs to without reading it back.
+
+Locations follow where Kenyan short-stay supply actually is: about half in
+Nairobi, a quarter on the coast, the rest spread over the upcountry towns.
+Listing popularity is skewed, so a few listings get most of the bookings.
+
+New rows get ids above the current maximum of each table, so the generator
+can be run against a database that already has data. Afterwards the id
+sequences are moved past the new rows and the tables are analysed.
+
+Generated users share the password ``password123``, like the demo seed.
+
+Usage:
+    python -m infrastructure.database.seeds.generate_bulk_data --preset small
+    python -m infrastructure.database.seeds.generate_bulk_data --preset large --workers 8
+    python -m infrastructure.database.seeds.generate_bulk_data --listings 200000 --bookings 2000000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import bisect
+import json
+import math
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import date, datetime, time as dt_time, timedelta, UTC
+from decimal import Decimal
+from itertools import accumulate
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+# Add the app root to the path
+app_root = Path(__file__).resolve().parents[3]
+sys.path.insert(0, str(app_root))
+
+from sqlalchemy import DateTime, JSON, func, select, text
+
+from infrastructure.config.database import Base, engine
+
+# Importing the package registers every table on Base.metadata
+import infrastructure.database.models  # noqa: F401
+
+PASSWORD = "password123"
+MESSAGES_PER_THREAD = 4
+
+# (county, town, latitude, longitude, share of listings, price factor)
+LOCATIONS = [
+    ("Nairobi", "Westlands", -1.2676, 36.8108, 0.11, 1.3),
+    ("Nairobi", "Kilimani", -1.2921, 36.7856, 0.09, 1.2),
+    ("Nairobi", "Kileleshwa", -1.2807, 36.7834, 0.06, 1.2),
+    ("Nairobi", "Lavington", -1.2784, 36.7689, 0.04, 1.3),
+    ("Nairobi", "Karen", -1.3197, 36.7073, 0.04, 1.6),
+    ("Nairobi", "Embakasi", -1.3226, 36.9010, 0.05, 0.7),
+    ("Nairobi", "Kasarani", -1.2219, 36.8989, 0.04, 0.7),
+    ("Nairobi", "Nairobi CBD", -1.2864, 36.8172, 0.04, 0.9),
+    ("Kiambu", "Ruiru", -1.1459, 36.9609, 0.03, 0.6),
+    ("Kiambu", "Thika", -1.0333, 37.0693, 0.02, 0.6),
+    ("Kiambu", "Limuru", -1.1136, 36.6422, 0.01, 0.8),
+    ("Kajiado", "Kitengela", -1.4736, 36.9600, 0.02, 0.6),
+    ("Kajiado", "Ongata Rongai", -1.3960, 36.7570, 0.02, 0.6),
+    ("Machakos", "Athi River", -1.4560, 36.9780, 0.01, 0.6),
+    ("Mombasa", "Nyali", -4.0226, 39.7196, 0.07, 1.2),
+    ("Mombasa", "Bamburi", -3.9977, 39.7270, 0.04, 1.0),
+    ("Mombasa", "Mombasa Island", -4.0435, 39.6682, 0.02, 0.8),
+    ("Kwale", "Diani", -4.3167, 39.5667, 0.06, 1.5),
+    ("Kilifi", "Malindi", -3.2192, 40.1169, 0.03, 1.1),
+    ("Kilifi", "Watamu", -3.3540, 40.0240, 0.03, 1.3),
+    ("Kilifi", "Kilifi", -3.6305, 39.8499, 0.01, 1.0),
+    ("Lamu", "Lamu", -2.2717, 40.9020, 0.01, 1.4),
+    ("Nakuru", "Naivasha", -0.7167, 36.4333, 0.03, 1.1),
+    ("Nakuru", "Nakuru", -0.3031, 36.0800, 0.03, 0.7),
+    ("Kisumu", "Kisumu", -0.0917, 34.7680, 0.03, 0.7),
+    ("Uasin Gishu", "Eldoret", 0.5143, 35.2698, 0.02, 0.6),
+    ("Laikipia", "Nanyuki", 0.0167, 37.0667, 0.02, 1.2),
+    ("Nyeri", "Nyeri", -0.4167, 36.9500, 0.01, 0.7),
+    ("Narok", "Maasai Mara", -1.4061, 35.0069, 0.01, 2.5),
+]
+_LOCATION_CUMULATIVE = list(accumulate(location[4] for location in LOCATIONS))
+
+# (type, share of listings, base nightly price in KES, capacity range)
+LISTING_TYPES = [
+    ("APARTMENT", 0.34, 5500, (2, 4)),
+    ("STUDIO", 0.18, 3500, (1, 2)),
+    ("ENTIRE", 0.14, 9000, (4, 8)),
+    ("PRIVATE", 0.14, 2500, (1, 2)),
+    ("VILLA", 0.06, 25000, (6, 12)),
+    ("SHARED", 0.05, 1500, (1, 1)),
+    ("LODGE", 0.05, 12000, (2, 6)),
+    ("RESORT", 0.04, 18000, (2, 4)),
+]
+_TYPE_CUMULATIVE = list(accumulate(listing_type[1] for listing_type in LISTING_TYPES))
+
+FIRST_NAMES = [
+    "Wanjiru", "Kamau", "Achieng", "Otieno", "Njeri", "Kipchoge", "Chebet", "Mwangi", "Akinyi", "Omondi",
+    "Wambui", "Kiprono", "Nyambura", "Ochieng", "Jepkosgei", "Mutua", "Muthoni", "Baraka", "Zawadi", "Amani",
+    "Grace", "Peter", "Mary", "John", "Faith", "David", "Esther", "James", "Ruth", "Daniel",
+]
+LAST_NAMES = [
+    "Kariuki", "Odhiambo", "Wekesa", "Kimani", "Mutiso", "Njoroge", "Onyango", "Kiptoo", "Wafula", "Maina",
+    "Ndungu", "Owino", "Kibet", "Mwende", "Nyaga", "Atieno", "Korir", "Githinji", "Barasa", "Chege",
+]
+LISTING_ADJECTIVES = ["Cozy", "Modern", "Spacious", "Serene", "Stylish", "Bright", "Quiet", "Charming", "Luxury", "Budget"]
+AMENITIES = ["wifi", "parking", "pool", "kitchen", "air_conditioning", "workspace", "tv", "washer", "gym", "backup_power"]
+TOUR_KINDS = ["Safari", "City Tour", "Beach Excursion", "Cultural Walk", "Hiking Trip", "Boat Ride", "Food Tour"]
+REVIEW_TITLES = {
+    5: ["Wonderful stay", "Highly recommend", "Perfect getaway"],
+    4: ["Great place", "Very comfortable", "Would stay again"],
+    3: ["Decent stay", "Okay for the price", "Average"],
+    2: ["Needs work", "Not as described", "Disappointing"],
+    1: ["Terrible experience", "Avoid", "Very poor"],
+}
+MESSAGE_BODIES = [
+    "Hello, is early check-in possible?",
+    "Welcome! Check-in is from 2pm; I can leave the keys with the caretaker.",
+    "Thanks, we should arrive around noon.",
+    "Great, safe travels and let me know if you need anything.",
+]
+
+# Presets: row counts per table
+PRESETS: Dict[str, Dict[str, int]] = {
+    "small": dict(
+        users=20_000, hosts=2_000, operators=200, agents=500, listings=10_000, availability_days=30,
+        bookings=100_000, tours=1_000, tour_bookings=50_000, reviews=50_000, messages=100_000,
+        properties=10_000,
+    ),
+    "medium": dict(
+        users=200_000, hosts=20_000, operators=1_000, agents=3_000, listings=100_000, availability_days=60,
+        bookings=1_000_000, tours=10_000, tour_bookings=500_000, reviews=500_000, messages=1_000_000,
+        properties=100_000,
+    ),
+    "large": dict(
+        users=2_000_000, hosts=200_000, operators=5_000, agents=20_000, listings=1_000_000, availability_days=30,
+        bookings=10_000_000, tours=50_000, tour_bookings=2_000_000, reviews=5_000_000, messages=10_000_000,
+        properties=500_000,
+    ),
+}
+
+_MASK = (1 << 64) - 1
+
+
+def _mix(x: int) -> int:
+    """splitmix64 finaliser: a fast, well-distributed 64-bit hash."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK
+    return x ^ (x >> 31)
+
+
+def _unit(seed: int, salt: int, i: int) -> float:
+    """Deterministic uniform value in [0, 1) for attribute *salt* of row *i*."""
+    return (_mix(_mix(seed * 1_000_003 + salt) ^ i) >> 11) / 2.0 ** 53
+
+
+def _index(seed: int, salt: int, i: int, n: int) -> int:
+    return int(_unit(seed, salt, i) * n)
+
+
+@dataclass(frozen=True)
+class Plan:
+    """Everything a worker process needs to build any chunk."""
+
+    seed: int
+    as_of: date
+    chunk_size: int
+    counts: Dict[str, int]
+    id_base: Dict[str, int]
+    password_hash: str
+    property_type_ids: Tuple[int, ...]
+
+    @property
+    def customers(self) -> int:
+        c = self.counts
+        return c["users"] - c["hosts"] - c["operators"] - c["agents"]
+
+    @property
+    def threads(self) -> int:
+        return min(self.counts["bookings"], self.counts["messages"] // MESSAGES_PER_THREAD)
+
+    def user_id(self, offset: int) -> int:
+        return self.id_base["users"] + offset + 1
+
+    def host_id(self, n: int) -> int:
+        return self.user_id(n)
+
+    def operator_id(self, n: int) -> int:
+        return self.user_id(self.counts["hosts"] + n)
+
+    def agent_id(self, n: int) -> int:
+        return self.user_id(self.counts["hosts"] + self.counts["operators"] + n)
+
+    def customer_id(self, n: int) -> int:
+        return self.user_id(self.counts["hosts"] + self.counts["operators"] + self.counts["agents"] + n)
+
+    def row_id(self, table: str, offset: int) -> int:
+        return self.id_base[table] + offset + 1
+
+    def at(self, day: date, hour: int = 12) -> datetime:
+        return datetime.combine(day, dt_time(hour % 24), tzinfo=UTC)
+
+
+@dataclass(frozen=True)
+class ListingProfile:
+    host_id: int
+    location: tuple
+    listing_type: tuple
+    capacity: int
+    nightly_price: Decimal
+
+
+@dataclass(frozen=True)
+class BookingProfile:
+    listing_offset: int
+    listing: ListingProfile
+    guest_id: int
+    check_in: date
+    check_out: date
+    status: str
+    created_at: datetime
+
+
+def listing_profile(plan: Plan, i: int) -> ListingProfile:
+    seed = plan.seed
+    location = LOCATIONS[bisect.bisect_right(_LOCATION_CUMULATIVE, _unit(seed, 2, i) * _LOCATION_CUMULATIVE[-1])]
+    listing_type = LISTING_TYPES[bisect.bisect_right(_TYPE_CUMULATIVE, _unit(seed, 3, i) * _TYPE_CUMULATIVE[-1])]
+    low, high = listing_type[3]
+    price = listing_type[2] * location[5] * (0.6 + 1.4 * _unit(seed, 4, i) ** 2)
+    return ListingProfile(
+        host_id=plan.host_id(_index(seed, 1, i, plan.counts["hosts"])),
+        location=location,
+        listing_type=listing_type,
+        capacity=low + _index(seed, 5, i, high - low + 1),
+        nightly_price=Decimal(max(500, round(price, -2))).quantize(Decimal("0.01")),
+    )
+
+
+def booking_profile(plan: Plan, j: int) -> BookingProfile:
+    seed = plan.seed
+    # Squaring skews demand towards the lower listing offsets
+    listing_offset = min(plan.counts["listings"] - 1, int(plan.counts["listings"] * _unit(seed, 10, j) ** 2))
+    check_in = plan.as_of + timedelta(days=int(_unit(seed, 12, j) * 910) - 730)
+    nights = min(21, 1 + int(-math.log(1.0 - _unit(seed, 13, j)) * 3))
+    check_out = check_in + timedelta(days=nights)
+    roll = _unit(seed, 14, j)
+    if check_out < plan.as_of:
+        status = "COMPLETED" if roll < 0.9 else "CANCELED"
+    else:
+        status = "CONFIRMED" if roll < 0.7 else "PENDING" if roll < 0.9 else "CANCELED"
+    lead_days = 1 + int(_unit(seed, 15, j) * 90)
+    return BookingProfile(
+        listing_offset=listing_offset,
+        listing=listing_profile(plan, listing_offset),
+        guest_id=plan.customer_id(_index(seed, 11, j, plan.customers)),
+        check_in=check_in,
+        check_out=check_out,
+        status=status,
+        created_at=plan.at(check_in - timedelta(days=lead_days), hour=int(_unit(seed, 16, j) * 24)),
+    )
+
+
+def _jitter(rng: random.Random, location: tuple, spread: float = 0.03) -> Tuple[float, float]:
+    return (
+        round(location[2] + rng.uniform(-spread, spread), 6),
+        round(location[3] + rng.uniform(-spread, spread), 6),
+    )
+
+
+# Row builders: (plan, start offset, stop offset, chunk rng) -> rows in COLUMNS order
+def _users(plan: Plan, start: int, stop: int, rng: random.Random) -> List[tuple]:
+    c = plan.counts
+    roles = (
+        (c["hosts"], "HOST"),
+        (c["hosts"] + c["operators"], "TOUR_OPERATOR"),
+        (c["hosts"] + c["operators"] + c["agents"], "AGENT"),
+    )
+    rows = []
+    for offset in range(start, stop):
+        user_id = plan.user_id(offset)
+        role = next((name for limit, name in roles if offset < limit), "USER")
+        created = plan.at(plan.as_of - timedelta(days=rng.randint(0, 1095)), rng.randint(0, 23))
+        rows.append((
+            user_id,
+            f"user{user_id}@bulk.example.com",
+            f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            f"+2547{rng.randint(0, 99_999_999):08d}",
+            plan.password_hash,
+            role,
+            True,
+            0,
+            created,
+            created,
+        ))
+    return rows
+
+
+def _listings(plan: Plan, start: int, stop: int, rng: random.Random) -> List[tuple]:
+    rows = []
+    for offset in range(start, stop):
+        profile = listing_profile(plan, offset)
+        county, town = profile.location[0], profile.location[1]
+        type_name = profile.listing_type[0]
+        latitude, longitude = _jitter(rng, profile.location)
+        bedrooms = max(1, profile.capacity // 2)
+        created = plan.at(plan.as_of - timedelta(days=rng.randint(0, 1095)), rng.randint(0, 23))
+        rows.append((
+            plan.row_id("st_listings", offset),
+            profile.host_id,
+            f"{rng.choice(LISTING_ADJECTIVES)} {type_name.title()} in {town}",
+            type_name,
+            profile.capacity,
+            bedrooms,
+            bedrooms + rng.randint(0, 1),
+            float(max(1, bedrooms - rng.randint(0, 1))),
+            profile.nightly_price,
+            Decimal(rng.choice([0, 500, 1000, 1500])),
+            f"{town}, {county}, Kenya",
+            county,
+            town,
+            latitude,
+            longitude,
+            {amenity: True for amenity in rng.sample(AMENITIES, rng.randint(3, 7))},
+            rng.choice(["FLEXIBLE", "MODERATE", "MODERATE", "STRICT"]),
+            rng.random() < 0.6,
+            rng.choice([1, 1, 1, 2, 3]),
+            rng.choice([14, 30, 90]),
+            created,
+            created,
+        ))
+    return rows
+
+
+def _availability(plan: Plan, start: int, stop: int, rng: random.Random) -> List[tuple]:
+    days = plan.counts["availability_days"]
+    rows = []
+    for offset in range(start, stop):
+        listing_offset, day = divmod(offset, days)
+        on = plan.as_of + timedelta(days=day)
+        price_override = None
+        if on.weekday() >= 4:
+            price_override = (listing_profile(plan, listing_offset).nightly_price * Decimal("1.2")).quantize(Decimal("1"))
+        rows.append((
+            plan.row_id("st_availability", offset),
+            plan.row_id("st_listings", listing_offset),
+            on,
+            rng.random() < 0.75,
+            price_override,
+            None,
+        ))
+    return rows
+
+
+def _bookings(plan: Plan, start: int, stop: int, rng: random.Random) -> List[tuple]:
+    rows = []
+    for offset in range(start, stop):
+        booking = booking_profile(plan, offset)
+        nights = (booking.check_out - booking.check_in).days
+        total = booking.listing.nightly_price * nights
+        rows.append((
+            plan.row_id("bookings", offset),
+            booking.guest_id,
+            plan.row_id("st_listings", booking.listing_offset),
+            booking.check_in,
+            booking.check_out,
+            rng.randint(1, booking.listing.capacity),
+            booking.status,
+            total,
+            (total * Decimal("0.3")).quantize(Decimal("0.01")),
+            "KES",
+            booking.created_at,
+            booking.created_at,
+        ))
+    return rows
+
+
+def _tour_price(plan: Plan, k: int) -> Decimal:
+    return Decimal(round(3000 + 57000 * _unit(plan.seed, 20, k) ** 2, -2)).quantize(Decimal("0.01"))
+
+
+def _tours(plan: Plan, start: int, stop: int, rng: random.Random) -> List[tuple]:
+    rows = []
+    for offset in range(start, stop):
+        location = LOCATIONS[bisect.bisect_right(_LOCATION_CUMULATIVE, rng.random() * _LOCATION_CUMULATIVE[-1])]
+        kind = rng.choice(TOUR_KINDS)
+        created = datetime.combine(plan.as_of - timedelta(days=rng.randint(0, 1095)), dt_time(12))
+        rows.append((
+            plan.row_id("tours", offset),
+            f"{location[1]} {kind}",
+            f"A {kind.lower()} around {location[1]}, {location[0]} County.",
+            _tour_price(plan, offset),
+            rng.choice([2, 3, 4, 6, 8, 24, 48, 72]),
+            plan.operator_id(_index(plan.seed, 21, offset, plan.counts["operators"])),
+            rng.randint(4, 40),
+            rng.sample(["transport", "guide", "meals", "park_fees", "water", "accommodation"], rng.randint(1, 4)),
+            created,
+            created,
+        ))
+    return rows
+
+
+def _tour_bookings(plan: Plan, start: int, stop: int, rng: random.Random) -> List[tuple]:
+    rows = []
+    for offset in range(start, stop):
+        tour_offset = min(plan.counts["tours"] - 1, int(plan.counts["tours"] * rng.random() ** 2))
+        booking_date = plan.as_of + timedelta(days=rng.randint(-365, 180))
+        participants = rng.randint(1, 8)
+        if booking_date < plan.as_of:
+            status = "COMPLETED" if rng.random() < 0.9 else "CANCELED"
+        else:
+            status = "CONFIRMED" if rng.random() < 0.75 else "PENDING"
+        created = datetime.combine(booking_date - timedelta(days=rng.randint(1, 60)), dt_time(rng.randint(0, 23)))
+        rows.append((
+            plan.row_id("tour_bookings", offset),
+            plan.row_id("tours", tour_offset),
+            plan.customer_id(rng.randrange(plan.customers)),
+            booking_date,
+            participants,
+            _tour_price(plan, tour_offset) * participants,
+            status,
+            created,
+            created,
+        ))
+    return rows
+
+
+def _reviews(plan: Plan, start: int, stop: int, rng: random.Random) -> List[tuple]:
+    bookings, reviews = plan.counts["bookings"], plan.counts["reviews"]
+    rows = []
+    for offset in range(start, stop):
+        booking_offset = offset * bookings // reviews
+        booking = booking_profile(plan, booking_offset)
+        nights = (booking.check_out - booking.check_in).days
+        rating = rng.choices([5, 4, 3, 2, 1], weights=[50, 30, 12, 5, 3])[0]
+        created = plan.at(booking.check_out + timedelta(days=rng.randint(1, 14)), rng.randint(0, 23))
+        rows.append((
+            plan.row_id("reviews", offset),
+            "bnb_listing",
+            plan.row_id("st_listings", booking.listing_offset),
+            rating,
+            rng.choice(REVIEW_TITLES[rating]),
+            f"{REVIEW_TITLES[rating][0]}. Stayed {nights} night{'s' if nights != 1 else ''} "
+            f"in {booking.listing.location[1]}.",
+            booking.guest_id,
+            plan.row_id("bookings", booking_offset),
+            False,
+            created,
+            created,
+        ))
+    return rows
+
+
+def _thread_messages(plan: Plan, thread: int):
+    """(sender, recipient, sent_at) of each message in *thread*, oldest first."""
+    booking = booking_profile(plan, thread)
+    guest, host = booking.guest_id, booking.listing.host_id
+    return booking, [
+        ((guest, host) if k % 2 == 0 else (host, guest)) + (booking.created_at + timedelta(hours=2 * k),)
+        for k in range(MESSAGES_PER_THREAD)
+    ]
+
+
+def _last_message_read(plan: Plan, thread: int) -> bool:
+    return _unit(plan.seed, 30, thread) >= 0.3
+
+
+def _threads(plan: Plan, start: int, stop: int, rng: random.Random) -> List[tuple]:
+    rows = []
+    for offset in range(start, stop):
+        booking, messages = _thread_messages(plan, offset)
+        low, high = sorted((booking.guest_id, booking.listing.host_id))
+        last_sender, last_recipient, last_at = messages[-1]
+        unread = 0 if _last_message_read(plan, offset) else 1
+        rows.append((
+            plan.row_id("conversation_threads", offset),
+            "bnb",
+            plan.row_id("bookings", offset),
+            low,
+            high,
+            plan.row_id("messages", offset * MESSAGES_PER_THREAD + MESSAGES_PER_THREAD - 1),
+            last_sender,
+            MESSAGE_BODIES[-1][:255],
+            last_at,
+            unread if last_recipient == low else 0,
+            unread if last_recipient == high else 0,
+            messages[0][2],
+            last_at,
+        ))
+    return rows
+
+
+def _messages(plan: Plan, start: int, stop: int, rng: random.Random) -> List[tuple]:
+    rows = []
+    thread = None
+    for offset in range(start, stop):
+        thread_offset, k = divmod(offset, MESSAGES_PER_THREAD)
+        if thread != thread_offset:
+            thread = thread_offset
+            _, messages = _thread_messages(plan, thread)
+        sender, recipient, sent_at = messages[k]
+        is_read = k < MESSAGES_PER_THREAD - 1 or _last_message_read(plan, thread_offset)
+        rows.append((
+            plan.row_id("messages", offset),
+            "bnb",
+            plan.row_id("bookings", thread_offset),
+            sender,
+            recipient,
+            MESSAGE_BODIES[k % len(MESSAGE_BODIES)],
+            is_read,
+            sent_at + timedelta(minutes=rng.randint(1, 90)) if is_read else None,
+            plan.row_id("conversation_threads", thread_offset),
+            sent_at,
+            sent_at,
+        ))
+    return rows
+
+
+def _properties(plan: Plan, start: int, stop: int, rng: random.Random) -> List[tuple]:
+    rows = []
+    for offset in range(start, stop):
+        property_id = plan.row_id("properties", offset)
+        location = LOCATIONS[bisect.bisect_right(_LOCATION_CUMULATIVE, rng.random() * _LOCATION_CUMULATIVE[-1])]
+        latitude, longitude = _jitter(rng, location, spread=0.08)
+        bedrooms = rng.randint(1, 6)
+        price = 2_500_000 + 77_500_000 * rng.random() ** 3 * location[5]
+        created = plan.at(plan.as_of - timedelta(days=rng.randint(0, 1095)), rng.randint(0, 23))
+        rows.append((
+            property_id,
+            f"{bedrooms} Bedroom {rng.choice(['Apartment', 'Maisonette', 'Townhouse', 'Bungalow'])} in {location[1]}",
+            Decimal(round(price, -4)).quantize(Decimal("0.01")),
+            plan.property_type_ids[_index(plan.seed, 40, offset, len(plan.property_type_ids))],
+            "AVAILABLE",
+            f"{location[1]}, {location[0]}, Kenya",
+            latitude,
+            longitude,
+            bedrooms,
+            max(1, bedrooms - rng.randint(0, 2)),
+            bedrooms * rng.randint(400, 700),
+            f"bulk-property-{property_id}",
+            plan.agent_id(_index(plan.seed, 41, offset, plan.counts["agents"])),
+            created,
+            created,
+        ))
+    return rows
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    name: str
+    columns: Tuple[str, ...]
+    build: Callable[[Plan, int, int, random.Random], List[tuple]]
+    rows: Callable[[Plan], int]
+
+
+# In foreign key order
+TABLES = [
+    TableSpec("users", (
+        "id", "email", "name", "phone", "hashed_password", "role", "is_active", "token_version",
+        "created_at", "updated_at",
+    ), _users, lambda plan: plan.counts["users"]),
+    TableSpec("st_listings", (
+        "id", "host_id", "title", "type", "capacity", "bedrooms", "beds", "baths", "nightly_price",
+        "cleaning_fee", "address", "county", "town", "latitude", "longitude", "amenities",
+        "cancellation_policy", "instant_book", "min_nights", "max_nights", "created_at", "updated_at",
+    ), _listings, lambda plan: plan.counts["listings"]),
+    TableSpec("tours", (
+        "id", "name", "description", "price", "duration_hours", "operator_id", "max_participants",
+        "included_services", "created_at", "updated_at",
+    ), _tours, lambda plan: plan.counts["tours"]),
+    TableSpec("properties", (
+        "id", "title", "price", "property_type_id", "status", "address", "latitude", "longitude",
+        "bedrooms", "bathrooms", "square_footage", "slug", "agent_id", "created_at", "updated_at",
+    ), _properties, lambda plan: plan.counts["properties"] if plan.property_type_ids else 0),
+    TableSpec("st_availability", (
+        "id", "listing_id", "date", "is_available", "price_override", "min_nights_override",
+    ), _availability, lambda plan: plan.counts["listings"] * plan.counts["availability_days"]),
+    TableSpec("bookings", (
+        "id", "guest_id", "listing_id", "check_in", "check_out", "guests", "status", "amount_total",
+        "deposit_amount", "currency", "created_at", "updated_at",
+    ), _bookings, lambda plan: plan.counts["bookings"]),
+    TableSpec("tour_bookings", (
+        "id", "tour_id", "customer_id", "booking_date", "participants", "total_price", "status",
+        "created_at", "updated_at",
+    ), _tour_bookings, lambda plan: plan.counts["tour_bookings"] if plan.counts["tours"] else 0),
+    TableSpec("reviews", (
+        "id", "target_type", "target_id", "rating", "title", "comment", "reviewer_id", "booking_id",
+        "is_flagged", "created_at", "updated_at",
+    ), _reviews, lambda plan: plan.counts["reviews"] if plan.counts["bookings"] else 0),
+    TableSpec("conversation_threads", (
+        "id", "booking_type", "booking_id", "participant_1_id", "participant_2_id", "last_message_id",
+        "last_message_sender_id", "last_message_preview", "last_message_at", "unread_count_participant_1",
+        "unread_count_participant_2", "created_at", "updated_at",
+    ), _threads, lambda plan: plan.threads),
+    TableSpec("messages", (
+        "id", "booking_type", "booking_id", "sender_id", "recipient_id", "body", "is_read", "read_at",
+        "thread_id", "created_at", "updated_at",
+    ), _messages, lambda plan: plan.threads * MESSAGES_PER_THREAD),
+]
+SPECS = {spec.name: spec for spec in TABLES}
+
+
+def build_chunk(plan: Plan, table: str, index: int) -> List[tuple]:
+    """Rows of chunk *index* of *table*; runs in a worker process."""
+    spec = SPECS[table]
+    start = index * plan.chunk_size
+    stop = min(spec.rows(plan), start + plan.chunk_size)
+    rng = random.Random(f"{plan.seed}:{table}:{index}")
+    return spec.build(plan, start, stop, rng)
+
+
+def _converters(table: str, columns: Tuple[str, ...], copy: bool):
+    """Per-column value conversion for the target column types."""
+    converters = []
+    for name in columns:
+        column_type = Base.metadata.tables[table].c[name].type
+        if isinstance(column_type, JSON) and copy:
+            converters.append(lambda value: None if value is None else json.dumps(value))
+        elif isinstance(column_type, DateTime) and not column_type.timezone:
+            converters.append(lambda value: None if value is None else value.replace(tzinfo=None))
+        else:
+            converters.append(None)
+    if not any(converters):
+        return None
+    return converters
+
+
+def _convert(rows: List[tuple], converters) -> List[tuple]:
+    if converters is None:
+        return rows
+    return [
+        tuple(value if convert is None else convert(value) for value, convert in zip(row, converters))
+        for row in rows
+    ]
+
+
+async def write_chunk(table: str, columns: Tuple[str, ...], rows: List[tuple]) -> None:
+    if not rows:
+        return
+    if engine.dialect.name == "postgresql":
+        async with engine.connect() as conn:
+            raw = await conn.get_raw_connection()
+            await raw.driver_connection.copy_records_to_table(
+                table, records=_convert(rows, _converters(table, columns, copy=True)), columns=list(columns)
+            )
+        return
+    rows = _convert(rows, _converters(table, columns, copy=False))
+    async with engine.begin() as conn:
+        await conn.execute(Base.metadata.tables[table].insert(), [dict(zip(columns, row)) for row in rows])
+
+
+async def load_table(spec: TableSpec, plan: Plan, pool: ProcessPoolExecutor, workers: int) -> int:
+    total = spec.rows(plan)
+    chunks = math.ceil(total / plan.chunk_size)
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(workers)
+
+    async def one(index: int) -> None:
+        async with semaphore:
+            rows = await loop.run_in_executor(pool, build_chunk, plan, spec.name, index)
+            await write_chunk(spec.name, spec.columns, rows)
+
+    await asyncio.gather(*(one(index) for index in range(chunks)))
+    return total
+
+
+async def make_plan(counts: Dict[str, int], seed: int, as_of: date, chunk_size: int) -> Plan:
+    from infrastructure.config.auth import get_password_hash
+
+    id_base = {}
+    async with engine.connect() as conn:
+        for spec in TABLES:
+            table = Base.metadata.tables[spec.name]
+            id_base[spec.name] = (await conn.execute(select(func.coalesce(func.max(table.c.id), 0)))).scalar_one()
+        property_types = Base.metadata.tables["property_types"]
+        property_type_ids = tuple(
+            (await conn.execute(select(property_types.c.id).order_by(property_types.c.id))).scalars()
+        )
+    return Plan(
+        seed=seed,
+        as_of=as_of,
+        chunk_size=chunk_size,
+        counts=counts,
+        id_base=id_base,
+        password_hash=get_password_hash(PASSWORD),
+        property_type_ids=property_type_ids,
+    )
+
+
+async def finish(tables: List[str]) -> None:
+    """Move id sequences past the generated rows and refresh planner statistics."""
+    if engine.dialect.name != "postgresql":
+        return
+    async with engine.begin() as conn:
+        for table in tables:
+            await conn.execute(text(
+                f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+                f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+            ))
+    async with engine.connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for table in tables:
+            await conn.execute(text(f"ANALYZE {table}"))
+
+
+def validate(counts: Dict[str, int]) -> Optional[str]:
+    if counts["hosts"] < 1 or counts["operators"] < 1 or counts["agents"] < 1:
+        return "hosts, operators and agents must each be at least 1"
+    if counts["users"] - counts["hosts"] - counts["operators"] - counts["agents"] < 1:
+        return "users must exceed hosts + operators + agents so there are customers"
+    if counts["listings"] < 1 and (counts["bookings"] or counts["availability_days"]):
+        return "bookings and availability need at least one listing"
+    return None
+
+
+async def generate(plan: Plan, workers: int) -> None:
+    loaded = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for spec in TABLES:
+            total = spec.rows(plan)
+            if total == 0:
+                print(f"{spec.name:<22} skipped")
+                continue
+            started = time.perf_counter()
+            await load_table(spec, plan, pool, workers)
+            elapsed = time.perf_counter() - started
+            loaded.append(spec.name)
+            print(f"{spec.name:<22} {total:>12,} rows {elapsed:>8.1f}s {total / elapsed:>12,.0f} rows/s")
+    if "properties" not in loaded and plan.counts["properties"]:
+        print("properties skipped: no property_types rows to reference")
+    await finish(loaded)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--preset", choices=list(PRESETS), default="small")
+    for name in PRESETS["small"]:
+        parser.add_argument(f"--{name.replace('_', '-')}", type=int, dest=name, help="Overrides the preset")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--as-of", type=date.fromisoformat, default=date.today(),
+                        help="Date bookings and availability are generated around (default today)")
+    parser.add_argument("--chunk-size", type=int, default=50_000)
+    parser.add_argument("--workers", type=int, default=4, help="Chunks built and loaded in parallel")
+    args = parser.parse_args()
+
+    counts = dict(PRESETS[args.preset])
+    for name in counts:
+        if getattr(args, name) is not None:
+            counts[name] = getattr(args, name)
+    problem = validate(counts)
+    if problem:
+        parser.error(problem)
+
+    async def run() -> None:
+        plan = await make_plan(counts, args.seed, args.as_of, args.chunk_size)
+        print(f"Generating {args.preset} dataset (seed={plan.seed}, as of {plan.as_of}) on {engine.dialect.name}")
+        await generate(plan, args.workers)
+        await engine.dispose()
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
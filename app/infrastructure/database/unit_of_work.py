@@ -0,0 +1,185 @@
+"""Request-scoped unit of work.
+
+One ``UnitOfWork`` is active per HTTP request (see ``UnitOfWorkMiddleware``)
+or per background job (``async with unit_of_work():``). Every repository
+created while it is active shares its session, so the request uses a single
+pooled connection and commits once at the end.
+
+Repositories keep calling ``session.commit()`` after their writes; on the
+shared session that only flushes, which still surfaces constraint errors
+and assigns primary keys. Outside a unit of work sessions behave as before.
+Writes that may fail and be handled by the caller run inside
+``session.begin_nested()``, so a failure rolls back to that SAVEPOINT
+instead of discarding everything the request has already flushed.
+
+Read-only routes may also let the session send plain reads to the replica;
+see ``infrastructure.database.replica``.
+"""
+from __future__ import annotations
+
+import inspect
+import logging
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Callable, List, Optional, cast
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from infrastructure.config.database import AsyncSessionLocal, engine
+from .replica import RoutingSession
+
+logger = logging.getLogger(__name__)
+
+
+class UnitOfWorkSession(AsyncSession):
+    """Session shared by the repositories of one unit of work."""
+
+    @property
+    def routing_session(self) -> RoutingSession:
+        # Built with sync_session_class=RoutingSession; typed as plain Session
+        return cast(RoutingSession, self.sync_session)
+
+    async def commit(self) -> None:
+        # The unit of work commits once when it ends
+        await self.flush()
+
+    async def commit_unit(self) -> None:
+        """Commit the transaction for real."""
+        await super().commit()
+
+
+UnitOfWorkSessionLocal = async_sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    expire_on_commit=False,
+    class_=UnitOfWorkSession,
+    sync_session_class=RoutingSession,
+)
+
+_current: ContextVar[Optional["UnitOfWork"]] = ContextVar("unit_of_work", default=None)
+
+
+class UnitOfWork:
+    """Lazily opened session committed or rolled back as a whole."""
+
+    def __init__(self, session_factory=UnitOfWorkSessionLocal) -> None:
+        self._session_factory = session_factory
+        self._session: Optional[UnitOfWorkSession] = None
+        self._use_replica = False
+        self._after_commit: List[Callable[[], Any]] = []
+
+    @property
+    def session(self) -> UnitOfWorkSession:
+        # No connection is checked out until the first query
+        if self._session is None:
+            self._session = self._session_factory()
+            self._session.routing_session.use_replica = self._use_replica
+        return self._session
+
+    @property
+    def started(self) -> bool:
+        return self._session is not None
+
+    @property
+    def pending(self) -> bool:
+        """Whether ending the unit of work has anything to commit or run."""
+        return self._session is not None or bool(self._after_commit)
+
+    @property
+    def wrote(self) -> bool:
+        """Whether anything besides plain reads reached the primary."""
+        return self._session is not None and self._session.routing_session.wrote
+
+    def use_replica(self) -> None:
+        """Send plain reads to the read replica until the first write."""
+        self._use_replica = True
+        if self._session is not None and not self._session.routing_session.wrote:
+            self._session.routing_session.use_replica = True
+
+    def after_commit(self, callback: Callable[[], Any]) -> None:
+        """Run *callback* once the transaction has committed; dropped on rollback.
+
+        A callback returning an awaitable, such as a coroutine function, is awaited.
+        """
+        self._after_commit.append(callback)
+
+    async def commit(self) -> None:
+        if self._session is not None:
+            await self._session.commit_unit()
+        callbacks, self._after_commit = self._after_commit, []
+        for callback in callbacks:
+            try:
+                result = callback()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                # The data is committed; a failed hook must not undo the response
+                logger.exception("after_commit callback failed")
+
+    async def rollback(self) -> None:
+        self._after_commit = []
+        if self._session is not None:
+            await self._session.rollback()
+
+    async def close(self) -> None:
+        """Release the connection; anything not committed is rolled back."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def activate(self):
+        """Make this the current unit of work; returns a token for ``deactivate``."""
+        return _current.set(self)
+
+    @staticmethod
+    def deactivate(token) -> None:
+        _current.reset(token)
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """Return the active unit of work, if any."""
+    return _current.get()
+
+
+async def run_after_commit(callback: Callable[[], Any]) -> None:
+    """Defer *callback* until the current unit of work commits, or run it now outside one."""
+    uow = _current.get()
+    if uow is not None:
+        uow.after_commit(callback)
+        return
+    result = callback()
+    if inspect.isawaitable(result):
+        await result
+
+
+def current_session() -> AsyncSession:
+    """Session for a repository: the unit of work's, or a new one outside it."""
+    uow = _current.get()
+    if uow is not None:
+        return uow.session
+    return AsyncSessionLocal()
+
+
+@asynccontextmanager
+async def unit_of_work() -> AsyncIterator[UnitOfWork]:
+    """Run a block in one transaction; commits on success, rolls back on error.
+
+    Nested blocks join the enclosing unit of work.
+    """
+    existing = _current.get()
+    if existing is not None:
+        yield existing
+        return
+
+    uow = UnitOfWork()
+    token = uow.activate()
+    try:
+        yield uow
+        await uow.commit()
+    except BaseException:
+        await uow.rollback()
+        raise
+    finally:
+        uow.deactivate(token)
+        await uow.close()
@@ -0,0 +1,28 @@
+"""Shared HTTP client factory for outbound calls to third-party APIs."""
+import httpx
+
+
+def create_http_client(
+    base_url: str = "",
+    max_connections: int = 20,
+    max_keepalive_connections: int = 10,
+    keepalive_expiry: float = 30.0,
+    timeout: float = 15.0,
+    http2: bool = True,
+) -> httpx.AsyncClient:
+    """Build a pooled client for a single upstream host.
+
+    One client is created per provider so each host gets its own connection
+    limit, and connections (TLS included) are reused across requests. The
+    owner must call ``aclose()`` on shutdown.
+    """
+    return httpx.AsyncClient(
+        base_url=base_url,
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(timeout, connect=5.0),
+    )
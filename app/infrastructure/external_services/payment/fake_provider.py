@@ -0,0 +1,62 @@
+import asyncio
+import random
+from typing import Any, Dict, Optional
+
+
+class FakePaymentProvider:
+    """Local stand-in for the Stripe and M-Pesa status APIs.
+
+    Answers ``retrieve_payment_intent`` and ``check_transaction_status``
+    with simulated latency, transient errors and a configurable mix of
+    outcomes, and records peak concurrency so reconciliation runs can be
+    exercised without network access.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.05,
+        error_rate: float = 0.05,
+        success_rate: float = 0.8,
+        pending_rate: float = 0.05,
+        seed: Optional[int] = None
+    ):
+        self.latency = latency
+        self.error_rate = error_rate
+        self.success_rate = success_rate
+        self.pending_rate = pending_rate
+        self.calls = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._random = random.Random(seed)
+
+    async def _call(self) -> float:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._random.uniform(0.5, 1.5) * self.latency)
+            if self._random.random() < self.error_rate:
+                raise ConnectionError("Simulated provider timeout")
+            return self._random.random()
+        finally:
+            self.in_flight -= 1
+
+    async def retrieve_payment_intent(self, payment_intent_id: str) -> Dict[str, Any]:
+        roll = await self._call()
+        if roll < self.success_rate:
+            return {"id": payment_intent_id, "status": "succeeded", "last_payment_error": None}
+        if roll < self.success_rate + self.pending_rate:
+            return {"id": payment_intent_id, "status": "processing", "last_payment_error": None}
+        return {
+            "id": payment_intent_id,
+            "status": "requires_payment_method",
+            "last_payment_error": {"message": "Your card was declined."},
+        }
+
+    async def check_transaction_status(self, checkout_request_id: str) -> Dict[str, Any]:
+        roll = await self._call()
+        if roll < self.success_rate:
+            return {"result_code": "0", "result_desc": "The service request is processed successfully."}
+        if roll < self.success_rate + self.pending_rate:
+            return {"result_code": None, "result_desc": "The transaction is being processed"}
+        return {"result_code": "1032", "result_desc": "Request cancelled by user"}
@@ -1,34 +1,176 @@
-from typing import Any, Dict
+import asyncio
+import base64
+import hmac
+import time
+from typing import Any, Dict, Optional
 from datetime import datetime, timedelta
 
+import httpx
+
+from shared.exceptions.payment import PaymentProcessingError, WebhookVerificationError
+
+# Daraja STK result code for a prompt the customer dismissed
+MPESA_RESULT_CANCELLED = 1032
+# Daraja error code returned by STK query while the customer has not responded
+MPESA_QUERY_PENDING = "500.001.1001"
+
+
 class MpesaPaymentService:
-    def __init__(self, consumer_key: str, consumer_secret: str, shortcode: str):
+    # Refresh the OAuth token this long before Daraja says it expires
+    TOKEN_REFRESH_MARGIN_SECONDS = 60
+
+    def __init__(
+        self,
+        consumer_key: str,
+        consumer_secret: str,
+        shortcode: str,
+        callback_token: str = "",
+        passkey: str = "",
+        callback_url: str = "",
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         self.consumer_key = consumer_key
         self.consumer_secret = consumer_secret
         self.shortcode = shortcode
+        # Daraja callbacks are unsigned; the callback URL carries this secret instead
+        self.callback_token = callback_token
+        self.passkey = passkey
+        self.callback_url = callback_url
+        # Pooled client bound to the Daraja host; None keeps the local placeholders
+        self.http_client = http_client
+        self._access_token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self._token_lock = asyncio.Lock()
+
+    async def get_access_token(self) -> str:
+        """Return a cached Daraja OAuth token, refreshing it at most once at a time"""
+        if self._access_token and time.monotonic() < self._token_expires_at:
+            return self._access_token
+        async with self._token_lock:
+            # Another request may have refreshed while we waited
+            if self._access_token and time.monotonic() < self._token_expires_at:
+                return self._access_token
+            response = await self.http_client.get(
+                "/oauth/v1/generate",
+                params={"grant_type": "client_credentials"},
+                auth=(self.consumer_key, self.consumer_secret),
+            )
+            response.raise_for_status()
+            data = response.json()
+            token: str = data["access_token"]
+            self._access_token = token
+            self._token_expires_at = (
+                time.monotonic() + int(data.get("expires_in", 3599)) - self.TOKEN_REFRESH_MARGIN_SECONDS
+            )
+            return token
+
+    def invalidate_access_token(self) -> None:
+        self._access_token = None
+        self._token_expires_at = 0.0
+
+    async def _post(self, path: str, payload: Dict[str, Any]) -> httpx.Response:
+        """POST with the cached token, retrying once if Daraja rejects it"""
+        for attempt in range(2):
+            token = await self.get_access_token()
+            response = await self.http_client.post(
+                path, json=payload, headers={"Authorization": f"Bearer {token}"}
+            )
+            if response.status_code != 401 or attempt:
+                return response
+            self.invalidate_access_token()
+        return response
+
+    def _password(self) -> Dict[str, str]:
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
+        raw = f"{self.shortcode}{self.passkey}{timestamp}".encode()
+        return {"Password": base64.b64encode(raw).decode(), "Timestamp": timestamp}
 
     async def initiate_stk_push(self, amount: int, phone_number: str, account_reference: str, transaction_desc: str) -> Dict[str, Any]:
         """Initiate M-Pesa STK Push"""
-        # Placeholder: integrate with M-Pesa API
-        checkout_request_id = f"mpesa_{abs(hash(f'{amount}{phone_number}{account_reference}'))}"
+        if self.http_client is None:
+            # Placeholder: integrate with M-Pesa API
+            checkout_request_id = f"mpesa_{abs(hash(f'{amount}{phone_number}{account_reference}'))}"
+            return {
+                "checkout_request_id": checkout_request_id,
+                "response_code": "0",
+                "response_description": "Success. Request accepted for processing",
+                "merchant_request_id": f"mr_{abs(hash(account_reference))}",
+                "expires_at": datetime.utcnow() + timedelta(minutes=5),
+                "checkout_url": f"https://sandbox.safaricom.co.ke/mpesa/stkpush/v1/processrequest/{checkout_request_id}"
+            }
+
+        response = await self._post("/mpesa/stkpush/v1/processrequest", {
+            "BusinessShortCode": self.shortcode,
+            **self._password(),
+            "TransactionType": "CustomerPayBillOnline",
+            "Amount": amount,
+            "PartyA": phone_number,
+            "PartyB": self.shortcode,
+            "PhoneNumber": phone_number,
+            "CallBackURL": self.callback_url,
+            "AccountReference": account_reference[:12],
+            "TransactionDesc": transaction_desc[:13],
+        })
+        data = response.json()
+        if response.status_code != 200 or data.get("ResponseCode") != "0":
+            raise PaymentProcessingError(
+                data.get("errorMessage") or data.get("ResponseDescription") or "STK push rejected"
+            )
         return {
-            "checkout_request_id": checkout_request_id,
-            "response_code": "0",
-            "response_description": "Success. Request accepted for processing",
-            "merchant_request_id": f"mr_{abs(hash(account_reference))}",
+            "checkout_request_id": data["CheckoutRequestID"],
+            "response_code": data["ResponseCode"],
+            "response_description": data.get("ResponseDescription"),
+            "merchant_request_id": data.get("MerchantRequestID"),
             "expires_at": datetime.utcnow() + timedelta(minutes=5),
-            "checkout_url": f"https://sandbox.safaricom.co.ke/mpesa/stkpush/v1/processrequest/{checkout_request_id}"
+            "checkout_url": None
         }
 
     async def check_transaction_status(self, checkout_request_id: str) -> Dict[str, Any]:
         """Check M-Pesa transaction status"""
-        # Placeholder: integrate with M-Pesa API
+        if self.http_client is None:
+            # Placeholder: the outcome is unknown without Daraja, so report it as pending
+            return {"result_code": None, "result_desc": "M-Pesa is not configured; status unknown"}
+
+        response = await self._post("/mpesa/stkpushquery/v1/query", {
+            "BusinessShortCode": self.shortcode,
+            **self._password(),
+            "CheckoutRequestID": checkout_request_id,
+        })
+        data = response.json()
+        if data.get("errorCode") == MPESA_QUERY_PENDING:
+            return {"result_code": None, "result_desc": data.get("errorMessage")}
+        if response.status_code != 200:
+            raise PaymentProcessingError(data.get("errorMessage") or "STK query failed")
+        return {
+            "result_code": str(data.get("ResultCode")),
+            "result_desc": data.get("ResultDesc"),
+        }
+
+    def parse_callback(self, payload: Dict[str, Any], token: str) -> Dict[str, Any]:
+        """Verify the callback token and return the STK callback summary"""
+        if not self.callback_token or not hmac.compare_digest(token or "", self.callback_token):
+            raise WebhookVerificationError("Invalid M-Pesa callback token")
+
+        body = payload.get("Body") if isinstance(payload, dict) else None
+        callback = body.get("stkCallback") if isinstance(body, dict) else None
+        if not isinstance(callback, dict) or not isinstance(callback.get("CheckoutRequestID"), str):
+            raise WebhookVerificationError("Malformed M-Pesa callback payload")
+        try:
+            result_code = int(callback["ResultCode"])
+        except (KeyError, TypeError, ValueError) as exc:
+            raise WebhookVerificationError("M-Pesa callback has no valid ResultCode") from exc
+
+        if result_code == 0:
+            outcome = "succeeded"
+        elif result_code == MPESA_RESULT_CANCELLED:
+            outcome = "cancelled"
+        else:
+            outcome = "failed"
+
         return {
-            "result_code": "0",
-            "result_desc": "The service request is processed successfully.",
-            "mpesa_receipt_number": f"MPE{abs(hash(checkout_request_id))}",
-            "transaction_date": datetime.utcnow().isoformat(),
-            "phone_number": "254712345678",
-            "amount": 1000,
-            "completed_at": datetime.utcnow().isoformat()
+            # One callback is sent per STK push, so the checkout ID identifies the event
+            "event_id": callback["CheckoutRequestID"],
+            "event_type": f"stk_callback.{outcome}",
+            "payment_intent_id": callback["CheckoutRequestID"],
+            "data": payload,
         }
@@ -1,15 +1,75 @@
-from typing import Any, Dict
+import hashlib
+import hmac
+import json
+import time
+from typing import Any, Dict, Optional
 
-from tenacity import retry, stop_after_attempt, wait_exponential
+import httpx
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential
+
+from shared.exceptions.payment import WebhookVerificationError
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether a failed Stripe call may succeed if sent again"""
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code >= 500
+    return isinstance(exc, httpx.TransportError)
 
 
 class StripePaymentService:
-    def __init__(self, api_key: str):
+    # Reject signed payloads older than this to limit replay
+    WEBHOOK_TOLERANCE_SECONDS = 300
+
+    def __init__(self, api_key: str, webhook_secret: str = "", http_client: Optional[httpx.AsyncClient] = None):
         self.api_key = api_key
+        self.webhook_secret = webhook_secret
+        # Pooled client bound to api.stripe.com; None keeps the local placeholders
+        self.http_client = http_client
+
+    async def _request(
+        self,
+        method: str,
+        path: str,
+        data: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        if idempotency_key:
+            headers["Idempotency-Key"] = idempotency_key
+        response = await self.http_client.request(method, path, data=data, headers=headers)
+        response.raise_for_status()
+        return response.json()
+
+    # Only transport errors and 5xx are retried; the idempotency key makes a
+    # resend after a lost response return the intent Stripe already created
+    @retry(
+        retry=retry_if_exception(_is_transient),
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(multiplier=0.5, max=4),
+        reraise=True,
+    )
+    async def create_payment_intent(
+        self,
+        amount: int,
+        currency: str,
+        customer_email: str,
+        metadata: Dict[str, Any] = None,
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a Stripe payment intent
+
+        Without an explicit *idempotency_key* one is derived from the request,
+        so identical requests never create a second intent.
+        """
+        if self.http_client is not None:
+            form = {"amount": amount, "currency": currency, "receipt_email": customer_email}
+            form.update({f"metadata[{key}]": value for key, value in (metadata or {}).items()})
+            if idempotency_key is None:
+                digest = hashlib.sha256(json.dumps(form, sort_keys=True, default=str).encode()).hexdigest()
+                idempotency_key = f"pi-{digest}"
+            return await self._request("POST", "/v1/payment_intents", form, idempotency_key)
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=0.5, max=4))
-    async def create_payment_intent(self, amount: int, currency: str, customer_email: str, metadata: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Create a Stripe payment intent"""
         # Placeholder: integrate with Stripe SDK
         intent_id = f"pi_{abs(hash(f'{amount}{currency}{customer_email}'))}"
         return {
@@ -23,6 +83,12 @@ class StripePaymentService:
 
     async def confirm_payment_intent(self, payment_intent_id: str, payment_method_id: str) -> Dict[str, Any]:
         """Confirm a Stripe payment intent"""
+        if self.http_client is not None:
+            return await self._request(
+                "POST", f"/v1/payment_intents/{payment_intent_id}/confirm",
+                {"payment_method": payment_method_id},
+            )
+
         # Placeholder: integrate with Stripe SDK
         return {
             "id": payment_intent_id,
@@ -31,6 +97,58 @@ class StripePaymentService:
             "created": "2024-01-20T10:00:00Z"
         }
 
+    async def retrieve_payment_intent(self, payment_intent_id: str) -> Dict[str, Any]:
+        """Fetch the current state of a Stripe payment intent"""
+        if self.http_client is not None:
+            return await self._request("GET", f"/v1/payment_intents/{payment_intent_id}")
+
+        # Placeholder: the outcome is unknown without Stripe, so never report success
+        return {
+            "id": payment_intent_id,
+            "status": "requires_payment_method",
+            "last_payment_error": None,
+        }
+
+    def parse_webhook(self, payload: bytes, signature_header: str) -> Dict[str, Any]:
+        """Verify a ``Stripe-Signature`` header and return the event summary"""
+        if not self.webhook_secret:
+            raise WebhookVerificationError("Stripe webhook secret is not configured")
+
+        timestamp = None
+        signatures = []
+        for part in (signature_header or "").split(","):
+            key, _, value = part.strip().partition("=")
+            if key == "t":
+                timestamp = value
+            elif key == "v1":
+                signatures.append(value)
+        if not timestamp or not signatures:
+            raise WebhookVerificationError("Malformed Stripe-Signature header")
+
+        signed_payload = timestamp.encode() + b"." + payload
+        expected = hmac.new(self.webhook_secret.encode(), signed_payload, hashlib.sha256).hexdigest()
+        if not any(hmac.compare_digest(expected, signature) for signature in signatures):
+            raise WebhookVerificationError("Invalid Stripe signature")
+        try:
+            if abs(time.time() - int(timestamp)) > self.WEBHOOK_TOLERANCE_SECONDS:
+                raise WebhookVerificationError("Stripe signature timestamp outside tolerance")
+            event = json.loads(payload)
+        except ValueError as exc:
+            raise WebhookVerificationError("Malformed Stripe webhook payload") from exc
+        if not isinstance(event, dict) or not isinstance(event.get("id"), str) or not isinstance(event.get("type"), str):
+            raise WebhookVerificationError("Stripe event has no ID or type")
+
+        data = event.get("data")
+        obj = data.get("object") if isinstance(data, dict) else None
+        if not isinstance(obj, dict):
+            raise WebhookVerificationError("Malformed Stripe webhook payload")
+        return {
+            "event_id": event.get("id"),
+            "event_type": event.get("type"),
+            "payment_intent_id": obj.get("id") if obj.get("object") == "payment_intent" else obj.get("payment_intent"),
+            "data": event,
+        }
+
 
 # Legacy function for backward compatibility
 @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=0.5, max=4))
@@ -1,3 +1,5 @@
 # Infrastructure services module
 
-from .bcrypt_password_service import BcryptPasswordService
\ No newline at end of file
+from .bcrypt_password_service import BcryptPasswordService
+from .message_broker import MessageBroker, InMemoryMessageBroker
+from .message_hub import MessageHub
\ No newline at end of file
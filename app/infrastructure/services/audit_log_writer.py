@@ -0,0 +1,142 @@
+"""Background writer that batches audit log rows off the request path."""
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+import structlog
+from sqlalchemy import insert
+
+from infrastructure.config.database import AsyncSessionLocal
+from infrastructure.database.models.audit_log import AuditLog
+
+logger = structlog.get_logger(__name__)
+
+_STOP = object()
+
+
+@dataclass(frozen=True)
+class AuditLogWriterStats:
+    enqueued: int
+    written: int
+    dropped: int
+    failed: int
+    pending: int
+
+
+class AuditLogWriter:
+    """Queue audit entries in memory and insert them in batches.
+
+    ``record`` never blocks: when the queue is full the entry is dropped
+    and counted. A background task writes a batch as soon as it holds
+    ``batch_size`` entries or ``flush_interval`` seconds after its first
+    entry, whichever comes first, as a single multi-row INSERT.
+
+    Args:
+        session_factory: Factory for the session each batch is written with
+        queue_size: Entries held before new ones are dropped
+        batch_size: Maximum rows per INSERT
+        flush_interval: Seconds an entry may wait for its batch to fill
+    """
+
+    def __init__(
+        self,
+        session_factory=AsyncSessionLocal,
+        queue_size: int = 10_000,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._queue: "asyncio.Queue[Any]" = asyncio.Queue(maxsize=queue_size)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._task: Optional[asyncio.Task] = None
+        self._closed = False
+        self._enqueued = 0
+        self._written = 0
+        self._dropped = 0
+        self._failed = 0
+
+    def record(self, entry: Dict[str, Any]) -> bool:
+        """Queue one ``audit_logs`` row; return False if it was dropped."""
+        if self._closed:
+            self._dropped += 1
+            return False
+        try:
+            self._queue.put_nowait(entry)
+        except asyncio.QueueFull:
+            self._dropped += 1
+            if self._dropped % 1000 == 1:
+                logger.warning("audit_log_queue_full", dropped=self._dropped)
+            return False
+        self._enqueued += 1
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+        return True
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """Write everything still queued, then stop the background task."""
+        self._closed = True
+        if self._task is None:
+            return
+        try:
+            self._queue.put_nowait(_STOP)
+        except asyncio.QueueFull:
+            # The writer stops by itself once it has drained the queue
+            pass
+        try:
+            await asyncio.wait_for(self._task, timeout)
+        except asyncio.TimeoutError:
+            logger.warning("audit_log_flush_timeout", pending=self._queue.qsize())
+        self._task = None
+
+    def stats(self) -> AuditLogWriterStats:
+        return AuditLogWriterStats(
+            enqueued=self._enqueued,
+            written=self._written,
+            dropped=self._dropped,
+            failed=self._failed,
+            pending=self._queue.qsize(),
+        )
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is _STOP:
+                break
+            batch: List[Dict[str, Any]] = [first]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                if self._queue.empty():
+                    if self._closed:
+                        stopping = True
+                        break
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        entry = await asyncio.wait_for(self._queue.get(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    entry = self._queue.get_nowait()
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+            await self._write(batch)
+            if self._closed and self._queue.empty():
+                stopping = True
+
+    async def _write(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            async with self._session_factory() as session:
+                await session.execute(insert(AuditLog).values(batch))
+                await session.commit()
+        except Exception as exc:
+            # Auditing must never take the API down; the batch is lost
+            self._failed += len(batch)
+            logger.error("audit_log_write_failed", rows=len(batch), error=str(exc))
+            return
+        self._written += len(batch)
@@ -1,12 +1,12 @@
 """Bcrypt implementation of password service."""
 from domain.services.password_service import PasswordService
-from infrastructure.config.auth import get_password_hash, verify_password
+from infrastructure.config.auth import get_password_hash_async, verify_password_async
 
 
 class BcryptPasswordService(PasswordService):
     """Bcrypt implementation of password service."""
     
-    def hash_password(self, password: str) -> str:
+    async def hash_password(self, password: str) -> str:
         """Hash a plain text password using bcrypt.
         
         Args:
@@ -15,9 +15,9 @@ class BcryptPasswordService(PasswordService):
         Returns:
             Hashed password string
         """
-        return get_password_hash(password)
+        return await get_password_hash_async(password)
     
-    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+    async def verify_password(self, plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash using bcrypt.
         
         Args:
@@ -27,4 +27,4 @@ class BcryptPasswordService(PasswordService):
         Returns:
             True if password matches, False otherwise
         """
-        return verify_password(plain_password, hashed_password)
+        return await verify_password_async(plain_password, hashed_password)
@@ -0,0 +1,51 @@
+"""Brokers that carry realtime events between API worker processes.
+
+The :class:`~infrastructure.services.message_hub.MessageHub` publishes every
+event through a broker and only fans out what the broker hands back, so
+swapping the in-memory broker for a networked one (Redis pub/sub, Postgres
+LISTEN/NOTIFY, ...) is enough to share events across workers.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+Envelope = Dict[str, Any]
+EnvelopeHandler = Callable[[Envelope], Awaitable[None]]
+
+
+class MessageBroker(ABC):
+    """Transport for realtime event envelopes."""
+
+    @abstractmethod
+    async def start(self, handler: EnvelopeHandler) -> None:
+        """Begin delivering published envelopes to *handler*."""
+        pass
+
+    @abstractmethod
+    async def publish(self, envelope: Envelope) -> None:
+        """Publish an envelope to every subscribed worker, including this one."""
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """Stop delivering envelopes and release resources."""
+        pass
+
+
+class InMemoryMessageBroker(MessageBroker):
+    """Single-process broker; hands envelopes straight back to the local hub.
+
+    Suitable for development, tests and single-worker deployments.
+    """
+
+    def __init__(self) -> None:
+        self._handler: Optional[EnvelopeHandler] = None
+
+    async def start(self, handler: EnvelopeHandler) -> None:
+        self._handler = handler
+
+    async def publish(self, envelope: Envelope) -> None:
+        if self._handler is not None:
+            await self._handler(envelope)
+
+    async def stop(self) -> None:
+        self._handler = None
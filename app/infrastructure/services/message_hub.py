@@ -0,0 +1,109 @@
+"""In-process pub/sub hub that fans realtime events out to WebSocket clients."""
+import asyncio
+from collections import defaultdict
+from typing import Any, Dict, Iterable, Optional, Set
+
+import structlog
+
+from domain.services.realtime_notifier import RealtimeNotifier
+from .message_broker import Envelope, MessageBroker
+
+logger = structlog.get_logger(__name__)
+
+
+class HubConnection:
+    """One live client connection with its own bounded outbound queue."""
+
+    def __init__(self, user_id: int, queue_size: int) -> None:
+        self.user_id = user_id
+        self.queue: "asyncio.Queue[Optional[Dict[str, Any]]]" = asyncio.Queue(maxsize=queue_size)
+        self.overflowed = False
+
+    def offer(self, event: Dict[str, Any]) -> bool:
+        """Enqueue *event* without blocking; return False if the client is too slow."""
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            return False
+
+    def close(self) -> None:
+        """Drop anything pending and wake the writer with the end-of-stream marker."""
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def next_event(self) -> Optional[Dict[str, Any]]:
+        """Wait for the next event; ``None`` means the connection must close."""
+        return await self.queue.get()
+
+
+class MessageHub(RealtimeNotifier):
+    """Routes broker envelopes to the connections of the addressed users.
+
+    Publishing never blocks on a slow client: each connection has a bounded
+    queue, and a connection whose queue is full is evicted so the client can
+    reconnect and resynchronise through the REST endpoints.
+    """
+
+    def __init__(self, broker: MessageBroker, queue_size: int = 100) -> None:
+        self._broker = broker
+        self._queue_size = queue_size
+        self._connections: Dict[int, Set[HubConnection]] = defaultdict(set)
+        self._started = False
+        self._lock = asyncio.Lock()
+
+    async def start(self) -> None:
+        async with self._lock:
+            if not self._started:
+                await self._broker.start(self._dispatch)
+                self._started = True
+
+    async def stop(self) -> None:
+        async with self._lock:
+            if self._started:
+                await self._broker.stop()
+                self._started = False
+            for connections in list(self._connections.values()):
+                for connection in list(connections):
+                    connection.close()
+            self._connections.clear()
+
+    async def connect(self, user_id: int) -> HubConnection:
+        """Register a new connection for *user_id*."""
+        await self.start()
+        connection = HubConnection(user_id, self._queue_size)
+        self._connections[user_id].add(connection)
+        return connection
+
+    def disconnect(self, connection: HubConnection) -> None:
+        """Forget *connection*; safe to call more than once."""
+        connections = self._connections.get(connection.user_id)
+        if connections is None:
+            return
+        connections.discard(connection)
+        if not connections:
+            del self._connections[connection.user_id]
+
+    def connection_count(self) -> int:
+        return sum(len(connections) for connections in self._connections.values())
+
+    async def notify(self, user_ids: Iterable[int], event_type: str, data: Dict[str, Any]) -> None:
+        envelope: Envelope = {
+            "user_ids": sorted(set(user_ids)),
+            "event": {"type": event_type, "data": data},
+        }
+        try:
+            await self._broker.publish(envelope)
+        except Exception as exc:  # pragma: no cover - push must never fail a request
+            logger.warning("realtime_publish_failed", event_type=event_type, error=str(exc))
+
+    async def _dispatch(self, envelope: Envelope) -> None:
+        event = envelope["event"]
+        for user_id in envelope.get("user_ids", []):
+            for connection in list(self._connections.get(user_id, ())):
+                if not connection.offer(event):
+                    connection.overflowed = True
+                    self.disconnect(connection)
+                    connection.close()
+                    logger.info("realtime_connection_evicted", user_id=user_id)
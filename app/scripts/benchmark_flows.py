@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Load-test the core marketplace flows end to end.
+
+Drives api.main.app in-process over ASGI (no sockets, no external load
+generator) against the database in DATABASE_URL, so it runs offline once a
+local database has been seeded, e.g. by
+infrastructure/database/seeds/generate_bulk_data.py. Each scenario sends
+--requests requests from --concurrency concurrent clients and reports
+throughput, p50/p95/p99 latency and SQL statements per request. Request
+parameters come from a seeded RNG, so two runs against the same dataset
+send the same requests.
+
+Scenarios:
+    bnb_search        POST /api/v1/bnb/search (county, dates, guests)
+    listing_detail    GET  /api/v1/bnb/listings/{id}
+    booking_create    POST /api/v1/bnb/bookings
+    tour_booking      POST /api/v1/tours/bookings
+    property_radius   GET  /api/v1/property/?latitude&longitude&radius
+    login             POST /api/v1/auth/token
+    host_dashboard    GET  /api/v1/bnb/host/dashboard
+    message_inbox     GET  /api/v1/messages/conversations
+
+The booking scenarios commit real rows: point DATABASE_URL at a disposable
+database. Users are expected to share one password (the seed scripts use
+"password123"). The rate limiter is off unless RATE_LIMIT_ENABLED is set, and
+so is the response cache unless RESPONSE_CACHE_ENABLED is: with it on, repeat
+GETs such as listing_detail measure cache hits rather than the handler. Set
+RESPONSE_CACHE_ENABLED=1 to measure the cached path; the setting is recorded
+in the results and --compare warns when it differs from the baseline.
+
+Results are written as JSON with the commit they were measured on; pass an
+earlier file to --compare to print the change per scenario.
+
+Usage:
+    python scripts/benchmark_flows.py --requests 500 --concurrency 20
+    python scripts/benchmark_flows.py --scenario listing_detail --scenario login
+    python scripts/benchmark_flows.py --compare benchmark_results/flows-1a2b3c4.json
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta, UTC
+from typing import Callable, Dict, List, Optional, Sequence
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(APP_ROOT)
+# Every request would come from one client; don't let the limiter throttle it
+os.environ.setdefault("RATE_LIMIT_ENABLED", "0")
+# Repeat GETs would be served from the response cache; measure the handlers
+os.environ.setdefault("RESPONSE_CACHE_ENABLED", "0")
+
+import httpx
+from sqlalchemy import func, select
+
+from api.main import app
+from infrastructure.config.config import settings
+from infrastructure.config.database import AsyncSessionLocal, engine
+from infrastructure.database.models.bnb_listing import StListing as StListingModel
+from infrastructure.database.models.tours import Tour as TourModel
+from infrastructure.database.models.user import User as UserModel
+from infrastructure.database.query_budget import install, recording
+from shared.constants.user_roles import UserRole
+
+# City centres radius searches start from: (name, latitude, longitude)
+SEARCH_CENTRES = [
+    ("Nairobi", -1.2864, 36.8172),
+    ("Mombasa", -4.0435, 39.6682),
+    ("Kisumu", -0.0917, 34.7680),
+    ("Nakuru", -0.3031, 36.0800),
+    ("Eldoret", 0.5143, 35.2698),
+    ("Kilifi", -3.6305, 39.8499),
+]
+SEARCH_COUNTIES = ["Nairobi", "Mombasa", "Kisumu", "Nakuru", "Kiambu", "Kilifi", "Kwale", "Uasin Gishu"]
+
+
+@dataclass
+class Fixtures:
+    """Rows sampled from the database that requests refer to."""
+
+    listing_ids: List[int]
+    host_ids: List[int]
+    tour_ids: List[int]
+    customers: List[tuple]
+    tokens: List[str] = field(default_factory=list)
+    counts: Dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class ScenarioResult:
+    requests: int
+    errors: int
+    status_codes: Dict[str, int]
+    duration_s: float
+    throughput_rps: float
+    latency_ms: Dict[str, float]
+    queries_per_request: Dict[str, float]
+
+
+def percentile(ordered: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q / 100 * len(ordered)) - 1))]
+
+
+async def load_fixtures(sample: int) -> Fixtures:
+    """Sample up to *sample* rows per table, spread evenly over the id range."""
+    async with AsyncSessionLocal() as session:
+        counts = {}
+        for name, model in (("st_listings", StListingModel), ("tours", TourModel), ("users", UserModel)):
+            counts[name] = (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+        async def spread(statement, model, total: int) -> list:
+            # Every n-th id rather than random(), so reruns get the same rows
+            stride = max(1, total // sample)
+            statement = statement.where(model.id % stride == 0).order_by(model.id).limit(sample)
+            return list((await session.execute(statement)).all())
+
+        listings = await spread(
+            select(StListingModel.id, StListingModel.host_id), StListingModel, counts["st_listings"]
+        )
+        tours = await spread(select(TourModel.id), TourModel, counts["tours"])
+        customers = await spread(
+            select(UserModel.id, UserModel.email).where(
+                UserModel.role == UserRole.USER, UserModel.is_active.is_(True)
+            ),
+            UserModel,
+            counts["users"],
+        )
+
+    return Fixtures(
+        listing_ids=[row.id for row in listings],
+        host_ids=sorted({row.host_id for row in listings}),
+        tour_ids=[row.id for row in tours],
+        customers=[(row.id, row.email) for row in customers],
+        counts=counts,
+    )
+
+
+def future_stay(rng: random.Random, max_nights: int = 7):
+    check_in = date.today() + timedelta(days=rng.randint(30, 540))
+    return check_in, check_in + timedelta(days=rng.randint(1, max_nights))
+
+
+# Each scenario turns (rng, fixtures, password) into httpx request arguments
+def bnb_search(rng, fx, password):
+    check_in, check_out = future_stay(rng)
+    return "POST", "/api/v1/bnb/search", {"json": {
+        "location": rng.choice(SEARCH_COUNTIES),
+        "check_in": check_in.isoformat(),
+        "check_out": check_out.isoformat(),
+        "guests": rng.randint(1, 6),
+    }}
+
+
+def listing_detail(rng, fx, password):
+    return "GET", f"/api/v1/bnb/listings/{rng.choice(fx.listing_ids)}", {}
+
+
+def booking_create(rng, fx, password):
+    check_in, check_out = future_stay(rng)
+    _, email = rng.choice(fx.customers)
+    return "POST", "/api/v1/bnb/bookings", {"json": {
+        "listing_id": rng.choice(fx.listing_ids),
+        "check_in": check_in.isoformat(),
+        "check_out": check_out.isoformat(),
+        "guests": rng.randint(1, 4),
+        "guest_email": email,
+    }}
+
+
+def tour_booking(rng, fx, password):
+    customer_id, _ = rng.choice(fx.customers)
+    return "POST", "/api/v1/tours/bookings", {"json": {
+        "tour_id": rng.choice(fx.tour_ids),
+        "customer_id": customer_id,
+        "booking_date": (date.today() + timedelta(days=rng.randint(7, 365))).isoformat(),
+        "participants": rng.randint(1, 8),
+    }}
+
+
+def property_radius(rng, fx, password):
+    _, latitude, longitude = rng.choice(SEARCH_CENTRES)
+    return "GET", "/api/v1/property/", {"params": {
+        "latitude": latitude,
+        "longitude": longitude,
+        "radius": rng.choice([2, 5, 10, 25]),
+    }}
+
+
+def login(rng, fx, password):
+    _, email = rng.choice(fx.customers)
+    return "POST", "/api/v1/auth/token", {"data": {"username": email, "password": password}}
+
+
+def host_dashboard(rng, fx, password):
+    return "GET", "/api/v1/bnb/host/dashboard", {"params": {"host_id": rng.choice(fx.host_ids)}}
+
+
+def message_inbox(rng, fx, password):
+    return "GET", "/api/v1/messages/conversations", {
+        "headers": {"Authorization": f"Bearer {rng.choice(fx.tokens)}"},
+    }
+
+
+SCENARIOS: Dict[str, Callable] = {
+    "bnb_search": bnb_search,
+    "listing_detail": listing_detail,
+    "booking_create": booking_create,
+    "tour_booking": tour_booking,
+    "property_radius": property_radius,
+    "login": login,
+    "host_dashboard": host_dashboard,
+    "message_inbox": message_inbox,
+}
+
+# Fixture lists a scenario cannot run without
+REQUIRES = {
+    "listing_detail": "listing_ids",
+    "booking_create": "listing_ids",
+    "host_dashboard": "host_ids",
+    "tour_booking": "tour_ids",
+    "login": "customers",
+    "message_inbox": "tokens",
+}
+
+
+async def log_in(client: httpx.AsyncClient, fx: Fixtures, password: str, count: int) -> None:
+    for _, email in fx.customers[:count]:
+        response = await client.post("/api/v1/auth/token", data={"username": email, "password": password})
+        if response.status_code == 200:
+            fx.tokens.append(response.json()["access_token"])
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    name: str,
+    fx: Fixtures,
+    password: str,
+    requests: int,
+    concurrency: int,
+    warmup: int,
+    seed: int,
+) -> ScenarioResult:
+    rng = random.Random(f"{seed}:{name}")
+    planned = [SCENARIOS[name](rng, fx, password) for _ in range(warmup + requests)]
+    latencies: List[float] = []
+    queries: List[int] = []
+    statuses: Dict[str, int] = {}
+
+    async def send(method: str, url: str, kwargs: dict, measure: bool) -> None:
+        with recording() as recorder:
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            elapsed = time.perf_counter() - started
+        if measure:
+            latencies.append(elapsed)
+            queries.append(recorder.count)
+            statuses[str(response.status_code)] = statuses.get(str(response.status_code), 0) + 1
+
+    for method, url, kwargs in planned[:warmup]:
+        await send(method, url, kwargs, measure=False)
+
+    pending = iter(planned[warmup:])
+
+    async def worker() -> None:
+        for method, url, kwargs in pending:
+            await send(method, url, kwargs, measure=True)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - started
+
+    latencies.sort()
+    queries.sort()
+    return ScenarioResult(
+        requests=requests,
+        errors=sum(count for status, count in statuses.items() if int(status) >= 400),
+        status_codes=statuses,
+        duration_s=round(duration, 3),
+        throughput_rps=round(requests / duration, 2) if duration else 0.0,
+        latency_ms={
+            "p50": round(percentile(latencies, 50) * 1000, 2),
+            "p95": round(percentile(latencies, 95) * 1000, 2),
+            "p99": round(percentile(latencies, 99) * 1000, 2),
+            "max": round(latencies[-1] * 1000, 2) if latencies else 0.0,
+        },
+        queries_per_request={
+            "mean": round(sum(queries) / len(queries), 2) if queries else 0.0,
+            "p95": percentile(queries, 95),
+            "max": queries[-1] if queries else 0,
+        },
+    )
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=APP_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_comparison(results: dict, baseline: dict) -> None:
+    print(f"\nChange against {baseline.get('commit') or 'baseline'} ({baseline.get('started_at', '?')})")
+    cached = results["config"]["response_cache"]
+    if baseline.get("config", {}).get("response_cache", cached) != cached:
+        print(f"warning: response cache was {'off' if cached else 'on'} for the baseline, {'on' if cached else 'off'} now")
+    print(f"{'scenario':<18} {'req/s':>16} {'p95 ms':>18} {'queries':>14}")
+    for name, current in results["scenarios"].items():
+        previous = baseline.get("scenarios", {}).get(name)
+        if previous is None:
+            continue
+
+        def delta(now: float, before: float) -> str:
+            change = f"{(now - before) / before * 100:+.0f}%" if before else "n/a"
+            return f"{before:g}->{now:g} {change}"
+
+        print(
+            f"{name:<18} {delta(current['throughput_rps'], previous['throughput_rps']):>16} "
+            f"{delta(current['latency_ms']['p95'], previous['latency_ms']['p95']):>18} "
+            f"{delta(current['queries_per_request']['mean'], previous['queries_per_request']['mean']):>14}"
+        )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scenario", action="append", choices=list(SCENARIOS), help="Scenario to run; repeatable")
+    parser.add_argument("--requests", type=int, default=200, help="Measured requests per scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per scenario")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--sample", type=int, default=1000, help="Rows sampled per table for request parameters")
+    parser.add_argument("--password", default="password123", help="Password shared by the seeded users")
+    parser.add_argument("--output", help="Results file (default benchmark_results/flows-<commit>.json)")
+    parser.add_argument("--compare", help="Earlier results file to compare against")
+    args = parser.parse_args()
+
+    install(engine)
+    fx = await load_fixtures(args.sample)
+    commit = git_commit()
+    results = {
+        "commit": commit,
+        "started_at": datetime.now(UTC).isoformat(),
+        "python": platform.python_version(),
+        "database": engine.dialect.name,
+        "dataset": fx.counts,
+        "config": {
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "warmup": args.warmup,
+            "seed": args.seed,
+            "response_cache": settings.RESPONSE_CACHE_ENABLED,
+        },
+        "scenarios": {},
+    }
+
+    print(f"dataset: {fx.counts}")
+    print(f"response cache: {'on' if settings.RESPONSE_CACHE_ENABLED else 'off'}")
+    print(f"{'scenario':<18} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'queries':>8} {'errors':>7}")
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        await log_in(client, fx, args.password, count=20)
+        for name in args.scenario or list(SCENARIOS):
+            required = REQUIRES.get(name)
+            if required and not getattr(fx, required):
+                print(f"{name:<18} skipped: no {required} in the database")
+                continue
+            result = await run_scenario(
+                client, name, fx, args.password, args.requests, args.concurrency, args.warmup, args.seed
+            )
+            results["scenarios"][name] = asdict(result)
+            print(
+                f"{name:<18} {result.throughput_rps:>8.1f} {result.latency_ms['p50']:>8.1f} "
+                f"{result.latency_ms['p95']:>8.1f} {result.latency_ms['p99']:>8.1f} "
+                f"{result.queries_per_request['mean']:>8.1f} {result.errors:>7}"
+            )
+
+    output = args.output or os.path.join("benchmark_results", f"flows-{commit or 'unknown'}.json")
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w", encoding="utf-8") as results_file:
+        json.dump(results, results_file, indent=2)
+    print(f"\nwrote {output}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as baseline_file:
+            print_comparison(results, json.load(baseline_file))
+
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
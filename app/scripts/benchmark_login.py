@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark login password checks with and without the password executor.
+
+Fires N concurrent bcrypt verifications, the CPU-bound part of a login, while
+a heartbeat task measures how long the event loop stalls. "inline" runs
+verify_password directly in the coroutine as the handlers used to; "pool"
+goes through verify_password_async. No database is needed.
+
+Usage:
+    python scripts/benchmark_login.py --logins 200 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infrastructure.config.auth import (
+    get_password_hash,
+    password_executor,
+    verify_password,
+    verify_password_async,
+)
+
+
+async def heartbeat(interval: float, lags: list, stop: asyncio.Event) -> None:
+    """Record how late each tick fires; lateness is time the loop was blocked."""
+    while not stop.is_set():
+        expected = time.perf_counter() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(0.0, time.perf_counter() - expected))
+
+
+async def run(mode: str, hashed: str, logins: int, concurrency: int) -> None:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def login() -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            if mode == "inline":
+                ok = verify_password("password123", hashed)
+            else:
+                ok = await verify_password_async("password123", hashed)
+            assert ok
+            latencies.append(time.perf_counter() - started)
+
+    lags: list = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(heartbeat(0.01, lags, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await ticker
+
+    latencies.sort()
+    print(f"{mode}: {logins / elapsed:.1f} logins/s over {elapsed:.2f}s")
+    print(
+        f"  latency p50={statistics.median(latencies) * 1000:.0f}ms "
+        f"p95={latencies[int(len(latencies) * 0.95) - 1] * 1000:.0f}ms"
+    )
+    print(f"  event loop: max stall={max(lags, default=0) * 1000:.0f}ms ticks={len(lags)}")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--mode", choices=["inline", "pool", "both"], default="both")
+    args = parser.parse_args()
+
+    hashed = get_password_hash("password123")
+    modes = ["inline", "pool"] if args.mode == "both" else [args.mode]
+    for mode in modes:
+        await run(mode, hashed, args.logins, args.concurrency)
+
+    stats = password_executor.stats()
+    print(
+        f"executor: workers={stats.max_workers} completed={stats.completed} "
+        f"queue avg={stats.queue_time_avg * 1000:.0f}ms max={stats.queue_time_max * 1000:.0f}ms"
+    )
+    password_executor.shutdown()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+"""
+Benchmark requests/sec through the API middleware chain.
+
+Calls a trivial route in-process over ASGI (no sockets, no database) with
+three stacks:
+
+- bare: no middleware, the floor
+- before: the BaseHTTPMiddleware audit logger and slowapi's
+  SlowAPIMiddleware the app used to run (skipped if slowapi is not
+  installed)
+- after: the pure ASGI chain from api.main, including the rate limiter
+  with the in-memory store
+
+Each is measured on a plain route and on an audited /api/v1/auth route.
+Audit entries are discarded, so only middleware cost is measured.
+
+Usage:
+    python scripts/benchmark_middleware.py --requests 20000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import sys
+import os
+import time
+from datetime import datetime, UTC
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from infrastructure.config.middleware import (
+    AuditLoggingMiddleware,
+    RateLimitMiddleware,
+    UnitOfWorkMiddleware,
+)
+from infrastructure.config.rate_limit import (
+    InMemoryRateLimitStore,
+    RateLimitPolicy,
+    RateLimiter,
+)
+from infrastructure.services.audit_log_writer import AuditLogWriter
+
+CRITICAL_PATHS = {"/api/v1/admin", "/api/v1/auth"}
+PATHS = {"plain": "/api/v1/ping", "audited": "/api/v1/auth/ping"}
+
+
+class DiscardingWriter(AuditLogWriter):
+    """An AuditLogWriter that keeps a count instead of writing."""
+
+    def __init__(self):
+        super().__init__()
+        self.recorded = 0
+
+    def record(self, entry):
+        self.recorded += 1
+        return True
+
+
+class LegacyAuditLoggingMiddleware(BaseHTTPMiddleware):
+    """The previous BaseHTTPMiddleware implementation, for comparison."""
+
+    def __init__(self, app, writer, critical_paths):
+        super().__init__(app)
+        self.writer = writer
+        self.critical_paths = critical_paths
+
+    async def dispatch(self, request: Request, call_next):
+        response = None
+        try:
+            response = await call_next(request)
+            return response
+        finally:
+            if any(request.url.path.startswith(p) for p in self.critical_paths):
+                self.writer.record({
+                    "path": request.url.path,
+                    "method": request.method,
+                    "status_code": response.status_code if response else 500,
+                    "created_at": datetime.now(UTC),
+                })
+
+
+def build_app(stack: str) -> FastAPI:
+    app = FastAPI()
+
+    @app.get(PATHS["plain"])
+    async def ping():
+        return {"ok": True}
+
+    @app.get(PATHS["audited"])
+    async def auth_ping():
+        return {"ok": True}
+
+    writer = DiscardingWriter()
+    if stack == "before":
+        from slowapi import Limiter
+        from slowapi.middleware import SlowAPIMiddleware
+
+        app.state.limiter = Limiter(key_func=lambda request: request.client.host)
+        app.add_middleware(UnitOfWorkMiddleware)
+        app.add_middleware(SlowAPIMiddleware)
+        app.add_middleware(LegacyAuditLoggingMiddleware, writer=writer, critical_paths=CRITICAL_PATHS)
+    elif stack == "after":
+        # High enough that the benchmark is never throttled
+        limiter = RateLimiter(InMemoryRateLimitStore(), RateLimitPolicy("default", 10**9, 60))
+        app.add_middleware(UnitOfWorkMiddleware)
+        app.add_middleware(RateLimitMiddleware, limiter=limiter)
+        app.add_middleware(AuditLoggingMiddleware, writer=writer, critical_paths=CRITICAL_PATHS)
+    if stack != "bare":
+        app.add_middleware(CORSMiddleware, allow_origins=["*"], allow_methods=["*"], allow_headers=["*"])
+    return app
+
+
+async def call(app: FastAPI, path: str) -> int:
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"benchmark")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("benchmark", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    await app(scope, receive, send)
+    return status
+
+
+async def run(app: FastAPI, path: str, requests: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            assert await call(app, path) == 200
+
+    # Warm up so the middleware stack is built before timing
+    await asyncio.gather(*(one() for _ in range(min(200, requests))))
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return requests / (time.perf_counter() - started)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=20000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    args = parser.parse_args()
+
+    results = {}
+    for stack in ("bare", "before", "after"):
+        try:
+            app = build_app(stack)
+        except ImportError as exc:
+            print(f"skipping {stack}: {exc}")
+            continue
+        for label, path in PATHS.items():
+            results[(stack, label)] = await run(app, path, args.requests, args.concurrency)
+
+    print(f"{'stack':<8} {'route':<8} {'req/s':>10} {'vs bare':>8}")
+    for (stack, label), rate in results.items():
+        print(f"{stack:<8} {label:<8} {rate:>10.0f} {rate / results[('bare', label)]:>7.0%}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
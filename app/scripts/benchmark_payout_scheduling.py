@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Benchmark set-based payout scheduling on a large synthetic data set.
+
+Seeds N completed bookings split across BnB, tours and car rentals, runs
+SqlAlchemyPayoutRepository.schedule_payouts twice (the second run must find
+nothing to do) and rolls everything back. Needs a Postgres database at
+DATABASE_URL with migrations applied and at least one user.
+
+Usage:
+    python scripts/benchmark_payout_scheduling.py --bookings 1000000 --hosts 500
+"""
+
+import argparse
+import asyncio
+import sys
+import os
+import time
+from datetime import datetime
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from infrastructure.config.config import settings
+from infrastructure.database.repositories.payout import SqlAlchemyPayoutRepository
+
+
+async def seed(session: AsyncSession, bookings: int, hosts: int) -> None:
+    result = await session.execute(
+        text("SELECT id FROM users ORDER BY id LIMIT :hosts"), {"hosts": hosts}
+    )
+    host_ids = [row.id for row in result]
+    if not host_ids:
+        raise SystemExit("No users found; create at least one user first")
+
+    listing_ids = [row.id for row in await session.execute(text("""
+        INSERT INTO st_listings (host_id, title, type, capacity, nightly_price, address,
+                                 cancellation_policy, instant_book)
+        SELECT h, 'Benchmark listing ' || h, 'ENTIRE', 4, 5000, 'Nairobi', 'MODERATE', false
+        FROM unnest(CAST(:host_ids AS integer[])) AS h
+        RETURNING id
+    """), {"host_ids": host_ids})]
+    tour_ids = [row.id for row in await session.execute(text("""
+        INSERT INTO tours (name, description, price, duration_hours, operator_id, max_participants)
+        SELECT 'Benchmark tour ' || h, 'Benchmark', 3000, 4, h, 10
+        FROM unnest(CAST(:host_ids AS integer[])) AS h
+        RETURNING id
+    """), {"host_ids": host_ids})]
+    vehicle_ids = [row.id for row in await session.execute(text("""
+        INSERT INTO vehicles (make, model, year, daily_rate, owner_id)
+        SELECT 'Toyota', 'Benchmark', 2020, 4000, h
+        FROM unnest(CAST(:host_ids AS integer[])) AS h
+        RETURNING id
+    """), {"host_ids": host_ids})]
+
+    bnb_count = int(bookings * 0.6)
+    tour_count = int(bookings * 0.25)
+    car_count = bookings - bnb_count - tour_count
+
+    await session.execute(text("""
+        INSERT INTO bookings (guest_id, listing_id, check_in, check_out, guests, status,
+                              amount_total, currency)
+        SELECT :guest_id, (CAST(:ids AS integer[]))[1 + g % :n],
+               current_date - 33 - g % 300, current_date - 30 - g % 300, 2, 'COMPLETED',
+               1000 + g % 9000, 'KES'
+        FROM generate_series(1, :count) AS g
+    """), {"guest_id": host_ids[0], "ids": listing_ids, "n": len(listing_ids), "count": bnb_count})
+    await session.execute(text("""
+        INSERT INTO tour_bookings (tour_id, customer_id, booking_date, participants, total_price, status)
+        SELECT (CAST(:ids AS integer[]))[1 + g % :n], :guest_id, current_date - 30 - g % 300,
+               2, 500 + g % 5000, 'COMPLETED'
+        FROM generate_series(1, :count) AS g
+    """), {"guest_id": host_ids[0], "ids": tour_ids, "n": len(tour_ids), "count": tour_count})
+    await session.execute(text("""
+        INSERT INTO car_rentals (vehicle_id, renter_id, pickup_date, return_date, total_cost, status)
+        SELECT (CAST(:ids AS integer[]))[1 + g % :n], :guest_id,
+               now() - interval '33 days' - (g % 300) * interval '1 day',
+               now() - interval '30 days' - (g % 300) * interval '1 day',
+               2000 + g % 8000, 'COMPLETED'
+        FROM generate_series(1, :count) AS g
+    """), {"guest_id": host_ids[0], "ids": vehicle_ids, "n": len(vehicle_ids), "count": car_count})
+    for table in ("bookings", "tour_bookings", "car_rentals"):
+        await session.execute(text(f"ANALYZE {table}"))
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--bookings", type=int, default=1_000_000)
+    parser.add_argument("--hosts", type=int, default=500)
+    args = parser.parse_args()
+
+    engine = create_async_engine(settings.DATABASE_URL)
+    async with engine.connect() as conn:
+        outer = await conn.begin()
+        # Repository commits become savepoint releases; the outer rollback undoes everything
+        session = AsyncSession(bind=conn, join_transaction_mode="create_savepoint")
+        try:
+            started = time.perf_counter()
+            await seed(session, args.bookings, args.hosts)
+            print(f"Seeded {args.bookings} completed bookings in {time.perf_counter() - started:.1f}s")
+
+            repository = SqlAlchemyPayoutRepository(session)
+            for label in ("first run", "re-run"):
+                started = time.perf_counter()
+                summary = await repository.schedule_payouts(datetime.utcnow().date(), datetime.utcnow())
+                print(
+                    f"{label}: {summary.payouts_created} payouts, {summary.bookings_paid_out} bookings, "
+                    f"total {summary.total_amount} in {time.perf_counter() - started:.2f}s"
+                )
+        finally:
+            await session.close()
+            await outer.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
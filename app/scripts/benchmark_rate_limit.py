@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Benchmark the per-request cost of rate limiting.
+
+Times what RateLimitMiddleware does for each request: pick the policy for
+the path, derive the client key (verifying the bearer token, cached after
+the first sight of each token), and count the hit in the store. Runs
+against the in-memory store, and against Redis when --redis-url is given.
+
+Usage:
+    python scripts/benchmark_rate_limit.py --requests 100000 --users 1000
+    python scripts/benchmark_rate_limit.py --redis-url redis://localhost:6379/0
+"""
+
+import argparse
+import asyncio
+import random
+import statistics
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from infrastructure.config.auth import create_access_token
+from infrastructure.config.rate_limit import (
+    InMemoryRateLimitStore,
+    RateLimitPolicy,
+    RateLimiter,
+    RedisRateLimitStore,
+    client_key,
+)
+
+PATHS = ["/api/v1/bnb/listings", "/api/v1/bnb/search", "/api/v1/auth/token", "/api/v1/reviews/bnb/1"]
+
+
+async def run(label: str, limiter: RateLimiter, tokens: list, requests: int) -> None:
+    timings = []
+    limited = 0
+    for i in range(requests):
+        path = PATHS[i % len(PATHS)]
+        # Mix of signed-in users and anonymous clients
+        authorization = f"Bearer {random.choice(tokens)}" if i % 4 else None
+        started = time.perf_counter()
+        policy = limiter.policy_for(path)
+        key = client_key(authorization, f"10.0.{i % 256}.{i % 7}")
+        if policy is not None:
+            result = await limiter.hit(policy, key)
+            limited += not result.allowed
+        timings.append(time.perf_counter() - started)
+
+    timings.sort()
+    print(
+        f"{label}: mean={statistics.fmean(timings) * 1e6:.1f}us "
+        f"p50={timings[len(timings) // 2] * 1e6:.1f}us "
+        f"p99={timings[int(len(timings) * 0.99)] * 1e6:.1f}us "
+        f"limited={limited}/{requests}"
+    )
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--redis-url")
+    args = parser.parse_args()
+
+    tokens = [create_access_token(user_id) for user_id in range(1, args.users + 1)]
+    default = RateLimitPolicy.parse("default", "120/minute")
+    routes = [
+        ("/api/v1/auth/token", RateLimitPolicy.parse("auth", "10/minute")),
+        ("/api/v1/bnb/search", RateLimitPolicy.parse("search", "300/minute")),
+    ]
+
+    await run("memory", RateLimiter(InMemoryRateLimitStore(), default, routes), tokens, args.requests)
+    if args.redis_url:
+        store = RedisRateLimitStore(args.redis_url)
+        try:
+            await run("redis", RateLimiter(store, default, routes), tokens, args.requests)
+        finally:
+            await store.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark the payment reconciliation worker against the fake provider.
+
+Runs ReconcilePendingPaymentsUseCase over N synthetic stale intents held in
+memory, so no database or network access is needed.
+
+Usage:
+    python scripts/benchmark_reconciliation.py --intents 5000 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import sys
+import os
+import time
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import cast
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from domain.entities.payment import PaymentIntent
+from domain.repositories.payment import PaymentRepository
+from application.use_cases.payment.reconcile_payments import ReconcilePendingPaymentsUseCase
+from infrastructure.external_services.payment.fake_provider import FakePaymentProvider
+from infrastructure.external_services.payment.mpesa_service import MpesaPaymentService
+from infrastructure.external_services.payment.stripe_service import StripePaymentService
+
+
+class InMemoryIntentStore:
+    """The two repository calls reconciliation makes, backed by a list."""
+
+    def __init__(self, intents):
+        self.intents = intents
+        self.claimed = set()
+        self.bulk_updates = 0
+
+    async def claim_stale_pending_intents(self, older_than, limit=500, lease=None):
+        page = [
+            intent for intent in self.intents
+            if intent.id not in self.claimed and intent.status in ("pending", "processing")
+            and intent.created_at < older_than
+        ][:limit]
+        self.claimed.update(intent.id for intent in page)
+        return page
+
+    async def update_payment_statuses(self, updates):
+        self.bulk_updates += 1
+        by_id = dict(updates)
+        for intent in self.intents:
+            if intent.intent_id in by_id:
+                intent.status = by_id[intent.intent_id]
+        return len(by_id)
+
+
+def make_intents(count: int):
+    created = datetime.utcnow() - timedelta(hours=1)
+    return [
+        PaymentIntent(
+            id=i,
+            intent_id=f"{'pi' if i % 2 else 'ws_CO'}_{i}",
+            amount=Decimal("1000"),
+            payment_method="stripe" if i % 2 else "mpesa",
+            booking_id=i,
+            booking_type="bnb",
+            customer_id=1,
+            status="pending",
+            created_at=created,
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--intents", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.05, help="Mean provider latency in seconds")
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--mpesa-rps", type=float, default=100.0)
+    parser.add_argument("--stripe-rps", type=float, default=100.0)
+    args = parser.parse_args()
+
+    store = InMemoryIntentStore(make_intents(args.intents))
+    provider = FakePaymentProvider(latency=args.latency, error_rate=args.error_rate, seed=42)
+    use_case = ReconcilePendingPaymentsUseCase(
+        payment_repository=lambda: cast(PaymentRepository, store),
+        stripe_service=cast(StripePaymentService, provider),
+        mpesa_service=cast(MpesaPaymentService, provider),
+        concurrency=args.concurrency,
+        rate_limits={"mpesa": args.mpesa_rps, "stripe": args.stripe_rps},
+    )
+
+    started = time.perf_counter()
+    stats = await use_case.execute()
+    elapsed = time.perf_counter() - started
+
+    sequential = provider.calls * args.latency
+    print(f"Reconciled {stats['checked']} intents in {elapsed:.2f}s")
+    print(f"  updated={stats['updated']} errors={stats['errors']} provider_calls={provider.calls}")
+    print(f"  peak in-flight calls={provider.peak_in_flight} bulk updates={store.bulk_updates}")
+    print(f"  sequential estimate={sequential:.1f}s ({sequential / elapsed:.1f}x speed-up)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
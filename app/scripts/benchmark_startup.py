@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Benchmark API cold start: import time and time to first request.
+
+Starts a fresh interpreter per run with ``-X importtime``, imports
+api.main and sends one in-process ASGI request, so every run pays the full
+cold-start cost. Reports the median import and first-request times per
+API_DOMAINS value, and which top-level packages and modules the import
+time went to in the first configuration.
+
+Usage:
+    python scripts/benchmark_startup.py --runs 5
+    python scripts/benchmark_startup.py --domains all --domains bnb,search --top 15
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+APP_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def child(path: str) -> None:
+    """Measure one cold start in this (fresh) process and print it as JSON."""
+    sys.path.insert(0, APP_ROOT)
+    started = time.perf_counter()
+    from api.main import app
+    imported = time.perf_counter()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"host", b"benchmark")],
+        "client": ("127.0.0.1", 50000),
+        "server": ("benchmark", 80),
+    }
+    status = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+
+    asyncio.run(app(scope, receive, send))
+    answered = time.perf_counter()
+    print(json.dumps({
+        "import": imported - started,
+        "first_request": answered - imported,
+        "status": status,
+        "routes": len(app.routes),
+    }))
+
+
+def parse_importtime(stderr: str):
+    """Self time per module from ``-X importtime`` output, in seconds."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        modules[name.strip()] = int(self_us) / 1e6
+    return modules
+
+
+def measure(domains: str, path: str):
+    env = {**os.environ, "API_DOMAINS": domains}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.abspath(__file__), "--child", "--path", path],
+        cwd=APP_ROOT, env=env, capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"cold start failed for API_DOMAINS={domains}:\n{proc.stderr[-2000:]}")
+    return json.loads(proc.stdout.strip().splitlines()[-1]), parse_importtime(proc.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--domains", action="append", help="API_DOMAINS value to measure; repeatable")
+    parser.add_argument("--path", default="/", help="Path of the first request")
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.path)
+        return
+
+    configurations = args.domains or ["all"]
+    breakdown = None
+    print(f"{'API_DOMAINS':<24} {'routes':>6} {'import':>9} {'first req':>10}")
+    for domains in configurations:
+        results = []
+        for _ in range(args.runs):
+            result, modules = measure(domains, args.path)
+            results.append(result)
+            if breakdown is None:
+                breakdown = modules
+        print(
+            f"{domains:<24} {results[0]['routes']:>6} "
+            f"{statistics.median(r['import'] for r in results) * 1000:>7.0f}ms "
+            f"{statistics.median(r['first_request'] for r in results) * 1000:>8.1f}ms"
+        )
+
+    by_package = defaultdict(float)
+    for name, seconds in breakdown.items():
+        by_package[name.split(".", 1)[0]] += seconds
+    print(f"\nImport time by top-level package (API_DOMAINS={configurations[0]}, one run)")
+    for package, seconds in sorted(by_package.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {seconds * 1000:>8.1f}ms  {package}")
+    print("\nSlowest modules by self time")
+    for name, seconds in sorted(breakdown.items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {seconds * 1000:>8.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
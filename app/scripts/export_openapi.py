@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Write the API's OpenAPI schema to a file at build time.
+
+Point OPENAPI_SCHEMA_PATH at the output and each worker serves the file
+instead of generating the schema on the first /openapi.json request.
+Regenerate it whenever routes or DTOs change, or the docs will be stale.
+
+Usage:
+    python scripts/export_openapi.py --output openapi.json
+"""
+
+import argparse
+import json
+import sys
+import os
+import time
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.main import build_openapi
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--output", default="openapi.json")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    schema = build_openapi()
+    elapsed = time.perf_counter() - started
+    with open(args.output, "w", encoding="utf-8") as schema_file:
+        json.dump(schema, schema_file, separators=(",", ":"))
+    print(f"wrote {len(schema.get('paths', {}))} paths to {args.output} (generated in {elapsed * 1000:.0f}ms)")
+
+
+if __name__ == "__main__":
+    main()
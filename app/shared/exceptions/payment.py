@@ -29,3 +29,7 @@ class RefundError(PaymentException):
 class WebhookVerificationError(PaymentException):
     """Raised when webhook signature verification fails"""
     pass
+
+class LedgerImbalanceError(PaymentException):
+    """Raised when a ledger posting's lines do not sum to zero"""
+    pass
@@ -0,0 +1,21 @@
+from domain.entities.ledger import LedgerAccount, LedgerAccountKind
+from infrastructure.database.models.ledger import LedgerAccountModel
+
+
+class LedgerMapper:
+    """Mapper for converting between ledger entities and database models"""
+
+    @staticmethod
+    def account_model_to_entity(model: LedgerAccountModel) -> LedgerAccount:
+        """Convert LedgerAccountModel to LedgerAccount entity"""
+        return LedgerAccount(
+            id=model.id,
+            kind=LedgerAccountKind(model.kind),
+            owner_id=model.owner_id,
+            currency=model.currency,
+            balance=model.balance,
+            credits_total=model.credits_total,
+            debits_total=model.debits_total,
+            last_entry_id=model.last_entry_id,
+            updated_at=model.updated_at,
+        )
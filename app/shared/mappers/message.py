@@ -1,6 +1,9 @@
 """Message entity to model mapper."""
-from domain.entities.message import Message
-from infrastructure.database.models.message import Message as MessageModel
+from domain.entities.message import Message, MessageThread
+from infrastructure.database.models.message import (
+    Message as MessageModel,
+    ConversationThread as ConversationThreadModel,
+)
 
 
 class MessageMapper:
@@ -18,6 +21,7 @@ class MessageMapper:
             read_at=model.read_at,
             parent_message_id=model.parent_message_id,
             is_system_message=model.is_system_message,
+            thread_id=model.thread_id,
             created_at=model.created_at,
             updated_at=model.updated_at
         )
@@ -35,5 +39,22 @@ class MessageMapper:
             is_read=entity.is_read,
             read_at=entity.read_at,
             parent_message_id=entity.parent_message_id,
-            is_system_message=entity.is_system_message
+            is_system_message=entity.is_system_message,
+            thread_id=entity.thread_id
+        )
+
+    @staticmethod
+    def thread_model_to_entity(model: ConversationThreadModel) -> MessageThread:
+        return MessageThread(
+            id=model.id,
+            booking_type=model.booking_type,
+            booking_id=model.booking_id,
+            participant_1_id=model.participant_1_id,
+            participant_2_id=model.participant_2_id,
+            last_message_id=model.last_message_id,
+            last_message_sender_id=model.last_message_sender_id,
+            last_message_preview=model.last_message_preview,
+            last_message_at=model.last_message_at,
+            unread_count_participant_1=model.unread_count_participant_1,
+            unread_count_participant_2=model.unread_count_participant_2
         )
@@ -2,8 +2,8 @@ from typing import Optional
 from datetime import datetime
 from decimal import Decimal
 
-from domain.entities.payment import Payment, PaymentIntent, Refund
-from infrastructure.database.models.payment import PaymentModel, PaymentIntentModel, RefundModel
+from domain.entities.payment import Payment, PaymentIntent, Refund, PaymentWebhookEvent
+from infrastructure.database.models.payment import PaymentModel, PaymentIntentModel, RefundModel, PaymentWebhookEventModel
 
 
 class PaymentMapper:
@@ -83,7 +83,7 @@ class PaymentMapper:
             booking_type=model.booking_type,
             customer_id=model.customer_id,
             status=model.status,
-            metadata=model.metadata,
+            metadata=model.extra,
             expires_at=model.expires_at,
             created_at=model.created_at,
             updated_at=model.updated_at
@@ -120,3 +120,20 @@ class PaymentMapper:
             created_at=model.created_at,
             updated_at=model.updated_at
         )
+
+    @staticmethod
+    def webhook_event_model_to_entity(model: PaymentWebhookEventModel) -> PaymentWebhookEvent:
+        """Convert PaymentWebhookEventModel to PaymentWebhookEvent entity"""
+        return PaymentWebhookEvent(
+            id=model.id,
+            provider=model.provider,
+            event_id=model.event_id,
+            event_type=model.event_type,
+            payment_intent_id=model.payment_intent_id,
+            payload=model.payload,
+            status=model.status,
+            attempts=model.attempts,
+            last_error=model.last_error,
+            processed_at=model.processed_at,
+            created_at=model.created_at
+        )
@@ -15,6 +15,7 @@ class UserMapper:
             phone_number=model.phone,  # Optional phone field
             agent_license_id=model.agent_license_id,
             agency_name=model.agency_name,
+            token_version=model.token_version,
             created_at=model.created_at,
             updated_at=model.updated_at,
         )
@@ -31,6 +32,7 @@ class UserMapper:
             agent_license_id=getattr(entity, 'agent_license_id', None),
             agency_name=getattr(entity, 'agency_name', None),
             is_active=entity.is_active,
+            token_version=getattr(entity, 'token_version', 0),
             created_at=entity.created_at,
             updated_at=entity.updated_at,
         )
@@ -25,11 +25,21 @@ from .pagination import (
     PaginationParams,
     PaginationResult,
     paginate_query,
+    encode_keyset_cursor,
+    decode_keyset_cursor,
 )
 from .slug_utils import (
     create_slug,
     ensure_unique_slug,
 )
+from .bloom import BloomFilter
+from .sql import fingerprint
+from .concurrency import (
+    AsyncRateLimiter,
+    BoundedExecutor,
+    ExecutorStats,
+    backoff_delay,
+)
 
 __all__ = [
     # Date utilities
@@ -54,7 +64,18 @@ __all__ = [
     "PaginationParams",
     "PaginationResult",
     "paginate_query",
+    "encode_keyset_cursor",
+    "decode_keyset_cursor",
     # Slug utilities
     "create_slug",
     "ensure_unique_slug",
+    # Membership
+    "BloomFilter",
+    # SQL
+    "fingerprint",
+    # Concurrency
+    "AsyncRateLimiter",
+    "BoundedExecutor",
+    "ExecutorStats",
+    "backoff_delay",
 ]
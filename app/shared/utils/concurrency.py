@@ -0,0 +1,138 @@
+"""Helpers for pacing concurrent calls and offloading blocking work."""
+
+import asyncio
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket limiting how often callers may proceed.
+
+    Args:
+        rate: Tokens added per second
+        burst: Bucket capacity; defaults to one second's worth of tokens
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.capacity = float(burst if burst is not None else max(1, int(rate)))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                # Holding the lock keeps waiters in FIFO order
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def backoff_delay(attempt: int, base: float = 0.5, cap: float = 30.0) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    Args:
+        attempt: Zero-based retry attempt
+        base: Delay ceiling for the first retry in seconds
+        cap: Maximum delay ceiling in seconds
+
+    Returns:
+        Seconds to wait before the next attempt
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+@dataclass
+class ExecutorStats:
+    """Snapshot of a BoundedExecutor's counters; times are in seconds."""
+    max_workers: int
+    in_flight: int
+    waiting: int
+    completed: int
+    queue_time_total: float
+    queue_time_max: float
+    run_time_total: float
+
+    @property
+    def queue_time_avg(self) -> float:
+        return self.queue_time_total / self.completed if self.completed else 0.0
+
+
+class BoundedExecutor:
+    """
+    Thread pool for blocking CPU work, capped so bursts queue on the event loop.
+
+    At most *max_workers* calls are handed to the pool at once; further
+    callers wait on a semaphore instead of piling up in the pool's
+    unbounded queue, and the time they spend waiting is recorded.
+
+    Args:
+        max_workers: Threads in the pool and maximum calls in flight
+        name: Thread name prefix
+    """
+
+    def __init__(self, max_workers: int, name: str = "bounded"):
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.max_workers = max_workers
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._in_flight = 0
+        self._waiting = 0
+        self._completed = 0
+        self._queue_time_total = 0.0
+        self._queue_time_max = 0.0
+        self._run_time_total = 0.0
+
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run ``fn(*args)`` on the pool and return its result."""
+        if self._semaphore is None:
+            # Created lazily so it binds to the loop that first uses it
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        queued = time.perf_counter()
+        self._waiting += 1
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self._waiting -= 1
+        started = time.perf_counter()
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+        finally:
+            self._in_flight -= 1
+            self._semaphore.release()
+            waited = started - queued
+            self._completed += 1
+            self._queue_time_total += waited
+            self._queue_time_max = max(self._queue_time_max, waited)
+            self._run_time_total += time.perf_counter() - started
+
+    def stats(self) -> ExecutorStats:
+        return ExecutorStats(
+            max_workers=self.max_workers,
+            in_flight=self._in_flight,
+            waiting=self._waiting,
+            completed=self._completed,
+            queue_time_total=self._queue_time_total,
+            queue_time_max=self._queue_time_max,
+            run_time_total=self._run_time_total,
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._pool.shutdown(wait=wait)
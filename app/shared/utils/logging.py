@@ -2,7 +2,7 @@
 
 import structlog
 import logging.config
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 import json
 
@@ -244,6 +244,76 @@ def log_database_query(
     )
 
 
+def log_slow_query(
+    fingerprint: str,
+    duration_ms: float,
+    threshold_ms: float,
+    database: str,
+    route: Optional[str] = None
+):
+    """
+    Log a SQL statement that ran longer than the slow-query threshold.
+    
+    Args:
+        fingerprint: Statement with literals and parameters replaced by ?
+        duration_ms: Execution time in milliseconds
+        threshold_ms: Slow-query threshold in milliseconds
+        database: Engine that ran it (primary or replica)
+        route: Route template or job that issued it
+    """
+    logger = get_logger("slow_queries")
+    logger.warning(
+        "Slow query",
+        fingerprint=fingerprint,
+        duration_ms=round(duration_ms, 2),
+        threshold_ms=threshold_ms,
+        database=database,
+        route=route,
+        timestamp=datetime.now().isoformat()
+    )
+
+
+def log_query_plan(
+    fingerprint: str,
+    plan: str,
+    duration_ms: float,
+    database: str
+):
+    """
+    Log the EXPLAIN output captured for a slow statement.
+    
+    Args:
+        fingerprint: Statement with literals and parameters replaced by ?
+        plan: Query plan as returned by the database
+        duration_ms: Execution time of the statement that was explained
+        database: Engine that ran it (primary or replica)
+    """
+    logger = get_logger("slow_queries")
+    logger.warning(
+        "Slow query plan",
+        fingerprint=fingerprint,
+        plan=plan,
+        duration_ms=round(duration_ms, 2),
+        database=database,
+        timestamp=datetime.now().isoformat()
+    )
+
+
+def log_query_summary(statements: List[Dict[str, Any]]):
+    """
+    Log aggregated timings of the most expensive statement fingerprints.
+    
+    Args:
+        statements: Per-fingerprint counts and percentiles, costliest first
+    """
+    logger = get_logger("slow_queries")
+    logger.info(
+        "Query summary",
+        statements=statements,
+        timestamp=datetime.now().isoformat()
+    )
+
+
 def log_error(
     error: Exception,
     context: Optional[Dict[str, Any]] = None,
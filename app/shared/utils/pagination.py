@@ -1,7 +1,9 @@
 """Pagination utility functions and classes."""
 
+import base64
 from dataclasses import dataclass
-from typing import List, TypeVar, Generic, Optional, Any, Dict
+from datetime import datetime
+from typing import List, TypeVar, Generic, Optional, Any, Dict, Tuple
 from math import ceil
 
 T = TypeVar('T')
@@ -235,3 +237,39 @@ class CursorPagination:
             "previous_cursor": previous_cursor,
             "page_size": self.page_size
         }
+
+
+def encode_keyset_cursor(created_at: datetime, item_id: int) -> str:
+    """
+    Encode a ``(created_at, id)`` keyset position as an opaque URL-safe token.
+    
+    Args:
+        created_at: Timestamp of the last item on the current page
+        item_id: ID of the last item, used as a tie-breaker
+        
+    Returns:
+        Cursor string to hand back to clients
+    """
+    raw = f"{created_at.isoformat()}|{item_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_keyset_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by :func:`encode_keyset_cursor`.
+    
+    Args:
+        cursor: Opaque cursor string
+        
+    Returns:
+        ``(created_at, id)`` tuple
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at_raw, item_id_raw = base64.urlsafe_b64decode(padded).decode().split("|", 1)
+        return datetime.fromisoformat(created_at_raw), int(item_id_raw)
+    except Exception as exc:
+        raise ValueError("Invalid pagination cursor") from exc
@@ -0,0 +1,32 @@
+"""Helpers for reasoning about SQL statement text."""
+
+import re
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+# asyncpg ($1), psycopg (%(name)s, %s), sqlite (?) and named (:name) parameters
+_PARAMETER = re.compile(r"\$\d+|%\(\w+\)s|%s|(?<![:\w]):\w+|\?")
+_NUMBER = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_VALUE_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """
+    Normalise a SQL statement so executions differing only in values match.
+
+    Literals and bind parameters become ``?`` and value lists collapse to
+    ``(...)``, so ``WHERE id IN ($1, $2, $3)`` and ``WHERE id IN ($1)``
+    share a fingerprint.
+
+    Args:
+        statement: SQL text as sent to the driver
+
+    Returns:
+        Single-line normalised statement
+    """
+    text = _STRING.sub("?", statement)
+    text = _PARAMETER.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _WHITESPACE.sub(" ", text).strip()
+    text = _VALUE_LIST.sub("(...)", text)
+    return text.replace("(?)", "(...)")
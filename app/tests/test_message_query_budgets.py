@@ -0,0 +1,107 @@
+"""The message endpoints stay within their declared query budgets."""
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+import pytest_asyncio
+
+from infrastructure.config.auth import create_access_token
+from infrastructure.config.database import AsyncSessionLocal
+import infrastructure.database.models  # noqa: F401  (configures every mapper)
+from infrastructure.database.models.message import ConversationThread, Message
+from infrastructure.database.models.user import User
+
+# Enough threads and messages that a per-row lookup would repeat past its budget
+THREADS = 5
+MESSAGES_PER_THREAD = 4
+
+TABLES = [User.__table__, ConversationThread.__table__, Message.__table__]
+
+
+def _create_tables(conn):
+    metadata = User.metadata
+    metadata.drop_all(conn, tables=TABLES[::-1])
+    metadata.create_all(conn, tables=TABLES)
+
+
+def _drop_tables(conn):
+    User.metadata.drop_all(conn, tables=TABLES[::-1])
+
+
+@pytest_asyncio.fixture
+async def inbox(query_budget_engine):
+    async with query_budget_engine.begin() as conn:
+        await conn.run_sync(_create_tables)
+
+    started = datetime(2026, 1, 1, 12, 0)
+    async with AsyncSessionLocal() as session:
+        owner = User(email="owner@example.com", name="Inbox Owner", hashed_password="x")
+        others = [
+            User(email=f"guest{n}@example.com", name=f"Guest {n}", hashed_password="x")
+            for n in range(THREADS)
+        ]
+        session.add_all([owner, *others])
+        await session.flush()
+
+        for n, other in enumerate(others):
+            low, high = sorted((owner.id, other.id))
+            thread = ConversationThread(
+                booking_type="bnb", booking_id=100 + n, participant_1_id=low, participant_2_id=high,
+            )
+            session.add(thread)
+            await session.flush()
+            for m in range(MESSAGES_PER_THREAD):
+                sender, recipient = (other, owner) if m % 2 == 0 else (owner, other)
+                session.add(Message(
+                    booking_type="bnb", booking_id=100 + n, thread_id=thread.id,
+                    sender_id=sender.id, recipient_id=recipient.id, body=f"Message {m}",
+                    created_at=started + timedelta(minutes=10 * n + m),
+                ))
+            thread.last_message_at = started + timedelta(minutes=10 * n + MESSAGES_PER_THREAD)
+            thread.last_message_preview = f"Message {MESSAGES_PER_THREAD - 1}"
+        await session.commit()
+        owner_id, other_ids = owner.id, [other.id for other in others]
+
+    yield owner_id, other_ids
+
+    async with query_budget_engine.begin() as conn:
+        await conn.run_sync(_drop_tables)
+
+
+@pytest_asyncio.fixture
+async def client(inbox, query_budget_app):
+    owner_id, _ = inbox
+    token = create_access_token(owner_id, claims={"ver": 0})
+    transport = httpx.ASGITransport(app=query_budget_app)
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://testserver",
+        headers={"Authorization": f"Bearer {token}"},
+    ) as client:
+        yield client
+
+
+@pytest.mark.asyncio
+async def test_inbox_within_budget(client):
+    response = await client.get("/api/v1/messages/conversations")
+    assert response.status_code == 200
+    threads = response.json()
+    assert len(threads) == THREADS
+    assert {thread["other_participant_name"] for thread in threads} == {f"Guest {n}" for n in range(THREADS)}
+
+
+@pytest.mark.asyncio
+async def test_conversation_page_within_budget(client, inbox):
+    _, other_ids = inbox
+    response = await client.get(f"/api/v1/messages/conversations/bnb/100/{other_ids[0]}")
+    assert response.status_code == 200
+    page = response.json()
+    assert len(page["messages"]) == MESSAGES_PER_THREAD
+    assert {message["sender_name"] for message in page["messages"]} == {"Inbox Owner", "Guest 0"}
+
+
+@pytest.mark.asyncio
+async def test_stats_within_budget(client):
+    response = await client.get("/api/v1/messages/stats")
+    assert response.status_code == 200
+    assert response.json()["conversations_count"] == THREADS
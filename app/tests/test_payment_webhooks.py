@@ -0,0 +1,117 @@
+"""The webhook consumer job applies stored inbox events to payment intents."""
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from application.dto.payment import PaymentStatus
+from infrastructure.config.database import AsyncSessionLocal, engine
+from infrastructure.config.tasks import process_payment_webhooks_job
+import infrastructure.database.models  # noqa: F401  (configures every mapper)
+from infrastructure.database.models.ledger import (
+    LedgerAccountModel,
+    LedgerEntryModel,
+    LedgerTransactionModel,
+)
+from infrastructure.database.models.payment import PaymentIntentModel, PaymentWebhookEventModel
+from infrastructure.database.models.user import User
+from infrastructure.database.repositories.payment import (
+    SqlAlchemyPaymentRepository,
+    SqlAlchemyPaymentWebhookRepository,
+)
+
+pytestmark = pytest.mark.skipif(
+    engine.dialect.name != "postgresql",
+    reason="the webhook inbox uses PostgreSQL-only SQL; set TEST_DATABASE_URL",
+)
+
+TABLES = [
+    User.__table__,
+    PaymentIntentModel.__table__,
+    PaymentWebhookEventModel.__table__,
+    LedgerAccountModel.__table__,
+    LedgerTransactionModel.__table__,
+    LedgerEntryModel.__table__,
+]
+
+
+@pytest_asyncio.fixture
+async def pending_intent():
+    def create(conn):
+        User.metadata.drop_all(conn, tables=TABLES[::-1])
+        User.metadata.create_all(conn, tables=TABLES)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(create)
+    async with AsyncSessionLocal() as session:
+        customer = User(email="guest@example.com", name="Guest", hashed_password="x")
+        session.add(customer)
+        await session.flush()
+        session.add(PaymentIntentModel(
+            intent_id="pi_123", amount=Decimal("2500.00"), currency="KES", payment_method="stripe",
+            booking_id=1, booking_type="bnb", customer_id=customer.id, status="pending",
+        ))
+        await session.commit()
+    yield "pi_123"
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: User.metadata.drop_all(sync_conn, tables=TABLES[::-1]))
+
+
+@pytest.mark.asyncio
+async def test_job_applies_inbox_event(pending_intent):
+    async with AsyncSessionLocal() as session:
+        stored = await SqlAlchemyPaymentWebhookRepository(session).record_event(
+            "stripe", "evt_1", "payment_intent.succeeded", pending_intent, {"id": "evt_1"}
+        )
+    assert stored
+
+    await process_payment_webhooks_job()
+
+    async with AsyncSessionLocal() as session:
+        intent = (await session.execute(select(PaymentIntentModel))).scalar_one()
+        event = (await session.execute(select(PaymentWebhookEventModel))).scalar_one()
+        entries = (await session.execute(select(func.count()).select_from(LedgerEntryModel))).scalar_one()
+    assert intent.status == "completed"
+    assert (event.status, event.attempts, event.last_error) == ("processed", 1, None)
+    assert entries == 2
+
+
+def _charge_refunded(event_id, intent_id, fully):
+    charge = {"object": "charge", "payment_intent": intent_id, "refunded": fully}
+    return {"id": event_id, "type": "charge.refunded", "data": {"object": charge}}
+
+
+@pytest.mark.asyncio
+async def test_capture_and_refund_in_one_batch(pending_intent):
+    async with AsyncSessionLocal() as session:
+        inbox = SqlAlchemyPaymentWebhookRepository(session)
+        await inbox.record_event("stripe", "evt_1", "payment_intent.succeeded", pending_intent, {"id": "evt_1"})
+        await inbox.record_event(
+            "stripe", "evt_2", "charge.refunded", pending_intent, _charge_refunded("evt_2", pending_intent, False)
+        )
+        await inbox.record_event(
+            "stripe", "evt_3", "charge.refunded", pending_intent, _charge_refunded("evt_3", pending_intent, True)
+        )
+
+    await process_payment_webhooks_job()
+
+    async with AsyncSessionLocal() as session:
+        intent = (await session.execute(select(PaymentIntentModel))).scalar_one()
+        entries = (await session.execute(select(func.count()).select_from(LedgerEntryModel))).scalar_one()
+    assert intent.status == "refunded"
+    assert entries == 4
+
+
+@pytest.mark.asyncio
+async def test_single_status_update_is_guarded_and_posted(pending_intent):
+    async with AsyncSessionLocal() as session:
+        payments = SqlAlchemyPaymentRepository(session)
+        await payments.update_payment_status(pending_intent, PaymentStatus.COMPLETED)
+        await payments.update_payment_status(pending_intent, PaymentStatus.FAILED)
+
+    async with AsyncSessionLocal() as session:
+        intent = (await session.execute(select(PaymentIntentModel))).scalar_one()
+        entries = (await session.execute(select(func.count()).select_from(LedgerEntryModel))).scalar_one()
+    assert intent.status == "completed"
+    assert entries == 2
@@ -0,0 +1,59 @@
+"""Payout balances come from the ledger accounts a payout moves money through."""
+from decimal import Decimal
+
+import pytest
+import pytest_asyncio
+
+from application.use_cases.payout.get_payout_balance import GetPayoutBalanceUseCase
+from domain.services import ledger_postings
+from infrastructure.config.database import AsyncSessionLocal, engine
+from infrastructure.database.models.ledger import (
+    LedgerAccountModel,
+    LedgerEntryModel,
+    LedgerTransactionModel,
+)
+from infrastructure.database.repositories.ledger import SqlAlchemyLedgerRepository
+
+pytestmark = pytest.mark.skipif(
+    engine.dialect.name != "postgresql",
+    reason="ledger postings use PostgreSQL-only SQL; set TEST_DATABASE_URL",
+)
+
+TABLES = [LedgerAccountModel.__table__, LedgerTransactionModel.__table__, LedgerEntryModel.__table__]
+HOST_ID = 42
+
+
+@pytest_asyncio.fixture
+async def ledger():
+    def create(conn):
+        LedgerAccountModel.metadata.drop_all(conn, tables=TABLES[::-1])
+        LedgerAccountModel.metadata.create_all(conn, tables=TABLES)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(create)
+    async with AsyncSessionLocal() as session:
+        yield SqlAlchemyLedgerRepository(session)
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: LedgerAccountModel.metadata.drop_all(sync_conn, tables=TABLES[::-1]))
+
+
+@pytest.mark.asyncio
+async def test_scheduled_payout_is_not_available(ledger):
+    amount = Decimal("3000.00")
+    await ledger.post([
+        ledger_postings.payment_captured("pi_1", amount, "KES"),
+        ledger_postings.booking_completed("bnb", 1, HOST_ID, Decimal("1000.00"), "KES"),
+        ledger_postings.booking_completed("bnb", 2, HOST_ID, Decimal("2000.00"), "KES"),
+    ])
+    before = await GetPayoutBalanceUseCase(ledger).execute(HOST_ID)
+    await ledger.post([
+        ledger_postings.payout_released(9, HOST_ID, Decimal("1000.00"), "KES"),
+        ledger_postings.payout_scheduled(9, HOST_ID, Decimal("1000.00"), "KES"),
+    ])
+    after = await GetPayoutBalanceUseCase(ledger).execute(HOST_ID)
+
+    assert (before.pending_balance, before.available_balance, before.in_payout_balance) == (amount, 0, 0)
+    assert after.pending_balance == Decimal("2000.00")
+    assert after.available_balance == 0
+    assert after.in_payout_balance == after.total_payouts == Decimal("1000.00")
+    assert after.total_earnings == amount
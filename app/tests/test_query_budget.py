@@ -0,0 +1,99 @@
+"""Statement budgets and the query_budget pytest plugin."""
+import pytest
+from sqlalchemy import create_engine, text
+
+from infrastructure.database.query_budget import (
+    QueryBudgetExceeded,
+    assert_query_budget,
+    install,
+    recording,
+)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    install(engine)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, owner_id INTEGER)"))
+        conn.execute(text("INSERT INTO items (id, owner_id) VALUES (1, 10), (2, 10), (3, 20)"))
+    yield engine
+    engine.dispose()
+
+
+def _owners_one_by_one(conn):
+    return [
+        conn.execute(text("SELECT owner_id FROM items WHERE id = :id"), {"id": item_id}).scalar_one()
+        for item_id in (1, 2, 3)
+    ]
+
+
+def test_batched_lookup_stays_within_budget(engine):
+    with engine.connect() as conn, assert_query_budget(1, max_repeats=1) as recorder:
+        conn.execute(text("SELECT owner_id FROM items WHERE id IN (1, 2, 3)")).all()
+    assert recorder.count == 1
+
+
+def test_n_plus_one_exceeds_repeat_budget(engine):
+    with engine.connect() as conn:
+        with pytest.raises(QueryBudgetExceeded, match="a statement ran 3 times, budget 1"):
+            with assert_query_budget(10, max_repeats=1, label="owners"):
+                _owners_one_by_one(conn)
+
+
+def test_total_budget(engine):
+    with engine.connect() as conn:
+        with pytest.raises(QueryBudgetExceeded, match="3 statements, budget 2"):
+            with assert_query_budget(2):
+                _owners_one_by_one(conn)
+
+
+def test_repeats_are_reported_by_fingerprint(engine):
+    with engine.connect() as conn, recording() as outer:
+        with recording() as inner:
+            _owners_one_by_one(conn)
+        conn.execute(text("SELECT COUNT(*) FROM items")).scalar_one()
+
+    assert inner.count == 3
+    assert outer.count == 4
+    [(statement, times, _callers)] = outer.repeated()
+    assert statement == "SELECT owner_id FROM items WHERE id = ?"
+    assert times == 3
+
+
+N_PLUS_ONE_TEST = """
+import pytest
+from sqlalchemy import create_engine, text
+
+
+@pytest.fixture(scope="session")
+def query_budget_engine():
+    engine = create_engine("sqlite://")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY, owner_id INTEGER)"))
+        conn.execute(text("INSERT INTO items (id, owner_id) VALUES (1, 10), (2, 10), (3, 20)"))
+    return engine
+
+
+@pytest.mark.query_budget(5, max_repeats=1)
+def test_batched(query_budget_engine, query_recorder):
+    with query_budget_engine.connect() as conn:
+        conn.execute(text("SELECT owner_id FROM items WHERE id IN (1, 2, 3)")).all()
+
+
+@pytest.mark.query_budget(5, max_repeats=1)
+def test_n_plus_one(query_budget_engine, query_recorder):
+    with query_budget_engine.connect() as conn:
+        for item_id in (1, 2, 3):
+            conn.execute(text("SELECT owner_id FROM items WHERE id = :id"), {"id": item_id}).one()
+"""
+
+
+def test_marker_fails_an_n_plus_one_test(pytester):
+    pytester.makepyfile(N_PLUS_ONE_TEST)
+    result = pytester.runpytest("-p", "infrastructure.database.query_budget_plugin")
+    result.assert_outcomes(passed=1, failed=1)
+    result.stdout.fnmatch_lines([
+        "*Query budget exceeded for test_*::test_n_plus_one: a statement ran 3 times, budget 1*",
+        "*3x SELECT owner_id FROM items WHERE id = ?*",
+    ])
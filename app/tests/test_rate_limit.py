@@ -0,0 +1,43 @@
+"""Rate limiter policies and the in-memory window store."""
+import pytest
+
+from infrastructure.config.rate_limit import (
+    InMemoryRateLimitStore,
+    RateLimitPolicy,
+    RateLimiter,
+    create_rate_limiter,
+)
+
+
+def test_payment_webhooks_are_exempt():
+    limiter = create_rate_limiter()
+
+    assert limiter.policy_for("/api/v1/payments/webhooks/stripe") is None
+    assert limiter.policy_for("/api/v1/payments/webhooks/mpesa") is None
+    assert limiter.policy_for("/api/v1/payments/intents") is limiter.default
+    assert limiter.policy_for("/api/v1/auth/token").name == "auth"
+
+
+@pytest.mark.asyncio
+async def test_stale_windows_are_dropped_when_a_window_starts():
+    store = InMemoryRateLimitStore()
+    limiter = RateLimiter(store, RateLimitPolicy("default", 2, 60))
+
+    for client in range(100):
+        await limiter.hit(limiter.default, f"ip:10.0.0.{client}", now=10)
+    await limiter.hit(limiter.default, "ip:10.0.0.1", now=70)
+    assert len(store) == 101
+
+    result = await limiter.hit(limiter.default, "ip:10.0.0.1", now=130)
+    assert len(store) == 2
+    assert result.allowed
+
+
+@pytest.mark.asyncio
+async def test_previous_window_counts_towards_the_estimate():
+    limiter = RateLimiter(InMemoryRateLimitStore(), RateLimitPolicy("default", 2, 60))
+
+    assert (await limiter.hit(limiter.default, "ip:1", now=50)).allowed
+    assert (await limiter.hit(limiter.default, "ip:1", now=55)).allowed
+    blocked = await limiter.hit(limiter.default, "ip:1", now=61)
+    assert not blocked.allowed and blocked.retry_after == 59
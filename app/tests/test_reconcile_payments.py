@@ -0,0 +1,113 @@
+"""Reconciliation claims intents per page and commits each page on its own."""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import cast
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+
+from application.use_cases.payment.reconcile_payments import ReconcilePendingPaymentsUseCase
+from infrastructure.config.database import AsyncSessionLocal, engine
+import infrastructure.database.models  # noqa: F401  (configures every mapper)
+from infrastructure.database.models.ledger import (
+    LedgerAccountModel,
+    LedgerEntryModel,
+    LedgerTransactionModel,
+)
+from infrastructure.database.models.payment import PaymentIntentModel
+from infrastructure.database.models.user import User
+from infrastructure.database.repositories.payment import SqlAlchemyPaymentRepository
+from infrastructure.database.unit_of_work import current_session
+from infrastructure.external_services.payment.fake_provider import FakePaymentProvider
+from infrastructure.external_services.payment.mpesa_service import MpesaPaymentService
+from infrastructure.external_services.payment.stripe_service import StripePaymentService
+
+pytestmark = pytest.mark.skipif(
+    engine.dialect.name != "postgresql",
+    reason="intent claims use PostgreSQL-only SQL; set TEST_DATABASE_URL",
+)
+
+TABLES = [
+    User.__table__,
+    PaymentIntentModel.__table__,
+    LedgerAccountModel.__table__,
+    LedgerTransactionModel.__table__,
+    LedgerEntryModel.__table__,
+]
+INTENTS = ["pi_1", "pi_2", "pi_3"]
+
+
+@pytest_asyncio.fixture
+async def stale_intents():
+    def create(conn):
+        User.metadata.drop_all(conn, tables=TABLES[::-1])
+        User.metadata.create_all(conn, tables=TABLES)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(create)
+    created = datetime.now(timezone.utc) - timedelta(hours=1)
+    async with AsyncSessionLocal() as session:
+        customer = User(email="guest@example.com", name="Guest", hashed_password="x")
+        session.add(customer)
+        await session.flush()
+        session.add_all([
+            PaymentIntentModel(
+                intent_id=intent_id, amount=Decimal("1000.00"), currency="KES", payment_method="stripe",
+                booking_id=n, booking_type="bnb", customer_id=customer.id, status="pending",
+                created_at=created,
+            )
+            for n, intent_id in enumerate(INTENTS, start=1)
+        ])
+        await session.commit()
+    yield INTENTS
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: User.metadata.drop_all(sync_conn, tables=TABLES[::-1]))
+
+
+class FailingSecondPageRepository(SqlAlchemyPaymentRepository):
+    pages = 0
+
+    async def update_payment_statuses(self, updates):
+        FailingSecondPageRepository.pages += 1
+        if FailingSecondPageRepository.pages == 2:
+            raise RuntimeError("database went away")
+        return await super().update_payment_statuses(updates)
+
+
+async def _statuses():
+    async with AsyncSessionLocal() as session:
+        rows = await session.execute(select(PaymentIntentModel.intent_id, PaymentIntentModel.status))
+        return dict(rows.all())
+
+
+@pytest.mark.asyncio
+async def test_claimed_intents_are_skipped_by_other_workers(stale_intents):
+    cutoff = datetime.now(timezone.utc)
+    async with AsyncSessionLocal() as session:
+        first = await SqlAlchemyPaymentRepository(session).claim_stale_pending_intents(cutoff, limit=2)
+    async with AsyncSessionLocal() as session:
+        second = await SqlAlchemyPaymentRepository(session).claim_stale_pending_intents(cutoff, limit=2)
+    async with AsyncSessionLocal() as session:
+        third = await SqlAlchemyPaymentRepository(session).claim_stale_pending_intents(cutoff, limit=2)
+
+    assert [intent.intent_id for intent in first] == ["pi_1", "pi_2"]
+    assert [intent.intent_id for intent in second] == ["pi_3"]
+    assert third == []
+
+
+@pytest.mark.asyncio
+async def test_failed_page_keeps_earlier_pages(stale_intents):
+    FailingSecondPageRepository.pages = 0
+    provider = FakePaymentProvider(latency=0, error_rate=0, success_rate=1, seed=1)
+    use_case = ReconcilePendingPaymentsUseCase(
+        payment_repository=lambda: FailingSecondPageRepository(current_session()),
+        stripe_service=cast(StripePaymentService, provider),
+        mpesa_service=cast(MpesaPaymentService, provider),
+        page_size=1,
+    )
+
+    with pytest.raises(RuntimeError):
+        await use_case.execute()
+
+    assert await _statuses() == {"pi_1": "completed", "pi_2": "pending", "pi_3": "pending"}
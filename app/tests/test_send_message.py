@@ -0,0 +1,107 @@
+"""Sending a message writes thread and message together and pushes only after commit."""
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.exc import IntegrityError
+
+from application.dto.message import BookingType, MessageCreateDTO
+from application.use_cases.message.send_message import SendMessageUseCase
+from domain.entities.message import Message
+from domain.services.realtime_notifier import RealtimeNotifier
+from infrastructure.config.database import AsyncSessionLocal, engine
+import infrastructure.database.models  # noqa: F401  (configures every mapper)
+from infrastructure.database.models.message import ConversationThread, Message as MessageModel
+from infrastructure.database.models.user import User
+from infrastructure.database.repositories.message import SqlAlchemyMessageRepository
+from infrastructure.database.repositories.user import SqlAlchemyUserRepository
+from infrastructure.database.unit_of_work import current_session, unit_of_work
+
+TABLES = [User.__table__, ConversationThread.__table__, MessageModel.__table__]
+
+
+class RecordingNotifier(RealtimeNotifier):
+    def __init__(self):
+        self.events = []
+
+    async def notify(self, user_ids, event_type, data):
+        self.events.append((sorted(user_ids), event_type, data))
+
+
+@pytest_asyncio.fixture
+async def users():
+    def create(conn):
+        User.metadata.drop_all(conn, tables=TABLES[::-1])
+        User.metadata.create_all(conn, tables=TABLES)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(create)
+    async with AsyncSessionLocal() as session:
+        sender = User(email="guest@example.com", name="Guest", hashed_password="x")
+        recipient = User(email="host@example.com", name="Host", hashed_password="x")
+        session.add_all([sender, recipient])
+        await session.commit()
+        ids = sender.id, recipient.id
+    yield ids
+    async with engine.begin() as conn:
+        await conn.run_sync(lambda sync_conn: User.metadata.drop_all(sync_conn, tables=TABLES[::-1]))
+
+
+async def _count(model) -> int:
+    async with AsyncSessionLocal() as session:
+        return (await session.execute(select(func.count()).select_from(model))).scalar_one()
+
+
+def _use_case(notifier):
+    session = current_session()
+    return SendMessageUseCase(SqlAlchemyMessageRepository(session), SqlAlchemyUserRepository(session), notifier)
+
+
+def _request(recipient_id):
+    return MessageCreateDTO(
+        booking_type=BookingType.BNB, booking_id=7, recipient_id=recipient_id, subject=None,
+        body="Is the cottage free in May?", parent_message_id=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_push_waits_for_commit(users):
+    sender_id, recipient_id = users
+    notifier = RecordingNotifier()
+    async with unit_of_work():
+        sent = await _use_case(notifier).execute(_request(recipient_id), sender_id)
+        assert notifier.events == []
+
+    assert [event_type for _, event_type, _ in notifier.events] == ["message.created", "unread.count"]
+    async with AsyncSessionLocal() as session:
+        thread = (await session.execute(select(ConversationThread))).scalar_one()
+    assert thread.last_message_id == sent.id
+    assert thread.last_message_at is not None
+    assert (thread.participant_2_id, thread.unread_count_participant_2) == (recipient_id, 1)
+
+
+@pytest.mark.asyncio
+async def test_rolled_back_send_is_not_pushed(users):
+    sender_id, recipient_id = users
+    notifier = RecordingNotifier()
+    with pytest.raises(RuntimeError):
+        async with unit_of_work():
+            await _use_case(notifier).execute(_request(recipient_id), sender_id)
+            raise RuntimeError("request failed after the send")
+
+    assert notifier.events == []
+    assert await _count(ConversationThread) == 0
+    assert await _count(MessageModel) == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_insert_leaves_no_empty_thread(users):
+    sender_id, recipient_id = users
+    async with unit_of_work():
+        repository = SqlAlchemyMessageRepository(current_session())
+        message = Message(booking_type="bnb", booking_id=7, sender_id=sender_id, recipient_id=recipient_id)
+        message.body = None  # type: ignore[assignment]  # violates NOT NULL once the thread is flushed
+        with pytest.raises(IntegrityError):
+            await repository.create_in_thread(message)
+
+    assert await _count(ConversationThread) == 0
+    assert await _count(MessageModel) == 0
@@ -0,0 +1,65 @@
+"""Stripe intent creation retries only transient failures, with one idempotency key."""
+import httpx
+import pytest
+from tenacity import wait_none
+
+from infrastructure.external_services.payment.stripe_service import StripePaymentService
+
+INTENT = {"id": "pi_1", "client_secret": "pi_1_secret", "status": "requires_payment_method"}
+
+
+def _service(*responses):
+    sent = []
+    replies = iter(responses)
+
+    def handler(request):
+        sent.append(request)
+        reply = next(replies)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    client = httpx.AsyncClient(base_url="https://api.stripe.test", transport=httpx.MockTransport(handler))
+    return StripePaymentService(api_key="sk_test", http_client=client), sent
+
+
+async def _create(service, **kwargs):
+    create = StripePaymentService.create_payment_intent.retry_with(wait=wait_none())
+    return await create(service, amount=2500, currency="kes", customer_email="guest@example.com", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_server_error_is_retried_with_the_same_key():
+    service, sent = _service(httpx.Response(500), httpx.Response(200, json=INTENT))
+
+    assert await _create(service, metadata={"booking_id": "7"}) == INTENT
+    keys = [request.headers["Idempotency-Key"] for request in sent]
+    assert len(keys) == 2 and keys[0] == keys[1]
+
+
+@pytest.mark.asyncio
+async def test_transport_error_is_retried():
+    service, sent = _service(httpx.ReadTimeout("timed out"), httpx.Response(200, json=INTENT))
+
+    assert await _create(service, idempotency_key="booking-bnb-7") == INTENT
+    assert [request.headers["Idempotency-Key"] for request in sent] == ["booking-bnb-7"] * 2
+
+
+@pytest.mark.asyncio
+async def test_client_error_is_not_retried():
+    service, sent = _service(httpx.Response(400, json={"error": {"message": "Invalid currency"}}))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await _create(service)
+    assert len(sent) == 1
+
+
+@pytest.mark.asyncio
+async def test_derived_key_depends_on_the_request():
+    service, sent = _service(*(httpx.Response(200, json=INTENT) for _ in range(3)))
+
+    await _create(service, metadata={"booking_id": "7"})
+    await _create(service, metadata={"booking_id": "7"})
+    await _create(service, metadata={"booking_id": "8"})
+    keys = [request.headers["Idempotency-Key"] for request in sent]
+    assert keys[0] == keys[1] != keys[2]